@@ -1,8 +1,8 @@
 import sys
-import pygame
-from spacegame.screens.main_menu import main as main_menu
-from spacegame.screens.game_screen import run_game
-from spacegame.screens.end_screen import end_screen
+from spacegame.core import startup
+
+# Screens are imported when first entered so the main menu shows up without
+# waiting for the gameplay modules (see `--startup-report`).
 
 STATE_MAIN_MENU = "main_menu"
 STATE_GAME      = "game"
@@ -10,44 +10,57 @@ STATE_END       = "end"
 STATE_EXIT      = "exit"
 
 def run_state_machine():
-    pygame.init()
-    state = STATE_MAIN_MENU
-
-    while state != STATE_EXIT:
-        if state == STATE_MAIN_MENU:
-            # main menu: choose play or exit
-            result = main_menu()
-            if result in (STATE_GAME, STATE_EXIT):
-                state = result
-            else:
-                # default fallback: if None, go to EXIT
-                state = STATE_EXIT
+    startup.init_pygame()
+    try:
+        state = STATE_MAIN_MENU
 
-        elif state == STATE_GAME:
-            # main gameplay
-            result = run_game()
-            if result in (STATE_MAIN_MENU, STATE_END, STATE_EXIT):
-                state = result
-            else:
-                # ESC fallback: go back to main menu
-                state = STATE_MAIN_MENU
-
-        elif state == STATE_END:
-            # game over screen
-            result = end_screen()
-            if result in (STATE_GAME, STATE_MAIN_MENU, STATE_EXIT):
-                state = result
-            else:
-                # default: go back to main menu
-                state = STATE_MAIN_MENU
+        while state != STATE_EXIT:
+            if state == STATE_MAIN_MENU:
+                # main menu: choose play or exit
+                from spacegame.screens.main_menu import main as main_menu
+                result = main_menu()
+                if result in (STATE_GAME, STATE_EXIT):
+                    state = result
+                else:
+                    # default fallback: if None, go to EXIT
+                    state = STATE_EXIT
+
+            elif state == STATE_GAME:
+                # main gameplay
+                from spacegame.screens.game_screen import run_game
+                result = run_game()
+                if result in (STATE_MAIN_MENU, STATE_END, STATE_EXIT):
+                    state = result
+                else:
+                    # ESC fallback: go back to main menu
+                    state = STATE_MAIN_MENU
 
-        else:
-            # unknown state → exit
-            state = STATE_EXIT
+            elif state == STATE_END:
+                # game over screen
+                from spacegame.screens.end_screen import end_screen
+                result = end_screen()
+                if result in (STATE_GAME, STATE_MAIN_MENU, STATE_EXIT):
+                    state = result
+                else:
+                    # default: go back to main menu
+                    state = STATE_MAIN_MENU
 
+            else:
+                # unknown state → exit
+                state = STATE_EXIT
+    finally:
+        # Make sure the write-behind autosave reaches disk before exiting,
+        # whichever way the loop ends
+        from spacegame.core.save_scheduler import flush_pending_saves
+        flush_pending_saves()
+    import pygame
     pygame.quit()
     sys.exit()
 
 
 if __name__ == "__main__":
+    # --startup-report: print import times and startup phases to stderr
+    # once the main menu is on screen
+    if "--startup-report" in sys.argv[1:]:
+        startup.enable_report()
     run_state_machine()
\ No newline at end of file
@@ -78,6 +78,9 @@ UI_SECTION_TEXT_COLOR = (230, 240, 255)
 # ---- UI Layout ----
 UI_TOP_BAR_HEIGHT = 96
 UI_TAB_HEIGHT     = 38
+UI_GRID_SCROLL_STEP   = 40    # pixels per mouse-wheel notch
+UI_GRID_SCROLL_SMOOTH = 0.25  # 0..1, higher = snappier
+UI_GRID_CELL_CACHE    = 120   # rendered cards kept per card grid
 
 # ---- Tier flag colors ----
 UI_ICON_BLUE  = (70, 130, 220)
@@ -87,4 +90,110 @@ UI_ICON_WHITE = (240, 240, 255)
 # Seconds between spawn waves (float). Set to 0 to disable automatic spawns.
 ENEMY_SPAWN_INTERVAL = 8.0
 # How many enemies to spawn each interval
-ENEMY_SPAWN_COUNT = 2
\ No newline at end of file
+ENEMY_SPAWN_COUNT = 2
+
+# ---- Galactic map ----
+# World-space cell size (map pixels) of the spatial grid used to cull and
+# hit-test map areas.
+GALAXY_MAP_GRID_CELL = 128.0
+# Area labels are drawn only when the zoom is at least this multiple of the
+# fit-to-screen zoom, or when few areas are on screen.
+GALAXY_MAP_LABEL_ZOOM = 1.5
+GALAXY_MAP_LABEL_MAX_VISIBLE = 64
+
+# ---- Asteroid fields ----
+# Asteroid locations are generated lazily in chunks. The chunk grid is
+# anchored so the 2x2 home chunks tile the visible play area (screen minus
+# a 100px margin).
+ASTEROID_CHUNK_ORIGIN = (100, 100)
+ASTEROID_CHUNK_SIZE = ((SCREEN_WIDTH - 200) // 2, (SCREEN_HEIGHT - 200) // 2)
+# Asteroids generated per chunk (inclusive range)
+ASTEROID_CHUNK_COUNT_RANGE = (1, 3)
+# Chunks within this many chunks of the view are generated; chunks beyond
+# the evict margin are dropped (only their mined-out delta is kept).
+ASTEROID_CHUNK_LOAD_MARGIN = 0
+ASTEROID_CHUNK_EVICT_MARGIN = 1
+# Ore an asteroid holds before it is mined out (inclusive range)
+ASTEROID_RESERVE_RANGE = (6000, 15000)
+
+# ---- Autosave ----
+# Saves are written on a background thread once state has been quiet for
+# SAVE_DEBOUNCE_S, and never later than SAVE_MAX_LATENCY_S after the first
+# unsaved change.
+SAVE_DEBOUNCE_S = 0.5
+SAVE_MAX_LATENCY_S = 3.0
+# Journal size (bytes) past which the save worker folds the change log
+# into a fresh snapshot.
+SAVE_JOURNAL_COMPACT_BYTES = 256 * 1024
+
+# ---- Game clock ----
+# Game time per wall-clock second for production timers (1.0 = real time)
+GAME_TIME_SCALE = 1.0
+
+# ---- Production ----
+# Raw ore consumed per unit of refined material
+REFINING_INPUT_PER_OUTPUT = 2
+# Refined units produced by one refinement run
+REFINING_BATCH_OUTPUT = 100
+
+# ---- Asset loading ----
+# Threads decoding images for the background preloader
+ASSET_PRELOAD_WORKERS = 4
+# Main-thread time (ms) per frame spent converting preloaded images
+ASSET_CONVERT_BUDGET_MS = 2.0
+# Directory (relative to the project root, like IMAGES_DIR) holding sprite
+# packs baked by `python -m spacegame.tools.bake`
+SPRITE_CACHE_DIR = "spacegame/cache"
+# Rotation frames per unit sprite (3 degree steps)
+SPRITE_ROTATION_FRAMES = 120
+# Cap (MiB of decoded PCM) on sounds kept in memory; least recently used are dropped
+SOUND_CACHE_MAX_MB = 16
+# Threads decoding sounds in the background
+SOUND_DECODE_WORKERS = 2
+# Mixer channels used for sound effects (simultaneous voices)
+SOUND_VOICES = 4
+# Without a per-frame flush for this long (ms), play requests are submitted at once
+SOUND_FLUSH_IDLE_MS = 100
+
+# ---- Background simulation ----
+# While menus and maps are open the battle keeps running at this fixed
+# rate (steps per second), without sprite syncing or drawing.
+BACKGROUND_SIM_HZ = 30
+# Steps per menu frame at most; time beyond that is dropped, like MAX_DT
+BACKGROUND_SIM_MAX_STEPS = 4
+
+# ---- AI scheduling ----
+# Time per frame (ms) for AI decisions (enemy targeting, collector heal /
+# mine choices). Agents not reached keep their last orders; movement still
+# updates every frame.
+AI_FRAME_BUDGET_MS = 1.0
+# Agents decided between budget checks; each kind of agent gets at least
+# one group per frame
+AI_GROUP_SIZE = 8
+
+# ---- Navigation ----
+# Grid (pixels per cell) that group move orders path over to avoid
+# asteroids and stations; it covers the screen plus NAV_MARGIN pixels
+NAV_CELL_SIZE = 32
+NAV_MARGIN = 160
+# Extra clearance (pixels) kept around asteroids
+NAV_CLEARANCE = 12
+# Flow fields cached per destination cell
+NAV_FIELD_CACHE = 16
+# Units fly straight once their remaining path is this close to the goal
+# (plus their formation offset)
+NAV_ARRIVE_RADIUS = 48
+
+# ---- Formations ----
+# Layout used for group move orders ("line", "wedge", "box" or "ring");
+# F cycles through them in game
+FORMATION_DEFAULT = "box"
+# Pixels between neighbouring ships' bounding circles
+FORMATION_SPACING_GAP = 12
+# Groups up to this size get the optimal slot assignment; larger groups
+# use a fast row sweep
+FORMATION_OPTIMAL_MAX = 32
+# Large groups: each ship may swap slots with this many neighbours (sorted
+# across and along the move), repeated for up to this many passes
+FORMATION_IMPROVE_WINDOW = 3
+FORMATION_IMPROVE_PASSES = 2
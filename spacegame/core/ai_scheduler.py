@@ -0,0 +1,149 @@
+"""Time-sliced AI decisions under a per-frame budget.
+
+Movement runs every frame, but the decisions steering it (which ship a
+pirate closes on, whether a collector is in heal / mine range, when it
+heads home) don't need to. Each kind of agent is a channel visited in
+round-robin order, a group of `AI_GROUP_SIZE` agents at a time, until the
+frame's `AI_FRAME_BUDGET_MS` is used up:
+
+    ai = get_ai_scheduler()
+    ai.begin_frame(dt)
+    ai.run("enemies", enemy_fleet, decide_enemy)
+    ai.run("collectors", collectors, decide_collector)
+
+`decide(agent, elapsed)` gets the battle time since that agent's previous
+decision, so rate-based work done there (healing, mining fill) stays
+correct when decisions come less often. With a handful of agents every
+one is decided every frame; with hundreds the cost stays bounded and
+decisions just come later. Every channel gets at least one group per
+frame, so no agent waits forever.
+"""
+import time
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from spacegame.config import AI_FRAME_BUDGET_MS, AI_GROUP_SIZE
+
+
+class _Channel:
+    __slots__ = ("cursor", "last", "interval")
+
+    def __init__(self):
+        self.cursor = 0
+        self.last: Dict[int, float] = {}      # id(agent) -> battle time of its last decision
+        self.interval: Dict[int, float] = {}  # id(agent) -> time between its last two decisions
+
+
+class AIScheduler:
+    """Round-robin decision updates sharing one time budget per frame."""
+
+    def __init__(self, budget_ms: float = AI_FRAME_BUDGET_MS, group_size: int = AI_GROUP_SIZE):
+        self.budget_ms = float(budget_ms)
+        self.group_size = max(1, int(group_size))
+        self._channels: Dict[str, _Channel] = {}
+        self._time = 0.0  # battle time (sum of frame dts)
+        self._dt = 0.0
+        self._remaining = 0.0  # seconds of this frame's budget not yet spent inside run()
+        # metrics
+        self.frames = 0
+        self.decisions = 0           # total decisions made
+        self.frame_decisions = 0     # decisions in the current / last frame
+        self.frame_ms = 0.0          # time spent deciding in the current / last frame
+        self.deferred = 0            # agents left for a later frame, current / last frame
+        self.limited_frames = 0      # frames that ran out of budget before a full round
+
+    def begin_frame(self, dt: float) -> None:
+        """Start a frame's budget; call once per simulation step, before `run()`."""
+        self._dt = max(0.0, float(dt))
+        self._time += self._dt
+        self._remaining = self.budget_ms / 1000.0
+        self.frames += 1
+        self.frame_decisions = 0
+        self.frame_ms = 0.0
+        self.deferred = 0
+
+    def run(self, channel: str, agents: Iterable[Any], decide: Callable[[Any, float], None]) -> int:
+        """Decide agents of `channel` in round-robin order; returns how many were decided."""
+        agents = list(agents)
+        ch = self._channels.get(channel)
+        if ch is None:
+            ch = self._channels[channel] = _Channel()
+        n = len(agents)
+        if n == 0:
+            ch.last.clear()
+            ch.interval.clear()
+            return 0
+        if len(ch.last) > n:
+            # forget agents that died or docked
+            alive = {id(a) for a in agents}
+            ch.last = {k: v for k, v in ch.last.items() if k in alive}
+            ch.interval = {k: v for k, v in ch.interval.items() if k in alive}
+
+        t0 = time.perf_counter()
+        # only time spent deciding counts against the budget, not the
+        # movement and combat work the step does between channels
+        deadline = t0 + self._remaining
+        now = self._time
+        start = ch.cursor % n
+        done = 0
+        while done < n:
+            for i in range(done, min(n, done + self.group_size)):
+                agent = agents[(start + i) % n]
+                key = id(agent)
+                # an agent seen for the first time has been waiting one frame
+                elapsed = now - ch.last.get(key, now - self._dt)
+                ch.last[key] = now
+                ch.interval[key] = elapsed
+                try:
+                    decide(agent, elapsed)
+                except Exception as e:
+                    print(f"AI decision failed for {type(agent).__name__}: {e}")
+            done = min(n, done + self.group_size)
+            if time.perf_counter() >= deadline:
+                break
+        ch.cursor = (start + done) % n
+        if done < n and not self.deferred:
+            self.limited_frames += 1
+        self.frame_decisions += done
+        self.decisions += done
+        self.deferred += n - done
+        spent = time.perf_counter() - t0
+        self._remaining = max(0.0, self._remaining - spent)
+        self.frame_ms += spent * 1000.0
+        return done
+
+    # ---- Metrics ----
+    def decision_latency_ms(self, channel: str, agent: Any) -> float:
+        """Battle time between `agent`'s last two decisions (0 if not seen yet)."""
+        ch = self._channels.get(channel)
+        if ch is None:
+            return 0.0
+        return ch.interval.get(id(agent), 0.0) * 1000.0
+
+    def get_metrics(self) -> Dict[str, float]:
+        """Return decision counters and latency stats for profiling overlays and logs."""
+        metrics: Dict[str, float] = {
+            "frames": self.frames,
+            "decisions": self.decisions,
+            "frame_decisions": self.frame_decisions,
+            "frame_ms": self.frame_ms,
+            "deferred": self.deferred,
+            "limited_frames": self.limited_frames,
+        }
+        for name, ch in self._channels.items():
+            intervals = list(ch.interval.values())
+            metrics[f"{name}_agents"] = len(intervals)
+            metrics[f"{name}_max_latency_ms"] = max(intervals) * 1000.0 if intervals else 0.0
+            metrics[f"{name}_avg_latency_ms"] = sum(intervals) / len(intervals) * 1000.0 if intervals else 0.0
+        return metrics
+
+
+# Global singleton instance
+_instance: Optional[AIScheduler] = None
+
+
+def get_ai_scheduler() -> AIScheduler:
+    """Get or create the global AI scheduler."""
+    global _instance
+    if _instance is None:
+        _instance = AIScheduler()
+    return _instance
@@ -0,0 +1,193 @@
+"""Shared image cache and prioritized background preloader.
+
+`load_image(path)` returns a display-format surface for an image file,
+cached by path; screens and units share the cached surface (they rotate or
+scale copies of it, never draw into it).
+
+`AssetPreloader` fills that cache ahead of time. Files are queued in
+priority tiers:
+
+- `TIER_CRITICAL`: gameplay sprites (ships, asteroids, battle background)
+- `TIER_HUD`: HUD and navigation icons
+- `TIER_PREVIEWS`: map, menu and item previews
+
+A thread pool decodes the files (PNG decoding releases the GIL) and hands
+the raw surfaces back through a queue. Conversion to the display format
+must happen on the main thread, so `pump()` converts decoded surfaces
+within a small time budget each frame. The loading screen waits only for
+the critical tier; the rest streams in while the game runs.
+"""
+import os
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import pygame
+
+from spacegame.config import IMAGES_DIR, PREVIEWS_DIR, ASSET_PRELOAD_WORKERS, ASSET_CONVERT_BUDGET_MS
+
+
+TIER_CRITICAL = 0
+TIER_HUD = 1
+TIER_PREVIEWS = 2
+TIER_NAMES = ("ships", "HUD", "previews")
+
+# Preview-folder files that belong to the HUD tier (matched by prefix)
+_HUD_PREFIXES = ("HudIcon_", "Nav_Icon_", "UI_icon_", "UI_Map_", "FleetIcon", "BackArrow", "WarningIcon_")
+# Opaque images converted without per-pixel alpha (faster blits)
+_OPAQUE_FILES = ("nebula_15.png",)
+_IMAGE_EXTS = (".png", ".jpg", ".jpeg")
+
+_IMAGE_CACHE: Dict[str, pygame.Surface] = {}
+
+
+def _key(path: str) -> str:
+    return os.path.normpath(path)
+
+
+def _convert(surf: pygame.Surface, alpha: bool) -> pygame.Surface:
+    if pygame.display.get_surface() is None:
+        return surf
+    return surf.convert_alpha() if alpha else surf.convert()
+
+
+def load_image(path: str, alpha: bool = True) -> pygame.Surface:
+    """Return the cached display-format surface for `path`, loading it if needed.
+
+    Raises like `pygame.image.load` when the file cannot be read.
+    """
+    key = _key(path)
+    surf = _IMAGE_CACHE.get(key)
+    if surf is not None:
+        return surf
+    surf = pygame.image.load(path)
+    if pygame.display.get_surface() is None:
+        # cannot convert before the display exists; don't cache the slow surface
+        return surf
+    surf = _convert(surf, alpha)
+    _IMAGE_CACHE[key] = surf
+    return surf
+
+
+def is_loaded(path: str) -> bool:
+    return _key(path) in _IMAGE_CACHE
+
+
+def _manifest() -> List[Tuple[int, str, bool]]:
+    """Return (tier, path, alpha) for every image the preloader knows about."""
+    items = []
+    for folder, default_tier in ((IMAGES_DIR, TIER_CRITICAL), (PREVIEWS_DIR, TIER_PREVIEWS)):
+        try:
+            names = sorted(os.listdir(folder))
+        except OSError:
+            continue
+        for fn in names:
+            if not fn.lower().endswith(_IMAGE_EXTS):
+                continue
+            tier = default_tier
+            if default_tier == TIER_PREVIEWS and fn.startswith(_HUD_PREFIXES):
+                tier = TIER_HUD
+            items.append((tier, f"{folder}/{fn}", fn not in _OPAQUE_FILES))
+    items.sort(key=lambda item: item[0])
+    return items
+
+
+class AssetPreloader:
+    """Decode images on a thread pool and convert them on the main thread."""
+
+    def __init__(self, workers: int = ASSET_PRELOAD_WORKERS):
+        self.workers = max(1, int(workers))
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._ready: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._items: List[Tuple[int, str, bool]] = []
+        self.total = [0, 0, 0]
+        self.done = [0, 0, 0]
+        self.failed = 0
+        self.current = ""
+        self.started = False
+
+    def start(self, skip=()) -> None:
+        """Queue every known image except paths in `skip`; safe to call more than once."""
+        if self.started:
+            return
+        self.started = True
+        skip = {_key(p) for p in skip}
+        self._items = [item for item in _manifest() if _key(item[1]) not in skip]
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="asset-decode")
+        # the pool's queue is FIFO, so submitting in tier order decodes in tier order
+        for tier, path, alpha in self._items:
+            self.total[tier] += 1
+            if is_loaded(path):
+                self.done[tier] += 1
+                continue
+            self._executor.submit(self._decode, tier, path, alpha)
+        self._executor.shutdown(wait=False)
+
+    def _decode(self, tier: int, path: str, alpha: bool) -> None:
+        # worker thread: decode only, no display access
+        try:
+            surf = pygame.image.load(path)
+        except Exception:
+            surf = None
+        self._ready.put((tier, path, alpha, surf))
+
+    def pump(self, budget_ms: float = ASSET_CONVERT_BUDGET_MS) -> int:
+        """Convert decoded images on the main thread until `budget_ms` is spent.
+
+        Returns the number of images finished this call.
+        """
+        if not self.started or self.is_done():
+            return 0
+        deadline = time.perf_counter() + budget_ms / 1000.0
+        finished = 0
+        while True:
+            try:
+                tier, path, alpha, surf = self._ready.get_nowait()
+            except queue.Empty:
+                break
+            key = _key(path)
+            if key not in _IMAGE_CACHE:
+                if surf is None:
+                    self.failed += 1
+                elif pygame.display.get_surface() is not None:
+                    _IMAGE_CACHE[key] = _convert(surf, alpha)
+            self.done[tier] += 1
+            self.current = os.path.basename(path)
+            finished += 1
+            if time.perf_counter() >= deadline:
+                break
+        return finished
+
+    def tier_done(self, tier: int) -> bool:
+        """True when every tier up to and including `tier` is loaded."""
+        return all(self.done[t] >= self.total[t] for t in range(tier + 1))
+
+    def is_done(self) -> bool:
+        return self.started and self.tier_done(TIER_PREVIEWS)
+
+    def progress(self, tier: int = TIER_PREVIEWS) -> float:
+        """Fraction (0..1) of images loaded in tiers up to `tier`."""
+        total = sum(self.total[:tier + 1])
+        if total <= 0:
+            return 1.0 if self.started else 0.0
+        return min(1.0, sum(self.done[:tier + 1]) / total)
+
+    def loading_tier(self) -> int:
+        """The first tier that is not yet complete."""
+        for t in range(len(self.total)):
+            if self.done[t] < self.total[t]:
+                return t
+        return TIER_PREVIEWS
+
+
+# Global singleton instance
+_preloader: Optional[AssetPreloader] = None
+
+
+def get_asset_preloader() -> AssetPreloader:
+    """Get or create the global asset preloader."""
+    global _preloader
+    if _preloader is None:
+        _preloader = AssetPreloader()
+    return _preloader
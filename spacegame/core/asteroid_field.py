@@ -0,0 +1,259 @@
+"""Chunked, seeded asteroid fields.
+
+An `AsteroidField` divides a location's world space into rectangular chunks.
+Each chunk's asteroids are generated deterministically from
+(system, area, chunk coords), so a chunk can be dropped when it is far from
+the view and rebuilt identically when it comes back. The only state kept
+for an evicted chunk is a compact delta of how much ore was extracted from
+each of its asteroids; fully mined-out asteroids are skipped on rebuild.
+
+Deltas survive leaving the location: `get_asteroid_field` keeps one delta
+store per (system, area) for the whole session.
+"""
+from typing import Dict, List, Optional, Tuple
+import hashlib
+import math
+import random
+import pygame
+
+from spacegame.models.asteroids.asteroida import MineableAsteroidA
+from spacegame.models.asteroids.asteroidb import MineableAsteroidB
+from spacegame.models.asteroids.asteroidc import MineableAsteroidC
+from spacegame.models.asteroids.asteroidm import MineableAsteroidM
+from spacegame.config import (
+    ASTEROID_CHUNK_ORIGIN,
+    ASTEROID_CHUNK_SIZE,
+    ASTEROID_CHUNK_COUNT_RANGE,
+    ASTEROID_CHUNK_LOAD_MARGIN,
+    ASTEROID_CHUNK_EVICT_MARGIN,
+    ASTEROID_RESERVE_RANGE,
+)
+
+
+ASTEROID_CLASSES = {
+    'A': MineableAsteroidA,
+    'B': MineableAsteroidB,
+    'C': MineableAsteroidC,
+    'M': MineableAsteroidM,
+}
+
+HIGH_PURITY = 0.5
+LOW_PURITY = 0.13
+
+# Clearance (pixels) kept between generated asteroids and their chunk border
+# so neighbouring chunks never overlap.
+_CHUNK_BORDER = 40
+
+# (system, area) -> {(cx, cy): {asteroid_index: ore_mined}}
+_FIELD_DELTAS: Dict[Tuple[str, str], Dict[Tuple[int, int], Dict[int, float]]] = {}
+
+
+def chunk_seed(system: str, area: str, cx: int, cy: int) -> int:
+    """Return a stable 64-bit seed for a chunk (independent of PYTHONHASHSEED)."""
+    key = f"{system}|{area}|{cx}|{cy}".encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+
+
+class AsteroidField:
+    """Lazily generated asteroid field for one asteroid-type location.
+
+    Call `update(view_rect)` once per frame with the visible world rect;
+    chunks within `ASTEROID_CHUNK_LOAD_MARGIN` chunks of the view are
+    generated and added to `group`, chunks beyond `ASTEROID_CHUNK_EVICT_MARGIN`
+    are evicted and their mined state folded into the delta store.
+    """
+
+    def __init__(self, system: str, area: str, ore_type: str = 'M', tier: int = 0,
+                 group: Optional[pygame.sprite.Group] = None,
+                 deltas: Optional[Dict[Tuple[int, int], Dict[int, float]]] = None):
+        self.system = str(system)
+        self.area = str(area)
+        self.ore_type = str(ore_type or 'M')
+        self.tier = int(tier or 0)
+        self.group = group if group is not None else pygame.sprite.Group()
+        self.chunk_w, self.chunk_h = ASTEROID_CHUNK_SIZE
+        self.origin_x, self.origin_y = ASTEROID_CHUNK_ORIGIN
+        # loaded chunk -> list of (index, asteroid)
+        self.chunks: Dict[Tuple[int, int], List[Tuple[int, object]]] = {}
+        self.deltas = deltas if deltas is not None else {}
+        self._last_range = None
+
+    # ---------- Chunk coordinates ----------
+    def chunk_of(self, x: float, y: float) -> Tuple[int, int]:
+        return (int(math.floor((x - self.origin_x) / self.chunk_w)),
+                int(math.floor((y - self.origin_y) / self.chunk_h)))
+
+    def _chunk_range(self, rect, margin: int) -> Tuple[int, int, int, int]:
+        cx0, cy0 = self.chunk_of(rect.left, rect.top)
+        cx1, cy1 = self.chunk_of(rect.right - 1, rect.bottom - 1)
+        return (cx0 - margin, cy0 - margin, cx1 + margin, cy1 + margin)
+
+    # ---------- Generation ----------
+    def _chunk_layout(self, cx: int, cy: int) -> List[Tuple[str, float, float, float, float]]:
+        """Return the deterministic (ore, x, y, purity, reserve) layout of a chunk."""
+        rng = random.Random(chunk_seed(self.system, self.area, cx, cy))
+        lo, hi = ASTEROID_CHUNK_COUNT_RANGE
+        count = rng.randint(int(lo), int(hi))
+
+        if self.ore_type == 'M':
+            ores = ['M'] * count
+        else:
+            # The home chunk always offers each of A/B/C, like the old spawner did.
+            ores = ['A', 'B', 'C'] if (cx, cy) == (0, 0) else []
+            while len(ores) < count:
+                ores.append(rng.choice(['A', 'B', 'C']))
+            rng.shuffle(ores)
+
+        left = self.origin_x + cx * self.chunk_w + _CHUNK_BORDER
+        top = self.origin_y + cy * self.chunk_h + _CHUNK_BORDER
+        right = max(left, self.origin_x + (cx + 1) * self.chunk_w - _CHUNK_BORDER)
+        bottom = max(top, self.origin_y + (cy + 1) * self.chunk_h - _CHUNK_BORDER)
+        res_lo, res_hi = ASTEROID_RESERVE_RANGE
+
+        layout = []
+        for ore in ores:
+            x = rng.uniform(left, right)
+            y = rng.uniform(top, bottom)
+            if self.ore_type == 'M' or ore == self.ore_type:
+                purity = HIGH_PURITY
+            else:
+                purity = LOW_PURITY
+            reserve = float(rng.randint(int(res_lo), int(res_hi)))
+            layout.append((ore, x, y, purity, reserve))
+        return layout
+
+    def _load_chunk(self, key: Tuple[int, int]) -> None:
+        delta = self.deltas.get(key, {})
+        loaded = []
+        for index, (ore, x, y, purity, reserve) in enumerate(self._chunk_layout(*key)):
+            mined = float(delta.get(index, 0.0))
+            if mined >= reserve:
+                # mined out: nothing to build
+                continue
+            asteroid = ASTEROID_CLASSES[ore]((x, y), tier=self.tier, purity=purity)
+            asteroid.reserve = reserve
+            asteroid.mined = mined
+            loaded.append((index, asteroid))
+            self.group.add(asteroid)
+        self.chunks[key] = loaded
+
+    def _evict_chunk(self, key: Tuple[int, int]) -> None:
+        self._store_delta(key)
+        for _, asteroid in self.chunks.pop(key, []):
+            asteroid.kill()
+
+    def _store_delta(self, key: Tuple[int, int]) -> None:
+        # Start from the existing delta so mined-out (already removed)
+        # asteroids keep their entries.
+        delta = dict(self.deltas.get(key, {}))
+        for index, asteroid in self.chunks.get(key, []):
+            mined = float(getattr(asteroid, 'mined', 0.0))
+            if mined > 0.0:
+                delta[index] = mined
+        if delta:
+            self.deltas[key] = delta
+        else:
+            self.deltas.pop(key, None)
+
+    # ---------- Per-frame API ----------
+    def update(self, view_rect) -> None:
+        """Load chunks around `view_rect` and evict chunks far from it."""
+        view_rect = pygame.Rect(view_rect)
+        load = self._chunk_range(view_rect, ASTEROID_CHUNK_LOAD_MARGIN)
+        if load != self._last_range:
+            self._last_range = load
+            lx0, ly0, lx1, ly1 = load
+            for cx in range(lx0, lx1 + 1):
+                for cy in range(ly0, ly1 + 1):
+                    if (cx, cy) not in self.chunks:
+                        self._load_chunk((cx, cy))
+            ex0, ey0, ex1, ey1 = self._chunk_range(view_rect, ASTEROID_CHUNK_EVICT_MARGIN)
+            for key in list(self.chunks):
+                if not (ex0 <= key[0] <= ex1 and ey0 <= key[1] <= ey1):
+                    self._evict_chunk(key)
+
+        # Drop asteroids that were mined out while loaded
+        for key, loaded in self.chunks.items():
+            if any(a.is_depleted() for _, a in loaded):
+                self._store_delta(key)
+                for _, a in loaded:
+                    if a.is_depleted():
+                        a.kill()
+                self.chunks[key] = [(i, a) for i, a in loaded if not a.is_depleted()]
+
+    # ---------- Snapshot support ----------
+    def key_of(self, asteroid) -> Optional[Tuple[int, int, int]]:
+        """Return (cx, cy, index) of a loaded asteroid, or None."""
+        for key, loaded in self.chunks.items():
+            for index, a in loaded:
+                if a is asteroid:
+                    return (key[0], key[1], index)
+        return None
+
+    def find(self, cx: int, cy: int, index: int):
+        """Return the loaded asteroid at (cx, cy, index), or None."""
+        for i, a in self.chunks.get((cx, cy), ()):
+            if i == index:
+                return a
+        return None
+
+    def mined_state(self) -> Dict[Tuple[int, int], Dict[int, float]]:
+        """Return a copy of the mined amounts, including loaded asteroids."""
+        state = {key: dict(delta) for key, delta in self.deltas.items()}
+        for key, loaded in self.chunks.items():
+            for index, asteroid in loaded:
+                mined = float(getattr(asteroid, 'mined', 0.0))
+                if mined > 0.0:
+                    state.setdefault(key, {})[index] = mined
+        return state
+
+    def restore_mined_state(self, state: Dict[Tuple[int, int], Dict[int, float]]) -> None:
+        """Reset mined amounts to `state` (as returned by `mined_state`).
+
+        Loaded chunks whose surviving asteroids still match are updated in
+        place; a chunk is rebuilt only when asteroids must reappear or vanish.
+        """
+        self.deltas.clear()
+        for key, delta in state.items():
+            if delta:
+                self.deltas[key] = dict(delta)
+        for key, loaded in list(self.chunks.items()):
+            delta = self.deltas.get(key, {})
+            wanted = {i for i, (_, _, _, _, reserve) in enumerate(self._chunk_layout(*key))
+                      if float(delta.get(i, 0.0)) < reserve}
+            if wanted == {i for i, _ in loaded}:
+                for i, a in loaded:
+                    a.mined = float(delta.get(i, 0.0))
+            else:
+                for _, a in loaded:
+                    a.kill()
+                self._load_chunk(key)
+
+    @property
+    def asteroids(self) -> List[object]:
+        return [a for loaded in self.chunks.values() for _, a in loaded]
+
+    def close(self) -> None:
+        """Evict every loaded chunk (keeping deltas) and empty the sprite group."""
+        for key in list(self.chunks):
+            self._evict_chunk(key)
+        self._last_range = None
+
+
+def get_asteroid_field(system: str, area: str, location_data, group=None) -> Optional[AsteroidField]:
+    """Return an `AsteroidField` for an asteroid location, or None for other types.
+
+    Mined-out deltas are shared per (system, area) for the whole session so
+    returning to a location restores its depleted asteroids.
+    """
+    if location_data is None or location_data.get('type') != 'Asteroids':
+        return None
+    deltas = _FIELD_DELTAS.setdefault((str(system), str(area)), {})
+    return AsteroidField(
+        system,
+        area,
+        ore_type=location_data.get('ore', 'M'),
+        tier=location_data.get('tier', 0),
+        group=group,
+        deltas=deltas,
+    )
@@ -0,0 +1,393 @@
+"""Battle simulation step, shared by the game loop and the menus.
+
+`Battle` holds the state `run_game` simulates (fleets, sprite groups,
+asteroid field, spawn timer) and `step(dt)` advances it by one frame
+without drawing anything. `run_game` calls it every frame.
+
+While a menu or map is open, `run_game` is blocked inside that screen's
+call, so the battle is handed to the background simulation instead:
+
+    with get_background_sim().running(battle):
+        internal_screen(main_player, player_fleet)
+
+Menu loops call `get_background_sim().tick()` once per frame. It steps the
+battle at the fixed `BACKGROUND_SIM_HZ` rate measured from wall time,
+skipping sprite syncing, so collectors keep mining, jobs complete and
+fights resolve at a fraction of the cost of a full game frame. Everything
+runs on the main thread: sprites, surfaces and the event bus are not
+thread-safe.
+
+After each step a `BattleStatus` is published by swapping in a new
+immutable tuple, so menus read a complete, consistent summary without
+touching the live fleets.
+"""
+import contextlib
+from typing import List, NamedTuple, Optional
+
+import pygame
+
+from spacegame.core import effects
+from spacegame.core import events
+from spacegame.core.mover import Mover
+from spacegame.core.job_scheduler import get_job_scheduler
+from spacegame.core.ai_scheduler import get_ai_scheduler
+from spacegame.core.sound_manager import get_sound_manager
+from spacegame.core.utils import spawn_enemy_wave, handle_auto_fire, handle_projectile_collisions
+from spacegame.models.units.fleet_unit import SpaceUnit
+from spacegame.models.units.interceptor import Interceptor
+from spacegame.models.units.resource_collector import ResourceCollector
+from spacegame.models.units.plasma_bomber import PlasmaBomber
+from spacegame.config import (
+    SCREEN_WIDTH,
+    SCREEN_HEIGHT,
+    SEPARATION_ITER,
+    ENEMY_SPAWN_INTERVAL,
+    ENEMY_SPAWN_COUNT,
+    STATION_HEALING_RATE,
+    BACKGROUND_SIM_HZ,
+    BACKGROUND_SIM_MAX_STEPS,
+)
+
+
+LIGHT_CRAFTS = (Interceptor, ResourceCollector, PlasmaBomber)
+
+
+def handle_collisions(player_fleet, enemy_fleet, dt):
+    """Handle separation and collision damage between ships."""
+    # Separation: keep ships from overlapping too much
+    for _ in range(SEPARATION_ITER):
+        # Player-player separation
+        for i, a in enumerate(player_fleet):
+            for b in player_fleet[i + 1:]:
+                # Light crafts push each other
+                # but don't push larger ships
+                if isinstance(a, LIGHT_CRAFTS) and isinstance(b, LIGHT_CRAFTS):
+                    Mover.separate_rotated(a, b)
+                elif not isinstance(a, LIGHT_CRAFTS) and not isinstance(b, LIGHT_CRAFTS):
+                    Mover.separate_rotated(a, b)
+
+        # Enemy-enemy separation
+        for i, a in enumerate(enemy_fleet):
+            for b in enemy_fleet[i + 1:]:
+                Mover.separate_rotated(a, b)
+
+        # NEW: Player-enemy separation (so big ships push enemies instead of clipping)
+        for p in player_fleet:
+            for e in enemy_fleet:
+                Mover.separate_rotated(p, e)
+
+    # Player-enemy collision damage (unchanged)
+    for p in player_fleet:
+        for e in enemy_fleet:
+            if p.collides_with(e):
+                dmg = SpaceUnit.COLLISION_DPS * dt
+                if getattr(p, 'max_armor', 0) > 0 and getattr(p, 'armor', 0) > 0:
+                    p.take_armor_damage(dmg)
+                else:
+                    p.take_damage(dmg)
+                if getattr(e, 'max_armor', 0) > 0 and getattr(e, 'armor', 0) > 0:
+                    e.take_armor_damage(dmg)
+                else:
+                    e.take_damage(dmg)
+
+
+def _decide_collector(collector, elapsed: float) -> None:
+    collector.update_healing(elapsed)
+    collector.update_mining(elapsed)
+
+
+def _decide_enemy(e, player_fleet) -> None:
+    closest = min(player_fleet, key=lambda p: (p.pos - e.pos).length_squared())
+    dist = (closest.pos - e.pos).length()
+    if dist > e.fire_range * 0.95:
+        e.mover.set_target(closest.pos)  # approach
+    else:
+        e.mover.set_target(e.pos)  # hold & shoot
+
+
+class BattleStatus(NamedTuple):
+    """Summary of the battle after a step, safe for menus to read."""
+
+    sim_time_s: float = 0.0  # battle time simulated in the background
+    player_ships: int = 0
+    enemies: int = 0
+    projectiles: int = 0
+    mothership_health: float = 0.0
+    mothership_max_health: float = 0.0
+    mothership_lost: bool = False
+
+
+class Battle:
+    """The live battle state `run_game` simulates.
+
+    The fleet lists are updated in place, so callers (and the screens
+    they are passed to) can keep referencing them across steps.
+    """
+
+    def __init__(self, main_player, player_fleet: List, enemy_fleet: List, player_group, enemy_group,
+                 projectile_group, asteroid_field=None, location_data=None, spawn_timer: float = ENEMY_SPAWN_INTERVAL):
+        self.main_player = main_player
+        self.player_fleet = player_fleet
+        self.enemy_fleet = enemy_fleet
+        self.player_group = player_group
+        self.enemy_group = enemy_group
+        self.projectile_group = projectile_group
+        self.asteroid_field = asteroid_field
+        self.location_data = location_data
+        self.spawn_timer = float(spawn_timer)
+
+    def location(self):
+        return (getattr(self.main_player, 'location_system', None), getattr(self.main_player, 'location_area', None))
+
+    def step(self, dt: float, sync_sprites: bool = True) -> None:
+        """Advance the battle by `dt` seconds.
+
+        `sync_sprites=False` skips re-rotating sprite images; the next
+        foreground step brings them up to date before anything is drawn.
+        """
+        main_player = self.main_player
+        player_fleet = self.player_fleet
+        enemy_fleet = self.enemy_fleet
+        location_data = self.location_data
+
+        # Heal player fleet if at a station
+        if location_data and location_data.get('type') == 'Station':
+            healing_rate = float(STATION_HEALING_RATE)  # HP per second
+            for ship in player_fleet:
+                if ship.health < ship.max_health:
+                    ship.heal(healing_rate * dt)
+                if ship.armor < ship.max_armor:
+                    ship.set_armor(ship.armor + healing_rate * dt)
+
+        # --- Update cooldowns ---
+        for s in player_fleet + enemy_fleet:
+            s.update_cooldown(dt)
+        # Finalize fabrication / refining jobs that came due (a heap peek
+        # when none did, however many modules are installed)
+        try:
+            get_job_scheduler().run_due()
+        except Exception:
+            pass
+        # Update expedition ship notifications (timers) via InventoryManager
+        try:
+            inv = getattr(main_player, 'inventory_manager', None)
+            if inv is not None:
+                inv.update(dt)
+        except Exception:
+            pass
+
+        # Heal / mine and enemy targeting decisions share a per-frame budget
+        ai = get_ai_scheduler()
+        ai.begin_frame(dt)
+
+        # --- Update healing and mining for resource collectors ---
+        ai.run("collectors", [s for s in player_fleet if isinstance(s, ResourceCollector)], _decide_collector)
+
+        # --- Update movement ---
+        for spaceship in player_fleet:
+            spaceship.mover.update(dt)
+        # --- Handle recalled fighters: fly back to main ship and re-dock ---
+        recalled_done = []
+        for spaceship in player_fleet:
+            if isinstance(spaceship, LIGHT_CRAFTS) and getattr(spaceship, "recalling", False):
+                # Always steer toward the main ship
+                spaceship.mover.set_target(main_player.pos)
+
+                # When close enough, mark for docking
+                if (spaceship.pos - main_player.pos).length() < 50:
+                    recalled_done.append(spaceship)
+
+        for craft in recalled_done:
+            # Remove from active ships; Hangar will take care of internal lists.
+            if craft in player_fleet:
+                player_fleet.remove(craft)
+
+            # Play ship docking sound
+            try:
+                sound_manager = get_sound_manager()
+                sound_manager.on_ship_docking()
+            except Exception:
+                pass
+
+            # Inform the Hangar (via InventoryManager) that this craft has successfully docked
+            # so the corresponding slot becomes ready again.
+            inv = getattr(main_player, 'inventory_manager', None)
+            if inv is None or getattr(inv, 'hangar', None) is None:
+                raise RuntimeError("Hangar/InventoryManager not available on main_player; migration required")
+            inv.hangar.on_recalled(craft)
+            try:
+                # ensure sprite is removed from any drawing groups
+                if isinstance(craft, pygame.sprite.Sprite):
+                    craft.kill()
+            except Exception:
+                pass
+        # Enemies: approach to within range, then hold
+        if player_fleet:
+            ai.run("enemies", enemy_fleet, lambda e, elapsed: _decide_enemy(e, player_fleet))
+        for e in enemy_fleet:
+            e.mover.update(dt)
+
+        # Sync sprite images/rects to mover state
+        if sync_sprites:
+            try:
+                self.player_group.update(dt)
+            except Exception:
+                pass
+            try:
+                self.enemy_group.update(dt)
+            except Exception:
+                pass
+
+        # --- Enemy spawning (timed waves) ---
+        if ENEMY_SPAWN_INTERVAL > 0:
+            self.spawn_timer -= dt
+            if self.spawn_timer <= 0:
+                self.spawn_timer = ENEMY_SPAWN_INTERVAL
+                # Only spawn enemies if at an asteroid location
+                if location_data and location_data.get('type') == 'Asteroids':
+                    # spawn N pirates at random edge positions via helper
+                    spawn_enemy_wave(SCREEN_WIDTH, SCREEN_HEIGHT, location_data, self.enemy_group, enemy_fleet,
+                                     count=ENEMY_SPAWN_COUNT)
+
+        # --- Auto-fire: both sides (delegated to helper) ---
+        handle_auto_fire(player_fleet, enemy_fleet, self.projectile_group, owner_is_enemy=False, color=(255,240,120), speed_factor=1.0)
+        handle_auto_fire(enemy_fleet, player_fleet, self.projectile_group, owner_is_enemy=True, color=(255,120,120), speed_factor=0.9)
+
+        # --- Update projectiles (group) & handle hits ---
+        self.projectile_group.update(dt)
+        # update effects (particles, explosions)
+        try:
+            effects.effects_group.update(dt)
+        except Exception:
+            pass
+
+        handle_projectile_collisions(self.projectile_group, player_fleet, enemy_fleet)
+
+        # Update hangar state for any light crafts that died this frame
+        dead_crafts = [
+            s for s in player_fleet
+            if isinstance(s, LIGHT_CRAFTS) and s.health <= 0.0
+        ]
+        for craft in dead_crafts:
+            inv = getattr(main_player, 'inventory_manager', None)
+            if inv is None or getattr(inv, 'hangar', None) is None:
+                raise RuntimeError("Hangar/InventoryManager not available on main_player; migration required")
+            inv.hangar.on_interceptor_dead(craft)
+
+        # remove sprites for any ships that were destroyed and announce
+        # the losses once (sounds and other subscribers react at end of frame)
+        bus = events.get_event_bus()
+        for fleet, enemy in ((enemy_fleet, True), (player_fleet, False)):
+            dead = [s for s in fleet if s.health <= 0.0]
+            if not dead:
+                continue
+            fleet[:] = [s for s in fleet if s.health > 0.0]
+            for s in dead:
+                bus.post(events.UnitDestroyed(s, enemy=True) if enemy else events.UnitDestroyed(s))
+                try:
+                    s.kill()
+                except Exception:
+                    pass
+
+        # --- Collisions (residual): small damage from touching using class-level DPS ---
+        handle_collisions(player_fleet, enemy_fleet, dt)
+
+    def status(self, sim_time_s: float = 0.0) -> BattleStatus:
+        mp = self.main_player
+        return BattleStatus(
+            sim_time_s=sim_time_s,
+            player_ships=len(self.player_fleet),
+            enemies=len(self.enemy_fleet),
+            projectiles=len(self.projectile_group),
+            mothership_health=float(mp.health),
+            mothership_max_health=float(mp.max_health),
+            mothership_lost=mp.health <= 0,
+        )
+
+
+class BackgroundSimulation:
+    """Steps an attached `Battle` at a fixed rate from the menu loops."""
+
+    def __init__(self, hz: float = BACKGROUND_SIM_HZ, max_steps: int = BACKGROUND_SIM_MAX_STEPS):
+        self.step_s = 1.0 / max(1.0, float(hz))
+        self.max_steps = max(1, int(max_steps))
+        self.battle: Optional[Battle] = None
+        self._location = None
+        self._last_ms = 0
+        self._acc = 0.0
+        self._sim_time = 0.0
+        self._status = BattleStatus()
+        self.steps = 0  # steps taken since creation
+
+    @property
+    def status(self) -> BattleStatus:
+        """Summary published after the latest background step."""
+        return self._status
+
+    def attach(self, battle: Battle) -> None:
+        self.battle = battle
+        self._location = battle.location()
+        self._last_ms = pygame.time.get_ticks()
+        self._acc = 0.0
+        self._sim_time = 0.0
+        self._status = battle.status()
+
+    def detach(self) -> None:
+        self.battle = None
+
+    @contextlib.contextmanager
+    def running(self, battle: Battle):
+        """Keep `battle` running in the background for the duration of the block."""
+        previous = self.battle
+        self.attach(battle)
+        try:
+            yield self
+        finally:
+            self.battle = previous
+
+    def tick(self) -> BattleStatus:
+        """Run the steps that came due since the last call; call once per menu frame."""
+        battle = self.battle
+        if battle is None:
+            return self._status
+        now = pygame.time.get_ticks()
+        self._acc += max(0, now - self._last_ms) / 1000.0
+        self._last_ms = now
+        # the fleet jumped from a map screen: the old battle is left behind
+        if battle.location() != self._location:
+            self._acc = 0.0
+            return self._status
+        if battle.main_player.health <= 0:
+            self._acc = 0.0
+            if not self._status.mothership_lost:
+                self._status = battle.status(self._sim_time)
+            return self._status
+        steps = 0
+        while self._acc >= self.step_s and steps < self.max_steps:
+            battle.step(self.step_s, sync_sprites=False)
+            self._acc -= self.step_s
+            self._sim_time += self.step_s
+            steps += 1
+            if battle.main_player.health <= 0:
+                break
+        if self._acc >= self.step_s:
+            # too far behind (a blocking load or a slow frame): drop the backlog
+            self._acc = 0.0
+        if steps:
+            self.steps += steps
+            self._status = battle.status(self._sim_time)
+            # the game loop is not running: deliver the step's events here
+            events.get_event_bus().dispatch_pending()
+        return self._status
+
+
+# Global singleton instance
+_instance: Optional[BackgroundSimulation] = None
+
+
+def get_background_sim() -> BackgroundSimulation:
+    """Get or create the global background simulation."""
+    global _instance
+    if _instance is None:
+        _instance = BackgroundSimulation()
+    return _instance
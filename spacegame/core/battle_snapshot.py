@@ -0,0 +1,373 @@
+"""Compact binary snapshots of the live battle state.
+
+`capture_battle` packs everything `run_game` simulates into a few hundred
+bytes: both fleets (mover state, health, armor, cooldowns, collector
+mining/healing state, hangar slot), projectiles, the asteroid field's
+mined state, the enemy spawn timer, hangar slots and in-flight
+fabrication / refining jobs. `restore_battle` rebuilds that state in place.
+
+Both run well inside a frame budget: records are fixed-size `struct`
+packs, and restored ships are cloned from a per-class prototype instead of
+re-running the unit constructors (which load and scale sprite images).
+
+Snapshots are bound to a location (system + area); restoring into a
+different location is refused. Used for quick-save / quick-load (F5 / F9)
+and for seeding repeatable benchmark scenarios.
+"""
+import copy
+import json
+import struct
+from typing import List, Optional, Tuple
+
+import pygame
+from pygame.math import Vector2
+
+from spacegame.core import effects
+from spacegame.core.mover import Mover
+from spacegame.core.projectile import Projectile
+from spacegame.core.job_scheduler import now_ms
+from spacegame.core.save_scheduler import record_change
+from spacegame.core.save_journal import job_key
+from spacegame.models.units.expedition_ship import ExpeditionShip
+from spacegame.models.units.frigate import Frigate
+from spacegame.models.units.interceptor import Interceptor
+from spacegame.models.units.resource_collector import ResourceCollector
+from spacegame.models.units.plasma_bomber import PlasmaBomber
+from spacegame.models.units.pirate_frigate import PirateFrigate
+
+
+MAGIC = b"SGBS"
+VERSION = 1
+
+# unit type codes (stable across versions)
+UNIT_TYPES = {
+    ExpeditionShip: 1,
+    Frigate: 2,
+    Interceptor: 3,
+    ResourceCollector: 4,
+    PlasmaBomber: 5,
+    PirateFrigate: 6,
+}
+_UNIT_CLASSES = {code: cls for cls, code in UNIT_TYPES.items()}
+
+# attribute holding the hangar pool id for each light-craft class
+_POOL_ID_ATTR = {
+    Interceptor: "interceptor_id",
+    ResourceCollector: "collector_id",
+    PlasmaBomber: "bomber_id",
+}
+
+_F_SELECTED = 1
+_F_RECALLING = 2
+_F_RETURNING = 4
+_NONE16 = -32768
+
+_HEADER = struct.Struct("<4sHdHHHHH")
+# type, flags, tier, hangar slot, pool id,
+# pos xy, target xy, formation offset xy, angle,
+# health, max health, armor, max armor, cooldown, mining fill,
+# mining target (cx, cy, index), healing target (player index)
+_UNIT = struct.Struct("<BBhbi7d6f4h")
+# pos xy, direction xy, speed, hull, armor, lifetime, radius, rgb, enemy flag
+_PROJECTILE = struct.Struct("<4d5f4B")
+# chunk cx, cy, asteroid index, mined
+_MINED = struct.Struct("<hhhf")
+_HANGAR_SLOT = struct.Struct("<iB")
+_POOL_ALIVE = struct.Struct("<iB")
+_LEN16 = struct.Struct("<H")
+_LEN32 = struct.Struct("<I")
+
+# class -> detached unit used as a clone source on restore
+_PROTOTYPES = {}
+
+
+# ---------- Helpers ----------
+def _pack_str(s: str) -> bytes:
+    raw = str(s or "").encode("utf-8")
+    return _LEN16.pack(len(raw)) + raw
+
+
+def _unpack_str(buf: bytes, off: int) -> Tuple[str, int]:
+    (n,) = _LEN16.unpack_from(buf, off)
+    off += _LEN16.size
+    return buf[off:off + n].decode("utf-8"), off + n
+
+
+def _detached_copy(unit):
+    """Shallow copy of a unit with its own sprite groups, mover and rect."""
+    clone = copy.copy(unit)
+    # reset sprite group membership shared by the shallow copy
+    pygame.sprite.Sprite.__init__(clone)
+    m = unit.mover
+    clone.mover = Mover(m.world_pos, ship_size=m.ship_size, speed=m.speed, rotation_speed=m.rotation_speed)
+    clone.rect = unit.rect.copy()
+    return clone
+
+
+def _remember_prototype(unit) -> None:
+    cls = type(unit)
+    if cls not in _PROTOTYPES and cls is not ExpeditionShip:
+        _PROTOTYPES[cls] = _detached_copy(unit)
+
+
+def _new_unit(cls):
+    proto = _PROTOTYPES.get(cls)
+    if proto is None:
+        # no live instance seen yet (e.g. a snapshot loaded from disk)
+        proto = cls((0, 0))
+        _PROTOTYPES[cls] = proto
+    return _detached_copy(proto)
+
+
+def _pool_id(unit) -> int:
+    attr = _POOL_ID_ATTR.get(type(unit))
+    value = getattr(unit, attr, None) if attr else None
+    return -1 if value is None else int(value)
+
+
+def _jobs_blob(main_player) -> bytes:
+    from spacegame.core.fabrication import get_fabrication_manager, fabrication_job_payload
+    from spacegame.core.refining import get_refinery_manager, refinement_job_payload
+
+    now = now_ms()
+    jobs = {}
+    for kind, mgr, payload in (
+        ("fab", get_fabrication_manager(main_player), fabrication_job_payload),
+        ("ref", get_refinery_manager(main_player), refinement_job_payload),
+    ):
+        for module in mgr.get_modules() or []:
+            job = payload(module)
+            if job is not None:
+                job["elapsed_ms"] = max(0, now - int(job.get("start_ticks", now)))
+                # keyed by module id like the save, so layout changes don't move jobs
+                jobs[job_key(kind, module.module_id)] = job
+    return json.dumps(jobs, separators=(",", ":")).encode("utf-8")
+
+
+def _restore_jobs(main_player, raw: bytes) -> None:
+    from spacegame.core.fabrication import get_fabrication_manager, fabrication_job_payload, restore_fabrication_job
+    from spacegame.core.refining import get_refinery_manager, refinement_job_payload, restore_refinement_job
+
+    jobs = json.loads(raw.decode("utf-8")) if raw else {}
+    now = now_ms()
+
+    fm = get_fabrication_manager(main_player)
+    rm = get_refinery_manager(main_player)
+    for kind, mgr, payload, restore in (
+        ("fab", fm, fabrication_job_payload, restore_fabrication_job),
+        ("ref", rm, refinement_job_payload, restore_refinement_job),
+    ):
+        mgr.player = main_player
+        for i, module in enumerate(mgr.get_modules() or []):
+            job = jobs.get(job_key(kind, module.module_id))
+            if job is None:
+                # snapshots from before module ids keyed jobs by position
+                job = jobs.get(f"{kind}:{i}")
+            restore(module, job, now - int(job.get("elapsed_ms", 0)) if job else 0)
+            record_change("job", kind=kind, module=module.module_id, job=payload(module))
+
+    # the restored jobs replace whatever the scheduler was tracking
+    fm.sync_jobs()
+    rm.sync_jobs()
+
+
+# ---------- Capture ----------
+def capture_battle(main_player, player_fleet, enemy_fleet, projectile_group,
+                   asteroid_field=None, spawn_timer: float = 0.0) -> bytes:
+    """Return a binary snapshot of the current battle state."""
+    asteroid_index = {}
+    if asteroid_field is not None:
+        for key, loaded in asteroid_field.chunks.items():
+            for index, a in loaded:
+                asteroid_index[id(a)] = (key[0], key[1], index)
+    player_index = {id(s): i for i, s in enumerate(player_fleet)}
+
+    units = []
+    for unit in list(player_fleet) + list(enemy_fleet):
+        code = UNIT_TYPES.get(type(unit))
+        if code is None:
+            continue
+        _remember_prototype(unit)
+        m = unit.mover
+        flags = 0
+        if m.is_selected:
+            flags |= _F_SELECTED
+        if getattr(unit, "recalling", False):
+            flags |= _F_RECALLING
+        if getattr(unit, "returning_to_ship", False):
+            flags |= _F_RETURNING
+        mine = asteroid_index.get(id(getattr(unit, "mining_target", None)), (_NONE16, _NONE16, _NONE16))
+        heal = player_index.get(id(getattr(unit, "healing_target", None)), -1)
+        slot = getattr(unit, "hangar_slot", None)
+        units.append(_UNIT.pack(
+            code, flags, int(getattr(unit, "tier", 0) or 0), -1 if slot is None else int(slot), _pool_id(unit),
+            m.world_pos.x, m.world_pos.y, m.target_pos.x, m.target_pos.y,
+            m.formation_offset.x, m.formation_offset.y, m.angle,
+            unit.health, unit.max_health, unit.armor, unit.max_armor, unit.cooldown_timer,
+            float(getattr(unit, "mining_fill", 0.0)),
+            mine[0], mine[1], mine[2], heal,
+        ))
+
+    projectiles = []
+    for p in projectile_group:
+        r, g, b = tuple(p.color)[:3]
+        projectiles.append(_PROJECTILE.pack(
+            p.pos.x, p.pos.y, p.direction.x, p.direction.y,
+            p.speed, p.hull_damage, p.armor_damage, p.lifetime, p.radius,
+            r, g, b, 1 if p.owner_is_enemy else 0,
+        ))
+
+    mined = []
+    if asteroid_field is not None:
+        for (cx, cy), delta in asteroid_field.mined_state().items():
+            for index, amount in delta.items():
+                mined.append(_MINED.pack(cx, cy, index, amount))
+
+    hangar = main_player.hangar_system
+    slots = [_HANGAR_SLOT.pack(-1 if a is None else int(a), 1 if ready else 0)
+             for a, ready in zip(hangar.assignments, hangar.slots)]
+    pool = [_POOL_ALIVE.pack(int(e.id), 1 if e.alive else 0) for e in hangar.pool]
+
+    jobs = _jobs_blob(main_player)
+
+    parts = [
+        _HEADER.pack(MAGIC, VERSION, float(spawn_timer), len(units), len(projectiles), len(mined), len(slots), len(pool)),
+        _pack_str(getattr(main_player, "location_system", "")),
+        _pack_str(getattr(main_player, "location_area", "")),
+    ]
+    parts.extend(units)
+    parts.extend(projectiles)
+    parts.extend(mined)
+    parts.extend(slots)
+    parts.extend(pool)
+    parts.append(_LEN32.pack(len(jobs)))
+    parts.append(jobs)
+    return b"".join(parts)
+
+
+# ---------- Restore ----------
+def restore_battle(blob: bytes, main_player, player_group, enemy_group, projectile_group,
+                   asteroid_field=None) -> Optional[Tuple[List, List, float]]:
+    """Restore a snapshot from `capture_battle` into the running battle.
+
+    Refills the sprite groups and returns (player_fleet, enemy_fleet,
+    spawn_timer) for the caller's loop state, or None if the snapshot is
+    invalid or was taken at another location.
+    """
+    try:
+        magic, version, spawn_timer, n_units, n_proj, n_mined, n_slots, n_pool = _HEADER.unpack_from(blob, 0)
+    except struct.error:
+        return None
+    if magic != MAGIC or version != VERSION:
+        return None
+    off = _HEADER.size
+    system, off = _unpack_str(blob, off)
+    area, off = _unpack_str(blob, off)
+    if system != str(getattr(main_player, "location_system", "")) or area != str(getattr(main_player, "location_area", "")):
+        return None
+
+    unit_records = list(_UNIT.iter_unpack(blob[off:off + n_units * _UNIT.size]))
+    off += n_units * _UNIT.size
+    proj_records = _PROJECTILE.iter_unpack(blob[off:off + n_proj * _PROJECTILE.size])
+    off += n_proj * _PROJECTILE.size
+    mined_records = _MINED.iter_unpack(blob[off:off + n_mined * _MINED.size])
+    off += n_mined * _MINED.size
+    slot_records = list(_HANGAR_SLOT.iter_unpack(blob[off:off + n_slots * _HANGAR_SLOT.size]))
+    off += n_slots * _HANGAR_SLOT.size
+    pool_records = _POOL_ALIVE.iter_unpack(blob[off:off + n_pool * _POOL_ALIVE.size])
+    off += n_pool * _POOL_ALIVE.size
+    (n_jobs,) = _LEN32.unpack_from(blob, off)
+    off += _LEN32.size
+    jobs_raw = blob[off:off + n_jobs]
+
+    # asteroids first so collectors can re-acquire their mining targets
+    if asteroid_field is not None:
+        state = {}
+        for cx, cy, index, amount in mined_records:
+            state.setdefault((cx, cy), {})[index] = float(amount)
+        asteroid_field.restore_mined_state(state)
+
+    for group in (player_group, enemy_group, projectile_group):
+        group.empty()
+    try:
+        effects.effects_group.empty()
+    except Exception:
+        pass
+
+    player_fleet = []
+    enemy_fleet = []
+    heal_links = []
+    hangar = main_player.hangar_system
+    hangar.ships = [None] * hangar.num_slots
+    hangar.deployed = []
+
+    for (code, flags, tier, slot, pool_id, px, py, tx, ty, fx, fy, angle,
+         health, max_health, armor, max_armor, cooldown, fill, mcx, mcy, midx, heal) in unit_records:
+        cls = _UNIT_CLASSES.get(code)
+        if cls is None:
+            continue
+        unit = main_player if cls is ExpeditionShip else _new_unit(cls)
+        m = unit.mover
+        m.world_pos = Vector2(px, py)
+        m.target_pos = Vector2(tx, ty)
+        m.formation_offset = Vector2(fx, fy)
+        m.angle = angle
+        m.is_selected = bool(flags & _F_SELECTED) and not unit.is_enemy
+        unit.max_health = max_health
+        unit.health = health
+        unit.max_armor = max_armor
+        unit.armor = armor
+        unit.cooldown_timer = cooldown
+        unit._last_angle_for_mask = None
+        if cls is not ExpeditionShip and hasattr(unit, "tier"):
+            unit.tier = tier
+        attr = _POOL_ID_ATTR.get(cls)
+        if attr:
+            setattr(unit, attr, None if pool_id < 0 else pool_id)
+            unit.recalling = bool(flags & _F_RECALLING)
+            unit.hangar_slot = None if slot < 0 else slot
+            unit.mothership = main_player
+            if unit.hangar_slot is not None and 0 <= unit.hangar_slot < hangar.num_slots:
+                hangar.ships[unit.hangar_slot] = unit
+                hangar.deployed.append(unit)
+        if cls is ResourceCollector:
+            unit.mining_fill = fill
+            unit.returning_to_ship = bool(flags & _F_RETURNING)
+            unit.mining_target = None
+            if midx != _NONE16 and asteroid_field is not None:
+                unit.mining_target = asteroid_field.find(mcx, mcy, midx)
+            unit.healing_target = None
+            heal_links.append((unit, heal))
+        unit.update(0.0)
+        if unit.is_enemy or cls is PirateFrigate:
+            enemy_fleet.append(unit)
+            enemy_group.add(unit)
+        else:
+            player_fleet.append(unit)
+            player_group.add(unit)
+
+    for unit, heal in heal_links:
+        if 0 <= heal < len(player_fleet):
+            unit.healing_target = player_fleet[heal]
+
+    for px, py, dx, dy, speed, hull, armor, lifetime, radius, r, g, b, enemy in proj_records:
+        proj = Projectile((px, py), (dx, dy), speed=speed, radius=int(radius), hull_damage=hull,
+                          armor_damage=armor, color=(r, g, b), lifetime=lifetime, owner_is_enemy=bool(enemy))
+        projectile_group.add(proj)
+
+    # hangar bookkeeping tied to the deployed crafts
+    for i, (assigned, ready) in enumerate(slot_records[:hangar.num_slots]):
+        hangar.assignments[i] = None if assigned < 0 else assigned
+        hangar.slots[i] = bool(ready)
+    hangar._journal_slots()
+    for entry_id, alive in pool_records:
+        entry = hangar.get_entry_by_id(entry_id)
+        if entry is not None:
+            hangar.set_alive(entry, bool(alive))
+
+    try:
+        _restore_jobs(main_player, jobs_raw)
+    except Exception:
+        pass
+
+    return player_fleet, enemy_fleet, float(spawn_timer)
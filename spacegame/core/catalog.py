@@ -0,0 +1,176 @@
+"""Catalog of blueprint, module and ore types with indexed queries.
+
+Each type is registered once with a prototype instance. The catalog keeps
+secondary indexes on tier, rarity, unit type, allowed section, required ore
+and free-form tags, so a filter query only touches the entries of its most
+selective index:
+
+    catalog = get_catalog()
+    catalog.query("blueprint", tag="shipyard")
+    catalog.query("module", section=1, sort_by="tier")
+    catalog.query("blueprint", ore="M", tier=0)
+
+Query results are memoized until the next registration, so screens can ask
+every frame. Mods and procedural tiers add entries with `register()`.
+"""
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+
+KINDS = ("blueprint", "module", "ore")
+# Entry fields with a secondary index (tuple fields index each element)
+_INDEXED = ("kind", "tier", "rarity", "unit_type", "sections", "ores", "tags")
+
+
+class CatalogEntry(NamedTuple):
+    """One registered type and the facts the indexes are built from."""
+
+    kind: str
+    key: str  # class name, or the inventory key for ores ("M", "RA", ...)
+    cls: type
+    prototype: Any  # shared instance; screens read from it, never mutate it
+    name: str
+    tier: int
+    rarity: str
+    unit_type: Optional[str]
+    sections: Tuple[int, ...]
+    ores: Tuple[str, ...]
+    tags: Tuple[str, ...]
+    order: int  # registration order, the default sort
+
+
+def _required_ores(bp) -> Tuple[str, ...]:
+    resources = getattr(bp, "required_resources", None)
+    if isinstance(resources, dict):
+        return tuple(str(k) for k in resources)
+    letter = getattr(bp, "required_ore_letter", None)
+    return (letter,) if letter else ()
+
+
+class Catalog:
+    """Registered types plus per-field indexes and a query memo."""
+
+    def __init__(self):
+        self.entries: List[CatalogEntry] = []
+        self._by_key: Dict[Tuple[str, str], CatalogEntry] = {}
+        self._index: Dict[Tuple[str, Any], List[CatalogEntry]] = {}
+        self._memo: Dict[tuple, Tuple[CatalogEntry, ...]] = {}
+        self.version = 0
+
+    def register(self, kind: str, cls: type, key: Optional[str] = None, tags=(), prototype=None) -> CatalogEntry:
+        """Register `cls` under `kind`; re-registering a key replaces the old entry."""
+        if kind not in KINDS:
+            raise ValueError(f"unknown catalog kind {kind!r}")
+        obj = prototype if prototype is not None else cls()
+        key = key or cls.__name__
+        unit_cls = getattr(obj, "unit_class", None)
+        entry = CatalogEntry(
+            kind=kind,
+            key=key,
+            cls=cls,
+            prototype=obj,
+            name=str(getattr(obj, "name", key)),
+            tier=int(getattr(obj, "tier", 0)),
+            rarity=str(getattr(obj, "rarity", "COMMON")).upper(),
+            unit_type=unit_cls.__name__ if unit_cls is not None else None,
+            sections=tuple(getattr(obj, "allowed_sections", ()) or ()),
+            ores=_required_ores(obj) if kind == "blueprint" else (key,),
+            tags=tuple(tags),
+            order=len(self.entries),
+        )
+        old = self._by_key.get((kind, key))
+        self._by_key[(kind, key)] = entry
+        if old is None:
+            self.entries.append(entry)
+            self._add_to_index(entry)
+        else:
+            # keep the replaced entry's position
+            entry = entry._replace(order=old.order)
+            self._by_key[(kind, key)] = entry
+            self.entries = [entry if e is old else e for e in self.entries]
+            self._reindex()
+        self._memo.clear()
+        self.version += 1
+        return entry
+
+    def _add_to_index(self, entry: CatalogEntry) -> None:
+        for field in _INDEXED:
+            value = getattr(entry, field)
+            values = value if isinstance(value, tuple) else (value,)
+            for v in values:
+                self._index.setdefault((field, v), []).append(entry)
+
+    def _reindex(self) -> None:
+        self._index.clear()
+        for entry in self.entries:
+            self._add_to_index(entry)
+
+    def get(self, kind: str, key: str) -> Optional[CatalogEntry]:
+        return self._by_key.get((kind, key))
+
+    def query(self, kind: Optional[str] = None, *, tier: Optional[int] = None, rarity: Optional[str] = None,
+              unit_type: Optional[str] = None, section: Optional[int] = None, ore: Optional[str] = None,
+              tag: Optional[str] = None, sort_by: Optional[str] = None, reverse: bool = False) -> Tuple[CatalogEntry, ...]:
+        """Entries matching every given filter, in registration order unless `sort_by` names a field."""
+        memo_key = (kind, tier, rarity, unit_type, section, ore, tag, sort_by, reverse)
+        result = self._memo.get(memo_key)
+        if result is not None:
+            return result
+        filters = [
+            (field, value) for field, value in (
+                ("kind", kind), ("tier", tier), ("rarity", rarity.upper() if rarity else None),
+                ("unit_type", unit_type), ("sections", section), ("ores", ore), ("tags", tag),
+            ) if value is not None
+        ]
+        if not filters:
+            matches = list(self.entries)
+        else:
+            # scan the smallest index, check the rest by set membership
+            buckets = sorted((self._index.get(f, []) for f in filters), key=len)
+            others = [set(map(id, b)) for b in buckets[1:]]
+            matches = [e for e in buckets[0] if all(id(e) in s for s in others)]
+            matches.sort(key=lambda e: e.order)
+        if sort_by:
+            matches.sort(key=lambda e: (getattr(e, sort_by), e.order), reverse=reverse)
+        result = tuple(matches)
+        self._memo[memo_key] = result
+        return result
+
+    def prototypes(self, kind: Optional[str] = None, **filters) -> List[Any]:
+        """Shared instances for `query(kind, **filters)`."""
+        return [e.prototype for e in self.query(kind, **filters)]
+
+
+def _register_defaults(catalog: Catalog) -> None:
+    from spacegame.models.blueprints.interceptorblueprint import BPInterceptor
+    from spacegame.models.blueprints.plasmabomberblueprint import BPPlasmaBomber
+    from spacegame.models.blueprints.resourcecollectorblueprint import BPResourceCollector
+    from spacegame.models.blueprints.refineryblueprint import BPRefinery
+    from spacegame.models.blueprints.fabricatorblueprint import BPFabricator
+    from spacegame.models.blueprints.escortfrigateblueprint import BPEscortFrigate
+    from spacegame.models.modules.fabricatormodule import FabricatorModule
+    from spacegame.models.modules.refinerymodule import RefineryModule
+    from spacegame.core.production import ORE_CLASSES, REFINED_CLASSES
+
+    # fabricator blueprints in their display order; large ships need a shipyard
+    for cls in (BPInterceptor, BPPlasmaBomber, BPResourceCollector, BPRefinery, BPFabricator):
+        catalog.register("blueprint", cls, tags=("fabricator",))
+    catalog.register("blueprint", BPEscortFrigate, tags=("shipyard",))
+    for cls in (FabricatorModule, RefineryModule):
+        catalog.register("module", cls)
+    for key, cls in ORE_CLASSES.items():
+        catalog.register("ore", cls, key=key, tags=("raw",))
+    for key, cls in REFINED_CLASSES.items():
+        catalog.register("ore", cls, key=key, tags=("refined",))
+
+
+# Global singleton instance
+_instance: Optional[Catalog] = None
+
+
+def get_catalog() -> Catalog:
+    """Get or create the global catalog (built-in types registered on first use)."""
+    global _instance
+    if _instance is None:
+        _instance = Catalog()
+        _register_defaults(_instance)
+    return _instance
@@ -0,0 +1,236 @@
+"""Schema-driven codecs for persisted game objects.
+
+Persistable classes declare what they save:
+
+- ``PERSIST_FIELDS``: attribute names written to the save.
+- ``PERSIST_VERSION``: bumped when the field list changes; older records
+  are passed through ``migrate_persisted(fields, version)`` when the class
+  defines it.
+- ``PERSIST_TRANSIENT`` (optional): runtime-only attributes that are
+  deliberately not saved.
+
+Classes are registered with `register_type` (the model base classes do this
+for every subclass). For each type a dedicated encode and decode function
+is generated once, on first use, so per-object work is a handful of
+attribute reads/writes; decoding never imports modules or guesses
+constructor arguments.
+
+Decoded objects start from a copy of a default-constructed template, so
+constructor-defined constants (allowed sections, blueprint costs, ...) are
+present without being saved. An attribute that is neither persisted,
+transient nor set by the constructor is reported once per type, so newly
+added state is not dropped silently.
+
+Encoded form: ``{"t": type_id, "v": version, "f": {field: value}}``. The
+older reflective format (``{"__class__", "__module__", "attrs"}``) is still
+decoded.
+"""
+import copy
+import dataclasses
+import pkgutil
+import importlib
+from typing import Any, Callable, Dict, Optional
+
+
+# Packages whose modules define persistable classes; imported once before
+# the first decode so every type is registered.
+_MODEL_PACKAGES = (
+    "spacegame.models.modules",
+    "spacegame.models.blueprints",
+    "spacegame.models.ores",
+    "spacegame.models.resources",
+)
+
+
+class _Codec:
+    __slots__ = ("cls", "type_id", "version", "fields", "encode", "decode", "known", "reported")
+
+    def __init__(self, cls, type_id: str, version: int, fields: tuple):
+        self.cls = cls
+        self.type_id = type_id
+        self.version = version
+        self.fields = fields
+        self.encode: Optional[Callable[[Any], dict]] = None
+        self.decode: Optional[Callable[[dict], Any]] = None
+        self.known: Optional[frozenset] = None
+        self.reported = set()
+
+
+_REGISTRY: Dict[type, _Codec] = {}
+_BY_ID: Dict[str, _Codec] = {}
+_models_imported = False
+
+
+def register_type(cls, type_id: Optional[str] = None):
+    """Register `cls` as persistable; usable as a class decorator."""
+    tid = type_id or cls.__name__
+    existing = _BY_ID.get(tid)
+    if existing is not None and existing.cls is not cls:
+        raise ValueError(f"Duplicate persisted type id '{tid}' ({existing.cls!r} and {cls!r})")
+    codec = _Codec(cls, tid, int(getattr(cls, "PERSIST_VERSION", 1)), tuple(getattr(cls, "PERSIST_FIELDS", ())))
+    _REGISTRY[cls] = codec
+    _BY_ID[tid] = codec
+    return cls
+
+
+def _import_models() -> None:
+    global _models_imported
+    if _models_imported:
+        return
+    _models_imported = True
+    for pkg_name in _MODEL_PACKAGES:
+        try:
+            pkg = importlib.import_module(pkg_name)
+            for info in pkgutil.iter_modules(pkg.__path__):
+                try:
+                    importlib.import_module(f"{pkg_name}.{info.name}")
+                except Exception:
+                    continue
+        except Exception:
+            continue
+
+
+# ---------- Code generation ----------
+def _compile(codec: _Codec) -> None:
+    """Generate the encode/decode functions for `codec`'s type."""
+    cls = codec.cls
+    fields = codec.fields
+    ns: Dict[str, Any] = {"cls": cls, "codec": codec, "_migrate": _migrate, "_check": _check_undeclared}
+
+    items = ", ".join(f"{f!r}: getattr(o, {f!r}, None)" for f in fields)
+    enc_src = (
+        "def encode(o):\n"
+        "    if o.__dict__.keys() - codec.known:\n"
+        "        _check(codec, o)\n"
+        f"    return {{'t': {codec.type_id!r}, 'v': {codec.version}, 'f': {{{items}}}}}\n"
+    )
+
+    if dataclasses.is_dataclass(cls):
+        # dataclasses are built through their constructor
+        ns["_init"] = tuple(f.name for f in dataclasses.fields(cls) if f.init and f.name in fields)
+        dec_src = (
+            "def decode(f, v):\n"
+            f"    if v != {codec.version}:\n"
+            "        f = _migrate(codec, f, v)\n"
+            "    return cls(**{k: f[k] for k in _init if k in f})\n"
+        )
+        defaults = frozenset(f.name for f in dataclasses.fields(cls))
+    else:
+        # start from a default instance so constructor constants are present
+        template = vars(cls())
+        ns["_template"] = template
+        ns["_copy"] = copy.copy
+        ns["_new"] = object.__new__
+        mutable = [k for k, val in template.items() if isinstance(val, (list, dict, set))]
+        lines = [
+            "def decode(f, v):",
+            f"    if v != {codec.version}:",
+            "        f = _migrate(codec, f, v)",
+            "    o = _new(cls)",
+            "    d = o.__dict__",
+            "    d.update(_template)",
+        ]
+        for k in mutable:
+            lines.append(f"    d[{k!r}] = _copy(_template[{k!r}])")
+        for name in fields:
+            lines.append(f"    if {name!r} in f: d[{name!r}] = f[{name!r}]")
+        lines.append("    return o")
+        dec_src = "\n".join(lines) + "\n"
+        defaults = frozenset(template)
+
+    codec.known = defaults | frozenset(fields) | frozenset(getattr(cls, "PERSIST_TRANSIENT", ()))
+    exec(compile(enc_src + dec_src, f"<codec {codec.type_id}>", "exec"), ns)
+    codec.encode = ns["encode"]
+    codec.decode = ns["decode"]
+
+
+def _migrate(codec: _Codec, fields: dict, version: int) -> dict:
+    migrate = getattr(codec.cls, "migrate_persisted", None)
+    if migrate is not None:
+        try:
+            return migrate(dict(fields), int(version))
+        except Exception:
+            pass
+    return fields
+
+
+def _check_undeclared(codec: _Codec, o) -> None:
+    missing = set(o.__dict__.keys() - codec.known) - codec.reported
+    if missing:
+        codec.reported |= missing
+        print(f"Warning: {codec.type_id} attributes not persisted: {', '.join(sorted(missing))} "
+              f"(add them to PERSIST_FIELDS or PERSIST_TRANSIENT)")
+
+
+def _codec_for_type(cls) -> Optional[_Codec]:
+    codec = _REGISTRY.get(cls)
+    if codec is not None and codec.encode is None:
+        _compile(codec)
+    return codec
+
+
+def _codec_for_id(type_id: str) -> Optional[_Codec]:
+    codec = _BY_ID.get(type_id)
+    if codec is None:
+        _import_models()
+        codec = _BY_ID.get(type_id)
+    if codec is not None and codec.encode is None:
+        _compile(codec)
+    return codec
+
+
+# ---------- Public API ----------
+def is_persistable(o: Any) -> bool:
+    return type(o) in _REGISTRY
+
+
+def encode(o: Any) -> Optional[dict]:
+    """Encode a registered object; returns None for None or unregistered types."""
+    if o is None:
+        return None
+    codec = _codec_for_type(type(o))
+    if codec is None:
+        return None
+    return codec.encode(o)
+
+
+def decode(d: Any, default_type: Optional[str] = None) -> Any:
+    """Decode a record produced by `encode` (or the legacy reflective format).
+
+    `default_type` names the type of bare field dicts, e.g. hangar pool
+    entries written by older saves. Returns None if the record cannot be
+    decoded.
+    """
+    if not isinstance(d, dict):
+        return None
+    try:
+        if "t" in d:
+            codec = _codec_for_id(d["t"])
+            fields, version = d.get("f") or {}, d.get("v", 1)
+        elif "__class__" in d:
+            # legacy reflective format: keep only declared fields
+            codec = _codec_for_id(d.get("__class__"))
+            fields, version = d.get("attrs") or {}, None
+        elif default_type is not None:
+            codec = _codec_for_id(default_type)
+            fields, version = d, None
+        else:
+            return None
+        if codec is None:
+            return None
+        if version is None:
+            version = codec.version
+        return codec.decode(fields, version)
+    except Exception:
+        return None
+
+
+def fields_of(d: Any) -> dict:
+    """Return the field dict of an encoded (or bare / legacy) record."""
+    if not isinstance(d, dict):
+        return {}
+    if "t" in d:
+        return d.get("f") or {}
+    if "__class__" in d:
+        return d.get("attrs") or {}
+    return d
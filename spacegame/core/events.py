@@ -1,4 +1,6 @@
 import pygame
+from collections import defaultdict, deque
+from typing import Any, Callable, Deque, Dict, List, NamedTuple, Optional
 
 # Custom event types for the game. Uses pygame.USEREVENT range.
 # Consumers should call `make_save_game_event(owner)` to create an event
@@ -14,3 +16,128 @@ def make_save_game_event(owner):
     that should be persisted (typically the `ExpeditionShip`).
     """
     return pygame.event.Event(SAVE_GAME_EVENT, {"owner": owner})
+
+
+# ---------- In-process event bus ----------
+# Game systems publish what happened (a unit died, ore was delivered, a job
+# finished, the fleet jumped) once, and interested systems (sound, HUD
+# notifications, saves, telemetry) subscribe to the event type instead of
+# being called directly or polling for the change.
+
+class UnitDestroyed(NamedTuple):
+    """A ship was destroyed this frame."""
+
+    unit: Any
+    enemy: bool = False
+
+
+class CollectorFull(NamedTuple):
+    """A resource collector filled its hold and is heading home."""
+
+    collector: Any
+
+
+class ResourceDelivered(NamedTuple):
+    """A resource collector unloaded ore into the mothership."""
+
+    collector: Any
+    ore_letter: str
+    amount: int
+
+
+class JobFinished(NamedTuple):
+    """A fabrication ("fab") or refining ("ref") job completed.
+
+    `offline` jobs finished while the game was closed and were settled on
+    load; they are summarized in one notification instead of announced.
+    """
+
+    kind: str
+    slot: int
+    player: Any
+    title: str = ""
+    preview: Optional[str] = None
+    offline: bool = False
+
+
+class LocationChanged(NamedTuple):
+    """The fleet arrived at a new system / area (after the jump cinematic)."""
+
+    player: Any
+    prev_system: Optional[str]
+    prev_area: Optional[str]
+    system: Optional[str]
+    area: Optional[str]
+
+
+class EventBus:
+    """Typed publish/subscribe with synchronous and end-of-frame dispatch.
+
+    Handlers are registered per event class. `publish(event)` calls them
+    immediately; `post(event)` queues the event until `dispatch_pending()`,
+    which the game loop calls once per frame. A failing handler is reported
+    and skipped so it cannot break the publisher or other subscribers.
+    """
+
+    # events posted while dispatching are handled in the same pass, up to this many
+    MAX_DISPATCH = 1000
+
+    def __init__(self):
+        self._handlers: Dict[type, List[Callable[[Any], None]]] = defaultdict(list)
+        self._queue: Deque[Any] = deque()
+        self.counts: Dict[str, int] = defaultdict(int)
+        self.handler_errors = 0
+
+    def subscribe(self, event_type: type, handler: Callable[[Any], None]) -> Callable[[Any], None]:
+        """Call `handler(event)` for every `event_type` event; returns the handler."""
+        handlers = self._handlers[event_type]
+        if handler not in handlers:
+            handlers.append(handler)
+        return handler
+
+    def unsubscribe(self, event_type: type, handler: Callable[[Any], None]) -> None:
+        try:
+            self._handlers[event_type].remove(handler)
+        except ValueError:
+            pass
+
+    def publish(self, event: Any) -> None:
+        """Dispatch `event` to its subscribers now."""
+        self.counts[type(event).__name__] += 1
+        for handler in list(self._handlers.get(type(event), ())):
+            try:
+                handler(event)
+            except Exception as e:
+                self.handler_errors += 1
+                print(f"Event handler {getattr(handler, '__qualname__', handler)} failed for {type(event).__name__}: {e}")
+
+    def post(self, event: Any) -> None:
+        """Queue `event` for the end-of-frame dispatch."""
+        self._queue.append(event)
+
+    def dispatch_pending(self) -> int:
+        """Publish queued events in order; returns how many were dispatched."""
+        dispatched = 0
+        while self._queue and dispatched < self.MAX_DISPATCH:
+            self.publish(self._queue.popleft())
+            dispatched += 1
+        return dispatched
+
+    def get_metrics(self) -> Dict[str, int]:
+        """Return per-event-type publish counts for profiling overlays and logs."""
+        metrics = dict(self.counts)
+        metrics["queued"] = len(self._queue)
+        metrics["handler_errors"] = self.handler_errors
+        return metrics
+
+
+# Global singleton instance
+_bus: Optional[EventBus] = None
+
+
+def get_event_bus() -> EventBus:
+    """Get or create the global event bus."""
+    global _bus
+    if _bus is None:
+        _bus = EventBus()
+    return _bus
@@ -1,17 +1,61 @@
-import pygame
 from typing import List
 from spacegame.models.modules.fabricatormodule import FabricatorModule
 from spacegame.core.modules_manager import manager as modules_manager
 from spacegame.core.hangar import HangarEntry
-from spacegame.core.sound_manager import get_sound_manager
+from spacegame.core import events
+from spacegame.core.save_scheduler import record_change
+from spacegame.core.codec import encode, decode
+from spacegame.core.job_scheduler import get_job_scheduler, now_ms
+from spacegame.core.game_clock import get_game_clock
+from spacegame.core.production import get_production_graph
+
+
+def fabrication_job_payload(module):
+    """Return the persisted description of `module`'s job, or None when idle.
+
+    `due` is the absolute game-time deadline; `anchor` pairs game time with
+    wall time so a later session can tell how much time passed.
+    """
+    bp = getattr(module, "fabrication_blueprint", None)
+    if bp is None:
+        return None
+    total_ms = int(getattr(module, "fabrication_total_ms", 0))
+    start_ticks = int(getattr(module, "fabrication_start_ticks", 0))
+    return {
+        "blueprint": encode(bp),
+        "total_ms": total_ms,
+        "start_ticks": start_ticks,
+        "due": start_ticks + total_ms,
+        "anchor": get_game_clock().anchor(),
+    }
+
+
+def restore_fabrication_job(module, job, start_ms: int) -> bool:
+    """Load a persisted job description into `module` (cleared when `job` is None).
+
+    Returns True if the module now has a running job.
+    """
+    bp = decode(job.get("blueprint")) if job else None
+    if bp is None:
+        module.fabrication_total_ms = 0
+        module.fabrication_start_ticks = 0
+        module.fabrication_blueprint = None
+        module.fabrication_progress = 0.0
+        return False
+    module.fabrication_total_ms = int(job.get("total_ms", 0))
+    module.fabrication_start_ticks = int(start_ms)
+    module.fabrication_blueprint = bp
+    module.fabrication_progress = 0.0
+    return True
 
 
 class FabricationManager:
     """Manage fabricator modules and fabrication timers for a player/ship.
 
     The manager holds module instances and exposes helper methods to start,
-    cancel, and speed-up fabrications. It also computes progress so UI
-    screens can read consistent, persistent values.
+    cancel, and speed-up fabrications. Running jobs are registered with the
+    central `JobScheduler`, which finalizes them when they are due; progress
+    reads for UI come from the scheduler.
     """
 
     def __init__(self):
@@ -30,6 +74,36 @@ class FabricationManager:
             return mods[index]
         return None
 
+    # ---- Scheduling ----
+    @staticmethod
+    def _job_key(module):
+        return ("fab", id(module))
+
+    def _schedule(self, module) -> None:
+        """Register `module`'s running fabrication with the job scheduler."""
+        get_job_scheduler().schedule(
+            self._job_key(module),
+            int(module.fabrication_start_ticks),
+            int(module.fabrication_total_ms),
+            lambda: self._on_job_due(module),
+        )
+
+    def _on_job_due(self, module) -> None:
+        # look the slot up now; modules may have moved since the job started
+        for i, m in enumerate(self.get_modules() or []):
+            if m is module:
+                self._finalize_module(i)
+                return
+
+    def sync_jobs(self) -> None:
+        """Re-register jobs after module state was restored from a save or snapshot."""
+        scheduler = get_job_scheduler()
+        for module in self.get_modules() or []:
+            if getattr(module, "fabrication_blueprint", None) is not None and int(getattr(module, "fabrication_total_ms", 0)) > 0:
+                self._schedule(module)
+            else:
+                scheduler.cancel(self._job_key(module))
+
     def start_fabrication(self, index: int, blueprint, player) -> bool:
         """Start fabricating `blueprint` in module `index` if resources exist.
 
@@ -52,20 +126,17 @@ class FabricationManager:
         if available < ore_amount:
             return False
 
-        # Compute true fabrication time as: blueprint base time * module factor
-        # Blueprint `base_fabrication_time` is typically expressed in seconds.
-        # Module `base_fabrication_time` is a multiplier (e.g. 1.0).
-        blueprint_time = float(getattr(blueprint, "base_fabrication_time", 0))
+        # True fabrication time: blueprint base time (seconds) * module factor
         if module is None:
             return False
 
-        module_factor = float(getattr(module, "base_fabrication_time", 1.0))
-        total_seconds = blueprint_time * module_factor
+        total_seconds = get_production_graph().fabrication_time_s(blueprint, module)
         total_ms = max(1, int(total_seconds * 1000))
         module.fabrication_total_ms = int(total_ms)
-        module.fabrication_start_ticks = int(pygame.time.get_ticks())
+        module.fabrication_start_ticks = now_ms()
         module.fabrication_blueprint = blueprint
         module.fabrication_progress = 0.0
+        self._schedule(module)
 
         # consume ore from player inventory (if applicable)
         if ore_letter is not None:
@@ -75,6 +146,8 @@ class FabricationManager:
                 raise RuntimeError("InventoryManager required to consume fabrication resources")
             inv_mgr.consume_resource(ore_letter, ore_amount)
 
+        record_change("job", kind="fab", module=module.module_id, job=fabrication_job_payload(module))
+
         # attach owner reference so manager can finalize on completion
         try:
             self.player = player
@@ -91,6 +164,8 @@ class FabricationManager:
         module.fabrication_start_ticks = 0
         module.fabrication_progress = 0.0
         module.fabrication_blueprint = None
+        get_job_scheduler().cancel(self._job_key(module))
+        record_change("job", kind="fab", module=module.module_id, job=None)
 
     def speed_up(self, index: int) -> None:
         module = self.get_module(index)
@@ -99,7 +174,9 @@ class FabricationManager:
         total_ms = int(getattr(module, "fabrication_total_ms", 0))
         if total_ms > 0:
             # set start_ticks so that elapsed >= total_ms (complete instantly)
-            module.fabrication_start_ticks = int(pygame.time.get_ticks()) - int(total_ms)
+            module.fabrication_start_ticks = now_ms() - int(total_ms)
+            self._schedule(module)
+            record_change("job", kind="fab", module=module.module_id, job=fabrication_job_payload(module))
 
     def get_status(self, index: int):
         """Compute and return status info for module `index`.
@@ -107,6 +184,10 @@ class FabricationManager:
         Returns a dict with keys: total_ms, start_ticks, progress (0.0-1.0), remaining_s,
         is_fabricating (bool), blueprint
         """
+        # finalize anything due first (a heap peek when nothing is)
+        now_ticks = now_ms()
+        scheduler = get_job_scheduler()
+        scheduler.run_due(now_ticks)
         module = self.get_module(index)
         # If the module has no assigned blueprint, consider it idle regardless
         # of any lingering timer fields.
@@ -135,21 +216,18 @@ class FabricationManager:
 
         total_ms = int(getattr(module, "fabrication_total_ms", 0)) if module is not None else 0
         start_ticks = int(getattr(module, "fabrication_start_ticks", 0)) if module is not None else 0
-        now_ticks = int(pygame.time.get_ticks())
 
         if total_ms > 0 and start_ticks > 0:
-            elapsed = max(0, now_ticks - start_ticks)
-            progress = min(1.0, elapsed / float(total_ms))
-            remaining_ms = max(0, total_ms - elapsed)
+            key = self._job_key(module)
+            if key not in scheduler:
+                # job state restored without going through start_fabrication
+                self._schedule(module)
+                scheduler.run_due(now_ticks)
+            progress, remaining_ms = scheduler.progress(key, now_ticks)
+            if key not in scheduler:
+                progress = 1.0
             remaining_s = remaining_ms // 1000
             is_fabricating = progress < 1.0
-            # If fabrication completed, finalize result and clear module
-            if progress >= 1.0:
-                try:
-                    self._finalize_module(index)
-                except Exception:
-                    # don't let finalization errors break UI; report idle instead
-                    pass
         else:
             progress = 0.0
             remaining_s = int(getattr(module, "base_fabrication_time", 0)) if module is not None else 0
@@ -169,7 +247,7 @@ class FabricationManager:
             "blueprint": getattr(module, "fabrication_blueprint", None),
         }
 
-    def _finalize_module(self, index: int) -> None:
+    def _finalize_module(self, index: int, offline: bool = False) -> None:
         """Finalize a completed fabrication.
 
         Creates a new `HangarEntry` for the completed blueprint and adds it to
@@ -178,6 +256,7 @@ class FabricationManager:
         with a `hangar` and will raise if those contracts are not met.
 
         Clears the module fabrication state after successful finalization.
+        `offline` marks jobs settled on load (no per-job popup or sound).
         """
         module = self.get_module(index)
         bp = getattr(module, "fabrication_blueprint", None)
@@ -206,54 +285,25 @@ class FabricationManager:
             elif "Bomber" in name or "Plasma" in name:
                 unit_type = "plasma_bomber"
 
-        # generate new pool id
-        existing_ids = [e.id for e in hangar.pool] if hangar.pool else []
-        next_id = max(existing_ids) + 1 if existing_ids else 0
+        # new pool id from the hangar's persistent allocator
+        next_id = hangar.allocate_id()
         entry_name = getattr(bp, "title", getattr(bp, "name", "Craft"))
         entry = HangarEntry(id=next_id, name=entry_name, unit_type=unit_type, alive=True, tier=getattr(bp, "tier", 0), rarity=getattr(bp, "rarity", ""))
         # Add via InventoryManager (strict)
         inv_mgr.add_hangar_entry(entry)
 
-        # Notify player (if present) so gameplay HUD can show a popup
-        try:
-            if player is not None:
-                notif = {
-                    'type': 'fabrication',
-                    'title': entry_name,
-                    'elapsed': 0.0,
-                    'duration': 3.5,
-                }
-                # include preview filename when blueprint supplies one
-                try:
-                    preview = getattr(bp, 'preview_filename', None)
-                    if preview:
-                        notif['preview'] = preview
-                except Exception:
-                    pass
-
-                # Use InventoryManager to add notification if available
-                try:
-                    inv_mgr = getattr(player, 'inventory_manager', None)
-                    if inv_mgr is not None:
-                        inv_mgr.add_notification(notif)
-                except Exception:
-                    pass
-        except Exception:
-            pass
-
-        # Play fabrication complete sound
-        try:
-            sound_manager = get_sound_manager()
-            sound_manager.on_fabrication_complete()
-        except Exception:
-            pass
-
         # Clear module fabrication state
         module.fabrication_total_ms = 0
         module.fabrication_start_ticks = 0
         module.fabrication_progress = 0.0
         module.fabrication_blueprint = None
         module.fabrication_remaining_s = 0
+        get_job_scheduler().cancel(self._job_key(module))
+        record_change("job", kind="fab", module=module.module_id, job=None)
+
+        # HUD popup and sound subscribe to this
+        events.get_event_bus().publish(events.JobFinished(
+            "fab", index, player, title=entry_name, preview=getattr(bp, 'preview_filename', None), offline=offline))
 
     def get_selected_index(self) -> int:
         # clamp to valid range
@@ -270,18 +320,13 @@ class FabricationManager:
         self.selected_index = max(0, min(int(index), len(mods) - 1))
 
     def update(self) -> None:
-        """Perform a passive per-frame update: check all modules and finalize
-        any fabrications that reached completion. This should be called from
-        the game's main loop so completions are processed even when no
-        fabrication UI is open.
+        """Finalize any fabrications that reached completion.
+
+        Completions are driven by the shared job scheduler, so this does no
+        per-module work; the game loop runs the scheduler directly.
         """
-        # iterate modules and call get_status which will internally finalize
-        # completed modules (get_status already contains the finalize call).
         try:
-            mods = self.get_modules() or []
-            for i in range(len(mods)):
-                # ignore returned status; get_status has side-effects we rely on
-                self.get_status(i)
+            get_job_scheduler().run_due()
         except Exception:
             # swallow exceptions to avoid interrupting the game loop
             pass
@@ -0,0 +1,239 @@
+"""Formation slot layouts and ship-to-slot assignment for group moves.
+
+A move order places the selection in a formation around the clicked
+point, facing the direction of travel:
+
+    offsets = plan_formation(selected_ships, target, "wedge")
+    for ship, offset in zip(selected_ships, offsets):
+        ship.mover.formation_offset = offset
+        ship.mover.set_target(target + offset)
+
+`slot_layout()` builds line / wedge / box / ring slots sized to the
+selection, spaced by the largest ship's bounding circle. Ships are
+matched to slots by `assign_slots()`, which minimises total travel
+distance. Minimising summed Euclidean distance also keeps the paths from
+crossing, which keeps separation and collision work down on arrival.
+
+Up to `FORMATION_OPTIMAL_MAX` ships the exact Hungarian solver is used.
+Above that, a row sweep pairs ships with slots in O(n log n): front ships
+fill front rows, and ships are ordered across each row. A pass of
+slot swaps between nearby ships then removes most remaining crossings.
+"""
+import math
+from typing import List, Sequence
+
+from pygame.math import Vector2
+
+from spacegame.config import (
+    FORMATION_DEFAULT,
+    FORMATION_SPACING_GAP,
+    FORMATION_OPTIMAL_MAX,
+    FORMATION_IMPROVE_WINDOW,
+    FORMATION_IMPROVE_PASSES,
+)
+
+
+FORMATIONS = ("line", "wedge", "box", "ring")
+
+
+def next_formation(kind: str) -> str:
+    """The formation after `kind` in `FORMATIONS` (for cycling with a key)."""
+    try:
+        return FORMATIONS[(FORMATIONS.index(kind) + 1) % len(FORMATIONS)]
+    except ValueError:
+        return FORMATIONS[0]
+
+
+# ---------- Layouts ----------
+def slot_layout(kind: str, n: int, spacing: float) -> List[Vector2]:
+    """`n` slot offsets centered on (0, 0); +x is forward, +y is to the right."""
+    if n <= 0:
+        return []
+    s = float(spacing)
+    slots: List[Vector2] = []
+    if kind == "line":
+        slots = [Vector2(0, (i - (n - 1) / 2.0) * s) for i in range(n)]
+    elif kind == "wedge":
+        # tip in front, then one ship further back on each side per row
+        slots.append(Vector2(0, 0))
+        for i in range(1, n):
+            k = (i + 1) // 2
+            side = 1 if i % 2 else -1
+            slots.append(Vector2(-k * s * 0.8, side * k * s))
+    elif kind == "ring":
+        if n == 1:
+            slots = [Vector2(0, 0)]
+        else:
+            radius = max(s, n * s / (2 * math.pi))
+            slots = [Vector2(radius, 0).rotate(360.0 * i / n) for i in range(n)]
+    else:
+        # box: near-square rows, front row first, last row centered
+        cols = int(math.ceil(math.sqrt(n)))
+        for i in range(n):
+            row, col = divmod(i, cols)
+            in_row = min(cols, n - row * cols)
+            slots.append(Vector2(-row * s, (col - (in_row - 1) / 2.0) * s))
+    # center on the slots' centroid so the group's center lands on the target
+    cx = sum(v.x for v in slots) / n
+    cy = sum(v.y for v in slots) / n
+    return [Vector2(v.x - cx, v.y - cy) for v in slots]
+
+
+def orient(slots: Sequence[Vector2], forward: Vector2) -> List[Vector2]:
+    """Rotate local slots so +x points along `forward`."""
+    if forward.length_squared() == 0:
+        forward = Vector2(1, 0)
+    fwd = forward.normalize()
+    right = Vector2(-fwd.y, fwd.x)
+    return [fwd * v.x + right * v.y for v in slots]
+
+
+# ---------- Assignment ----------
+def _hungarian(cost: List[List[float]]) -> List[int]:
+    """Optimal assignment for a square cost matrix; returns column per row."""
+    n = len(cost)
+    inf = float("inf")
+    u = [0.0] * (n + 1)
+    v = [0.0] * (n + 1)
+    p = [0] * (n + 1)    # p[j]: row matched to column j (1-based, 0 = none)
+    way = [0] * (n + 1)
+    for i in range(1, n + 1):
+        p[0] = i
+        j0 = 0
+        minv = [inf] * (n + 1)
+        used = [False] * (n + 1)
+        while True:
+            used[j0] = True
+            i0 = p[j0]
+            row = cost[i0 - 1]
+            ui0 = u[i0]
+            delta = inf
+            j1 = 0
+            for j in range(1, n + 1):
+                if not used[j]:
+                    cur = row[j - 1] - ui0 - v[j]
+                    if cur < minv[j]:
+                        minv[j] = cur
+                        way[j] = j0
+                    if minv[j] < delta:
+                        delta = minv[j]
+                        j1 = j
+            for j in range(n + 1):
+                if used[j]:
+                    u[p[j]] += delta
+                    v[j] -= delta
+                else:
+                    minv[j] -= delta
+            j0 = j1
+            if p[j0] == 0:
+                break
+        while j0:
+            j1 = way[j0]
+            p[j0] = p[j1]
+            j0 = j1
+    result = [0] * n
+    for j in range(1, n + 1):
+        if p[j]:
+            result[p[j] - 1] = j - 1
+    return result
+
+
+def _sweep(starts: Sequence[Vector2], goals: Sequence[Vector2], forward: Vector2) -> List[int]:
+    """Row sweep: front ships to front slot rows, ordered across each row."""
+    n = len(starts)
+    fwd = forward.normalize() if forward.length_squared() else Vector2(1, 0)
+    right = Vector2(-fwd.y, fwd.x)
+    ships = sorted(range(n), key=lambda i: -starts[i].dot(fwd))
+    slots = sorted(range(n), key=lambda j: -goals[j].dot(fwd))
+    result = [0] * n
+    # slots within a few pixels along `forward` share a row
+    i = 0
+    while i < n:
+        depth = goals[slots[i]].dot(fwd)
+        end = i + 1
+        while end < n and depth - goals[slots[end]].dot(fwd) < 4.0:
+            end += 1
+        row_ships = sorted(ships[i:end], key=lambda k: starts[k].dot(right))
+        row_slots = sorted(slots[i:end], key=lambda k: goals[k].dot(right))
+        for a, b in zip(row_ships, row_slots):
+            result[a] = b
+        i = end
+    return result
+
+
+def _ring_sweep(starts: Sequence[Vector2], goals: Sequence[Vector2]) -> List[int]:
+    """Pair ships and ring slots in angular order around their centers."""
+    n = len(starts)
+    sc = sum(starts, Vector2()) / n
+    gc = sum(goals, Vector2()) / n
+    ships = sorted(range(n), key=lambda i: math.atan2(starts[i].y - sc.y, starts[i].x - sc.x))
+    slots = sorted(range(n), key=lambda j: math.atan2(goals[j].y - gc.y, goals[j].x - gc.x))
+    # rotate the pairing so the first ship takes its nearest slot
+    first = starts[ships[0]]
+    shift = min(range(n), key=lambda k: first.distance_squared_to(goals[slots[k]]))
+    result = [0] * n
+    for k, i in enumerate(ships):
+        result[i] = slots[(k + shift) % n]
+    return result
+
+
+def _improve(starts: Sequence[Vector2], goals: Sequence[Vector2], result: List[int], forward: Vector2) -> None:
+    """Swap slots between nearby ships while that shortens the total distance.
+
+    Two crossing paths can always be shortened by swapping their slots, so
+    this removes most of the crossings the sweep leaves. "Nearby" means
+    close in start position or in assigned slot, across or along the move.
+    """
+    fwd = forward.normalize() if forward.length_squared() else Vector2(1, 0)
+    right = Vector2(-fwd.y, fwd.x)
+    n = len(starts)
+    window = FORMATION_IMPROVE_WINDOW
+    for _ in range(FORMATION_IMPROVE_PASSES):
+        swapped = False
+        for axis in (right, fwd):
+            for by_slot in (False, True):
+                if by_slot:
+                    order = sorted(range(n), key=lambda i: goals[result[i]].dot(axis))
+                else:
+                    order = sorted(range(n), key=lambda i: starts[i].dot(axis))
+                for k, a in enumerate(order):
+                    sa = starts[a]
+                    for b in order[k + 1:k + 1 + window]:
+                        sb = starts[b]
+                        ga, gb = goals[result[a]], goals[result[b]]
+                        if sa.distance_to(gb) + sb.distance_to(ga) < sa.distance_to(ga) + sb.distance_to(gb) - 1e-6:
+                            result[a], result[b] = result[b], result[a]
+                            swapped = True
+        if not swapped:
+            break
+
+
+def assign_slots(starts: Sequence[Vector2], goals: Sequence[Vector2], forward: Vector2 = Vector2(1, 0),
+                 ring: bool = False) -> List[int]:
+    """Slot index for each start position, minimising total travel distance."""
+    n = len(starts)
+    if n == 0:
+        return []
+    if n <= FORMATION_OPTIMAL_MAX:
+        return _hungarian([[s.distance_to(g) for g in goals] for s in starts])
+    result = _ring_sweep(starts, goals) if ring else _sweep(starts, goals, forward)
+    _improve(starts, goals, result, forward)
+    return result
+
+
+def plan_formation(units, target, kind: str = FORMATION_DEFAULT, spacing: float = None) -> List[Vector2]:
+    """Formation offset (from `target`) for each of `units`, in order."""
+    units = list(units)
+    n = len(units)
+    if n == 0:
+        return []
+    target = Vector2(target)
+    positions = [Vector2(u.pos) for u in units]
+    centroid = sum(positions, Vector2()) / n
+    if spacing is None:
+        spacing = max(2.0 * float(u.bounding_radius()) for u in units) + FORMATION_SPACING_GAP
+    forward = target - centroid
+    slots = orient(slot_layout(kind, n, spacing), forward)
+    goals = [target + s for s in slots]
+    assignment = assign_slots(positions, goals, forward, ring=(kind == "ring"))
+    return [slots[j] for j in assignment]
@@ -0,0 +1,117 @@
+"""Game-time clock read by production timers and the job scheduler.
+
+Game time normally follows wall time (``pygame.time.get_ticks()``) but can
+be paused, scaled, or driven entirely by hand:
+
+    clock = GameClock(manual=True, start_ms=1000)
+    set_game_clock(clock)
+    clock.step(3 * 3600 * 1000)   # three hours of production, instantly
+    get_job_scheduler().run_due()
+
+A running clock is rebased whenever it is paused, resumed or rescaled, so
+game time never jumps. Stepping works in every mode and adds game time
+directly.
+
+Game time carries over between sessions: saves store an `anchor()` (game
+time paired with the wall-clock time), and loading calls `continue_from()`
+so the time the game was closed counts as elapsed game time.
+"""
+import time
+from typing import Callable, List, Optional
+
+import pygame
+
+from spacegame.config import GAME_TIME_SCALE
+
+
+def _wall_ms() -> int:
+    return int(pygame.time.get_ticks())
+
+
+class GameClock:
+    """Pausable, scalable game time in milliseconds."""
+
+    def __init__(self, scale: float = GAME_TIME_SCALE, manual: bool = False,
+                 start_ms: Optional[int] = None, source: Callable[[], int] = _wall_ms):
+        self.source = source
+        self.manual = bool(manual)
+        self.scale = max(0.0, float(scale))
+        self.paused = False
+        wall = self.source()
+        # game time at the last rebase, and the wall time it happened at
+        self._base_game = float(wall if start_ms is None else start_ms)
+        self._base_wall = wall
+
+    def _running(self) -> bool:
+        return not (self.manual or self.paused)
+
+    def _rebase(self) -> None:
+        wall = self.source()
+        if self._running():
+            self._base_game += (wall - self._base_wall) * self.scale
+        self._base_wall = wall
+
+    def now_ms(self) -> int:
+        """Current game time."""
+        if not self._running():
+            return int(self._base_game)
+        return int(self._base_game + (self.source() - self._base_wall) * self.scale)
+
+    def pause(self) -> None:
+        if not self.paused:
+            self._rebase()
+            self.paused = True
+
+    def resume(self) -> None:
+        if self.paused:
+            self._rebase()
+            self.paused = False
+
+    def set_scale(self, scale: float) -> None:
+        """Run game time `scale` times faster than wall time (0 freezes it)."""
+        self._rebase()
+        self.scale = max(0.0, float(scale))
+
+    def step(self, ms: float) -> int:
+        """Advance game time by `ms`; returns the new game time."""
+        self._rebase()
+        self._base_game += max(0.0, float(ms))
+        return self.now_ms()
+
+    def set_now(self, ms: int) -> None:
+        """Jump game time to `ms` (e.g. when resuming a saved campaign)."""
+        self._base_wall = self.source()
+        self._base_game = float(ms)
+
+    def anchor(self) -> List[int]:
+        """Return [game ms, unix ms] pairing the current game time with wall time."""
+        return [self.now_ms(), int(time.time() * 1000)]
+
+    def continue_from(self, anchor) -> int:
+        """Resume game time from a saved `anchor()`, counting the time since as played.
+
+        Returns the offline time in milliseconds.
+        """
+        game_ms, wall_ms = int(anchor[0]), int(anchor[1])
+        offline = max(0, int(time.time() * 1000) - wall_ms)
+        self.set_now(game_ms + offline)
+        return offline
+
+
+# Global singleton instance
+_instance: Optional[GameClock] = None
+
+
+def get_game_clock() -> GameClock:
+    """Get or create the global game clock."""
+    global _instance
+    if _instance is None:
+        _instance = GameClock()
+    return _instance
+
+
+def set_game_clock(clock: GameClock) -> GameClock:
+    """Install `clock` as the global game clock (tests, benchmarks)."""
+    global _instance
+    _instance = clock
+    return clock
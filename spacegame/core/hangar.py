@@ -14,11 +14,17 @@ from pygame.math import Vector2
 from spacegame.models.units.interceptor import Interceptor
 from spacegame.models.units.resource_collector import ResourceCollector
 from spacegame.models.units.plasma_bomber import PlasmaBomber
+from spacegame.core.save_scheduler import record_change
+from spacegame.core.codec import register_type, encode
 
 
+@register_type
 @dataclass
 class HangarEntry:
     """Represents a single light-craft in the persistent hangar pool."""
+    PERSIST_VERSION = 1
+    PERSIST_FIELDS = ("id", "name", "unit_type", "alive", "tier", "rarity")
+
     id: int
     name: str
     unit_type: str = ""
@@ -35,6 +41,12 @@ class Hangar:
       - ships: which live unit objects are currently deployed from each slot
       - assignments: which pool entry id is assigned to each slot
       - pool: the persistent pool (all possible crafts, alive/dead, any unit_type)
+
+    The pool is indexed by id, and the alive entries by unit type and tier,
+    so lookups stay O(1) however large the pool grows. Add entries with
+    `add_entry()` (ids from `allocate_id()`) and change liveness with
+    `set_alive()` so the indexes stay current; `version` increases on every
+    pool change. Assigning `pool` replaces it wholesale and reindexes.
     """
 
     def __init__(self, owner, num_slots: int = 3, interceptor_pool_size: int = 5, collector_pool_size: int = 0, bomber_pool_size: int = 0, inventory_manager=None) -> None:
@@ -52,6 +64,8 @@ class Hangar:
 
         # Persistent pool (data only, not ship instances).
         # The InventoryManager is expected to register this hangar; there
+        self.version = 0
+        self.next_id = 0
         self.pool = self._initialize_pool(interceptor_pool_size, collector_pool_size, bomber_pool_size)
 
         # Track all currently deployed ships from this hangar.
@@ -66,6 +80,66 @@ class Hangar:
             inventory_manager.register_hangar(self)
 
 
+    # ---------- Pool and indexes ----------
+
+    @property
+    def pool(self) -> list[HangarEntry]:
+        """All pool entries in insertion order (read-only; see `add_entry`)."""
+        return self._pool
+
+    @pool.setter
+    def pool(self, entries) -> None:
+        self._pool = list(entries)
+        self._by_id = {e.id: e for e in self._pool}
+        # ids are never reused, even if a loaded pool has gaps
+        self.next_id = max(self.next_id, max(self._by_id) + 1 if self._by_id else 0)
+        self._pool_changed()
+
+    def _pool_changed(self) -> None:
+        self.version += 1
+        self._views = None
+        self._split = None
+
+    def allocate_id(self) -> int:
+        """Return a new, never-used pool entry id."""
+        entry_id = self.next_id
+        self.next_id += 1
+        return entry_id
+
+    def add_entry(self, entry: HangarEntry) -> None:
+        """Append `entry` to the pool and journal it."""
+        self._pool.append(entry)
+        self._by_id[entry.id] = entry
+        self.next_id = max(self.next_id, int(entry.id) + 1)
+        self._pool_changed()
+        self.journal_entry(entry)
+
+    def set_alive(self, entry: HangarEntry, alive: bool) -> None:
+        """Mark `entry` alive or destroyed and journal the change."""
+        if entry.alive != bool(alive):
+            entry.alive = bool(alive)
+            self._pool_changed()
+            self.journal_entry(entry)
+
+    def _index(self) -> dict:
+        # alive entries in pool order, grouped by unit type and by tier;
+        # rebuilt on first use after a pool change
+        if self._views is None:
+            alive = [e for e in self._pool if e.alive]
+            by_type: dict[str, list[HangarEntry]] = {}
+            by_tier: dict[int, list[HangarEntry]] = {}
+            for e in alive:
+                by_type.setdefault(e.unit_type or "", []).append(e)
+                by_tier.setdefault(int(e.tier or 0), []).append(e)
+            self._views = {
+                "alive": alive,
+                "by_type": by_type,
+                "by_tier": by_tier,
+                # grouped by ship type, pool order within each type
+                "by_type_sorted": [e for t in sorted(by_type) for e in by_type[t]],
+            }
+        return self._views
+
     # ---------- Pool initialization ----------
 
     def _initialize_pool(self, interceptor_count: int, collector_count: int, bomber_count: int = 0) -> list[HangarEntry]:
@@ -133,10 +207,7 @@ class Hangar:
 
     def get_entry_by_id(self, entry_id: int) -> HangarEntry | None:
         """Return the pool entry with the given id, or None if not found."""
-        for entry in self.pool:
-            if entry.id == entry_id:
-                return entry
-        return None
+        return self._by_id.get(entry_id)
 
     def get_entry_for_slot(self, slot: int) -> HangarEntry | None:
         """Return the pool entry assigned to a given slot, if any and alive."""
@@ -207,13 +278,14 @@ class Hangar:
         if entry_id is not None:
             entry = self.get_entry_by_id(entry_id)
             if entry is not None:
-                entry.alive = False
+                self.set_alive(entry, False)
 
         slot = getattr(ship, "hangar_slot", None)
         if slot is not None and 0 <= slot < self.num_slots:
             self.slots[slot] = False
             self.ships[slot] = None
             self.assignments[slot] = None
+            self._journal_slots()
 
         if ship in self.deployed:
             self.deployed.remove(ship)
@@ -229,6 +301,7 @@ class Hangar:
         self.assignments[slot] = None
         self.slots[slot] = False
         self.ships[slot] = None
+        self._journal_slots()
 
     def assign_to_slot(self, slot: int, interceptor_id: int) -> None:
         """
@@ -244,28 +317,62 @@ class Hangar:
 
         self.assignments[slot] = interceptor_id
         self.slots[slot] = True
+        self._journal_slots()
 
         ship = self.ships[slot]
         if ship is not None and ship.health <= 0.0:
             self.ships[slot] = None
 
+    # ---------- Save journal ----------
+    def journal_entry(self, entry: HangarEntry) -> None:
+        """Record the current state of a pool entry in the save journal."""
+        record_change("entry", e=encode(entry))
+
+    def _journal_slots(self) -> None:
+        # deploy / recall only toggle readiness, which load recomputes from
+        # the assignments, so only assignment changes are journaled
+        record_change("slots", a=list(self.assignments), s=list(self.slots))
+
     # ---------- Query helpers for UI screens ----------
 
     def alive_pool_entries(self):
-        """Return a list of pool entries that are still marked as alive."""
-        return [e for e in self.pool if e.alive]
+        """Return a list of pool entries that are still marked as alive (read-only)."""
+        return self._index()["alive"]
+
+    def alive_entries_by_type(self, unit_type: str):
+        """Alive entries of `unit_type` in pool order (read-only)."""
+        return self._index()["by_type"].get(unit_type or "", [])
+
+    def alive_entries_by_tier(self, tier: int):
+        """Alive entries of `tier` in pool order (read-only)."""
+        return self._index()["by_tier"].get(int(tier), [])
 
     def selected_interceptor_ids(self):
         """Return a set of interceptor IDs that are assigned to any slot and still alive."""
-        alive_ids = {e.id for e in self.pool if e.alive}
         result = set()
         for interceptor_id in self.assignments:
             if interceptor_id is None:
                 continue
-            if interceptor_id in alive_ids:
+            entry = self._by_id.get(interceptor_id)
+            if entry is not None and entry.alive:
                 result.add(interceptor_id)
         return result
 
+    def split_alive_by_type(self):
+        """Return (selected, stored) alive entries, each grouped by unit type.
+
+        `selected` holds entries assigned to a slot. Cached until the pool or
+        the assignments change, so screens can call it every frame.
+        """
+        key = (self.version, tuple(self.assignments))
+        if self._split is None or self._split[0] != key:
+            selected_ids = self.selected_interceptor_ids()
+            ordered = self._index()["by_type_sorted"]
+            selected = [e for e in ordered if e.id in selected_ids]
+            stored = [e for e in ordered if e.id not in selected_ids]
+            self._split = (key, selected, stored)
+        return self._split[1], self._split[2]
+
 
     def snapshot(self):
         """Return a simple snapshot of the current hangar state.
@@ -277,7 +384,8 @@ class Hangar:
         """
         assignments = list(self.assignments)
         ships = list(self.ships)
-        pool_by_id = {entry.id: entry for entry in self.pool}
+        # the live id index; callers must not modify it
+        pool_by_id = self._by_id
         return assignments, ships, pool_by_id
 
 
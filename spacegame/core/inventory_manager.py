@@ -7,6 +7,8 @@ strict: the hangar must be registered before modifying its pool.
 """
 from typing import Dict, List, Optional
 
+from spacegame.core import events
+
 
 class InventoryManager:
     """Manage a simple inventory mapping ore_letter -> int and notifications.
@@ -28,38 +30,17 @@ class InventoryManager:
         # Stored as a simple list of module instances.
         self.modules: List[object] = []
 
-    def _trigger_autosave(self) -> None:
-        """Post a custom SAVE_GAME event so the running screen loop performs the save.
+    def _journal(self, record_kind: str, **payload) -> None:
+        """Append a change record to the save journal.
 
-        This replaces the previous direct save call. The event contains an
-        `owner` attribute with the object to save.
+        Records are queued and written by the background save scheduler, so
+        callers never block on disk I/O.
         """
         # Avoid module-level cycles by importing here.
         try:
-            import pygame
-            from spacegame.core import events as _events
+            from spacegame.core.save_scheduler import record_change
 
-            ev = _events.make_save_game_event(self.owner)
-            try:
-                pygame.event.post(ev)
-            except Exception:
-                # If posting to the event queue fails (unlikely), fall back
-                # to performing a direct save below.
-                pass
-        except Exception:
-            # If events/pygame cannot be imported for any reason, continue
-            # and attempt a direct save below.
-            pass
-
-        # Also perform a direct save immediately to ensure persistence even
-        # when the current screen's event loop doesn't handle the custom event.
-        try:
-            from spacegame.core import save as _save
-
-            try:
-                _save.save_game(self.owner)
-            except Exception:
-                pass
+            record_change(record_kind, **payload)
         except Exception:
             pass
 
@@ -70,14 +51,15 @@ class InventoryManager:
     def set_amount(self, ore_letter: str, amount: int) -> None:
         self.inventory[str(ore_letter)] = int(amount)
         try:
-            self._trigger_autosave()
+            self._journal("inv_set", key=str(ore_letter), v=int(amount))
         except Exception:
             pass
 
-    def add_resource(self, ore_letter: str, amount: int, preview: Optional[str] = None) -> None:
+    def add_resource(self, ore_letter: str, amount: int, preview: Optional[str] = None, notify: bool = True) -> None:
         """Add `amount` of resource `ore_letter` to inventory and emit a notification.
 
         Keeps behavior consistent with previous `ExpeditionShip.add_resource`.
+        Pass `notify=False` to skip the popup (e.g. for batched results).
         """
         if amount <= 0:
             return
@@ -94,9 +76,10 @@ class InventoryManager:
         }
         if preview:
             notif['preview'] = preview
-        self.notifications.append(notif)
+        if notify:
+            self.notifications.append(notif)
         try:
-            self._trigger_autosave()
+            self._journal("inv", key=ore_letter, d=int(amount))
         except Exception:
             pass
 
@@ -109,7 +92,7 @@ class InventoryManager:
             return False
         self.inventory[str(ore_letter)] = have - int(amount)
         try:
-            self._trigger_autosave()
+            self._journal("inv", key=str(ore_letter), d=-int(amount))
         except Exception:
             pass
         return True
@@ -122,7 +105,7 @@ class InventoryManager:
         k = str(key)
         self.inventory[k] = int(self.inventory.get(k, 0)) + int(amount)
         try:
-            self._trigger_autosave()
+            self._journal("inv", key=k, d=int(amount))
         except Exception:
             pass
 
@@ -133,7 +116,9 @@ class InventoryManager:
             return
         self.modules.append(module_obj)
         try:
-            self._trigger_autosave()
+            from spacegame.core.codec import encode
+
+            self._journal("mod_add", m=encode(module_obj))
         except Exception:
             pass
 
@@ -141,9 +126,10 @@ class InventoryManager:
         """Remove a module instance from the unequipped modules list. Returns True if removed."""
         # Prefer exact identity removal
         try:
-            self.modules.remove(module_obj)
+            index = self.modules.index(module_obj)
+            self.modules.pop(index)
             try:
-                self._trigger_autosave()
+                self._journal("mod_del", i=index)
             except Exception:
                 pass
             return True
@@ -151,7 +137,7 @@ class InventoryManager:
             # Fallback: try to remove a module that matches by type and a set
             # of likely identifying attributes (name, tier, capacity/module_size).
             try:
-                for m in list(self.modules):
+                for index, m in enumerate(list(self.modules)):
                     try:
                         if type(m) is type(module_obj):
                             # compare a number of common attributes if present
@@ -171,9 +157,9 @@ class InventoryManager:
 
                             # Accept a match if name and tier match, or tier+capacity match
                             if (same_name and same_tier) or (same_tier and same_capacity):
-                                self.modules.remove(m)
+                                self.modules.pop(index)
                                 try:
-                                    self._trigger_autosave()
+                                    self._journal("mod_del", i=index)
                                 except Exception:
                                     pass
                                 return True
@@ -227,15 +213,35 @@ class InventoryManager:
         """
         if self.hangar is None:
             raise RuntimeError("No Hangar registered on InventoryManager; cannot add hangar entry")
-        # Append directly to the hangar pool; let any higher-level persistence
-        # be handled by the owning systems.
-        self.hangar.pool.append(entry)
-        try:
-            self._trigger_autosave()
-        except Exception:
-            pass
+        # the hangar indexes and journals the entry
+        self.hangar.add_entry(entry)
 
     def get_hangar_pool(self):
         if self.hangar is None:
             raise RuntimeError("No Hangar registered on InventoryManager")
         return getattr(self.hangar, 'pool', None)
+
+
+def _notify_job_finished(event) -> None:
+    """Show the HUD popup for a finished fabrication.
+
+    Refining output already gets the ore delivery popup from `add_resource`.
+    """
+    if event.kind != "fab" or event.offline:
+        return
+    inv_mgr = getattr(event.player, 'inventory_manager', None)
+    if inv_mgr is None:
+        return
+    notif = {
+        'type': 'fabrication',
+        'title': event.title,
+        'elapsed': 0.0,
+        'duration': 3.5,
+    }
+    # include preview filename when blueprint supplies one
+    if event.preview:
+        notif['preview'] = event.preview
+    inv_mgr.add_notification(notif)
+
+
+events.get_event_bus().subscribe(events.JobFinished, _notify_job_finished)
@@ -0,0 +1,138 @@
+"""Central scheduler for timed production jobs (fabrication, refining).
+
+Jobs register when they start with their start time and duration; the
+scheduler keeps them in a min-heap ordered by due time. `run_due()` is
+called once per frame and costs a single heap peek when nothing is due, no
+matter how many modules are installed. When a job's time comes, its
+callback (the manager's finalizer) runs exactly once.
+
+UI code reads progress through `progress(key)`, an O(1) lookup, instead of
+recomputing module timers each frame.
+
+Times are in milliseconds of game time (`GameClock`), so jobs pause,
+speed up and step along with the clock.
+"""
+import heapq
+import itertools
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from spacegame.core.game_clock import get_game_clock
+
+
+def now_ms() -> int:
+    """Current game time (milliseconds), the scheduler's time base."""
+    return get_game_clock().now_ms()
+
+
+class Job:
+    """A scheduled job: when it started, when it is due, what to call then."""
+
+    __slots__ = ("key", "start_ms", "total_ms", "due_ms", "on_due", "seq")
+
+    def __init__(self, key: Any, start_ms: int, total_ms: int, on_due: Callable[[], None], seq: int):
+        self.key = key
+        self.start_ms = int(start_ms)
+        self.total_ms = max(1, int(total_ms))
+        self.due_ms = self.start_ms + self.total_ms
+        self.on_due = on_due
+        self.seq = seq
+
+
+class JobScheduler:
+    """Min-heap of jobs keyed by due time, with lazy deletion."""
+
+    def __init__(self):
+        self._heap: List[Tuple[int, int, Any]] = []  # (due_ms, seq, key)
+        self._jobs: Dict[Any, Job] = {}
+        self._seq = itertools.count()
+        self.fired = 0
+
+    def schedule(self, key: Any, start_ms: int, total_ms: int, on_due: Callable[[], None]) -> Job:
+        """Register (or replace) the job for `key`."""
+        job = Job(key, start_ms, total_ms, on_due, next(self._seq))
+        self._jobs[key] = job
+        heapq.heappush(self._heap, (job.due_ms, job.seq, key))
+        return job
+
+    def reschedule(self, key: Any, due_ms: int) -> None:
+        """Move the due time of `key`'s job (e.g. speed-up), keeping its start."""
+        job = self._jobs.get(key)
+        if job is None:
+            return
+        job.due_ms = int(due_ms)
+        job.total_ms = max(1, job.due_ms - job.start_ms)
+        job.seq = next(self._seq)
+        heapq.heappush(self._heap, (job.due_ms, job.seq, key))
+
+    def cancel(self, key: Any) -> None:
+        # the heap entry goes stale and is skipped when it surfaces
+        self._jobs.pop(key, None)
+
+    def get(self, key: Any) -> Optional[Job]:
+        return self._jobs.get(key)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._jobs
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def next_due(self) -> Optional[int]:
+        """Due time of the earliest live job, or None when idle."""
+        self._drop_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def _drop_stale(self) -> None:
+        heap = self._heap
+        while heap:
+            due, seq, key = heap[0]
+            job = self._jobs.get(key)
+            if job is not None and job.seq == seq:
+                return
+            heapq.heappop(heap)
+
+    def run_due(self, now: Optional[int] = None) -> int:
+        """Fire every job due at `now` (default: `now_ms()`); returns how many fired."""
+        heap = self._heap
+        if not heap:
+            return 0
+        if now is None:
+            now = now_ms()
+        if heap[0][0] > now:
+            return 0
+        fired = 0
+        while heap and heap[0][0] <= now:
+            due, seq, key = heapq.heappop(heap)
+            job = self._jobs.get(key)
+            if job is None or job.seq != seq:
+                continue
+            del self._jobs[key]
+            fired += 1
+            try:
+                job.on_due()
+            except Exception as e:
+                print(f"Scheduled job {key!r} failed to finalize: {e}")
+        self.fired += fired
+        return fired
+
+    def progress(self, key: Any, now: Optional[int] = None) -> Tuple[float, int]:
+        """Return (progress 0..1, remaining ms) for `key`'s job; (0.0, 0) if none."""
+        job = self._jobs.get(key)
+        if job is None:
+            return 0.0, 0
+        if now is None:
+            now = now_ms()
+        elapsed = max(0, now - job.start_ms)
+        return min(1.0, elapsed / float(job.total_ms)), max(0, job.due_ms - now)
+
+
+# Global singleton instance
+_instance: Optional[JobScheduler] = None
+
+
+def get_job_scheduler() -> JobScheduler:
+    """Get or create the global job scheduler."""
+    global _instance
+    if _instance is None:
+        _instance = JobScheduler()
+    return _instance
@@ -5,14 +5,49 @@ installed internal modules (three sections) and provides helpers to query
 fabricator/refinery modules. It is intended to be the single source of
 truth for equipped modules across the codebase.
 """
-from typing import List
-from spacegame.models.modules.module import ShipModule
+from typing import Dict, List
+from spacegame.models.modules.module import ShipModule, new_module_id
+from spacegame.core.save_scheduler import record_change
+from spacegame.core.codec import encode
+
+
+# View categories kept by the manager
+FABRICATORS = "fabricators"
+REFINERIES = "refineries"
+
+
+def _categories(module) -> tuple:
+    """Categories `module` belongs to, decided once when it is installed.
+
+    Duck-typed so this module does not import the concrete module types.
+    """
+    cats = []
+    try:
+        if getattr(module, "allowed_sections", None) is not None and getattr(module, "base_fabrication_time", None) is not None:
+            cats.append(FABRICATORS)
+        if getattr(module, "standard_refinement_time_s", None) is not None or getattr(module, "base_refinement_time", None) is not None:
+            cats.append(REFINERIES)
+    except Exception:
+        pass
+    return tuple(cats)
 
 
 class ModulesManager:
+    """Installed internal modules plus cached per-category views.
+
+    Typed views and per-section capacity totals are maintained
+    incrementally by `install_module`, `remove_module` and
+    `set_internal_sections`; `version` increases on every change so callers
+    can skip recomputing layouts when nothing changed. Mutate sections only
+    through these methods.
+    """
+
     def __init__(self):
         # internal sections: 0 = left, 1 = middle, 2 = right
         self.installed_internal_modules: List[List[ShipModule]] = [[], [], []]
+        self.version = 0
+        # modules given a new id because theirs was missing or taken
+        self.reissued_ids = 0
 
         # Ensure a reasonable default when the game starts with no save:
         # install one Fabricator and one Refinery in the middle section so
@@ -27,6 +62,57 @@ class ModulesManager:
         except Exception:
             # Do not raise if imports or instantiation fails
             pass
+        self._rebuild()
+
+    # --- Cached views ---
+    def _rebuild(self) -> None:
+        # per category, per section: installed modules in section order
+        self._typed: Dict[str, List[List[ShipModule]]] = {FABRICATORS: [[], [], []], REFINERIES: [[], [], []]}
+        self._capacity: List[int] = [0, 0, 0]
+        self._ids: Dict[str, ShipModule] = {}
+        for i, sec in enumerate(self.installed_internal_modules):
+            for m in sec:
+                self._track(i, m)
+        self._changed()
+
+    def _track(self, section_index: int, module: ShipModule) -> None:
+        # installed modules need distinct ids: persisted jobs are keyed by them
+        # (modules decoded from older saves all share their template's id)
+        mid = getattr(module, "module_id", None)
+        if mid is None or self._ids.get(mid, module) is not module:
+            module.module_id = mid = new_module_id()
+            self.reissued_ids += 1
+        self._ids[mid] = module
+        for cat in _categories(module):
+            self._typed[cat][section_index].append(module)
+        self._capacity[section_index] += int(getattr(module, "capacity", 0) or 0)
+
+    def _untrack(self, section_index: int, module: ShipModule) -> None:
+        for cat in _categories(module):
+            sec = self._typed[cat][section_index]
+            for i, m in enumerate(sec):
+                if m is module:
+                    sec.pop(i)
+                    break
+        self._capacity[section_index] -= int(getattr(module, "capacity", 0) or 0)
+        self._ids.pop(getattr(module, "module_id", None), None)
+
+    def _changed(self) -> None:
+        self._flat: Dict[str, List[ShipModule]] = {}
+        self.version += 1
+
+    def _view(self, category: str) -> List[ShipModule]:
+        view = self._flat.get(category)
+        if view is None:
+            view = [m for sec in self._typed[category] for m in sec]
+            self._flat[category] = view
+        return view
+
+    def section_capacity(self, section_index: int) -> int:
+        """Capacity used by the modules installed in `section_index`."""
+        if 0 <= section_index < 3:
+            return self._capacity[section_index]
+        return 0
 
     # --- Internal sections ---
     def get_internal_sections(self) -> List[List[ShipModule]]:
@@ -38,51 +124,37 @@ class ModulesManager:
         # ensure exactly three sections
         while len(self.installed_internal_modules) < 3:
             self.installed_internal_modules.append([])
+        self._rebuild()
+        record_change("sections", v=[[encode(m) for m in sec] for sec in self.installed_internal_modules])
 
     def install_module(self, section_index: int, module: ShipModule) -> None:
         if 0 <= section_index < 3 and module is not None:
             sec = self.installed_internal_modules[section_index]
             sec.append(module)
+            self._track(section_index, module)
+            self._changed()
+            record_change("sec_add", s=section_index, m=encode(module))
 
     def remove_module(self, section_index: int, module: ShipModule) -> None:
         try:
             if 0 <= section_index < 3:
                 sec = self.installed_internal_modules[section_index]
                 if module in sec:
-                    sec.remove(module)
+                    index = sec.index(module)
+                    removed = sec.pop(index)
+                    self._untrack(section_index, removed)
+                    self._changed()
+                    record_change("sec_del", s=section_index, i=index)
         except Exception:
             pass
 
     # --- Helpers for specific module types ---
+    # The returned lists are shared views; treat them as read-only.
     def get_fabricators(self) -> List[ShipModule]:
-        out: List[ShipModule] = []
-        try:
-            for sec in self.installed_internal_modules:
-                for m in sec:
-                    # avoid importing module types here; callers can isinstance
-                    # against concrete classes if needed
-                    try:
-                        if getattr(m, "allowed_sections", None) is not None and getattr(m, "base_fabrication_time", None) is not None:
-                            out.append(m)
-                    except Exception:
-                        continue
-        except Exception:
-            pass
-        return out
+        return self._view(FABRICATORS)
 
     def get_refineries(self) -> List[ShipModule]:
-        out: List[ShipModule] = []
-        try:
-            for sec in self.installed_internal_modules:
-                for m in sec:
-                    try:
-                        if getattr(m, "standard_refinement_time_s", None) is not None or getattr(m, "base_refinement_time", None) is not None:
-                            out.append(m)
-                    except Exception:
-                        continue
-        except Exception:
-            pass
-        return out
+        return self._view(REFINERIES)
 
 
 # single global manager instance used across the package
@@ -15,9 +15,18 @@ class Mover:
         self.angle = 0.0
         self.is_selected = False
         self.formation_offset = Vector2()
+        # shared flow field steering a group move (see core.navigation)
+        self.flow = None
+        self.flow_slack = 0.0
 
     def set_target(self, position):
         self.target_pos = Vector2(position)
+        self.flow = None
+
+    def follow(self, flow, slack: float = 0.0):
+        """Path around obstacles along `flow` until within `slack` of its goal, then fly straight."""
+        self.flow = flow
+        self.flow_slack = float(slack)
 
     def update(self, dt):
         """Move and rotate smoothly toward the target."""
@@ -26,9 +35,15 @@ class Mover:
 
         if distance > 0.1:
             move_dist = self.speed * dt
-            if move_dist >= distance:
+            step = self.flow.direction(self.world_pos, self.flow_slack) if self.flow is not None else None
+            if step is not None:
+                direction = step
+                self.world_pos += step * move_dist
+            elif move_dist >= distance:
+                self.flow = None
                 self.world_pos = self.target_pos
             else:
+                self.flow = None
                 self.world_pos += direction.normalize() * move_dist
 
             desired_angle = math.degrees(math.atan2(-direction.y, direction.x))
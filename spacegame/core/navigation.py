@@ -0,0 +1,259 @@
+"""Grid navigation around asteroids and stations with shared flow fields.
+
+`NavGrid` rasterises the location's obstacles (asteroid circles, station
+sprite masks) onto a coarse grid covering the play area. A `FlowField`
+for a goal cell is built once with a Dijkstra pass from the goal and
+stores, per cell, the step toward the goal and the path cost. Every unit
+ordered to that destination shares the field, so a group move costs one
+build plus an O(1) lookup per unit per frame:
+
+    nav = get_navigator()
+    nav.sync(asteroid_group, station_group)
+    field = nav.field_to(destination)        # cached by goal cell
+    for ship in group:
+        ship.mover.set_target(destination + ship.mover.formation_offset)
+        ship.mover.follow(field, slack=ship.mover.formation_offset.length())
+
+Fields are kept in an LRU cache keyed by goal cell and dropped whenever
+the obstacles change. Units leave the field and fly straight once their
+remaining path is within their slack of the goal.
+"""
+import heapq
+import math
+from collections import OrderedDict
+from typing import Iterable, List, Optional, Tuple
+
+import pygame
+from pygame.math import Vector2
+
+from spacegame.config import (
+    SCREEN_WIDTH,
+    SCREEN_HEIGHT,
+    NAV_CELL_SIZE,
+    NAV_MARGIN,
+    NAV_CLEARANCE,
+    NAV_FIELD_CACHE,
+    NAV_ARRIVE_RADIUS,
+)
+
+
+# neighbour offsets (dx, dy, cost); diagonal cost ~ 10 * sqrt(2)
+# (opposite steps are paired so that `k ^ 1` reverses step k)
+_STEPS = ((1, 0, 10), (-1, 0, 10), (0, 1, 10), (0, -1, 10),
+          (1, 1, 14), (-1, -1, 14), (1, -1, 14), (-1, 1, 14))
+# unit vector per step index; index 8 means "at the goal"
+_DIRS = [Vector2(dx, dy).normalize() for dx, dy, _ in _STEPS]
+_AT_GOAL = 8
+_NO_PATH = 255
+_INF = 1 << 30
+
+
+class NavGrid:
+    """Blocked cells over a world rect, rasterised from obstacles."""
+
+    def __init__(self, bounds: Optional[pygame.Rect] = None, cell_size: int = NAV_CELL_SIZE):
+        if bounds is None:
+            bounds = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT).inflate(2 * NAV_MARGIN, 2 * NAV_MARGIN)
+        self.bounds = pygame.Rect(bounds)
+        self.cell_size = max(4, int(cell_size))
+        self.cols = max(1, -(-self.bounds.width // self.cell_size))
+        self.rows = max(1, -(-self.bounds.height // self.cell_size))
+        self.blocked = bytearray(self.cols * self.rows)
+        self.blocked_count = 0
+        self.version = 0
+
+    def cell_of(self, x: float, y: float) -> Tuple[int, int]:
+        """Cell containing world point (x, y), clamped to the grid."""
+        cs = self.cell_size
+        cx = int((x - self.bounds.left) // cs)
+        cy = int((y - self.bounds.top) // cs)
+        return (min(max(cx, 0), self.cols - 1), min(max(cy, 0), self.rows - 1))
+
+    def index_of(self, x: float, y: float) -> int:
+        cx, cy = self.cell_of(x, y)
+        return cy * self.cols + cx
+
+    def center_of(self, cx: int, cy: int) -> Tuple[float, float]:
+        cs = self.cell_size
+        return (self.bounds.left + (cx + 0.5) * cs, self.bounds.top + (cy + 0.5) * cs)
+
+    # ---- Rasterising ----
+    def clear(self) -> None:
+        self.blocked = bytearray(self.cols * self.rows)
+        self.blocked_count = 0
+        self.version += 1
+
+    def _cell_span(self, left: float, top: float, right: float, bottom: float):
+        cx0, cy0 = self.cell_of(left, top)
+        cx1, cy1 = self.cell_of(right, bottom)
+        return range(cx0, cx1 + 1), range(cy0, cy1 + 1)
+
+    def _block(self, cx: int, cy: int) -> None:
+        i = cy * self.cols + cx
+        if not self.blocked[i]:
+            self.blocked[i] = 1
+            self.blocked_count += 1
+
+    def block_circle(self, x: float, y: float, radius: float) -> None:
+        """Block every cell that overlaps the circle of `radius` around (x, y)."""
+        r2 = radius * radius
+        half = self.cell_size / 2.0
+        xs, ys = self._cell_span(x - radius, y - radius, x + radius, y + radius)
+        for cy in ys:
+            for cx in xs:
+                px, py = self.center_of(cx, cy)
+                # closest point of the cell to the circle's center
+                dx = max(abs(px - x) - half, 0.0)
+                dy = max(abs(py - y) - half, 0.0)
+                if dx * dx + dy * dy < r2:
+                    self._block(cx, cy)
+
+    def block_mask(self, rect: pygame.Rect, mask: pygame.mask.Mask) -> None:
+        """Block cells whose center falls on a set pixel of `mask` placed at `rect`."""
+        xs, ys = self._cell_span(rect.left, rect.top, rect.right - 1, rect.bottom - 1)
+        for cy in ys:
+            for cx in xs:
+                px, py = self.center_of(cx, cy)
+                mx, my = int(px) - rect.left, int(py) - rect.top
+                if 0 <= mx < rect.width and 0 <= my < rect.height and mask.get_at((mx, my)):
+                    self._block(cx, cy)
+
+
+class FlowField:
+    """Per-cell step toward one goal cell, with the path cost to it."""
+
+    __slots__ = ("grid", "goal", "goal_pos", "dirs", "cost")
+
+    def __init__(self, grid: NavGrid, goal: Tuple[int, int]):
+        self.grid = grid
+        self.goal = goal
+        self.goal_pos = Vector2(grid.center_of(*goal))
+        self.dirs = bytearray([_NO_PATH]) * (grid.cols * grid.rows)
+        self.cost: List[int] = [_INF] * (grid.cols * grid.rows)
+        self._build()
+
+    def _build(self) -> None:
+        grid = self.grid
+        cols, rows = grid.cols, grid.rows
+        blocked = grid.blocked
+        cost = self.cost
+        dirs = self.dirs
+        gx, gy = self.goal
+        start = gy * cols + gx
+        cost[start] = 0
+        dirs[start] = _AT_GOAL
+        heap = [(0, start)]
+        while heap:
+            c, i = heapq.heappop(heap)
+            if c != cost[i]:
+                continue
+            cy, cx = divmod(i, cols)
+            inside = blocked[i]
+            for k, (dx, dy, step) in enumerate(_STEPS):
+                nx, ny = cx + dx, cy + dy
+                if not (0 <= nx < cols and 0 <= ny < rows):
+                    continue
+                j = ny * cols + nx
+                # free cells never lead into an obstacle; a goal inside an
+                # obstacle is reached through that obstacle's cells
+                if blocked[j] and not inside:
+                    continue
+                # no corner cutting past an obstacle
+                if dx and dy and not inside and (blocked[cy * cols + nx] or blocked[ny * cols + cx]):
+                    continue
+                nc = c + step
+                if nc < cost[j]:
+                    cost[j] = nc
+                    # the step from j back toward i is the opposite of k
+                    dirs[j] = k ^ 1
+                    heapq.heappush(heap, (nc, j))
+        # cells inside other obstacles: step out to the cheapest free neighbour
+        if grid.blocked_count:
+            for i in range(cols * rows):
+                if dirs[i] != _NO_PATH:
+                    continue
+                cy, cx = divmod(i, cols)
+                best, best_k = _INF, _NO_PATH
+                for k, (dx, dy, step) in enumerate(_STEPS):
+                    nx, ny = cx + dx, cy + dy
+                    if 0 <= nx < cols and 0 <= ny < rows and cost[ny * cols + nx] + step < best:
+                        best, best_k = cost[ny * cols + nx] + step, k
+                if best_k != _NO_PATH:
+                    cost[i] = best
+                    dirs[i] = best_k
+
+    def path_length(self, pos) -> float:
+        """Approximate path length (pixels) from `pos` to the goal; inf if unreachable."""
+        c = self.cost[self.grid.index_of(pos[0], pos[1])]
+        return math.inf if c >= _INF else c * self.grid.cell_size / 10.0
+
+    def direction(self, pos, slack: float = 0.0) -> Optional[Vector2]:
+        """Unit step toward the goal at `pos`, or None once within `slack` + arrival radius of it."""
+        i = self.grid.index_of(pos[0], pos[1])
+        c = self.cost[i]
+        if c >= _INF or c * self.grid.cell_size / 10.0 <= slack + NAV_ARRIVE_RADIUS:
+            return None
+        k = self.dirs[i]
+        return _DIRS[k] if k < _AT_GOAL else None
+
+
+class Navigator:
+    """Nav grid for the current location plus an LRU cache of flow fields."""
+
+    def __init__(self, bounds: Optional[pygame.Rect] = None, cell_size: int = NAV_CELL_SIZE,
+                 max_fields: int = NAV_FIELD_CACHE):
+        self.grid = NavGrid(bounds, cell_size)
+        self.max_fields = max(1, int(max_fields))
+        self._fields: "OrderedDict[Tuple[int, int], FlowField]" = OrderedDict()
+        self._signature = None
+        # metrics
+        self.builds = 0
+        self.hits = 0
+
+    def sync(self, asteroids: Iterable = (), stations: Iterable = ()) -> None:
+        """Re-rasterise the grid if the obstacle set changed since the last call."""
+        asteroids = list(asteroids)
+        stations = list(stations)
+        signature = (tuple((id(a), a.pos.x, a.pos.y) for a in asteroids),
+                     tuple((id(s), tuple(s.rect)) for s in stations))
+        if signature == self._signature:
+            return
+        self._signature = signature
+        grid = self.grid
+        grid.clear()
+        for a in asteroids:
+            grid.block_circle(a.pos.x, a.pos.y, float(a.bounding_radius()) + NAV_CLEARANCE)
+        for s in stations:
+            image = getattr(s, "image", None)
+            if image is not None:
+                grid.block_mask(s.rect, pygame.mask.from_surface(image))
+        self._fields.clear()
+
+    def field_to(self, point) -> Optional[FlowField]:
+        """Shared flow field toward `point`; None when nothing is in the way."""
+        if not self.grid.blocked_count:
+            return None
+        goal = self.grid.cell_of(point[0], point[1])
+        field = self._fields.get(goal)
+        if field is not None:
+            self._fields.move_to_end(goal)
+            self.hits += 1
+            return field
+        field = FlowField(self.grid, goal)
+        self.builds += 1
+        self._fields[goal] = field
+        if len(self._fields) > self.max_fields:
+            self._fields.popitem(last=False)
+        return field
+
+
+# Global singleton instance
+_instance: Optional[Navigator] = None
+
+
+def get_navigator() -> Navigator:
+    """Get or create the global navigator."""
+    global _instance
+    if _instance is None:
+        _instance = Navigator()
+    return _instance
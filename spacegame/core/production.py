@@ -0,0 +1,235 @@
+"""Production chain: ores, refined materials and blueprints as one graph.
+
+Nodes are inventory keys (``"M"``, ``"A"`` ... raw ores, ``"RA"`` ... refined
+materials) and blueprint classes. Each node lists the inputs one unit of it
+consumes, so the graph reads as a DAG from raw ore up to finished units:
+
+    M, A ──(2:1)──> RA ──┐
+    C ─────(2:1)──> RC ──┼──> BPFabricator
+    M ───────────────────┘
+
+Everything derived from the model classes (tiers, previews, recipes,
+blueprint requirement rows, raw-ore totals) is computed once and memoized,
+so screens and managers can ask for it every frame:
+
+    graph = get_production_graph()
+    graph.refining_recipe("A")          # 200 A -> 100 RA
+    graph.raw_ore_for(BPFabricator(), 3)
+    graph.build_time_s(bp, 10, fab_module)
+"""
+import math
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from spacegame.config import REFINING_INPUT_PER_OUTPUT, REFINING_BATCH_OUTPUT
+from spacegame.models.ores.orem import RUOreM
+from spacegame.models.ores.orea import RUOreA
+from spacegame.models.ores.oreb import RUOreB
+from spacegame.models.ores.orec import RUOreC
+from spacegame.models.resources.refineda import RURefinedA
+from spacegame.models.resources.refinedb import RURefinedB
+from spacegame.models.resources.refinedc import RURefinedC
+
+
+# Inventory key -> item class
+ORE_CLASSES = {"M": RUOreM, "A": RUOreA, "B": RUOreB, "C": RUOreC}
+REFINED_CLASSES = {"RA": RURefinedA, "RB": RURefinedB, "RC": RURefinedC}
+# Refinery output for each raw ore (M has no refined form of its own)
+REFINES_TO = {"M": "RA", "A": "RA", "B": "RB", "C": "RC"}
+
+
+class Item(NamedTuple):
+    """Static facts about an inventory item."""
+
+    key: str
+    name: str
+    tier: int
+    preview_filename: Optional[str]
+    raw: bool
+
+
+class RefiningRecipe(NamedTuple):
+    """One refinery run; field names match what the refining manager persists."""
+
+    required_ore_letter: str
+    required_ore_amount: int
+    output_ore_letter: Optional[str]
+    output_ore_amount: int
+    preview_filename: Optional[str]
+    ore_tier: int
+
+
+class Requirement(NamedTuple):
+    """One row of a blueprint's cost as shown on the fabrication screen."""
+
+    letter: str  # label shown on the tier flag ("M", "A", ...)
+    amount: int
+    tier: int
+    keys: Tuple[str, ...]  # inventory keys to check, preferred first
+    preview_filename: Optional[str]
+
+
+def _describe(key: str, cls) -> Item:
+    obj = cls(quantity=0)
+    return Item(key, obj.name, int(obj.tier), getattr(obj, "preview_filename", None), key in ORE_CLASSES)
+
+
+class ProductionGraph:
+    """Memoized queries over the ore -> refined -> blueprint graph."""
+
+    def __init__(self):
+        self.items: Dict[str, Item] = {}
+        for key, cls in list(ORE_CLASSES.items()) + list(REFINED_CLASSES.items()):
+            self.items[key] = _describe(key, cls)
+        self._requirements: Dict[type, Tuple[Requirement, ...]] = {}
+        self._raw: Dict[object, Dict[str, float]] = {}
+        self._recipes: Dict[Tuple[str, int], RefiningRecipe] = {}
+
+    # ---- Items and refining ----
+    def item(self, key: str) -> Optional[Item]:
+        return self.items.get(key)
+
+    def ore_tier(self, letter: str) -> int:
+        """Tier used to scale refinement time (tier-0 ores count as 1)."""
+        item = self.items.get(letter)
+        return max(1, item.tier) if item is not None else 1
+
+    def refining_recipe(self, ore_letter: str, output_amount: int = REFINING_BATCH_OUTPUT) -> RefiningRecipe:
+        """Recipe for refining `ore_letter` into `output_amount` refined units."""
+        memo_key = (ore_letter, int(output_amount))
+        recipe = self._recipes.get(memo_key)
+        if recipe is not None:
+            return recipe
+        out_key = REFINES_TO.get(ore_letter)
+        out_item = self.items.get(out_key) if out_key else None
+        item = self.items.get(ore_letter)
+        recipe = RefiningRecipe(
+            required_ore_letter=ore_letter,
+            required_ore_amount=int(output_amount) * REFINING_INPUT_PER_OUTPUT,
+            output_ore_letter=out_key,
+            output_ore_amount=int(output_amount),
+            preview_filename=out_item.preview_filename if out_item else None,
+            ore_tier=item.tier if item else 1,
+        )
+        self._recipes[memo_key] = recipe
+        return recipe
+
+    def refining_time_s(self, ore_letter: str, module=None) -> int:
+        """Seconds for one refinement run of `ore_letter` on `module`."""
+        standard_s = float(getattr(module, "standard_refinement_time_s", 75.0))
+        factor = float(getattr(module, "base_refinement_time", 1.0))
+        return int(standard_s * factor * self.ore_tier(ore_letter))
+
+    # ---- Blueprints ----
+    def requirements(self, bp) -> Tuple[Requirement, ...]:
+        """Cost rows for blueprint `bp`, from `required_resources` or the legacy ore fields."""
+        cls = type(bp)
+        rows = self._requirements.get(cls)
+        if rows is not None:
+            return rows
+        rows = []
+        resources = getattr(bp, "required_resources", None)
+        if isinstance(resources, dict):
+            for letter, amt in resources.items():
+                letter = str(letter)
+                refined_key = "R" + letter
+                if refined_key in REFINED_CLASSES:
+                    # A/B/C costs are refined materials; raw ore also counts
+                    tier = int(getattr(bp, "tier", getattr(bp, "required_ore_tier", 1)))
+                    keys = (refined_key, letter)
+                    preview = f"RUIngot{letter}T{tier}.png"
+                else:
+                    # raw ore M is tier 0 (unrefined)
+                    tier = int(getattr(bp, "required_ore_tier", 0))
+                    keys = (letter,)
+                    preview = None
+                rows.append(Requirement(letter, int(amt), tier, keys, preview))
+        else:
+            letter = getattr(bp, "required_ore_letter", None)
+            if letter is not None:
+                tier = int(getattr(bp, "required_ore_tier", getattr(bp, "tier", 1)))
+                if letter == "M":
+                    tier = int(getattr(bp, "required_ore_tier", 0))
+                preview = None if letter == "M" else f"RUIngot{letter}T{tier}.png"
+                rows.append(Requirement(letter, int(getattr(bp, "required_ore_amount", 0)), tier, (letter,), preview))
+        rows = tuple(rows)
+        self._requirements[cls] = rows
+        return rows
+
+    @staticmethod
+    def available(req: Requirement, inv_mgr) -> int:
+        """Amount of `req` the inventory holds (refined stock preferred over raw)."""
+        if inv_mgr is None:
+            return 0
+        try:
+            for key in req.keys[:-1]:
+                amount = int(inv_mgr.get_amount(key))
+                if amount > 0:
+                    return amount
+            return int(inv_mgr.get_amount(req.keys[-1]))
+        except Exception:
+            return 0
+
+    @staticmethod
+    def refined_source(key: str) -> Optional[str]:
+        """The raw ore a refined material is normally made from (RA <- A)."""
+        src = key[1:]
+        return src if REFINES_TO.get(src) == key else None
+
+    def inputs(self, node) -> Dict[str, float]:
+        """Direct inputs (inventory key -> amount) for one unit of `node`."""
+        if isinstance(node, str):
+            src = self.refined_source(node)
+            return {src: float(REFINING_INPUT_PER_OUTPUT)} if src else {}
+        return {req.keys[0]: float(req.amount) for req in self.requirements(node)}
+
+    def raw_ore_per_unit(self, node) -> Dict[str, float]:
+        """Raw ore (key -> amount) behind one unit of `node`, memoized per node."""
+        memo_key = node if isinstance(node, str) else type(node)
+        raw = self._raw.get(memo_key)
+        if raw is not None:
+            return raw
+        inputs = self.inputs(node)
+        if not inputs:
+            raw = {node: 1.0} if isinstance(node, str) else {}
+        else:
+            raw = {}
+            for key, amt in inputs.items():
+                for ore, per in self.raw_ore_per_unit(key).items():
+                    raw[ore] = raw.get(ore, 0.0) + amt * per
+        self._raw[memo_key] = raw
+        return raw
+
+    def raw_ore_for(self, bp, n: int = 1) -> Dict[str, int]:
+        """Total raw ore needed to build `n` units of blueprint `bp` from scratch."""
+        return {ore: int(math.ceil(amt * n)) for ore, amt in self.raw_ore_per_unit(bp).items()}
+
+    def fabrication_time_s(self, bp, module=None) -> float:
+        """Seconds to fabricate one unit of `bp` on `module`."""
+        blueprint_time = float(getattr(bp, "base_fabrication_time", 0))
+        return blueprint_time * float(getattr(module, "base_fabrication_time", 1.0))
+
+    def build_time_s(self, bp, n: int = 1, fab_module=None, refinery=None) -> int:
+        """Seconds to build `n` units on one fabricator, refining inputs on one refinery.
+
+        Refined inputs are refined in whole `REFINING_BATCH_OUTPUT` runs
+        before fabrication starts.
+        """
+        total = self.fabrication_time_s(bp, fab_module) * n
+        for key, amt in self.inputs(bp).items():
+            if key not in REFINED_CLASSES:
+                continue
+            runs = int(math.ceil(amt * n / REFINING_BATCH_OUTPUT))
+            total += runs * self.refining_time_s(self.refined_source(key), refinery)
+        return int(total)
+
+
+# Global singleton instance
+_instance: Optional[ProductionGraph] = None
+
+
+def get_production_graph() -> ProductionGraph:
+    """Get or create the global production graph."""
+    global _instance
+    if _instance is None:
+        _instance = ProductionGraph()
+    return _instance
@@ -1,8 +1,63 @@
-import pygame
+from types import SimpleNamespace
 from typing import List
 from spacegame.models.modules.refinerymodule import RefineryModule
 from spacegame.core.modules_manager import manager as modules_manager
-from spacegame.core.sound_manager import get_sound_manager
+from spacegame.core import events
+from spacegame.core.save_scheduler import record_change
+from spacegame.core.job_scheduler import get_job_scheduler, now_ms
+from spacegame.core.game_clock import get_game_clock
+from spacegame.core.production import get_production_graph
+from spacegame.config import REFINING_BATCH_OUTPUT
+
+
+def refinement_job_payload(module):
+    """Return the persisted description of `module`'s job, or None when idle.
+
+    Carries the same `due` / `anchor` fields as `fabrication_job_payload`.
+    """
+    recipe = getattr(module, "refinement_recipe", None)
+    if recipe is None:
+        return None
+    total_ms = int(getattr(module, "refinement_total_ms", 0))
+    start_ticks = int(getattr(module, "refinement_start_ticks", 0))
+    return {
+        "recipe": {
+            "in": getattr(recipe, "required_ore_letter", None),
+            "in_amt": int(getattr(recipe, "required_ore_amount", 0)),
+            "out": getattr(recipe, "output_ore_letter", None),
+            "out_amt": int(getattr(recipe, "output_ore_amount", 0)),
+            "preview": getattr(recipe, "preview_filename", None),
+        },
+        "total_ms": total_ms,
+        "start_ticks": start_ticks,
+        "due": start_ticks + total_ms,
+        "anchor": get_game_clock().anchor(),
+    }
+
+
+def restore_refinement_job(module, job, start_ms: int) -> bool:
+    """Load a persisted job description into `module` (cleared when `job` is None).
+
+    Returns True if the module now has a running job.
+    """
+    if not job:
+        module.refinement_total_ms = 0
+        module.refinement_start_ticks = 0
+        module.refinement_recipe = None
+        module.refinement_progress = 0.0
+        return False
+    r = job.get("recipe") or {}
+    module.refinement_recipe = SimpleNamespace(
+        required_ore_letter=r.get("in"),
+        required_ore_amount=int(r.get("in_amt", 0)),
+        output_ore_letter=r.get("out"),
+        output_ore_amount=int(r.get("out_amt", 0)),
+        preview_filename=r.get("preview"),
+    )
+    module.refinement_total_ms = int(job.get("total_ms", 0))
+    module.refinement_start_ticks = int(start_ms)
+    module.refinement_progress = 0.0
+    return True
 
 
 class RefiningManager:
@@ -28,6 +83,35 @@ class RefiningManager:
             return mods[index]
         return None
 
+    # ---- Scheduling ----
+    @staticmethod
+    def _job_key(module):
+        return ("ref", id(module))
+
+    def _schedule(self, module) -> None:
+        """Register `module`'s running refinement with the job scheduler."""
+        get_job_scheduler().schedule(
+            self._job_key(module),
+            int(module.refinement_start_ticks),
+            int(module.refinement_total_ms),
+            lambda: self._on_job_due(module),
+        )
+
+    def _on_job_due(self, module) -> None:
+        for i, m in enumerate(self.get_modules() or []):
+            if m is module:
+                self._finalize_refinement(i)
+                return
+
+    def sync_jobs(self) -> None:
+        """Re-register jobs after module state was restored from a save or snapshot."""
+        scheduler = get_job_scheduler()
+        for module in self.get_modules() or []:
+            if getattr(module, "refinement_recipe", None) is not None and int(getattr(module, "refinement_total_ms", 0)) > 0:
+                self._schedule(module)
+            else:
+                scheduler.cancel(self._job_key(module))
+
     def start_refinement(self, index: int, ore_letter_or_recipe, output_amount: int = None, player=None) -> bool:
         """Start refining using either a recipe object or an ore letter.
 
@@ -35,38 +119,17 @@ class RefiningManager:
         - start_refinement(index, recipe_obj, player)
         - start_refinement(index, ore_letter, output_amount, player)
 
-        If an ore letter is provided we synthesize a simple recipe using a
-        standard conversion (default 2:1 input->output, e.g. 200 -> 100) and
-        a default base_refinement_time.
+        If an ore letter is provided the recipe comes from the production
+        graph (standard 2:1 input->output, e.g. 200 -> 100).
         """
         module = self.get_module(index)
         if ore_letter_or_recipe is None:
             return False
 
-        # If caller passed a recipe-like object, use it directly. Otherwise build one.
-        recipe = None
+        graph = get_production_graph()
         if isinstance(ore_letter_or_recipe, str):
-            ore_letter = ore_letter_or_recipe
-            out_amt = int(output_amount) if output_amount is not None else 100
-            # default conversion: 2 ore -> 1 refined (so input = out_amt * 2)
-            in_amt = out_amt * 2
-
-            out_letter_map = {'A': 'RA', 'B': 'RB', 'C': 'RC', 'M': 'RA'}
-            out_letter = out_letter_map.get(ore_letter, None)
-
-            preview_map = {'A': 'RUIngotAT1.png', 'B': 'RUIngotBT1.png', 'C': 'RUIngotCT1.png', 'M': 'RUIngotAT1.png'}
-
-            # synthesize lightweight recipe object
-            class _R:
-                pass
-
-            recipe = _R()
-            recipe.required_ore_letter = ore_letter
-            recipe.required_ore_amount = in_amt
-            recipe.output_ore_letter = out_letter
-            recipe.output_ore_amount = out_amt
-            recipe.base_refinement_time = getattr(module, 'base_refinement_time', 10)
-            recipe.preview_filename = preview_map.get(ore_letter, None)
+            out_amt = int(output_amount) if output_amount is not None else REFINING_BATCH_OUTPUT
+            recipe = graph.refining_recipe(ore_letter_or_recipe, out_amt)
         else:
             # assume recipe-like object
             recipe = ore_letter_or_recipe
@@ -82,36 +145,16 @@ class RefiningManager:
         if available < ore_amount:
             return False
 
-        # Get ore tier from ore class to factor into refinement time
-        ore_tier = 1
-        try:
-            ore_classes = {
-                'M': None, 'A': None, 'B': None, 'C': None,
-            }
-            if ore_letter in ore_classes:
-                from spacegame.models.ores.orem import RUOreM
-                from spacegame.models.ores.orea import RUOreA
-                from spacegame.models.ores.oreb import RUOreB
-                from spacegame.models.ores.orec import RUOreC
-                ore_classes = {'M': RUOreM, 'A': RUOreA, 'B': RUOreB, 'C': RUOreC}
-                ore_class = ore_classes.get(ore_letter, RUOreM)
-                ore_obj = ore_class(quantity=1)
-                ore_tier = int(getattr(ore_obj, 'tier', 1) or 1)
-        except Exception:
-            ore_tier = 1
-
-        # Use standard_refinement_time_s (in seconds) and apply module factor and ore tier
         if module is None:
             return False
 
-        module_standard_s = float(getattr(module, 'standard_refinement_time_s', 75.0))
-        module_factor = float(getattr(module, "base_refinement_time", 1.0))
-        total_seconds = int(module_standard_s * module_factor * ore_tier)
-        total_ms = max(1, int(total_seconds * 1000))
+        # standard_refinement_time_s (seconds) scaled by module factor and ore tier
+        total_ms = max(1, int(graph.refining_time_s(ore_letter, module) * 1000))
         module.refinement_total_ms = int(total_ms)
-        module.refinement_start_ticks = int(pygame.time.get_ticks())
+        module.refinement_start_ticks = now_ms()
         module.refinement_recipe = recipe
         module.refinement_progress = 0.0
+        self._schedule(module)
 
         if ore_letter is not None:
             if inv_mgr is None:
@@ -119,6 +162,8 @@ class RefiningManager:
             # consume the input ore amount
             inv_mgr.consume_resource(ore_letter, ore_amount)
 
+        record_change("job", kind="ref", module=module.module_id, job=refinement_job_payload(module))
+
         try:
             self.player = player
         except Exception:
@@ -134,6 +179,8 @@ class RefiningManager:
         module.refinement_start_ticks = 0
         module.refinement_progress = 0.0
         module.refinement_recipe = None
+        get_job_scheduler().cancel(self._job_key(module))
+        record_change("job", kind="ref", module=module.module_id, job=None)
 
     def speed_up(self, index: int) -> None:
         module = self.get_module(index)
@@ -141,13 +188,18 @@ class RefiningManager:
             return
         total_ms = int(getattr(module, "refinement_total_ms", 0))
         if total_ms > 0:
-            module.refinement_start_ticks = int(pygame.time.get_ticks()) - int(total_ms)
+            module.refinement_start_ticks = now_ms() - int(total_ms)
+            self._schedule(module)
+            record_change("job", kind="ref", module=module.module_id, job=refinement_job_payload(module))
 
     def get_status(self, index: int):
         """Return status dict for refinement slot `index`.
 
         Keys: total_ms, start_ticks, progress (0..1), remaining_s, is_refining, recipe
         """
+        now_ticks = now_ms()
+        scheduler = get_job_scheduler()
+        scheduler.run_due(now_ticks)
         module = self.get_module(index)
         recipe = getattr(module, "refinement_recipe", None) if module is not None else None
         if recipe is None:
@@ -167,19 +219,18 @@ class RefiningManager:
 
         total_ms = int(getattr(module, "refinement_total_ms", 0)) if module is not None else 0
         start_ticks = int(getattr(module, "refinement_start_ticks", 0)) if module is not None else 0
-        now_ticks = int(pygame.time.get_ticks())
 
         if total_ms > 0 and start_ticks > 0:
-            elapsed = max(0, now_ticks - start_ticks)
-            progress = min(1.0, elapsed / float(total_ms))
-            remaining_ms = max(0, total_ms - elapsed)
+            key = self._job_key(module)
+            if key not in scheduler:
+                # job state restored without going through start_refinement
+                self._schedule(module)
+                scheduler.run_due(now_ticks)
+            progress, remaining_ms = scheduler.progress(key, now_ticks)
+            if key not in scheduler:
+                progress = 1.0
             remaining_s = remaining_ms // 1000
             is_refining = progress < 1.0
-            if progress >= 1.0:
-                try:
-                    self._finalize_refinement(index)
-                except Exception:
-                    pass
         else:
             progress = 0.0
             remaining_s = int(getattr(module, "base_refinement_time", 0)) if module is not None else 0
@@ -198,11 +249,12 @@ class RefiningManager:
             "recipe": getattr(module, "refinement_recipe", None),
         }
 
-    def _finalize_refinement(self, index: int) -> None:
+    def _finalize_refinement(self, index: int, offline: bool = False) -> None:
         """Finalize a completed refinement.
 
         Produces output resources defined by the recipe and adds them to the
-        player's InventoryManager using `add_resource`.
+        player's InventoryManager using `add_resource`. `offline` marks jobs
+        settled on load (no per-job popup or sound).
         """
         module = self.get_module(index)
         recipe = getattr(module, "refinement_recipe", None)
@@ -225,23 +277,21 @@ class RefiningManager:
 
         if out_letter is not None and out_amount > 0:
             try:
-                inv_mgr.add_resource(out_letter, out_amount, preview=preview)
+                inv_mgr.add_resource(out_letter, out_amount, preview=preview, notify=not offline)
             except Exception:
                 pass
 
-        # Play refinement complete sound
-        try:
-            sound_manager = get_sound_manager()
-            sound_manager.on_refining_complete()
-        except Exception:
-            pass
-
         # Clear module refinement state
         module.refinement_total_ms = 0
         module.refinement_start_ticks = 0
         module.refinement_progress = 0.0
         module.refinement_recipe = None
         module.refinement_remaining_s = 0
+        get_job_scheduler().cancel(self._job_key(module))
+        record_change("job", kind="ref", module=module.module_id, job=None)
+
+        events.get_event_bus().publish(events.JobFinished(
+            "ref", index, player, title=str(out_letter or ""), preview=preview, offline=offline))
 
     def get_selected_index(self) -> int:
         mods = self.get_modules() or []
@@ -258,9 +308,7 @@ class RefiningManager:
 
     def update(self) -> None:
         try:
-            mods = self.get_modules() or []
-            for i in range(len(mods)):
-                self.get_status(i)
+            get_job_scheduler().run_due()
         except Exception:
             pass
 
@@ -1,10 +1,13 @@
 import os
 import json
-import importlib
-from typing import Any
+
+from spacegame.core import codec
+from spacegame.core.save_journal import job_key
 
 
 SAVE_DIR_NAME = "save"
+# Single-file save written by older versions; still read when no journal
+# snapshot exists yet (see `save_journal`).
 SAVE_FILE_NAME = "autosave.json"
 
 
@@ -20,260 +23,282 @@ def _save_path() -> str:
     return os.path.join(save_dir, SAVE_FILE_NAME)
 
 
-def _is_primitive(v: Any) -> bool:
-    return isinstance(v, (int, float, str, bool, type(None)))
-
+def build_save_data(owner) -> dict:
+    """Return a JSON-ready snapshot of the player state held by `owner`.
 
-def _serialize_obj(o: Any) -> Any:
-    # modules, blueprints and other game objects -> dict with class + attrs
+    Only primitives, lists and dicts are produced, so the result can be
+    handed to another thread for encoding without touching live objects.
+    """
+    data = {}
+    inv = getattr(owner, "inventory_manager", None)
+    if inv is not None:
+        data["inventory"] = dict(getattr(inv, "inventory", {}))
+        # serialize unequipped modules
+        data["unequipped_modules"] = [codec.encode(m) for m in getattr(inv, "modules", []) or []]
+    # installed internal modules: prefer central manager state if available
     try:
-        cls = o.__class__
-        data = {
-            "__class__": cls.__name__,
-            "__module__": cls.__module__,
-            "attrs": {},
-        }
-        for k, v in vars(o).items():
-            if _is_primitive(v):
-                data["attrs"][k] = v
-            elif isinstance(v, (list, tuple)):
-                # try to shallow-serialize lists of primitives
-                serial = []
-                ok = True
-                for item in v:
-                    if _is_primitive(item):
-                        serial.append(item)
-                    else:
-                        ok = False
-                        break
-                if ok:
-                    data["attrs"][k] = serial
-        return data
+        from spacegame.core.modules_manager import manager as modules_manager
+
+        installed = modules_manager.get_internal_sections()
     except Exception:
-        return None
+        installed = getattr(owner, "installed_internal_modules", None)
+    if installed is None:
+        # Initialize to 3 empty sections if not set yet
+        installed = [[], [], []]
+    data["installed_internal_modules"] = [[codec.encode(m) for m in section] for section in installed]
 
+    # hangar info (if present)
+    hangar = getattr(owner, "hangar_system", None) or (getattr(inv, "hangar", None) if inv is not None else None)
+    if hangar is not None:
+        pool = [codec.encode(e) for e in getattr(hangar, "pool", []) or []]
+        data["hangar"] = {
+            "assignments": list(getattr(hangar, "assignments", [])),
+            "slots": list(getattr(hangar, "slots", [])),
+            "pool": pool,
+            "next_id": int(getattr(hangar, "next_id", 0)),
+        }
 
-def _deserialize_obj(d: dict) -> Any:
+    # in-flight production jobs, keyed by module id like the journal
+    jobs = {}
     try:
-        mod_name = d.get("__module__")
-        cls_name = d.get("__class__")
-        attrs = d.get("attrs", {}) or {}
-        mod = importlib.import_module(mod_name)
-        cls = getattr(mod, cls_name)
-        # create instance with no args then set attributes
-        inst = None
-        try:
-            inst = cls()
-        except Exception:
-            # Try constructing with tier/capacity if available
-            try:
-                init_kwargs = {}
-                if "tier" in attrs:
-                    init_kwargs["tier"] = attrs.get("tier")
-                if "module_size" in attrs:
-                    init_kwargs["module_size"] = attrs.get("module_size")
-                if "capacity" in attrs:
-                    init_kwargs["module_size"] = attrs.get("capacity")
-                inst = cls(**init_kwargs)
-            except Exception:
-                # give up
-                inst = None
-        if inst is None:
-            return None
-        for k, v in attrs.items():
-            try:
-                setattr(inst, k, v)
-            except Exception:
-                pass
-        return inst
+        from spacegame.core.fabrication import get_fabrication_manager, fabrication_job_payload
+        from spacegame.core.refining import get_refinery_manager, refinement_job_payload
+
+        for m in get_fabrication_manager(owner).get_modules() or []:
+            job = fabrication_job_payload(m)
+            if job is not None:
+                jobs[job_key("fab", m.module_id)] = job
+        for m in get_refinery_manager(owner).get_modules() or []:
+            job = refinement_job_payload(m)
+            if job is not None:
+                jobs[job_key("ref", m.module_id)] = job
+    except Exception:
+        pass
+    data["jobs"] = jobs
+    try:
+        from spacegame.core.game_clock import get_game_clock
+
+        data["clock"] = get_game_clock().anchor()
     except Exception:
-        return None
+        pass
+
+    system = getattr(owner, "location_system", None)
+    if system:
+        data["location"] = {"system": system, "area": getattr(owner, "location_area", None)}
+    return data
 
 
 def save_game(owner) -> None:
-    """Save the main pieces of player state to JSON file next to run.py."""
+    """Write a full snapshot of `owner`'s state synchronously.
+
+    Gameplay code should prefer `save_scheduler.record_change(...)` or
+    `get_save_scheduler().mark_dirty(owner)`, which write in the background.
+    """
     try:
-        data = {}
-        inv = getattr(owner, "inventory_manager", None)
-        if inv is not None:
-            data["inventory"] = dict(getattr(inv, "inventory", {}))
-            # serialize unequipped modules
-            mods = []
-            for m in getattr(inv, "modules", []) or []:
-                ser = _serialize_obj(m)
-                mods.append(ser)
-            data["unequipped_modules"] = mods
-        # installed internal modules: prefer central manager state if available
-        try:
-            from spacegame.core.modules_manager import manager as modules_manager
+        from spacegame.core.save_scheduler import get_save_scheduler
 
-            installed = modules_manager.get_internal_sections()
-        except Exception:
-            installed = getattr(owner, "installed_internal_modules", None)
-        if installed is None:
-            # Initialize to 3 empty sections if not set yet
-            installed = [[], [], []]
-        ser_installed = []
-        for section in installed:
-            sec = []
-            for m in section:
-                sec.append(_serialize_obj(m))
-            ser_installed.append(sec)
-        data["installed_internal_modules"] = ser_installed
-
-        # hangar info (if present)
-        hangar = getattr(owner, "hangar_system", None) or (getattr(inv, "hangar", None) if inv is not None else None)
-        if hangar is not None:
-            pool = []
-            for e in getattr(hangar, "pool", []) or []:
-                try:
-                    pool.append({
-                        "id": int(getattr(e, "id", -1)),
-                        "name": getattr(e, "name", ""),
-                        "unit_type": getattr(e, "unit_type", ""),
-                        "alive": bool(getattr(e, "alive", True)),
-                        "tier": int(getattr(e, "tier", 0)),
-                        "rarity": getattr(e, "rarity", ""),
-                    })
-                except Exception:
-                    continue
-            data["hangar"] = {
-                "assignments": list(getattr(hangar, "assignments", [])),
-                "slots": list(getattr(hangar, "slots", [])),
-                "pool": pool,
-            }
-
-        path = _save_path()
-        # Write atomically: write to a temp file then replace
-        tmp_path = path + ".tmp"
-        try:
-            with open(tmp_path, "w", encoding="utf-8") as fh:
-                json.dump(data, fh, indent=2)
-                try:
-                    fh.flush()
-                    os.fsync(fh.fileno())
-                except Exception:
-                    pass
-            # Replace the target file atomically
-            try:
-                os.replace(tmp_path, path)
-            except Exception:
-                # fallback to rename on older systems
-                try:
-                    os.remove(path)
-                except Exception:
-                    pass
-                try:
-                    os.rename(tmp_path, path)
-                except Exception:
-                    # last resort: write directly
-                    with open(path, "w", encoding="utf-8") as fh:
-                        json.dump(data, fh, indent=2)
-        except Exception:
-            # If atomic write failed, try a direct write as fallback
-            try:
-                with open(path, "w", encoding="utf-8") as fh:
-                    json.dump(data, fh, indent=2)
-            except Exception:
-                pass
+        scheduler = get_save_scheduler()
+        scheduler.mark_dirty(owner)
+        scheduler.flush()
     except Exception:
         # never crash game due to save errors
         return
 
 
+def load_save_data():
+    """Return (data, last_seq, has_snapshot) for the persisted state.
+
+    Reads the journaled snapshot + change log; falls back to the legacy
+    single-file autosave when no journal state exists yet.
+    """
+    from spacegame.core import save_journal
+
+    data, last_seq, has_snapshot = save_journal.load_state()
+    if data is not None:
+        return data, last_seq, has_snapshot
+    path = _save_path()
+    if not os.path.exists(path):
+        return None, 0, False
+    with open(path, "r", encoding="utf-8") as fh:
+        return json.load(fh), 0, False
+
+
 def load_game(owner) -> bool:
     """Load saved state into `owner`. Returns True if a save was loaded."""
     try:
-        path = _save_path()
-        if not os.path.exists(path):
+        from spacegame.core.save_scheduler import get_save_scheduler
+
+        scheduler = get_save_scheduler()
+        # land queued records first so the load sees the latest state
+        scheduler.flush()
+        data, last_seq, has_snapshot = load_save_data()
+        scheduler.resume_from(last_seq)
+        if data is None:
+            # new game: persist the starting state as the journal's base
+            scheduler.mark_dirty(owner)
             return False
-        with open(path, "r", encoding="utf-8") as fh:
-            data = json.load(fh)
+        from spacegame.core.modules_manager import manager as modules_manager
 
-        inv = getattr(owner, "inventory_manager", None)
-        if inv is not None and "inventory" in data:
-            try:
-                inv.inventory = dict(data.get("inventory", {}))
-            except Exception:
-                pass
+        reissued = modules_manager.reissued_ids
+        # restoring state must not journal itself
+        with scheduler.suspended():
+            apply_save_data(owner, data)
+        # ...but settling jobs that finished offline must (outputs, cleared jobs)
+        try:
+            resume_jobs(owner, data)
+        except Exception:
+            pass
+        if not has_snapshot or modules_manager.reissued_ids != reissued:
+            # migrate a legacy save (or a journal without base, or modules
+            # saved without ids) to a snapshot
+            scheduler.mark_dirty(owner)
+        return True
+    except Exception:
+        return False
 
-        if inv is not None and "unequipped_modules" in data:
-            inv.modules = []
-            for ser in data.get("unequipped_modules", []) or []:
-                if ser is None:
-                    continue
-                obj = _deserialize_obj(ser)
-                if obj is not None:
-                    inv.modules.append(obj)
 
-        if "installed_internal_modules" in data:
+def apply_save_data(owner, data: dict) -> None:
+    """Restore a `build_save_data`-shaped dict into `owner`."""
+    inv = getattr(owner, "inventory_manager", None)
+    if inv is not None and "inventory" in data:
+        try:
+            inv.inventory = dict(data.get("inventory", {}))
+        except Exception:
+            pass
+
+    if inv is not None and "unequipped_modules" in data:
+        inv.modules = []
+        for ser in data.get("unequipped_modules", []) or []:
+            if ser is None:
+                continue
+            obj = codec.decode(ser)
+            if obj is not None:
+                inv.modules.append(obj)
+
+    if "installed_internal_modules" in data:
+        try:
+            inst = []
+            for section in data.get("installed_internal_modules", []) or []:
+                sec = []
+                for ser in section:
+                    if ser is None:
+                        continue
+                    obj = codec.decode(ser)
+                    if obj is not None:
+                        sec.append(obj)
+                inst.append(sec)
             try:
-                inst = []
-                for section in data.get("installed_internal_modules", []) or []:
-                    sec = []
-                    for ser in section:
-                        if ser is None:
-                            continue
-                        obj = _deserialize_obj(ser)
-                        if obj is not None:
-                            sec.append(obj)
-                    inst.append(sec)
-                try:
-                    setattr(owner, "installed_internal_modules", inst)
-                except Exception:
-                    pass
-                # Also restore central ModulesManager state for runtime use
-                try:
-                    from spacegame.core.modules_manager import manager as modules_manager
-
-                    modules_manager.set_internal_sections(inst)
-                except Exception:
-                    pass
+                setattr(owner, "installed_internal_modules", inst)
             except Exception:
                 pass
-
-        if "hangar" in data:
+            # Also restore central ModulesManager state for runtime use
             try:
-                hang = getattr(owner, "hangar_system", None) or (inv.hangar if inv is not None else None)
-                if hang is not None:
-                    pool = []
-                    try:
-                        from spacegame.core.hangar import HangarEntry
-                        for e in data.get("hangar", {}).get("pool", []) or []:
-                            try:
-                                entry = HangarEntry(
-                                    id=int(e.get("id", -1)),
-                                    name=e.get("name", ""),
-                                    unit_type=e.get("unit_type", ""),
-                                    alive=bool(e.get("alive", True)),
-                                    tier=int(e.get("tier", 0)),
-                                    rarity=e.get("rarity", ""),
-                                )
-                                pool.append(entry)
-                            except Exception:
-                                continue
-                    except Exception:
-                        # fallback: keep dicts
-                        for e in data.get("hangar", {}).get("pool", []) or []:
-                            pool.append(e)
-
-                    hang.pool = pool
-                    # Restore assignments and slots, ensuring they match num_slots
-                    saved_assignments = list(data.get("hangar", {}).get("assignments", []))
-                    saved_slots = list(data.get("hangar", {}).get("slots", []))
-                    
-                    # Pad or truncate to match num_slots
-                    hang.assignments = (saved_assignments + [None] * hang.num_slots)[:hang.num_slots]
-                    hang.slots = (saved_slots + [False] * hang.num_slots)[:hang.num_slots]
-                    
-                    # Ensure any slot with an assignment is marked as ready in hangar
-                    # (ship hasn't been deployed yet after load, so it's in hangar)
-                    for i, assignment_id in enumerate(hang.assignments):
-                        if i < len(hang.slots) and assignment_id is not None:
-                            hang.slots[i] = True
+                from spacegame.core.modules_manager import manager as modules_manager
+
+                modules_manager.set_internal_sections(inst)
             except Exception:
                 pass
+        except Exception:
+            pass
 
-        return True
-    except Exception:
-        return False
+    if "hangar" in data:
+        try:
+            hang = getattr(owner, "hangar_system", None) or (inv.hangar if inv is not None else None)
+            if hang is not None:
+                # older saves stored pool entries as bare field dicts
+                pool = []
+                for e in data.get("hangar", {}).get("pool", []) or []:
+                    entry = codec.decode(e, default_type="HangarEntry")
+                    if entry is not None:
+                        pool.append(entry)
+
+                hang.pool = pool
+                # the id allocator never goes backwards, even past removed entries
+                hang.next_id = max(hang.next_id, int(data.get("hangar", {}).get("next_id", 0) or 0))
+                # Restore assignments and slots, ensuring they match num_slots
+                saved_assignments = list(data.get("hangar", {}).get("assignments", []))
+                saved_slots = list(data.get("hangar", {}).get("slots", []))
+                
+                # Pad or truncate to match num_slots
+                hang.assignments = (saved_assignments + [None] * hang.num_slots)[:hang.num_slots]
+                hang.slots = (saved_slots + [False] * hang.num_slots)[:hang.num_slots]
+                
+                # Ensure any slot with an assignment is marked as ready in hangar
+                # (ship hasn't been deployed yet after load, so it's in hangar)
+                for i, assignment_id in enumerate(hang.assignments):
+                    if i < len(hang.slots) and assignment_id is not None:
+                        hang.slots[i] = True
+        except Exception:
+            pass
+
+    location = data.get("location") or {}
+    if location.get("system"):
+        owner.location_system = str(location["system"])
+        if location.get("area"):
+            owner.location_area = str(location["area"])
+
+
+def resume_jobs(owner, data: dict) -> int:
+    """Restore persisted production jobs and settle those that finished offline.
+
+    Game time continues from the newest saved clock anchor plus the time the
+    game was closed. Jobs whose deadline has passed are finalized in one pass,
+    in deadline order, without replaying any ticks; one summary notification
+    replaces the per-job popups. Jobs still running are handed back to the job
+    scheduler. Returns the number of jobs settled.
+    """
+    from spacegame.core.game_clock import get_game_clock
+    from spacegame.core.fabrication import get_fabrication_manager, restore_fabrication_job
+    from spacegame.core.refining import get_refinery_manager, restore_refinement_job
+
+    jobs = data.get("jobs") or {}
+    anchors = [data.get("clock")] + [job.get("anchor") for job in jobs.values() if isinstance(job, dict)]
+    anchors = [a for a in anchors if isinstance(a, (list, tuple)) and len(a) == 2]
+    clock = get_game_clock()
+    if anchors:
+        clock.continue_from(max(anchors, key=lambda a: a[1]))
+    now = clock.now_ms()
+
+    fm = get_fabrication_manager(owner)
+    rm = get_refinery_manager(owner)
+    due = []
+    for kind, mgr, restore in (("fab", fm, restore_fabrication_job), ("ref", rm, restore_refinement_job)):
+        mgr.player = owner
+        for i, module in enumerate(mgr.get_modules() or []):
+            job = jobs.get(job_key(kind, module.module_id))
+            if job is None:
+                # saves from before module ids keyed jobs by position
+                job = jobs.get(f"{kind}:{i}")
+            total_ms = int(job.get("total_ms", 0)) if job else 0
+            # older saves have no absolute deadline: run those jobs again from now
+            deadline = int(job["due"]) if job and "due" in job else now + total_ms
+            if restore(module, job, deadline - total_ms) and deadline <= now:
+                due.append((deadline, kind, i))
+        mgr.sync_jobs()
+
+    counts = {"fab": 0, "ref": 0}
+    for deadline, kind, i in sorted(due):
+        try:
+            if kind == "fab":
+                fm._finalize_module(i, offline=True)
+            else:
+                rm._finalize_refinement(i, offline=True)
+            counts[kind] += 1
+        except Exception:
+            pass
+
+    settled = counts["fab"] + counts["ref"]
+    inv = getattr(owner, "inventory_manager", None)
+    if settled and inv is not None:
+        parts = []
+        if counts["fab"]:
+            parts.append(f"{counts['fab']} fabrication{'s' if counts['fab'] != 1 else ''}")
+        if counts["ref"]:
+            parts.append(f"{counts['ref']} refinement{'s' if counts['ref'] != 1 else ''}")
+        inv.add_notification({
+            'type': 'summary',
+            'title': "Completed while away: " + ", ".join(parts),
+            'elapsed': 0.0,
+            'duration': 6.0,
+        })
+    return settled
@@ -0,0 +1,300 @@
+"""Append-only save journal with snapshot compaction.
+
+Persisted state lives in two files inside the save directory:
+
+- ``snapshot.json``: a compact full state dict (the format produced by
+  `save.build_save_data`) plus the sequence number it covers.
+- ``journal.log``: one change record per line, ``<crc32 hex> <json>``.
+
+Records are small pure-data deltas (inventory changes, module install /
+remove, hangar entry and slot changes, production job start / finish).
+Loading reads the snapshot and replays every record with a higher sequence
+number. Each line carries a CRC32 of its JSON body, so a torn or corrupt
+tail left by a crash is detected and dropped instead of breaking the load.
+
+Compaction replays the journal onto the snapshot and writes the result as
+the new snapshot; it only touches data, never live game objects, so it is
+safe to run on the save worker thread.
+"""
+import json
+import os
+import zlib
+from typing import List, Optional, Tuple
+
+from spacegame.core.codec import fields_of
+
+
+SNAPSHOT_FILE_NAME = "snapshot.json"
+JOURNAL_FILE_NAME = "journal.log"
+
+
+def _save_dir() -> str:
+    from spacegame.core.save import _project_root, SAVE_DIR_NAME
+
+    save_dir = os.path.join(_project_root(), SAVE_DIR_NAME)
+    os.makedirs(save_dir, exist_ok=True)
+    return save_dir
+
+
+def snapshot_path() -> str:
+    return os.path.join(_save_dir(), SNAPSHOT_FILE_NAME)
+
+
+def journal_path() -> str:
+    return os.path.join(_save_dir(), JOURNAL_FILE_NAME)
+
+
+# ---------- Record encoding ----------
+def encode_record(seq: int, kind: str, payload: dict) -> bytes:
+    """Return the journal line for a record (including trailing newline)."""
+    rec = dict(payload)
+    rec["q"] = int(seq)
+    rec["k"] = str(kind)
+    body = json.dumps(rec, separators=(",", ":")).encode("utf-8")
+    return b"%08x " % (zlib.crc32(body) & 0xFFFFFFFF) + body + b"\n"
+
+
+def decode_line(line: bytes) -> Optional[dict]:
+    """Return the record in `line`, or None if it is torn or corrupt."""
+    if not line.endswith(b"\n") or len(line) < 11 or line[8:9] != b" ":
+        return None
+    body = line[9:-1]
+    try:
+        if int(line[:8], 16) != (zlib.crc32(body) & 0xFFFFFFFF):
+            return None
+        rec = json.loads(body.decode("utf-8"))
+    except Exception:
+        return None
+    return rec if isinstance(rec, dict) else None
+
+
+def read_journal(path: Optional[str] = None) -> Tuple[List[dict], int]:
+    """Read valid records from the journal.
+
+    Returns (records, valid_bytes); reading stops at the first torn or corrupt
+    line, and `valid_bytes` is the length of the intact prefix.
+    """
+    path = path or journal_path()
+    records: List[dict] = []
+    valid = 0
+    try:
+        with open(path, "rb") as fh:
+            for line in fh:
+                rec = decode_line(line)
+                if rec is None:
+                    break
+                records.append(rec)
+                valid += len(line)
+    except FileNotFoundError:
+        pass
+    return records, valid
+
+
+def journal_size() -> int:
+    try:
+        return os.path.getsize(journal_path())
+    except OSError:
+        return 0
+
+
+# ---------- Applying records to state data ----------
+def _ensure_sections(data: dict) -> list:
+    sections = data.setdefault("installed_internal_modules", [[], [], []])
+    while len(sections) < 3:
+        sections.append([])
+    return sections
+
+
+# id -> position for the pool list last replayed into, so replaying entry
+# records stays O(1) per record for large pools
+_pool_index: list = [None, {}]
+
+
+def _pool_position(pool: list, entry_id) -> Optional[int]:
+    if _pool_index[0] is not pool or len(_pool_index[1]) > len(pool):
+        _pool_index[0] = pool
+        _pool_index[1] = {fields_of(e).get("id"): i for i, e in enumerate(pool)}
+    i = _pool_index[1].get(entry_id)
+    if i is not None and (i >= len(pool) or fields_of(pool[i]).get("id") != entry_id):
+        # the list was changed behind our back; reindex it
+        _pool_index[1] = {fields_of(e).get("id"): j for j, e in enumerate(pool)}
+        i = _pool_index[1].get(entry_id)
+    return i
+
+
+def job_key(kind: str, module_id) -> str:
+    """Key of a persisted production job: job kind plus the module's id."""
+    return f"{kind}@{module_id}"
+
+
+def apply_record(data: dict, rec: dict) -> None:
+    """Apply one journal record to a state dict in place."""
+    kind = rec.get("k")
+    if kind == "inv":
+        inv = data.setdefault("inventory", {})
+        key = str(rec.get("key"))
+        inv[key] = int(inv.get(key, 0)) + int(rec.get("d", 0))
+    elif kind == "inv_set":
+        data.setdefault("inventory", {})[str(rec.get("key"))] = int(rec.get("v", 0))
+    elif kind == "mod_add":
+        data.setdefault("unequipped_modules", []).append(rec.get("m"))
+    elif kind == "mod_del":
+        mods = data.setdefault("unequipped_modules", [])
+        i = int(rec.get("i", -1))
+        if 0 <= i < len(mods):
+            mods.pop(i)
+    elif kind == "sec_add":
+        sections = _ensure_sections(data)
+        s = int(rec.get("s", -1))
+        if 0 <= s < len(sections):
+            sections[s].append(rec.get("m"))
+    elif kind == "sec_del":
+        sections = _ensure_sections(data)
+        s = int(rec.get("s", -1))
+        i = int(rec.get("i", -1))
+        if 0 <= s < len(sections) and 0 <= i < len(sections[s]):
+            sections[s].pop(i)
+    elif kind == "sections":
+        data["installed_internal_modules"] = [list(s or []) for s in rec.get("v", [])]
+        _ensure_sections(data)
+    elif kind == "entry":
+        entry = rec.get("e") or {}
+        hangar = data.setdefault("hangar", {"assignments": [], "slots": [], "pool": []})
+        pool = hangar.setdefault("pool", [])
+        entry_id = fields_of(entry).get("id")
+        i = _pool_position(pool, entry_id)
+        if i is not None:
+            pool[i] = entry
+        else:
+            _pool_index[1][entry_id] = len(pool)
+            pool.append(entry)
+        if entry_id is not None:
+            hangar["next_id"] = max(int(hangar.get("next_id", 0) or 0), int(entry_id) + 1)
+    elif kind == "slots":
+        hangar = data.setdefault("hangar", {"assignments": [], "slots": [], "pool": []})
+        hangar["assignments"] = list(rec.get("a", []))
+        hangar["slots"] = list(rec.get("s", []))
+    elif kind == "job":
+        jobs = data.setdefault("jobs", {})
+        if "module" in rec:
+            key = job_key(rec.get("kind"), rec.get("module"))
+        else:
+            # older journals keyed jobs by the module's position
+            key = f"{rec.get('kind')}:{rec.get('slot')}"
+        job = rec.get("job")
+        if job is None:
+            jobs.pop(key, None)
+        else:
+            jobs[key] = job
+    elif kind == "loc":
+        data["location"] = {"system": rec.get("s"), "area": rec.get("a")}
+
+
+def replay(data: dict, records: List[dict], after_seq: int) -> int:
+    """Apply records newer than `after_seq` to `data`; return the last seq seen."""
+    last = after_seq
+    for rec in records:
+        seq = int(rec.get("q", 0))
+        if seq <= after_seq:
+            continue
+        try:
+            apply_record(data, rec)
+        except Exception:
+            continue
+        last = max(last, seq)
+    return last
+
+
+# ---------- Snapshot I/O ----------
+def read_snapshot() -> Tuple[Optional[dict], int]:
+    """Return (data, seq) from the snapshot file, or (None, 0) if absent/corrupt."""
+    try:
+        with open(snapshot_path(), "r", encoding="utf-8") as fh:
+            snap = json.load(fh)
+        return dict(snap.get("data") or {}), int(snap.get("seq", 0))
+    except Exception:
+        return None, 0
+
+
+def _write_atomic(path: str, payload: bytes) -> None:
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as fh:
+        fh.write(payload)
+        fh.flush()
+        try:
+            os.fsync(fh.fileno())
+        except Exception:
+            pass
+    os.replace(tmp_path, path)
+
+
+def write_snapshot(data: dict, seq: int) -> int:
+    """Atomically write a snapshot covering records up to `seq`; return bytes written."""
+    payload = json.dumps({"seq": int(seq), "data": data}, separators=(",", ":")).encode("utf-8")
+    _write_atomic(snapshot_path(), payload)
+    return len(payload)
+
+
+def append_lines(lines: List[bytes]) -> int:
+    """Append encoded record lines to the journal with a single fsync."""
+    if not lines:
+        return 0
+    payload = b"".join(lines)
+    with open(journal_path(), "ab") as fh:
+        fh.write(payload)
+        fh.flush()
+        try:
+            os.fsync(fh.fileno())
+        except Exception:
+            pass
+    return len(payload)
+
+
+def rewrite_journal(after_seq: int, extra_lines: List[bytes] = ()) -> int:
+    """Drop journal records covered by a snapshot at `after_seq`, then append `extra_lines`."""
+    records, _ = read_journal()
+    kept = [encode_record(r["q"], r["k"], {k: v for k, v in r.items() if k not in ("q", "k")})
+            for r in records if int(r.get("q", 0)) > after_seq]
+    payload = b"".join(kept) + b"".join(extra_lines)
+    _write_atomic(journal_path(), payload)
+    return len(payload)
+
+
+def truncate_journal(valid_bytes: int) -> None:
+    """Cut a torn tail so later appends land after the last intact record."""
+    try:
+        if os.path.getsize(journal_path()) > valid_bytes:
+            with open(journal_path(), "r+b") as fh:
+                fh.truncate(valid_bytes)
+    except OSError:
+        pass
+
+
+def compact() -> int:
+    """Fold the journal into a new snapshot and empty the journal; return bytes written."""
+    data, seq = read_snapshot()
+    records, _ = read_journal()
+    if data is None:
+        data = {}
+    last = replay(data, records, seq)
+    written = write_snapshot(data, last)
+    written += rewrite_journal(last)
+    return written
+
+
+def load_state() -> Tuple[Optional[dict], int, bool]:
+    """Return (data, last_seq, has_snapshot) from snapshot + journal replay.
+
+    A torn journal tail is truncated. Returns (None, 0, False) when there is
+    nothing to load.
+    """
+    data, seq = read_snapshot()
+    records, valid = read_journal()
+    truncate_journal(valid)
+    if data is None and not records:
+        return None, 0, False
+    has_snapshot = data is not None
+    if data is None:
+        data = {}
+    last = replay(data, records, seq)
+    return data, max(last, seq), has_snapshot
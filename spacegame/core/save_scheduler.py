@@ -0,0 +1,234 @@
+"""Write-behind autosave scheduler.
+
+Persisted state is written as a snapshot plus an append-only journal (see
+`save_journal`). Gameplay systems report individual changes with
+`record_change(record_kind, **payload)`; each becomes a small journal record.
+`get_save_scheduler().mark_dirty(owner)` still takes a full snapshot, for
+changes that are not journaled and to seed the journal for a new game.
+
+Records and snapshots are queued on the calling (main) thread and handed
+to a worker thread, which appends / writes them once the state has been
+quiet for `SAVE_DEBOUNCE_S`, or at the latest `SAVE_MAX_LATENCY_S` after
+the first unsaved change, with a single fsync per batch. When the journal
+grows past `SAVE_JOURNAL_COMPACT_BYTES` the worker folds it into a new
+snapshot.
+
+Call `flush()` before quitting so the latest state reaches disk.
+"""
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+from spacegame.core import events
+from spacegame.core import save as _save
+from spacegame.core import save_journal as _journal
+from spacegame.config import SAVE_DEBOUNCE_S, SAVE_MAX_LATENCY_S, SAVE_JOURNAL_COMPACT_BYTES
+
+
+class SaveScheduler:
+    """Coalesce save requests and write them on a background thread."""
+
+    def __init__(self, debounce_s: float = SAVE_DEBOUNCE_S, max_latency_s: float = SAVE_MAX_LATENCY_S,
+                 compact_bytes: int = SAVE_JOURNAL_COMPACT_BYTES):
+        self.debounce_s = float(debounce_s)
+        self.max_latency_s = float(max_latency_s)
+        self.compact_bytes = int(compact_bytes)
+
+        self._cond = threading.Condition()
+        # serializes taking a batch and writing it, so batches land in order
+        self._write_lock = threading.Lock()
+        self._pending: Optional[Tuple[int, dict]] = None
+        self._records: List[Tuple[int, str, dict]] = []
+        # one sequence shared by records and snapshots; a snapshot at seq S
+        # covers every record with seq <= S
+        self._seq = 0
+        self._suspend = 0
+        self._first_dirty = 0.0
+        self._last_dirty = 0.0
+        self._running = True
+
+        # metrics
+        self.save_count = 0
+        self.bytes_written = 0
+        self.write_time_s = 0.0
+        self.snapshot_time_s = 0.0
+        self.marks = 0
+        self.coalesced = 0
+        self.records = 0
+        self.compactions = 0
+
+        self._thread = threading.Thread(target=self._run, name="save-writer", daemon=True)
+        self._thread.start()
+
+    # ---------- Main-thread API ----------
+    def mark_dirty(self, owner) -> None:
+        """Snapshot `owner` and schedule a write-behind save."""
+        if owner is None or self._suspend:
+            return
+        t0 = time.perf_counter()
+        try:
+            data = _save.build_save_data(owner)
+        except Exception:
+            return
+        self.snapshot_time_s += time.perf_counter() - t0
+
+        with self._cond:
+            self.marks += 1
+            if self._pending is not None:
+                self.coalesced += 1
+            self._touch()
+            self._seq += 1
+            self._pending = (self._seq, data)
+            self._cond.notify()
+
+    def record(self, kind: str, payload: dict) -> None:
+        """Queue a journal record; `payload` must be JSON-ready data."""
+        if self._suspend:
+            return
+        with self._cond:
+            self.records += 1
+            self._touch()
+            self._seq += 1
+            self._records.append((self._seq, str(kind), payload))
+            self._cond.notify()
+
+    @contextmanager
+    def suspended(self):
+        """Ignore records and snapshots inside the block (used while loading)."""
+        self._suspend += 1
+        try:
+            yield
+        finally:
+            self._suspend -= 1
+
+    def resume_from(self, seq: int) -> None:
+        """Continue numbering after the last sequence found on disk."""
+        with self._cond:
+            self._seq = max(self._seq, int(seq))
+
+    def flush(self) -> None:
+        """Write pending records / snapshot synchronously on the calling thread."""
+        self._write_batch()
+
+    def shutdown(self) -> None:
+        """Flush pending state and stop the worker thread."""
+        self.flush()
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        self._thread.join(timeout=2.0)
+
+    def is_dirty(self) -> bool:
+        with self._cond:
+            return self._has_work()
+
+    def get_metrics(self) -> Dict[str, float]:
+        """Return save counters for profiling overlays and logs."""
+        return {
+            "save_count": self.save_count,
+            "bytes_written": self.bytes_written,
+            "write_time_s": self.write_time_s,
+            "avg_write_ms": (self.write_time_s / self.save_count * 1000.0) if self.save_count else 0.0,
+            "snapshot_time_s": self.snapshot_time_s,
+            "marks": self.marks,
+            "coalesced": self.coalesced,
+            "records": self.records,
+            "compactions": self.compactions,
+        }
+
+    # ---------- Worker ----------
+    def _has_work(self) -> bool:
+        return self._pending is not None or bool(self._records)
+
+    def _touch(self) -> None:
+        # caller holds self._cond
+        now = time.monotonic()
+        if not self._has_work():
+            self._first_dirty = now
+        self._last_dirty = now
+
+    def _due_in(self, now: float) -> float:
+        """Seconds until pending work should be written (<= 0 means now)."""
+        debounce_at = self._last_dirty + self.debounce_s
+        latest_at = self._first_dirty + self.max_latency_s
+        return min(debounce_at, latest_at) - now
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while self._running and not self._has_work():
+                    self._cond.wait()
+                if not self._running:
+                    return
+                wait = self._due_in(time.monotonic())
+                if wait > 0:
+                    # new work re-notifies and pushes the debounce deadline
+                    self._cond.wait(timeout=wait)
+                    continue
+            self._write_batch()
+
+    def _write_batch(self) -> None:
+        with self._write_lock:
+            with self._cond:
+                pending = self._pending
+                records = self._records
+                self._pending = None
+                self._records = []
+            if pending is None and not records:
+                return
+            t0 = time.perf_counter()
+            written = 0
+            try:
+                if pending is not None:
+                    snap_seq, data = pending
+                    # records queued before the snapshot are already part of it
+                    lines = [_journal.encode_record(q, k, p) for q, k, p in records if q > snap_seq]
+                    written += _journal.write_snapshot(data, snap_seq)
+                    written += _journal.rewrite_journal(snap_seq, lines)
+                else:
+                    lines = [_journal.encode_record(q, k, p) for q, k, p in records]
+                    written += _journal.append_lines(lines)
+                if self.compact_bytes > 0 and _journal.journal_size() > self.compact_bytes:
+                    written += _journal.compact()
+                    self.compactions += 1
+            except Exception:
+                pass
+            if written:
+                self.save_count += 1
+                self.bytes_written += written
+            self.write_time_s += time.perf_counter() - t0
+
+
+# Global singleton instance
+_instance: Optional[SaveScheduler] = None
+
+
+def get_save_scheduler() -> SaveScheduler:
+    """Get or create the global save scheduler."""
+    global _instance
+    if _instance is None:
+        _instance = SaveScheduler()
+    return _instance
+
+
+def record_change(record_kind: str, **payload) -> None:
+    """Journal one change record; never raises into gameplay code."""
+    try:
+        get_save_scheduler().record(record_kind, payload)
+    except Exception:
+        pass
+
+
+def flush_pending_saves() -> None:
+    """Flush the global scheduler if it was ever started."""
+    if _instance is not None:
+        _instance.flush()
+
+
+def _on_location_changed(event) -> None:
+    # the fleet resumes at the last visited location
+    record_change("loc", s=event.system, a=event.area)
+
+
+events.get_event_bus().subscribe(events.LocationChanged, _on_location_changed)
@@ -0,0 +1,249 @@
+"""Screen stack for the ship's management screens.
+
+Each screen is a persistent `Screen` object with lifecycle hooks:
+
+    setup()                  once, when the screen is first used (fonts, layout, caches)
+    enter(*args, **kwargs)   every time it is pushed onto the stack
+    resume(result)           when the screen above it is popped
+    exit()                   when it leaves the stack
+    handle_event(event)      input, for the top screen only
+    update(dt) / draw(surf)  once per frame, for the top screen only
+
+Screens are created once per name and reused on later visits, so their
+fonts, icons and layouts survive between visits. Navigation goes through
+the manager instead of nested calls:
+
+    self.manager.push("fabrication_bpselect", main_player, player_fleet, 0)
+    self.manager.pop(result)          # back to the previous screen
+    self.manager.switch("inventory", main_player, player_fleet)   # tab click
+    self.manager.close("to_game")     # leave the station screens
+
+`run()` drives the top screen with one loop until the stack unwinds, so
+navigating between tabs no longer nests calls. Closing the window makes
+`run()` return "exit", which callers pass up so the game shuts down
+through `run_state_machine` (and flushes pending saves).
+"""
+import importlib
+from typing import Any, Dict, List, Optional
+
+import pygame
+
+from spacegame.config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
+from spacegame.core.battle_sim import get_background_sim
+
+
+# Screen name -> "module:Class", imported on first use
+SCREENS = {
+    "internal": "spacegame.screens.internal_screen:InternalScreen",
+    "inventory": "spacegame.screens.inventory:InventoryScreen",
+    "fabrication_main": "spacegame.screens.fabrication_main_screen:FabricationMainScreen",
+    "fabrication_bpselect": "spacegame.screens.fabrication_bpselect_screen:FabricationBPSelectScreen",
+    "fabrication_bpdetails": "spacegame.screens.fabrication_bpdetails_screen:FabricationBPDetailsScreen",
+    "refining_main": "spacegame.screens.refining_main_screen:RefiningMainScreen",
+    "refining_oredetails": "spacegame.screens.refining_oredetails_screen:RefiningOreDetailsScreen",
+    "internal_modules": "spacegame.screens.internal_modules_screen:InternalModulesScreen",
+    "module_selection": "spacegame.screens.module_selection_screen:ModuleSelectionScreen",
+    "module_details": "spacegame.screens.module_details_screen:ModuleDetailsScreen",
+    "fleet_management": "spacegame.screens.fleet_management:FleetManagementScreen",
+    "squad_detail": "spacegame.screens.squad_detail:SquadDetailScreen",
+    "light_craft_selection": "spacegame.screens.light_craft_selection:LightCraftSelectionScreen",
+}
+
+# Station tab label -> screen name (BRIDGE has no screen of its own yet)
+TAB_SCREENS = {
+    "STORAGE": "inventory",
+    "FABRICATION": "fabrication_main",
+    "REFINING": "refining_main",
+    "INTERNAL MODULES": "internal_modules",
+}
+
+
+class Screen:
+    """Base class for screens driven by `ScreenManager`."""
+
+    def __init__(self, manager: "ScreenManager"):
+        self.manager = manager
+        self.screen = pygame.display.get_surface()
+        if self.screen is None:
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.width, self.height = self.screen.get_size()
+        self.setup()
+
+    def setup(self) -> None:
+        pass
+
+    def enter(self, *args, **kwargs) -> None:
+        pass
+
+    def resume(self, result: Any) -> None:
+        # results that used to be passed up through nested calls
+        if result == "to_game":
+            self.manager.close("to_game")
+        elif result == "to_internal":
+            self.manager.pop_to_root()
+
+    def exit(self) -> None:
+        pass
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        pass
+
+    def update(self, dt: float) -> None:
+        pass
+
+    def draw(self, surface: pygame.Surface) -> None:
+        pass
+
+    def open_tab(self, label: str, main_player, player_fleet) -> bool:
+        """Switch to the station tab `label`; returns False if it has no screen."""
+        name = TAB_SCREENS.get(label)
+        if name is None:
+            return False
+        self.manager.switch(name, main_player, player_fleet)
+        return True
+
+
+class ScreenManager:
+    """Stack of persistent screens driven by a single loop."""
+
+    def __init__(self):
+        self.stack: List[Screen] = []
+        self._instances: Dict[str, Screen] = {}
+        self._bases: List[int] = []  # stack depth each active run() unwinds to
+        self._result: Any = None
+        self._display = None
+        self._quitting = False  # window closed: every active run() unwinds with "exit"
+
+    def get(self, name: str) -> Screen:
+        """The (single, reused) instance of screen `name`."""
+        display = pygame.display.get_surface()
+        if display is not self._display and not self.stack:
+            # a new window: fonts and surfaces built for the old one are stale
+            self._instances.clear()
+            self._display = display
+        screen = self._instances.get(name)
+        if screen is None:
+            module_name, cls_name = SCREENS[name].split(":")
+            cls = getattr(importlib.import_module(module_name), cls_name)
+            screen = cls(self)
+            self._instances[name] = screen
+        return screen
+
+    @property
+    def top(self) -> Optional[Screen]:
+        return self.stack[-1] if self.stack else None
+
+    def _floor(self) -> int:
+        return self._bases[-1] if self._bases else 0
+
+    # ---- Navigation ----
+    def push(self, name: str, *args, **kwargs) -> Screen:
+        screen = self.get(name)
+        if screen in self.stack[self._floor():]:
+            # already open further down: go back to it instead of nesting
+            while self.stack[-1] is not screen:
+                self.stack.pop().exit()
+            self.stack.pop().exit()
+        self.stack.append(screen)
+        screen.enter(*args, **kwargs)
+        return screen
+
+    def pop(self, result: Any = None) -> None:
+        """Leave the top screen; the one below gets `resume(result)`."""
+        if not self.stack:
+            return
+        self.stack.pop().exit()
+        if len(self.stack) <= self._floor():
+            self._result = result
+            return
+        self.stack[-1].resume(result)
+
+    def replace(self, name: str, *args, **kwargs) -> Screen:
+        """Swap the top screen for `name` (same depth)."""
+        if len(self.stack) > self._floor():
+            self.stack.pop().exit()
+        return self.push(name, *args, **kwargs)
+
+    def switch(self, name: str, *args, **kwargs) -> Screen:
+        """Tab navigation: unwind to the first screen of this run, then open `name` above it."""
+        floor = self._floor()
+        while len(self.stack) > floor + 1:
+            self.stack.pop().exit()
+        if len(self.stack) > floor and self.stack[-1] is self.get(name):
+            # the run started on this tab: re-enter it in place
+            self.stack.pop().exit()
+        return self.push(name, *args, **kwargs)
+
+    def pop_to_root(self) -> None:
+        """Unwind to the first screen of this run (e.g. "to_internal")."""
+        floor = self._floor()
+        while len(self.stack) > floor + 1:
+            self.stack.pop().exit()
+
+    def close(self, result: Any = None) -> None:
+        """Unwind every screen of this run; `run()` returns `result`."""
+        floor = self._floor()
+        while len(self.stack) > floor:
+            self.stack.pop().exit()
+        self._result = result
+
+    # ---- Loop ----
+    def run(self, name: str, *args, **kwargs) -> Any:
+        """Open `name` and drive the stack until this run unwinds; returns the final result."""
+        base = len(self.stack)
+        if not self._bases:
+            self._quitting = False
+        self._bases.append(base)
+        self._result = None
+        clock = pygame.time.Clock()
+        try:
+            self.push(name, *args, **kwargs)
+            while len(self.stack) > self._floor():
+                if self._quitting:
+                    # closed from a screen opened by this one; the game shuts down normally
+                    self.close("exit")
+                    break
+                dt = clock.tick(FPS) / 1000.0
+                # the battle keeps running behind the station screens
+                if get_background_sim().tick().mothership_lost:
+                    self.close("to_game")
+                    break
+                top = self.stack[-1]
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        self._quitting = True
+                        self.close("exit")
+                        break
+                    top.handle_event(event)
+                    if not self.stack or self.stack[-1] is not top:
+                        # the rest of this frame's input belonged to the old screen
+                        break
+                if len(self.stack) <= self._floor():
+                    break
+                top = self.stack[-1]
+                top.update(dt)
+                top.draw(top.screen)
+                pygame.display.flip()
+            return self._result
+        finally:
+            # an exception left screens of this run on the stack
+            while len(self.stack) > base:
+                self.stack.pop().exit()
+            self._bases.pop()
+
+
+# Global singleton instance
+_instance: Optional[ScreenManager] = None
+
+
+def get_screen_manager() -> ScreenManager:
+    """Get or create the global screen manager."""
+    global _instance
+    if _instance is None:
+        _instance = ScreenManager()
+    return _instance
+
+
+def run_screen(name: str, *args, **kwargs) -> Any:
+    """Run screen `name` (and whatever it opens) until it closes; returns its result."""
+    return get_screen_manager().run(name, *args, **kwargs)
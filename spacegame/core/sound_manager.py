@@ -1,16 +1,41 @@
 """Sound Manager for Space Game.
 
 Manages all game audio using pygame mixer functions.
-Ensures only one sound plays at a time (mutual exclusivity).
 Maps game events to appropriate sound effects.
+
+Play requests are collected during a frame and submitted once by `flush()`
+(called from the game loop). Repeated requests for the same group are merged
+into one, and the survivors are assigned to a small pool of voices
+(`SOUND_VOICES` channels) by priority: a critical alert may cut off chatter,
+chatter never cuts off anything. When no loop is flushing (e.g. a menu
+screen with its own loop), requests are submitted right away.
+
+Sound files are only registered (name -> path) when the manager is created;
+they are decoded on first use or ahead of time by `prewarm()`, which decodes
+on a background thread. Decoded sounds live in an LRU cache capped at
+`SOUND_CACHE_MAX_MB` of PCM data.
 """
 
 import pygame
 import random
 import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Dict, List
 
+from spacegame.core import events
+from spacegame.config import SOUND_CACHE_MAX_MB, SOUND_DECODE_WORKERS, SOUND_VOICES, SOUND_FLUSH_IDLE_MS
+
+
+# Voice priorities (higher wins a voice)
+PRIORITY_CHATTER = 0
+PRIORITY_COMMAND = 1
+PRIORITY_STATUS = 2
+PRIORITY_CRITICAL = 3
+
 
 class SoundManager:
     """Centralized sound management system."""
@@ -32,12 +57,36 @@ class SoundManager:
             sounds_dir = str(base_dir / "assets" / "sounds")
 
         self.sounds_dir = sounds_dir
-        self.sound_cache: Dict[str, pygame.mixer.Sound] = {}
-        self.current_sound_channel = pygame.mixer.Channel(0)
+        # name -> file path for every sound on disk (nothing decoded yet)
+        self.sound_files: Dict[str, str] = {}
+        # decoded sounds, least recently used first; guarded by _lock
+        self.sound_cache: "OrderedDict[str, pygame.mixer.Sound]" = OrderedDict()
+        self._sound_bytes: Dict[str, int] = {}
+        self.cache_bytes = 0
+        self.max_cache_bytes = int(SOUND_CACHE_MAX_MB * 1024 * 1024)
+        self._pending: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
         self.is_playing = False
 
-        # Load all sounds on initialization
-        self._load_all_sounds()
+        # Voice pool: channel, and the request key / priority it is playing
+        if pygame.mixer.get_num_channels() < SOUND_VOICES:
+            pygame.mixer.set_num_channels(SOUND_VOICES)
+        self.voices = [pygame.mixer.Channel(i) for i in range(max(1, SOUND_VOICES))]
+        self.current_sound_channel = self.voices[0]
+        self._voice_keys: List[Optional[str]] = [None] * len(self.voices)
+        self._voice_priorities: List[int] = [0] * len(self.voices)
+
+        # Requests for the current frame: key -> [priority, count, is_group]
+        self._requests: "OrderedDict[str, list]" = OrderedDict()
+        self._last_flush = 0.0
+        self.requested = 0
+        self.played = 0
+        self.merged = 0
+        self.dropped = 0
+        self.stolen = 0
+
+        self._register_sounds()
 
         # Sound event groups for logical mapping
         self.sound_groups = {
@@ -110,8 +159,41 @@ class SoundManager:
             "UNIT_DESTROYED_STRIKEGROUP": ["STATUS_REPORT_DESTROYED_STRIKEGROUP_1"]
         }
 
-    def _load_all_sounds(self) -> None:
-        """Load all sound files from the sounds directory."""
+        # Voice priority per group; unlisted groups play as commands
+        self.group_priorities = {
+            "UNIT_DESTROYED_FRIGATE": PRIORITY_CRITICAL,
+            "UNIT_DESTROYED_COLLECTOR": PRIORITY_CRITICAL,
+            "UNIT_DESTROYED_STRIKEGROUP": PRIORITY_CRITICAL,
+            "HYPERSPACE_LAUNCH": PRIORITY_CRITICAL,
+            "HYPERSPACE_COMPLETE": PRIORITY_STATUS,
+            "REFINING_COMPLETE": PRIORITY_STATUS,
+            "FABRICATION_COMPLETE": PRIORITY_STATUS,
+            "SHIP_DOCKING": PRIORITY_CHATTER,
+            "RESOURCE_COLLECTOR_FULL": PRIORITY_CHATTER,
+            "RESOURCE_TRANSFER": PRIORITY_CHATTER,
+        }
+
+        # Unit class name -> group announcing its destruction
+        self.destroyed_groups = {
+            "PirateFrigate": "UNIT_DESTROYED_FRIGATE",
+            "ResourceCollector": "UNIT_DESTROYED_COLLECTOR",
+            "Interceptor": "UNIT_DESTROYED_STRIKEGROUP",
+            "PlasmaBomber": "UNIT_DESTROYED_STRIKEGROUP",
+        }
+
+        self._subscriptions = [
+            (events.UnitDestroyed, self._on_unit_destroyed),
+            (events.CollectorFull, lambda e: self.on_resource_collector_full()),
+            (events.ResourceDelivered, lambda e: self.on_resource_transfer()),
+            (events.JobFinished, self._on_job_finished),
+            (events.LocationChanged, lambda e: self.on_hyperspace_complete()),
+        ]
+        bus = events.get_event_bus()
+        for event_type, handler in self._subscriptions:
+            bus.subscribe(event_type, handler)
+
+    def _register_sounds(self) -> None:
+        """Record the path of every sound file in the sounds directory."""
         if not os.path.isdir(self.sounds_dir):
             print(f"Warning: Sounds directory not found at {self.sounds_dir}")
             return
@@ -119,59 +201,212 @@ class SoundManager:
         for filename in os.listdir(self.sounds_dir):
             if filename.endswith(('.ogg', '.wav', '.mp3')):
                 sound_name = filename.rsplit('.', 1)[0]
-                sound_path = os.path.join(self.sounds_dir, filename)
-                try:
-                    sound = pygame.mixer.Sound(sound_path)
-                    self.sound_cache[sound_name] = sound
-                except pygame.error as e:
-                    print(f"Error loading sound {sound_name}: {e}")
-
-    def _is_sound_playing(self) -> bool:
-        """Check if any sound is currently playing."""
-        return pygame.mixer.get_busy()
+                self.sound_files[sound_name] = os.path.join(self.sounds_dir, filename)
 
-    def _play_sound(self, sound: pygame.mixer.Sound) -> bool:
-        """Play a sound using the current channel.
-
-        Args:
-            sound: The pygame Sound object to play.
+    # ==================== Decoding and cache ====================
 
-        Returns:
-            True if sound was played, False if a sound was already playing.
-        """
-        if self._is_sound_playing():
-            return False
+    @staticmethod
+    def _pcm_bytes(sound: pygame.mixer.Sound) -> int:
+        """Approximate memory held by a decoded sound."""
+        init = pygame.mixer.get_init()
+        if not init:
+            return 0
+        freq, fmt, channels = init
+        return int(sound.get_length() * freq) * channels * (abs(fmt) // 8)
 
+    def _decode(self, sound_name: str) -> Optional[pygame.mixer.Sound]:
+        """Decode one sound file and store it in the cache (any thread)."""
         try:
-            self.current_sound_channel.play(sound)
-            return True
-        except Exception as e:
-            print(f"Error playing sound: {e}")
-            return False
-
-    def play_sound_by_name(self, sound_name: str) -> bool:
-        """Play a specific sound by its name.
+            sound = pygame.mixer.Sound(self.sound_files[sound_name])
+        except (pygame.error, KeyError, FileNotFoundError) as e:
+            print(f"Error loading sound {sound_name}: {e}")
+            sound = None
+        with self._lock:
+            self._pending.pop(sound_name, None)
+            if sound is not None and sound_name not in self.sound_cache:
+                size = self._pcm_bytes(sound)
+                self.sound_cache[sound_name] = sound
+                self._sound_bytes[sound_name] = size
+                self.cache_bytes += size
+                self._evict_locked()
+        return sound
+
+    def _evict_locked(self) -> None:
+        # drop least recently used sounds until under the cap (keep at least one)
+        while self.cache_bytes > self.max_cache_bytes and len(self.sound_cache) > 1:
+            name, _ = self.sound_cache.popitem(last=False)
+            self.cache_bytes -= self._sound_bytes.pop(name, 0)
+
+    def _cached(self, sound_name: str) -> Optional[pygame.mixer.Sound]:
+        with self._lock:
+            sound = self.sound_cache.get(sound_name)
+            if sound is not None:
+                self.sound_cache.move_to_end(sound_name)
+            return sound
+
+    def _decode_async(self, sound_name: str) -> Optional[Future]:
+        """Queue a background decode of `sound_name` unless cached or queued."""
+        with self._lock:
+            if sound_name in self.sound_cache or sound_name not in self.sound_files:
+                return None
+            future = self._pending.get(sound_name)
+            if future is not None:
+                return future
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=SOUND_DECODE_WORKERS, thread_name_prefix="sound-decode")
+            future = self._executor.submit(self._decode, sound_name)
+            self._pending[sound_name] = future
+            return future
+
+    def get_sound(self, sound_name: str) -> Optional[pygame.mixer.Sound]:
+        """Return the decoded sound, decoding it now if needed."""
+        sound = self._cached(sound_name)
+        if sound is not None:
+            return sound
+        if sound_name not in self.sound_files:
+            return None
+        with self._lock:
+            future = self._pending.get(sound_name)
+        if future is not None:
+            # already being decoded in the background; wait for that instead
+            try:
+                return future.result()
+            except Exception:
+                return None
+        return self._decode(sound_name)
+
+    def prewarm(self, group_names: Optional[List[str]] = None) -> None:
+        """Decode the sounds of `group_names` (default: all groups) in the background."""
+        if group_names is None:
+            group_names = list(self.sound_groups.keys())
+        for group_name in group_names:
+            for sound_name in self.sound_groups.get(group_name, ()):
+                self._decode_async(sound_name)
+
+    def pending_decodes(self) -> int:
+        """Number of sounds queued or being decoded in the background."""
+        with self._lock:
+            return len(self._pending)
+
+    # ==================== Requests and voices ====================
+
+    def _request(self, key: str, priority: int, is_group: bool) -> None:
+        """Queue a play request for this frame, merging repeats of `key`."""
+        entry = self._requests.get(key)
+        if entry is None:
+            self._requests[key] = [priority, 1, is_group]
+        else:
+            entry[1] += 1
+        if (time.monotonic() - self._last_flush) * 1000.0 > SOUND_FLUSH_IDLE_MS:
+            # nothing is flushing per frame right now: submit immediately
+            self._submit()
+
+    def flush(self) -> int:
+        """Submit this frame's requests to the voice pool; call once per frame.
+
+        Returns the number of sounds started.
+        """
+        self._last_flush = time.monotonic()
+        return self._submit()
+
+    def _submit(self) -> int:
+        if not self._requests:
+            return 0
+        requests = sorted(self._requests.items(), key=lambda item: -item[1][0])
+        self._requests.clear()
+        started = 0
+        for key, (priority, count, is_group) in requests:
+            self.requested += count
+            self.merged += count - 1
+            if self._playing(key):
+                # the same group is already being heard
+                self.merged += 1
+                continue
+            voice = self._free_voice(priority)
+            if voice is None:
+                self.dropped += 1
+                continue
+            sound = self._pick_from_group(key) if is_group else self.get_sound(key)
+            if sound is None:
+                self.dropped += 1
+                continue
+            try:
+                self.voices[voice].play(sound)
+            except Exception as e:
+                print(f"Error playing sound: {e}")
+                self.dropped += 1
+                continue
+            self._voice_keys[voice] = key
+            self._voice_priorities[voice] = priority
+            self.played += 1
+            started += 1
+        return started
+
+    def _playing(self, key: str) -> bool:
+        for i, channel in enumerate(self.voices):
+            if self._voice_keys[i] == key and channel.get_busy():
+                return True
+        return False
+
+    def _free_voice(self, priority: int) -> Optional[int]:
+        """Return an idle voice, or steal the lowest-priority one below `priority`."""
+        victim = None
+        for i, channel in enumerate(self.voices):
+            if not channel.get_busy():
+                return i
+            if self._voice_priorities[i] < priority and (
+                    victim is None or self._voice_priorities[i] < self._voice_priorities[victim]):
+                victim = i
+        if victim is not None:
+            self.voices[victim].stop()
+            self.stolen += 1
+        return victim
+
+    def _pick_from_group(self, group_name: str) -> Optional[pygame.mixer.Sound]:
+        """Pick a random decoded sound from a group."""
+        available_sounds = [name for name in self.sound_groups.get(group_name, ()) if name in self.sound_files]
+        if not available_sounds:
+            return None
+        sound_name = random.choice(available_sounds)
+        sound = self._cached(sound_name)
+        if sound is None:
+            # play an already decoded variant rather than decoding mid-frame,
+            # and fetch the chosen one in the background for next time
+            with self._lock:
+                decoded = [name for name in available_sounds if name in self.sound_cache]
+            if decoded:
+                self._decode_async(sound_name)
+                sound_name = random.choice(decoded)
+                sound = self._cached(sound_name)
+            if sound is None:
+                sound = self.get_sound(sound_name)
+        return sound
+
+    def play_sound_by_name(self, sound_name: str, priority: int = PRIORITY_COMMAND) -> bool:
+        """Request a specific sound by its name.
 
         Args:
             sound_name: The name of the sound file (without extension).
+            priority: Voice priority (one of the PRIORITY_* constants).
 
         Returns:
-            True if sound was played, False otherwise.
+            True if the request was queued, False if the sound is unknown.
         """
-        if sound_name not in self.sound_cache:
-            print(f"Sound '{sound_name}' not found in cache.")
+        if sound_name not in self.sound_files:
+            print(f"Sound '{sound_name}' not found.")
             return False
 
-        return self._play_sound(self.sound_cache[sound_name])
+        self._request(sound_name, priority, False)
+        return True
 
     def play_random_from_group(self, group_name: str) -> bool:
-        """Play a random sound from a named sound group.
+        """Request a random sound from a named sound group.
 
         Args:
             group_name: The name of the sound group (e.g., "MOVE_COMMAND").
 
         Returns:
-            True if sound was played, False otherwise.
+            True if the request was queued, False if the group has no sounds.
         """
         if group_name not in self.sound_groups:
             print(f"Sound group '{group_name}' not found.")
@@ -182,18 +417,39 @@ class SoundManager:
             print(f"Sound group '{group_name}' is empty.")
             return False
 
-        # Filter to only available sounds
-        available_sounds = [name for name in sound_names if name in self.sound_cache]
-        if not available_sounds:
+        if not any(name in self.sound_files for name in sound_names):
             print(f"No available sounds in group '{group_name}'.")
             return False
 
-        sound_name = random.choice(available_sounds)
-        return self._play_sound(self.sound_cache[sound_name])
+        self._request(group_name, self.group_priorities.get(group_name, PRIORITY_COMMAND), True)
+        return True
 
     def stop_current_sound(self) -> None:
-        """Stop the currently playing sound."""
-        self.current_sound_channel.stop()
+        """Stop every playing sound and forget queued requests."""
+        self._requests.clear()
+        for channel in self.voices:
+            channel.stop()
+
+    # ==================== Event bus subscribers ====================
+
+    def _on_unit_destroyed(self, event) -> None:
+        group_name = self.destroyed_groups.get(type(event.unit).__name__)
+        if group_name is not None:
+            self.play_random_from_group(group_name)
+
+    def _on_job_finished(self, event) -> None:
+        if event.offline:
+            return
+        if event.kind == "fab":
+            self.on_fabrication_complete()
+        elif event.kind == "ref":
+            self.on_refining_complete()
+
+    def unsubscribe_events(self) -> None:
+        """Stop reacting to game events (when this manager is replaced)."""
+        bus = events.get_event_bus()
+        for event_type, handler in self._subscriptions:
+            bus.unsubscribe(event_type, handler)
 
     # ==================== Event-based sound triggers ====================
 
@@ -261,21 +517,36 @@ class SoundManager:
 
     def get_cached_sounds(self) -> List[str]:
         """Get a list of all currently cached sound names."""
-        return list(self.sound_cache.keys())
+        with self._lock:
+            return list(self.sound_cache.keys())
 
     def set_volume(self, volume: float) -> None:
-        """Set the volume for the current channel.
+        """Set the volume for all voices.
 
         Args:
             volume: Volume level from 0.0 (silent) to 1.0 (full).
         """
         volume = max(0.0, min(1.0, volume))
-        self.current_sound_channel.set_volume(volume)
+        for channel in self.voices:
+            channel.set_volume(volume)
 
     def get_volume(self) -> float:
-        """Get the current channel volume."""
+        """Get the current voice volume."""
         return self.current_sound_channel.get_volume()
 
+    def get_metrics(self) -> Dict[str, float]:
+        """Return mixer and cache counters for profiling overlays and logs."""
+        return {
+            "requested": self.requested,
+            "played": self.played,
+            "merged": self.merged,
+            "dropped": self.dropped,
+            "stolen": self.stolen,
+            "voices_busy": sum(1 for channel in self.voices if channel.get_busy()),
+            "cached_sounds": len(self.sound_cache),
+            "cache_bytes": self.cache_bytes,
+        }
+
 
 # Global singleton instance
 _instance: Optional[SoundManager] = None
@@ -299,5 +570,7 @@ def init_sound_manager(sounds_dir: str = None) -> SoundManager:
         The initialized SoundManager instance.
     """
     global _instance
+    if _instance is not None:
+        _instance.unsubscribe_events()
     _instance = SoundManager(sounds_dir)
     return _instance
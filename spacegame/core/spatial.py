@@ -0,0 +1,103 @@
+"""Uniform grid spatial index.
+
+`SpatialGrid` buckets items by world position into square cells so that
+draw culling and hit-testing only touch the cells overlapping the query
+area instead of every item. It is intentionally small and free of pygame
+dependencies so both screens and gameplay systems can use it.
+"""
+from typing import Any, Dict, Iterable, List, Tuple
+import math
+
+
+class SpatialGrid:
+    """Bucket items into fixed-size square cells keyed by (cx, cy)."""
+
+    def __init__(self, cell_size: float = 128.0):
+        self.cell_size = float(cell_size) if cell_size and cell_size > 0 else 128.0
+        # (cx, cy) -> list of (item, x, y)
+        self.cells: Dict[Tuple[int, int], List[Tuple[Any, float, float]]] = {}
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def cell_of(self, x: float, y: float) -> Tuple[int, int]:
+        """Return the cell coordinates containing world point (x, y)."""
+        cs = self.cell_size
+        return (int(math.floor(x / cs)), int(math.floor(y / cs)))
+
+    def clear(self) -> None:
+        self.cells.clear()
+        self._count = 0
+
+    def insert(self, item: Any, pos) -> None:
+        """Insert `item` at world position `pos` (any 2-sequence)."""
+        x, y = float(pos[0]), float(pos[1])
+        self.cells.setdefault(self.cell_of(x, y), []).append((item, x, y))
+        self._count += 1
+
+    def remove(self, item: Any, pos) -> bool:
+        """Remove `item` previously inserted at `pos`. Returns True if removed."""
+        key = self.cell_of(float(pos[0]), float(pos[1]))
+        bucket = self.cells.get(key)
+        if not bucket:
+            return False
+        for i, entry in enumerate(bucket):
+            if entry[0] is item:
+                bucket.pop(i)
+                if not bucket:
+                    del self.cells[key]
+                self._count -= 1
+                return True
+        return False
+
+    def build(self, items: Iterable[Any], key) -> None:
+        """Rebuild the grid from `items`, using `key(item)` for positions."""
+        self.clear()
+        for item in items:
+            self.insert(item, key(item))
+
+    def query_rect(self, left: float, top: float, right: float, bottom: float) -> List[Any]:
+        """Return items whose position lies inside the world rect (inclusive)."""
+        if right < left:
+            left, right = right, left
+        if bottom < top:
+            top, bottom = bottom, top
+        cx0, cy0 = self.cell_of(left, top)
+        cx1, cy1 = self.cell_of(right, bottom)
+        out: List[Any] = []
+        cells = self.cells
+        # When the query covers more cells than are occupied, walk the
+        # occupied cells instead so a zoomed-out view never degrades into a
+        # scan over empty space.
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > len(cells):
+            for (cx, cy), bucket in cells.items():
+                if cx0 <= cx <= cx1 and cy0 <= cy <= cy1:
+                    for item, x, y in bucket:
+                        if left <= x <= right and top <= y <= bottom:
+                            out.append(item)
+            return out
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                bucket = cells.get((cx, cy))
+                if not bucket:
+                    continue
+                for item, x, y in bucket:
+                    if left <= x <= right and top <= y <= bottom:
+                        out.append(item)
+        return out
+
+    def query_radius(self, x: float, y: float, radius: float) -> List[Any]:
+        """Return items within `radius` of world point (x, y), nearest first."""
+        r2 = float(radius) * float(radius)
+        cx0, cy0 = self.cell_of(x - radius, y - radius)
+        cx1, cy1 = self.cell_of(x + radius, y + radius)
+        found = []
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                for item, ix, iy in self.cells.get((cx, cy), ()):
+                    d2 = (ix - x) * (ix - x) + (iy - y) * (iy - y)
+                    if d2 <= r2:
+                        found.append((d2, item))
+        found.sort(key=lambda t: t[0])
+        return [item for _, item in found]
@@ -0,0 +1,198 @@
+"""Unit sprites: pre-oriented, pre-scaled images with shared rotation frames.
+
+Unit classes declare their sprite as a `SpriteSpec` (source file,
+orientation fix, scale) instead of rotating and smoothscaling the source
+art in every constructor. `sprite_set(spec)` returns one `SpriteSet` per
+spec, shared by every instance:
+
+- `base`: the oriented, scaled sprite (the unit's `base_surf`).
+- `rotated(angle)`: the sprite rotated to the nearest of
+  `SPRITE_ROTATION_FRAMES` angles plus its collision mask. Frames and
+  masks are built once per sprite rather than once per unit per turn.
+
+When a sprite pack baked by ``python -m spacegame.tools.bake`` is present,
+base images and rotation frames are memory-mapped (copy-on-write) from it
+and wrapped with `pygame.image.frombuffer`, so no decoding or scaling
+happens at runtime.
+Pack entries whose source file changed since baking are ignored (the sprite
+is built from the source instead) until the pack is re-baked.
+"""
+import json
+import math
+import mmap
+import os
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import pygame
+
+from spacegame.config import IMAGES_DIR, SPRITE_CACHE_DIR, SPRITE_ROTATION_FRAMES
+from spacegame.core.assets import load_image
+
+
+# Bump when the pack layout or the baking transforms change
+PACK_VERSION = 1
+PACK_PIXEL_FORMAT = "BGRA"  # byte order of a convert_alpha() surface
+PACK_INDEX_NAME = "index.json"
+PACK_DATA_NAME = "sprites.pack"
+
+
+class SpriteSpec(NamedTuple):
+    """How a unit sprite is derived from its source image."""
+
+    source: str  # file name in IMAGES_DIR
+    rotate: float = 0.0  # orientation fix applied before scaling (degrees)
+    divisor: int = 1  # scale to (w // divisor, h // divisor)
+    size: Optional[Tuple[int, int]] = None  # explicit size (overrides divisor)
+    min_size: int = 1
+    frames: int = SPRITE_ROTATION_FRAMES  # rotation frames; 1 for sprites that never turn
+
+    @property
+    def key(self) -> str:
+        scale = f"{self.size[0]}x{self.size[1]}" if self.size else f"d{self.divisor}"
+        return f"{os.path.splitext(self.source)[0]}_r{self.rotate:g}_{scale}_m{self.min_size}_f{self.frames}"
+
+    @property
+    def path(self) -> str:
+        return f"{IMAGES_DIR}/{self.source}"
+
+
+def pack_dir() -> str:
+    return os.path.join(SPRITE_CACHE_DIR, f"sprites-v{PACK_VERSION}")
+
+
+# ---------- Building sprites from source art ----------
+def build_base(spec: SpriteSpec, source: Optional[pygame.Surface] = None) -> pygame.Surface:
+    """Orient and scale the source image as described by `spec`."""
+    sprite = source if source is not None else load_image(spec.path)
+    if spec.rotate:
+        sprite = pygame.transform.rotate(sprite, spec.rotate)
+    if spec.size:
+        w, h = spec.size
+    else:
+        w, h = sprite.get_width() // spec.divisor, sprite.get_height() // spec.divisor
+    w, h = max(spec.min_size, w), max(spec.min_size, h)
+    if (w, h) != sprite.get_size():
+        sprite = pygame.transform.smoothscale(sprite, (w, h))
+    return sprite
+
+
+def frame_angle(spec: SpriteSpec, index: int) -> float:
+    return index * 360.0 / max(1, spec.frames)
+
+
+def build_frame(spec: SpriteSpec, base: pygame.Surface, index: int) -> pygame.Surface:
+    return pygame.transform.rotate(base, frame_angle(spec, index))
+
+
+class SpriteSet:
+    """Base sprite, rotation frames and masks shared by all units of one spec.
+
+    `base` and the surfaces from `rotated()` are shared by every unit of the
+    spec (and may wrap the mapped sprite pack): treat them as read-only and
+    draw tints, flashes or overlays on a `.copy()`.
+    """
+
+    def __init__(self, spec: SpriteSpec, base: pygame.Surface, frames: Optional[List[pygame.Surface]] = None):
+        self.spec = spec
+        self.base = base
+        self.count = max(1, spec.frames)
+        self.step = 360.0 / self.count
+        self._frames: List[Optional[pygame.Surface]] = list(frames) if frames else [None] * self.count
+        self._masks: List[Optional[pygame.mask.Mask]] = [None] * self.count
+
+    def frame_index(self, angle: float) -> int:
+        return int(math.floor(angle / self.step + 0.5)) % self.count
+
+    def rotated(self, angle: float) -> Tuple[pygame.Surface, pygame.mask.Mask]:
+        """Return (surface, mask) for the frame nearest to `angle`."""
+        i = self.frame_index(angle)
+        surf = self._frames[i]
+        if surf is None:
+            surf = build_frame(self.spec, self.base, i)
+            self._frames[i] = surf
+        mask = self._masks[i]
+        if mask is None:
+            mask = pygame.mask.from_surface(surf)
+            self._masks[i] = mask
+        return surf, mask
+
+
+# ---------- Baked pack ----------
+class _Pack:
+    def __init__(self, directory: str):
+        self.entries: Dict[str, dict] = {}
+        self._mm = None
+        self.stale_reported = False
+        try:
+            with open(os.path.join(directory, PACK_INDEX_NAME), "r", encoding="utf-8") as fh:
+                index = json.load(fh)
+            if index.get("version") != PACK_VERSION or index.get("format") != PACK_PIXEL_FORMAT:
+                return
+            with open(os.path.join(directory, PACK_DATA_NAME), "rb") as fh:
+                # copy-on-write: a stray write to a sprite surface touches a
+                # private page instead of faulting on a read-only mapping
+                self._mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_COPY)
+            self._view = memoryview(self._mm)
+            self.entries = dict(index.get("sprites") or {})
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def _region(self, region) -> pygame.Surface:
+        offset, w, h = region
+        return pygame.image.frombuffer(self._view[offset:offset + w * h * 4], (w, h), PACK_PIXEL_FORMAT)
+
+    def load(self, spec: SpriteSpec) -> Optional[SpriteSet]:
+        entry = self.entries.get(spec.key)
+        if entry is None:
+            return None
+        try:
+            st = os.stat(spec.path)
+            if [st.st_size, st.st_mtime_ns] != entry.get("stat"):
+                if not self.stale_reported:
+                    self.stale_reported = True
+                    print("Sprite pack is out of date; run `python -m spacegame.tools.bake` to re-bake it")
+                return None
+            base = self._region(entry["base"])
+            frames = [self._region(r) for r in entry.get("frames", [])]
+        except (OSError, KeyError, ValueError, TypeError):
+            return None
+        if len(frames) != max(1, spec.frames):
+            frames = None
+        return SpriteSet(spec, base, frames)
+
+
+_pack: Optional[_Pack] = None
+_SETS: Dict[SpriteSpec, SpriteSet] = {}
+
+
+def _get_pack() -> _Pack:
+    global _pack
+    if _pack is None:
+        _pack = _Pack(pack_dir())
+    return _pack
+
+
+def baked_sources() -> set:
+    """Source image paths fully covered by the baked pack (no need to decode them)."""
+    sources = set()
+    for entry in _get_pack().entries.values():
+        path = f"{IMAGES_DIR}/{entry.get('source')}"
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        if [st.st_size, st.st_mtime_ns] == entry.get("stat"):
+            sources.add(path)
+    return sources
+
+
+def sprite_set(spec: SpriteSpec) -> SpriteSet:
+    """Return the shared `SpriteSet` for `spec` (baked if available)."""
+    sprites = _SETS.get(spec)
+    if sprites is not None:
+        return sprites
+    sprites = _get_pack().load(spec)
+    if sprites is None:
+        sprites = SpriteSet(spec, build_base(spec))
+    _SETS[spec] = sprites
+    return sprites
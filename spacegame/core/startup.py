@@ -0,0 +1,135 @@
+"""Startup helpers: selective pygame initialisation and a startup-time report.
+
+`init_pygame` initialises only the subsystems the game uses up front
+(display, fonts, timer). The mixer is opened on demand by the sound manager
+and joysticks are never used, so `pygame.init()` is avoided.
+
+`enable_report()` (``run.py --startup-report``) records module import times
+in the style of ``python -X importtime`` plus named startup phases, and
+prints them to stderr once the first menu frame is on screen.
+"""
+import builtins
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import List, Optional, Tuple
+
+# reference point for the report; this module is imported first by run.py
+_T0 = time.perf_counter()
+
+
+def init_pygame() -> None:
+    """Initialise the pygame subsystems needed before the first frame."""
+    import pygame
+
+    with phase("pygame init"):
+        pygame.display.init()
+        pygame.font.init()
+        # starts the SDL timer that pygame.time.get_ticks() reads
+        pygame.time.Clock().tick()
+
+
+class StartupReport:
+    """Collect import timings and startup phases on the main thread."""
+
+    def __init__(self):
+        self.imports: List[Tuple[int, str, float, float]] = []  # depth, name, self s, cumulative s
+        self.phases: List[Tuple[str, float]] = []
+        self._stack: List[list] = []  # [label, time spent in nested imports]
+        self._orig_import = None
+
+    # ---------- Import timing ----------
+    def install(self) -> None:
+        if self._orig_import is None:
+            self._orig_import = builtins.__import__
+            builtins.__import__ = self._import
+
+    def uninstall(self) -> None:
+        if self._orig_import is not None:
+            builtins.__import__ = self._orig_import
+            self._orig_import = None
+
+    def _label(self, name: str, fromlist) -> Optional[str]:
+        """Return the module a call will actually load, or None if already loaded."""
+        mod = sys.modules.get(name)
+        if mod is None:
+            return name
+        if fromlist and getattr(mod, "__path__", None) is not None:
+            # `from package import submodule`
+            for item in fromlist:
+                sub = f"{name}.{item}"
+                if item != "*" and sub not in sys.modules:
+                    return sub
+        return None
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        orig = self._orig_import
+        if level or threading.current_thread() is not threading.main_thread():
+            return orig(name, globals, locals, fromlist, level)
+        label = self._label(name, fromlist)
+        if label is None or any(frame[0] == label for frame in self._stack):
+            return orig(name, globals, locals, fromlist, level)
+        self._stack.append([label, 0.0])
+        t0 = time.perf_counter()
+        try:
+            return orig(name, globals, locals, fromlist, level)
+        finally:
+            total = time.perf_counter() - t0
+            children = self._stack.pop()[1]
+            if self._stack:
+                self._stack[-1][1] += total
+            self.imports.append((len(self._stack), label, total - children, total))
+
+    # ---------- Phases ----------
+    def add_phase(self, name: str, seconds: float) -> None:
+        self.phases.append((name, seconds))
+
+    def format(self) -> str:
+        lines = ["import time: self [us] | cumulative | imported package"]
+        for depth, name, self_s, cum_s in self.imports:
+            lines.append(f"import time: {int(self_s * 1e6):>9} | {int(cum_s * 1e6):>10} | {'  ' * depth}{name}")
+        top = sum(cum for depth, _, _, cum in self.imports if depth == 0)
+        lines.append("")
+        lines.append("startup phases:")
+        lines.append(f"  {'imports (total)':<24}{top * 1000.0:9.1f} ms")
+        for name, seconds in self.phases:
+            lines.append(f"  {name:<24}{seconds * 1000.0:9.1f} ms")
+        return "\n".join(lines)
+
+
+_report: Optional[StartupReport] = None
+
+
+def enable_report() -> StartupReport:
+    """Start recording imports and phases for the startup report."""
+    global _report
+    if _report is None:
+        _report = StartupReport()
+        _report.install()
+    return _report
+
+
+@contextmanager
+def phase(name: str):
+    """Time a named startup phase (no-op unless the report is enabled)."""
+    if _report is None:
+        yield
+        return
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        _report.add_phase(name, time.perf_counter() - t0)
+
+
+def first_frame_shown() -> None:
+    """Called once the first menu frame is presented; prints the report."""
+    global _report
+    report = _report
+    if report is None:
+        return
+    _report = None
+    report.uninstall()
+    report.add_phase("time to first frame", time.perf_counter() - _T0)
+    print(report.format(), file=sys.stderr)
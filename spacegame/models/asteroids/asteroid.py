@@ -6,6 +6,9 @@ from pygame.math import Vector2
 class Asteroid(pygame.sprite.Sprite, ABC):
     """Abstract asteroid: position, tier, ore_type (letter), purity (0..1), and radius.
 
+    `reserve` is the total ore the asteroid holds (None = inexhaustible) and
+    `mined` tracks how much has been delivered from it so far.
+
     Subclasses should call `self.set_sprite(surface)` after creating a scaled
     surface for the asteroid so that the sprite image/rect/mask are initialized.
     """
@@ -17,6 +20,8 @@ class Asteroid(pygame.sprite.Sprite, ABC):
         self.ore_type = str(ore_type)
         self.purity = float(purity)
         self.radius = int(radius)
+        self.reserve = None
+        self.mined = 0.0
         self.image = None
         self.rect = pygame.Rect(int(self.pos.x - self.radius), int(self.pos.y - self.radius), self.radius * 2, self.radius * 2)
         self.mask = None
@@ -37,3 +42,6 @@ class Asteroid(pygame.sprite.Sprite, ABC):
     def bounding_radius(self) -> float:
         return float(self.radius)
 
+    def is_depleted(self) -> bool:
+        return self.reserve is not None and self.mined >= self.reserve
+
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from spacegame.core.codec import register_type
 
 
 class Blueprint(ABC):
@@ -7,8 +8,18 @@ class Blueprint(ABC):
     Blueprints are stackable in principle, but some may be infinite
     (represented by quantity=float('inf')). Concrete blueprints should
     provide `name`, `tier`, and `preview_filename` properties.
+
+    Only the stack state is saved; costs, titles and unit classes come from
+    the concrete blueprint's constructor.
     """
 
+    PERSIST_VERSION = 1
+    PERSIST_FIELDS = ("tier", "quantity", "rarity")
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        register_type(cls)
+
     def __init__(self, tier: int = 0, stack_size: int = 9999, quantity=None, rarity: str = "COMMON", title: str | None = None, description: str = "",):
         self.tier = int(tier)
         self.stack_size = int(stack_size)
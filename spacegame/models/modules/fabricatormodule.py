@@ -10,6 +10,16 @@ class FabricatorModule(ShipModule):
     instead of hard-coded strings in the UI.
     """
 
+    PERSIST_FIELDS = ShipModule.PERSIST_FIELDS + ("module_size", "base_fabrication_time")
+    # Job state is persisted separately by the FabricationManager
+    PERSIST_TRANSIENT = (
+        "fabrication_total_ms",
+        "fabrication_start_ticks",
+        "fabrication_blueprint",
+        "fabrication_progress",
+        "fabrication_remaining_s",
+    )
+
     def __init__(
         self,
         *,
@@ -1,4 +1,11 @@
+import uuid
 from abc import ABC, abstractmethod
+from spacegame.core.codec import register_type
+
+
+def new_module_id() -> str:
+    """A fresh, persisted module id (saved jobs find their module by it)."""
+    return uuid.uuid4().hex[:12]
 
 
 class ShipModule(ABC):
@@ -14,11 +21,24 @@ class ShipModule(ABC):
     Concrete modules should also expose a `preview_filename` property
     so UI screens can render a consistent preview icon, similar to the
     Blueprint and Ore models.
+
+    Saved state is declared in `PERSIST_FIELDS` (see `spacegame.core.codec`);
+    subclasses extend it with their own tuning values.
     """
 
+    PERSIST_VERSION = 2
+    PERSIST_FIELDS = ("tier", "capacity", "module_id")
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        register_type(cls)
+
     def __init__(self, *, tier: int, capacity: int):
         self.tier = int(tier)
         self.capacity = int(capacity)
+        # Stable identity across saves; ModulesManager re-issues it for
+        # older saves that did not store one
+        self.module_id = new_module_id()
 
         # Which internal sections this module can be mounted into.
         # Sections use indices: 0=left, 1=middle, 2=right.
@@ -8,6 +8,20 @@ class RefineryModule(ShipModule):
     Mirrors FabricatorModule structure but exposes `base_refinement_time`.
     """
 
+    PERSIST_FIELDS = ShipModule.PERSIST_FIELDS + (
+        "module_size",
+        "base_refinement_time",
+        "standard_refinement_time_s",
+    )
+    # Job state is persisted separately by the RefiningManager
+    PERSIST_TRANSIENT = (
+        "refinement_total_ms",
+        "refinement_start_ticks",
+        "refinement_recipe",
+        "refinement_progress",
+        "refinement_remaining_s",
+    )
+
     def __init__(
         self,
         *,
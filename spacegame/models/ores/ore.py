@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from spacegame.core.codec import register_type
 
 
 class Ore(ABC):
@@ -6,8 +7,16 @@ class Ore(ABC):
 
     Provides common attributes: `tier` and `stack_size` (max per slot).
     Concrete ores should expose a `name` property and may add quantity.
+    Refined materials derive from this class and share its saved fields.
     """
 
+    PERSIST_VERSION = 1
+    PERSIST_FIELDS = ("tier", "quantity")
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        register_type(cls)
+
     def __init__(self, tier: int, stack_size: int = 10000):
         self.tier = int(tier)
         self.stack_size = int(stack_size)
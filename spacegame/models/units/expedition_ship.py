@@ -1,4 +1,3 @@
-import pygame
 """ExpeditionShip unit: mothership with an InventoryManager and Hangar.
 
 This module defines the player-controlled `ExpeditionShip` which owns the
@@ -13,8 +12,8 @@ from spacegame.config import (
     INTERCEPTOR_POOL_SIZE,
     RESOURCE_COLLECTOR_POOL_SIZE,
     PLASMA_BOMBER_POOL_SIZE,
-    IMAGES_DIR,
 )
+from spacegame.core.sprite_pack import SpriteSpec, sprite_set
 from spacegame.core.inventory_manager import InventoryManager
 
 class ExpeditionShip(SpaceUnit):
@@ -26,22 +25,18 @@ class ExpeditionShip(SpaceUnit):
     def get_tier(self) -> int:
         return 0
 
-    def __init__(self, start_pos, **kwargs):
-        # load sprite first
-        sprite = pygame.image.load(IMAGES_DIR + "/ExpeditionShip.png").convert_alpha()
-
-        # fix orientation (rotate -90 degrees clockwise)
-        sprite = pygame.transform.rotate(sprite, -90)
+    # source rotated -90 degrees to face right, scaled down 4x
+    SPRITE = SpriteSpec("ExpeditionShip.png", rotate=-90, divisor=4)
 
-        # use sprite size instead of tiny rectangle
-        scaled_sprite = pygame.transform.smoothscale(
-            sprite,
-            (sprite.get_width() // 4, sprite.get_height() // 4)
-        )
+    def __init__(self, start_pos, **kwargs):
+        # load sprite first (oriented and scaled; shared by all instances)
+        sprites = sprite_set(self.SPRITE)
+        scaled_sprite = sprites.base
 
         # update ship size
         super().__init__(start_pos, ship_size=scaled_sprite.get_size(), rarity="common", **kwargs)
         self.base_surf = scaled_sprite
+        self.sprite_set = sprites
 
         # Combat stats
         self.bullet_damage = 12.0
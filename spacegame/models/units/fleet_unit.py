@@ -74,6 +74,8 @@ class SpaceUnit(pygame.sprite.Sprite, ABC):
         self._last_angle_for_mask = None
         self._last_mask = None
         self._last_rot_surf = None
+        # shared rotation frames for sprite-based units (see core.sprite_pack)
+        self.sprite_set = None
 
         # initialize sprite image/rect/mask
         self.image = self.base_surf.copy()
@@ -138,6 +140,8 @@ class SpaceUnit(pygame.sprite.Sprite, ABC):
     # --------------- Helpers ---------------
     def get_rotated_sprite(self):
         # Return rotated surface at current angle (may reuse cached surf/mask).
+        if self.sprite_set is not None:
+            return self.sprite_set.rotated(self.angle)
         if self._last_angle_for_mask != self.angle or self._last_rot_surf is None:
             self._last_rot_surf = pygame.transform.rotate(self.base_surf, self.angle)
             self._last_mask = pygame.mask.from_surface(self._last_rot_surf)
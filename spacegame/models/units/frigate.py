@@ -1,6 +1,5 @@
-import pygame
 from spacegame.models.units.fleet_unit import SpaceUnit
-from spacegame.config import IMAGES_DIR
+from spacegame.core.sprite_pack import SpriteSpec, sprite_set
 
 class Frigate(SpaceUnit):
     """Escort frigate for the ExpeditionShip."""
@@ -11,22 +10,18 @@ class Frigate(SpaceUnit):
     def get_tier(self) -> int:
         return 0
 
+    # rotated so it faces horizontally like the other ships, scaled down 6x
+    SPRITE = SpriteSpec("Frigate.png", rotate=-90, divisor=6)
+
     def __init__(self, start_pos, **kwargs):
         # load frigate sprite
-        sprite = pygame.image.load(IMAGES_DIR + "/Frigate.png").convert_alpha()
-
-        # rotate so it faces horizontally like the other ships
-        sprite = pygame.transform.rotate(sprite, -90)
-
-        # scale to of sprite
-        scaled_sprite = pygame.transform.smoothscale(
-            sprite,
-            (sprite.get_width() // 6, sprite.get_height() // 6)
-        )
+        sprites = sprite_set(self.SPRITE)
+        scaled_sprite = sprites.base
 
         # use sprite size for collisions / drawing
         super().__init__(start_pos, ship_size=scaled_sprite.get_size(), rarity="common", **kwargs)
         self.base_surf = scaled_sprite
+        self.sprite_set = sprites
 
         # Combat stats
         self.bullet_damage = 67.0
@@ -1,6 +1,5 @@
-import pygame
 from spacegame.models.units.fleet_unit import SpaceUnit
-from spacegame.config import IMAGES_DIR
+from spacegame.core.sprite_pack import SpriteSpec, sprite_set
 
 class Interceptor(SpaceUnit):
     """Small deployable interceptor light craft."""
@@ -12,23 +11,21 @@ class Interceptor(SpaceUnit):
         # tier is stored per ship instance; default 0 like other ships.
         return getattr(self, "tier", 0)
 
+    # rotated so it faces like the other ships (to the right at angle 0),
+    # scaled down 24x (adjust divisor if you want a different size)
+    SPRITE = SpriteSpec("Interceptor.png", rotate=-90, divisor=24)
+
     def __init__(self, start_pos, interceptor_id=None, tier: int = 0, **kwargs):
         # per-ship tier value
         self.tier = tier
         # load interceptor sprite
-        sprite = pygame.image.load(IMAGES_DIR + "/Interceptor.png").convert_alpha()
-        # rotate so it faces like the other ships (to the right at angle 0)
-        sprite = pygame.transform.rotate(sprite, -90)
-
-        # scale down (adjust factor if you want a different size)
-        scaled_sprite = pygame.transform.smoothscale(
-            sprite,
-            (sprite.get_width() // 24, sprite.get_height() // 24)
-        )
+        sprites = sprite_set(self.SPRITE)
+        scaled_sprite = sprites.base
 
         # use sprite size for collisions / drawing
         super().__init__(start_pos, ship_size=scaled_sprite.get_size(), rarity="common", **kwargs)
         self.base_surf = scaled_sprite
+        self.sprite_set = sprites
 
         # id in the ExpeditionShip's interceptor pool (if any)
         self.interceptor_id = interceptor_id
@@ -1,4 +1,3 @@
-import pygame
 from spacegame.models.units.fleet_unit import SpaceUnit
 from spacegame.config import (
     PIRATE_DEFAULT_SPEED,
@@ -6,9 +5,9 @@ from spacegame.config import (
     PIRATE_DEFAULT_FIRE_RANGE,
     PIRATE_DEFAULT_FIRE_COOLDOWN,
     PIRATE_DEFAULT_BULLET_DAMAGE,
-    PIRATE_DEFAULT_ARMOR_DAMAGE,
-    IMAGES_DIR
+    PIRATE_DEFAULT_ARMOR_DAMAGE
 )
+from spacegame.core.sprite_pack import SpriteSpec, sprite_set
 
 class PirateFrigate(SpaceUnit):
     # ---- Enemy defaults ----
@@ -26,22 +25,18 @@ class PirateFrigate(SpaceUnit):
     def get_tier(self) -> int:
         return 0
 
+    # rotated so it faces to the right (like other ships), scaled down 6x
+    SPRITE = SpriteSpec("PirateCruiser.png", rotate=-90, divisor=6)
+
     def __init__(self, start_pos, **kwargs):
         # load pirate sprite
-        sprite = pygame.image.load(IMAGES_DIR + "/PirateCruiser.png").convert_alpha()
-
-        # rotate so it faces to the right (like other ships)
-        sprite = pygame.transform.rotate(sprite, -90)
-
-        # scale it down (adjust divisor for size)
-        scaled_sprite = pygame.transform.smoothscale(
-            sprite,
-            (sprite.get_width() // 6, sprite.get_height() // 6)
-        )
+        sprites = sprite_set(self.SPRITE)
+        scaled_sprite = sprites.base
 
         # use sprite size for collisions / drawing
         super().__init__(start_pos, ship_size=scaled_sprite.get_size(), rarity="common", **kwargs)
         self.base_surf = scaled_sprite
+        self.sprite_set = sprites
 
         # Combat stats
         self.bullet_damage = 67.0
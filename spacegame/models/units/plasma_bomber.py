@@ -1,11 +1,15 @@
 import pygame
 from spacegame.models.units.fleet_unit import SpaceUnit
-from spacegame.config import IMAGES_DIR
+from spacegame.core.sprite_pack import SpriteSpec, sprite_set
 
 
 class PlasmaBomber(SpaceUnit):
     """Plasma Bomber: heavy light-craft similar to Interceptor but trades speed for damage/health."""
 
+    # Rotated to face like the other ships; scaled down 16x, which makes the
+    # bomber slightly larger than the interceptor (//24)
+    SPRITE = SpriteSpec("TorpedoBomber.png", rotate=-90, divisor=16, min_size=8)
+
     def shape_id(self):
         return "plasma_bomber"
 
@@ -17,30 +21,18 @@ class PlasmaBomber(SpaceUnit):
         self.tier = tier
 
         # load bomber sprite (use TorpedoBomber.png if present)
+        sprites = None
         try:
-            sprite = pygame.image.load(IMAGES_DIR + "/TorpedoBomber.png").convert_alpha()
+            sprites = sprite_set(self.SPRITE)
+            scaled_sprite = sprites.base
         except Exception:
             # fallback to a simple rect surface
-            sprite = pygame.Surface((48, 24), pygame.SRCALPHA)
-            pygame.draw.rect(sprite, (200, 80, 80), sprite.get_rect())
-
-        # rotate so it faces like the other ships (to the right at angle 0)
-        try:
-            sprite = pygame.transform.rotate(sprite, -90)
-        except Exception:
-            pass
-
-        # scale down: make the bomber slightly larger than the interceptor
-        # (interceptor used //24); use a smaller divisor so bomber appears bigger
-        try:
-            target_w = max(8, sprite.get_width() // 16)
-            target_h = max(8, sprite.get_height() // 16)
-            scaled_sprite = pygame.transform.smoothscale(sprite, (target_w, target_h))
-        except Exception:
-            scaled_sprite = sprite
+            scaled_sprite = pygame.Surface((48, 24), pygame.SRCALPHA)
+            pygame.draw.rect(scaled_sprite, (200, 80, 80), scaled_sprite.get_rect())
 
         super().__init__(start_pos, ship_size=scaled_sprite.get_size(), rarity="common", **kwargs)
         self.base_surf = scaled_sprite
+        self.sprite_set = sprites
 
         # id in hangar pool (if any)
         self.bomber_id = bomber_id
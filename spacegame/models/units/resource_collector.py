@@ -1,8 +1,9 @@
 import pygame
 from spacegame.models.units.fleet_unit import SpaceUnit
-from spacegame.config import IMAGES_DIR
+from spacegame.core.sprite_pack import SpriteSpec, sprite_set
 from spacegame.core.effects import spawn_dust
 from spacegame.core.sound_manager import get_sound_manager
+from spacegame.core import events
 
 
 class ResourceCollector(SpaceUnit):
@@ -17,6 +18,9 @@ class ResourceCollector(SpaceUnit):
     HEAL_RATE = 15.0
     HEAL_RANGE = 60.0
 
+    # Source rotated to face right and scaled down 24x
+    SPRITE = SpriteSpec("ResourceCollector.png", rotate=-90, divisor=24)
+
     def shape_id(self):
         return "resource_collector"
 
@@ -28,14 +32,14 @@ class ResourceCollector(SpaceUnit):
         # per-instance tier (default 0)
         self.tier = tier
 
-        # Load, orient, and scale the collector sprite used for rendering.
-        sprite = pygame.image.load(IMAGES_DIR + "/ResourceCollector.png").convert_alpha()
-        sprite = pygame.transform.rotate(sprite, -90)
-        scaled_sprite = pygame.transform.smoothscale(sprite, (sprite.get_width() // 24, sprite.get_height() // 24))
+        # Oriented and scaled collector sprite used for rendering.
+        sprites = sprite_set(self.SPRITE)
+        scaled_sprite = sprites.base
 
         # Initialize base visual / collision size from the scaled sprite.
         super().__init__(start_pos, ship_size=scaled_sprite.get_size(), rarity="common", **kwargs)
         self.base_surf = scaled_sprite
+        self.sprite_set = sprites
 
         # Optional pool identifier assigned by the mothership's Hangar
         self.collector_id = collector_id
@@ -200,6 +204,14 @@ class ResourceCollector(SpaceUnit):
                 self.mover.set_target(mothership.pos)
 
 
+        # Asteroid mined out (possibly by another collector): stop mining it
+        if self.mining_target is not None and not self.returning_to_ship:
+            try:
+                if self.mining_target.is_depleted():
+                    self.cancel_mining()
+            except Exception:
+                pass
+
         # Active mining at asteroid
         if self.mining_target is not None and not self.returning_to_ship:
             # Distance to asteroid
@@ -218,12 +230,7 @@ class ResourceCollector(SpaceUnit):
                 # When full, set to return to mothership
                 if self.mining_fill >= self.mining_capacity:
                     self.mining_fill = self.mining_capacity
-                    # Play resource collector full sound
-                    try:
-                        sound_manager = get_sound_manager()
-                        sound_manager.on_resource_collector_full()
-                    except Exception:
-                        pass
+                    events.get_event_bus().post(events.CollectorFull(self))
                     self.returning_to_ship = True
                     if mothership is not None:
                         self.mover.set_target(mothership.pos)
@@ -253,16 +260,19 @@ class ResourceCollector(SpaceUnit):
                         if inv is None:
                             raise RuntimeError("Mothership missing InventoryManager; migration required")
                         inv.add_resource(self.mining_target.ore_type, amount)
-                        # Play resource transfer sound
+                        # Record extraction so the asteroid field can mine it out
                         try:
-                            sound_manager = get_sound_manager()
-                            sound_manager.on_resource_transfer()
+                            self.mining_target.mined += amount
                         except Exception:
                             pass
+                        events.get_event_bus().post(
+                            events.ResourceDelivered(self, self.mining_target.ore_type, amount))
                     # Reset fill and continue mining loop (go back to asteroid)
                     self.mining_fill = 0.0
                     self.returning_to_ship = False
                     # If there's still a mining target, head back to it to continue mining
+                    if self.mining_target is not None and self.mining_target.is_depleted():
+                        self.mining_target = None
                     if self.mining_target is not None:
                         self.mover.set_target(self.mining_target.pos)
 
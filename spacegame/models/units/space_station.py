@@ -1,6 +1,5 @@
-import pygame
 from spacegame.models.units.fleet_unit import SpaceUnit
-from spacegame.config import IMAGES_DIR
+from spacegame.core.sprite_pack import SpriteSpec, sprite_set
 
 
 class SpaceStation(SpaceUnit):
@@ -21,15 +20,13 @@ class SpaceStation(SpaceUnit):
     def get_tier(self) -> int:
         return 0
 
+    # Scaled to an appropriate size (stations should be large and visible);
+    # stations never turn, so no rotation frames
+    SPRITE = SpriteSpec("Higarran_Station.png", divisor=3, frames=1)
+
     def __init__(self, start_pos, **kwargs):
         # Load station sprite
-        sprite = pygame.image.load(IMAGES_DIR + "/Higarran_Station.png").convert_alpha()
-
-        # Scale the sprite to an appropriate size (stations should be large and visible)
-        scaled_sprite = pygame.transform.smoothscale(
-            sprite,
-            (sprite.get_width() // 3, sprite.get_height() // 3)
-        )
+        scaled_sprite = sprite_set(self.SPRITE).base
 
         # Initialize as a non-enemy unit with speed and rotation speed of 0
         super().__init__(
@@ -1,8 +1,5 @@
-import sys
 import pygame
 from spacegame.config import (
-    SCREEN_WIDTH,
-    SCREEN_HEIGHT,
     UI_BG_COLOR,
     UI_TAB_HEIGHT,
     UI_SECTION_TEXT_COLOR,
@@ -27,295 +24,304 @@ from spacegame.ui.fabrication_ui import (
 )
 from spacegame.ui.ui import draw_plus_circle, drawCornerFrame, OREM_PREVIEW_IMG, preview_for_unit, UI_BG_IMG
 from spacegame.ui.fleet_management_ui import draw_tier_icon_image
-                      
+from spacegame.core.production import get_production_graph
+from spacegame.core.assets import load_image
+from spacegame.core.screen_manager import Screen, run_screen
 
-def fabrication_bpdetails_screen(main_player, player_fleet, selected_fabricator_index, bp, station_slot=False):
-    # Use the existing display surface if present; otherwise create one.
-    screen = pygame.display.get_surface()
-    if screen is None:
-        screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-
-    width, height = screen.get_size()
-
-    # ---------- FONTS ----------
-    title_font = pygame.font.Font(None, 40)
-    tab_font = pygame.font.Font(None, 28)
-    # section_font removed: not used in this screen (other fonts created where needed)
-    close_font = pygame.font.Font(None, 40)
-    name_font = pygame.font.Font(None, 26)   # blueprint & REQUIREMENTS
-    desc_font = pygame.font.Font(None, 20)   # data
-    stat_font = pygame.font.Font(None, 20)   # ore
-    btn_font = pygame.font.Font(None, 28)    # BUILD
-    meta_font = pygame.font.Font(None, 20)   # DETAILS / PRODUCTION DETAILS / rarity
-
-    # ---------- TOP BAR ----------
-    TOP_BAR_HEIGHT = 96
-
-    # Title in the center of the top bar (moved slightly up to give more room to tabs)
-    title_text = "FABRICATION"
-    title_surf = title_font.render(title_text, True, UI_SECTION_TEXT_COLOR)
-    title_rect = title_surf.get_rect(center=(width // 2, TOP_BAR_HEIGHT // 2 - 22))
-
-    # Back arrow (left)
-    arrow_size = 32
-    back_arrow_rect = pygame.Rect(0, 0, arrow_size, arrow_size)
-    back_arrow_rect.center = (40, TOP_BAR_HEIGHT // 1.3)
-
-    # Close "X" (right)
-    close_surf = close_font.render("X", True, (255, 160, 40))
-    close_rect = close_surf.get_rect()
-    close_rect.center = (width - 40, TOP_BAR_HEIGHT // 1.25)
-    close_hit_rect = close_rect.inflate(16, 16)
-
-    # ---------- TABS ----------
-    tab_labels = ["STORAGE", "BRIDGE", "FABRICATION", "REFINING", "INTERNAL MODULES"]
-    icon_filenames = ["Nav_Icon_Inventory.png", "Nav_Icon_Bridge.png", "Nav_Icon_Fabricator.png", "Nav_Icon_Refinery.png", "Nav_Icon_InternalModules.png"]
-    selected_tab = 2  # FABRICATION selected
-
-    tab_entries, tabs_y = create_tab_entries(tab_labels, tab_font, width, TOP_BAR_HEIGHT, UI_TAB_HEIGHT, icon_filenames)
-    disabled_labels = set()
-    if not modules_manager.get_fabricators():
-        disabled_labels.add("FABRICATION")
-    if not modules_manager.get_refineries():
-        disabled_labels.add("REFINING")
-    # ---------- FABRICATOR MODULE SLOTS (01 / 02 / ...) ----------
-    manager = get_fabrication_manager(main_player)
-    fabricator_modules = manager.get_modules() or []
-    slot_count = max(1, len(fabricator_modules))
-
-    selected_fabricator_index = manager.get_selected_index()  # which fabricator slot is currently selected
-
-    # Geometry for the left card and index column (01 / 02 / ...)
-    nav_top_y = tabs_y - 6
-    nav_bottom_y = tabs_y + UI_TAB_HEIGHT + 6
-    content_top = nav_bottom_y + 24
-
-    LEFT_SHIFT = 20
-    card_rect = make_card_rect(width, height, content_top, left_shift=LEFT_SHIFT)
-
-    idx_size = 96
-    idx_rect_base = compute_idx_rect_base(card_rect, idx_size=idx_size)
-    IDX_V_SPACING = idx_size + 24
-    # one rect per equipped fabricator: 01 stays as-is, 02/03/... stacked below it
-    idx_rects: list[pygame.Rect] = generate_slot_rects(idx_rect_base, slot_count, IDX_V_SPACING)
-    # station-only SY slot rect. If opened from SY place it in the first slot position
-    # to avoid an empty gap; otherwise position it under module slots.
-    if station_slot and idx_rects:
-        sy_rect = idx_rects[0].copy()
-    else:
-        sy_rect = pygame.Rect(idx_rect_base.left, idx_rect_base.top + IDX_V_SPACING * len(idx_rects), idx_size, idx_size)
-    # station selection state
-    station_slot_selected = bool(station_slot)
-
-    # ----- BIG CENTER RECT -----
-    plus_radius = 120
-    preview_center = (width // 2, height // 2)
-    big_rect_pad = 100
-    big_rect = pygame.Rect(
-        preview_center[0] - plus_radius - big_rect_pad,
-        preview_center[1] - plus_radius - big_rect_pad,
-        (plus_radius + big_rect_pad) * 2,
-        (plus_radius + big_rect_pad) * 2
-    )
-
-    # ---------- REQUIREMENTS PANEL (RIGHT) ----------
-    right_panel_w = 340
-    right_rect = pygame.Rect(
-        width - right_panel_w - 40,
-        card_rect.top,
-        right_panel_w,
-        140,
-    )
-
-    # ---------- BUILD BUTTON (BIG GREEN) ----------
-    build_btn_h = 64
-    build_btn_rect = pygame.Rect(
-        right_rect.left,
-        height - build_btn_h - 40,
-        right_panel_w,
-        build_btn_h,
-    )
-
-    # "SPEED UP" button (used only while fabricating)
-    speed_btn_h = 64
-    speed_btn_rect = pygame.Rect(
-        right_rect.left,
-        right_rect.bottom + 40,
-        right_panel_w,
-        speed_btn_h,
-    )
-
-    ore_preview_img = None
+def _requirement_preview(req, ore_preview_img, size):
+    """Scaled preview for a requirement row (refined ingot, else the ore image)."""
+    if req.preview_filename:
+        try:
+            return pygame.transform.smoothscale(load_image(PREVIEWS_DIR + '/' + req.preview_filename), (size, size))
+        except Exception:
+            pass
     try:
-        ore_preview_img = OREM_PREVIEW_IMG
-        
+        return pygame.transform.smoothscale(ore_preview_img, (size, size))
     except Exception:
-        pass
+        return pygame.Surface((size, size))
+
+
+class FabricationBPDetailsScreen(Screen):
+    """Blueprint details, requirements and BUILD / SPEED UP / CANCEL for one fabricator slot."""
+
+    def setup(self):
+        width, height = self.width, self.height
+
+        # ---------- FONTS ----------
+        title_font = pygame.font.Font(None, 40)
+        self.tab_font = pygame.font.Font(None, 28)
+        close_font = pygame.font.Font(None, 40)
+        self.name_font = pygame.font.Font(None, 26)   # blueprint & REQUIREMENTS
+        self.desc_font = pygame.font.Font(None, 20)   # data
+        self.stat_font = pygame.font.Font(None, 20)   # ore
+        self.btn_font = pygame.font.Font(None, 28)    # BUILD
+        self.meta_font = pygame.font.Font(None, 20)   # DETAILS / PRODUCTION DETAILS / rarity
+        self.bp_title_font = pygame.font.Font(None, 26)
+        self.stat_label_font = pygame.font.Font(None, 20)
+        self.stat_value_font = pygame.font.Font(None, 20)
+        self.time_font = pygame.font.Font(None, 42)
+
+        # ---------- TOP BAR ----------
+        TOP_BAR_HEIGHT = 96
+
+        # Title in the center of the top bar (moved slightly up to give more room to tabs)
+        title_text = "FABRICATION"
+        self.title_surf = title_font.render(title_text, True, UI_SECTION_TEXT_COLOR)
+        self.title_rect = self.title_surf.get_rect(center=(width // 2, TOP_BAR_HEIGHT // 2 - 22))
+
+        # Back arrow (left)
+        arrow_size = 32
+        self.back_arrow_rect = pygame.Rect(0, 0, arrow_size, arrow_size)
+        self.back_arrow_rect.center = (40, TOP_BAR_HEIGHT // 1.3)
+
+        # Close "X" (right)
+        self.close_surf = close_font.render("X", True, (255, 160, 40))
+        self.close_rect = self.close_surf.get_rect()
+        self.close_rect.center = (width - 40, TOP_BAR_HEIGHT // 1.25)
+        self.close_hit_rect = self.close_rect.inflate(16, 16)
+
+        # ---------- TABS ----------
+        tab_labels = ["STORAGE", "BRIDGE", "FABRICATION", "REFINING", "INTERNAL MODULES"]
+        icon_filenames = ["Nav_Icon_Inventory.png", "Nav_Icon_Bridge.png", "Nav_Icon_Fabricator.png", "Nav_Icon_Refinery.png", "Nav_Icon_InternalModules.png"]
+        self.tab_entries, self.tabs_y = create_tab_entries(tab_labels, self.tab_font, width, TOP_BAR_HEIGHT, UI_TAB_HEIGHT, icon_filenames)
+
+        # Geometry for the left card and index column (01 / 02 / ...)
+        nav_bottom_y = self.tabs_y + UI_TAB_HEIGHT + 6
+        content_top = nav_bottom_y + 24
+
+        LEFT_SHIFT = 20
+        self.card_rect = make_card_rect(width, height, content_top, left_shift=LEFT_SHIFT)
+
+        self.idx_size = 96
+        self.idx_rect_base = compute_idx_rect_base(self.card_rect, idx_size=self.idx_size)
+        self.IDX_V_SPACING = self.idx_size + 24
+
+        # ----- BIG CENTER RECT -----
+        plus_radius = 120
+        preview_center = (width // 2, height // 2)
+        big_rect_pad = 100
+        self.big_rect = pygame.Rect(
+            preview_center[0] - plus_radius - big_rect_pad,
+            preview_center[1] - plus_radius - big_rect_pad,
+            (plus_radius + big_rect_pad) * 2,
+            (plus_radius + big_rect_pad) * 2
+        )
+
+        # ---------- REQUIREMENTS PANEL (RIGHT) ----------
+        self.right_panel_w = 340
+        self.right_rect = pygame.Rect(
+            width - self.right_panel_w - 40,
+            self.card_rect.top,
+            self.right_panel_w,
+            140,
+        )
+
+        # ---------- BUILD BUTTON (BIG GREEN) ----------
+        build_btn_h = 64
+        self.build_btn_rect = pygame.Rect(
+            self.right_rect.left,
+            height - build_btn_h - 40,
+            self.right_panel_w,
+            build_btn_h,
+        )
+
+        # "SPEED UP" button (used only while fabricating)
+        speed_btn_h = 64
+        self.speed_btn_rect = pygame.Rect(
+            self.right_rect.left,
+            self.right_rect.bottom + 40,
+            self.right_panel_w,
+            speed_btn_h,
+        )
+
+        self.ore_preview_img = None
+        try:
+            self.ore_preview_img = OREM_PREVIEW_IMG
+        except Exception:
+            pass
+
+        # blueprint cost rows come from the production graph (memoized per class)
+        self.graph = get_production_graph()
+        # scaled requirement previews per blueprint class, kept between visits
+        self.requirement_surfs_by_bp = {}
+
+    def enter(self, main_player, player_fleet, selected_fabricator_index, bp, station_slot=False):
+        self.main_player = main_player
+        self.player_fleet = player_fleet
+        self.bp = bp
+        self.station_slot = station_slot
+        self.selected_tab = 2  # FABRICATION selected
+
+        # ---------- FABRICATOR MODULE SLOTS (01 / 02 / ...) ----------
+        manager = self.fab_manager = get_fabrication_manager(main_player)
+        self.fabricator_modules = manager.get_modules() or []
+        slot_count = max(1, len(self.fabricator_modules))
+
+        self.selected_fabricator_index = manager.get_selected_index()  # which fabricator slot is currently selected
+
+        idx_rect_base = self.idx_rect_base
+        # one rect per equipped fabricator: 01 stays as-is, 02/03/... stacked below it
+        self.idx_rects: list[pygame.Rect] = generate_slot_rects(idx_rect_base, slot_count, self.IDX_V_SPACING)
+        # station-only SY slot rect. If opened from SY place it in the first slot position
+        # to avoid an empty gap; otherwise position it under module slots.
+        if station_slot and self.idx_rects:
+            self.sy_rect = self.idx_rects[0].copy()
+        else:
+            self.sy_rect = pygame.Rect(idx_rect_base.left, idx_rect_base.top + self.IDX_V_SPACING * len(self.idx_rects), self.idx_size, self.idx_size)
+        # station selection state
+        self.station_slot_selected = bool(station_slot)
+
+        self.requirements = self.graph.requirements(bp)
+        self.requirement_surfs = self.requirement_surfs_by_bp.setdefault(type(bp), [])
+        self.update(0.0)
 
-    running = True
-    while running:
+    def resume(self, result):
+        super().resume(result)
+        # keep focus on FABRICATION tab
+        self.selected_tab = 2
+
+    def update(self, dt):
         # Recompute disabled tabs each frame to stay in sync with ModulesManager
         disabled_labels = set()
         if not modules_manager.get_fabricators():
             disabled_labels.add("FABRICATION")
         if not modules_manager.get_refineries():
             disabled_labels.add("REFINING")
+        self.disabled_labels = disabled_labels
         # Determine if player is currently at a station (hide SY when not at a station)
         try:
-            loc_area = getattr(main_player, 'location_area', '')
+            loc_area = getattr(self.main_player, 'location_area', '')
             is_at_station = isinstance(loc_area, str) and ('station' in loc_area.lower())
         except Exception:
             is_at_station = False
-        station_visible = bool(station_slot and is_at_station)
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
+        self.station_visible = bool(self.station_slot and is_at_station)
 
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                return
+    def handle_event(self, event):
+        manager = self.fab_manager
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.manager.pop()
+            return
 
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                mx, my = event.pos
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            mx, my = event.pos
 
-                if back_arrow_rect.collidepoint(mx, my):
-                    return
+            if self.back_arrow_rect.collidepoint(mx, my):
+                self.manager.pop()
+                return
 
-                if close_hit_rect.collidepoint(mx, my):
-                    return "to_game"
-
-                # Tabs
-                for idx, entry in enumerate(tab_entries):
-                    if entry["rect"].collidepoint(mx, my):
-                        label = entry["label"]
-                        # ignore clicks on disabled tabs
-                        if label in disabled_labels:
-                            break
-                        # Open Storage (Inventory) when STORAGE tab clicked
-                        if label == "STORAGE":
-                            from spacegame.screens.inventory import inventory_screen
-                            res = inventory_screen(main_player, player_fleet)
-                            if res == "to_game":
-                                return "to_game"
-                            # return focus back to FABRICATION tab after closing inventory
-                            selected_tab = 2
-                        elif label == "INTERNAL MODULES":
-                            from spacegame.screens.internal_modules_screen import internal_modules_screen
-                            res = internal_modules_screen(main_player, player_fleet)
-                            if res == "to_game":
-                                return "to_game"
-                            if res == "to_internal":
-                                return "to_internal"
-                            # after closing, go back to FABRICATION tab highlight
-                            selected_tab = 2
-                        elif label == "REFINING":
-                            from spacegame.screens.refining_main_screen import refining_main_screen
-                            res = refining_main_screen(main_player, player_fleet)
-                            if res == "to_game":
-                                return "to_game"
-                            # after closing, keep focus on FABRICATION tab
-                            selected_tab = 2
-                        else:
-                            selected_tab = idx
+            if self.close_hit_rect.collidepoint(mx, my):
+                self.manager.pop("to_game")
+                return
+
+            # Tabs
+            for idx, entry in enumerate(self.tab_entries):
+                if entry["rect"].collidepoint(mx, my):
+                    label = entry["label"]
+                    # ignore clicks on disabled tabs
+                    if label in self.disabled_labels:
                         break
+                    if label != "FABRICATION" and self.open_tab(label, self.main_player, self.player_fleet):
+                        return
+                    self.selected_tab = idx
+                    break
                 
-                # Fabricator slot buttons (01 / 02 / ...) - only when not in station-only mode
-                if not station_visible:
-                    for i, rect in enumerate(idx_rects):
-                        if rect.collidepoint(mx, my):
-                            selected_fabricator_index = i
-                            station_slot_selected = False
-                            manager.set_selected_index(i)
-                            break
-                # SY station-only slot (only present when this screen was opened from SY and player is at a station)
-                if station_visible and 'sy_rect' in locals() and sy_rect.collidepoint(mx, my):
-                    station_slot_selected = True
-                    continue
-
-                # ----- BUILD / SPEED UP / CANCEL -----
-                fab_module = manager.get_module(selected_fabricator_index)
-
-                inv_mgr = getattr(main_player, 'inventory_manager', None)
-                # Determine insufficient resources compatibility for both
-                # legacy `required_ore_letter` and new `required_resources` mapping.
-                insufficient_resources = False
-                if hasattr(bp, 'required_resources') and isinstance(getattr(bp, 'required_resources'), dict):
-                    # Check every required resource for availability
-                    for letter, amt in bp.required_resources.items():
-                        letter = str(letter)
-                        amt = int(amt)
-                        available = 0
-                        try:
-                            if inv_mgr is not None:
-                                # prefer refined versions for A/B/C if present
-                                if letter in ('A', 'B', 'C') and inv_mgr.get_amount('R' + letter) > 0:
-                                    available = int(inv_mgr.get_amount('R' + letter))
-                                else:
-                                    available = int(inv_mgr.get_amount(letter))
-                        except Exception:
-                            available = 0
-                        if available < amt:
-                            insufficient_resources = True
-                            break
-                else:
-                    ore_letter = getattr(bp, 'required_ore_letter', None)
-                    ore_amount = int(getattr(bp, 'required_ore_amount', 0))
-                    available_ore = int(inv_mgr.get_amount(ore_letter)) if (inv_mgr is not None and ore_letter is not None) else 0
-                    insufficient_resources = available_ore < ore_amount
-
-                status = manager.get_status(selected_fabricator_index)
-                total_ms = int(status.get("total_ms", 0))
-                start_ticks = int(status.get("start_ticks", 0))
-                is_fabricating = bool(status.get("is_fabricating", False))
-
-                # CANCEL (bottom red button while fabricating)
-                if is_fabricating and build_btn_rect.collidepoint(mx, my):
-                    manager.cancel_fabrication(selected_fabricator_index)
-                    continue
-
-                # SPEED UP (grey button)
-                if is_fabricating and speed_btn_rect.collidepoint(mx, my):
-                    manager.speed_up(selected_fabricator_index)
-                    continue
-
-                # BUILD (start fabrication)
-                if (not is_fabricating) and (not insufficient_resources) and fab_module is not None and build_btn_rect.collidepoint(mx, my):
-                    # Station-slot builds: consume resources immediately and add a hangar entry
-                    if station_slot:
-                        inv_mgr = getattr(main_player, 'inventory_manager', None)
-                        ore_letter = getattr(bp, 'required_ore_letter', None)
-                        ore_amount = int(getattr(bp, 'required_ore_amount', 0))
-                        if inv_mgr is None or ore_letter is None or inv_mgr.get_amount(ore_letter) < ore_amount:
-                            # insufficient — ignore
-                            continue
-                        # consume resources
-                        inv_mgr.consume_resource(ore_letter, ore_amount)
-                        # create hangar entry and add via InventoryManager
+            # Fabricator slot buttons (01 / 02 / ...) - only when not in station-only mode
+            if not self.station_visible:
+                for i, rect in enumerate(self.idx_rects):
+                    if rect.collidepoint(mx, my):
+                        self.selected_fabricator_index = i
+                        self.station_slot_selected = False
+                        manager.set_selected_index(i)
+                        break
+            # SY station-only slot (only present when this screen was opened from SY and player is at a station)
+            if self.station_visible and self.sy_rect.collidepoint(mx, my):
+                self.station_slot_selected = True
+                return
+
+            # ----- BUILD / SPEED UP / CANCEL -----
+            fab_module = manager.get_module(self.selected_fabricator_index)
+
+            inv_mgr = getattr(self.main_player, 'inventory_manager', None)
+            # Determine insufficient resources compatibility for both
+            # legacy `required_ore_letter` and new `required_resources` mapping.
+            insufficient_resources = any(
+                self.graph.available(req, inv_mgr) < req.amount for req in self.requirements
+            )
+
+            status = manager.get_status(self.selected_fabricator_index)
+            is_fabricating = bool(status.get("is_fabricating", False))
+
+            # CANCEL (bottom red button while fabricating)
+            if is_fabricating and self.build_btn_rect.collidepoint(mx, my):
+                manager.cancel_fabrication(self.selected_fabricator_index)
+                return
+
+            # SPEED UP (grey button)
+            if is_fabricating and self.speed_btn_rect.collidepoint(mx, my):
+                manager.speed_up(self.selected_fabricator_index)
+                return
+
+            # BUILD (start fabrication)
+            if (not is_fabricating) and (not insufficient_resources) and fab_module is not None and self.build_btn_rect.collidepoint(mx, my):
+                # Station-slot builds: consume resources immediately and add a hangar entry
+                if self.station_slot:
+                    inv_mgr = getattr(self.main_player, 'inventory_manager', None)
+                    ore_letter = getattr(self.bp, 'required_ore_letter', None)
+                    ore_amount = int(getattr(self.bp, 'required_ore_amount', 0))
+                    if inv_mgr is None or ore_letter is None or inv_mgr.get_amount(ore_letter) < ore_amount:
+                        # insufficient — ignore
+                        return
+                    # consume resources
+                    inv_mgr.consume_resource(ore_letter, ore_amount)
+                    # create hangar entry and add via InventoryManager
+                    try:
+                        from spacegame.core.hangar import HangarEntry
+                        hangar = getattr(inv_mgr, 'hangar', None)
+                        next_id = hangar.allocate_id()
+                        entry_name = getattr(self.bp, 'title', getattr(self.bp, 'name', 'Craft'))
+                        entry = HangarEntry(id=next_id, name=entry_name, unit_type="", alive=True, tier=getattr(self.bp, 'tier', 0), rarity=getattr(self.bp, 'rarity', ''))
+                        inv_mgr.add_hangar_entry(entry)
+                        # add a simple notification
                         try:
-                            from spacegame.core.hangar import HangarEntry
-                            hangar = getattr(inv_mgr, 'hangar', None)
-                            existing_ids = [e.id for e in hangar.pool] if (hangar and getattr(hangar, 'pool', None)) else []
-                            next_id = max(existing_ids) + 1 if existing_ids else 0
-                            entry_name = getattr(bp, 'title', getattr(bp, 'name', 'Craft'))
-                            entry = HangarEntry(id=next_id, name=entry_name, unit_type="", alive=True, tier=getattr(bp, 'tier', 0), rarity=getattr(bp, 'rarity', ''))
-                            inv_mgr.add_hangar_entry(entry)
-                            # add a simple notification
-                            try:
-                                notif = {'type': 'fabrication', 'title': entry_name, 'elapsed': 0.0, 'duration': 3.5}
-                                preview = getattr(bp, 'preview_filename', None)
-                                if preview:
-                                    notif['preview'] = preview
-                                inv_mgr.add_notification(notif)
-                            except Exception:
-                                pass
+                            notif = {'type': 'fabrication', 'title': entry_name, 'elapsed': 0.0, 'duration': 3.5}
+                            preview = getattr(self.bp, 'preview_filename', None)
+                            if preview:
+                                notif['preview'] = preview
+                            inv_mgr.add_notification(notif)
                         except Exception:
                             pass
-                        continue
+                    except Exception:
+                        pass
+                    return
 
-                    # Default module-based fabrication
-                    manager.start_fabrication(selected_fabricator_index, bp, main_player)
-                    continue
+                # Default module-based fabrication
+                manager.start_fabrication(self.selected_fabricator_index, self.bp, self.main_player)
+                return
 
+    def draw(self, screen):
+        width = self.width
+        tabs_y = self.tabs_y
+        bp = self.bp
+        manager = self.fab_manager
+        graph = self.graph
+        requirements = self.requirements
+        requirement_surfs = self.requirement_surfs
+        fabricator_modules = self.fabricator_modules
+        selected_fabricator_index = self.selected_fabricator_index
+        station_slot_selected = self.station_slot_selected
+        station_visible = self.station_visible
+        idx_rects, sy_rect, idx_rect_base = self.idx_rects, self.sy_rect, self.idx_rect_base
+        card_rect, big_rect, right_rect = self.card_rect, self.big_rect, self.right_rect
+        right_panel_w = self.right_panel_w
+        build_btn_rect, speed_btn_rect = self.build_btn_rect, self.speed_btn_rect
+        ore_preview_img = self.ore_preview_img
+        name_font, desc_font, stat_font = self.name_font, self.desc_font, self.stat_font
+        btn_font, meta_font = self.btn_font, self.meta_font
+        title_surf, title_rect = self.title_surf, self.title_rect
+        back_arrow_rect, close_surf, close_rect = self.back_arrow_rect, self.close_surf, self.close_rect
+        tab_entries, selected_tab, tab_font = self.tab_entries, self.selected_tab, self.tab_font
+        disabled_labels = self.disabled_labels
+        main_player = self.main_player
 
         # ---------- DRAW ----------
         try:
@@ -355,11 +361,9 @@ def fabrication_bpdetails_screen(main_player, player_fleet, selected_fabricator_
         screen.blit(close_surf, close_rect)
 
         # Tabs (draw using shared nav helper)
-        nav_top_y, nav_bottom_y = draw_tabs(screen, tab_entries, selected_tab, tabs_y, width, tab_font, disabled_labels=disabled_labels)
+        draw_tabs(screen, tab_entries, selected_tab, tabs_y, width, tab_font, disabled_labels=disabled_labels)
 
         # ---------- MAIN CONTENT (fabrication visual) ----------
-        content_top = nav_bottom_y + 24  # same as used in card_rect
-
         # Left detail: index squares (01, 02, ...) with corner-only decoration + progress bar.
         # (Uses shared `draw_index_square` from `spacegame.ui.fabrication_ui`.)
 
@@ -392,9 +396,7 @@ def fabrication_bpdetails_screen(main_player, player_fleet, selected_fabricator_
             fab_module = fabricator_modules[selected_fabricator_index] if selected_fabricator_index < len(fabricator_modules) else None
         # Display true fabrication time as blueprint base time multiplied
         # by the fabricator module's base_fabrication_time factor.
-        blueprint_time = float(getattr(bp, "base_fabrication_time", 0))
-        module_factor = float(getattr(fab_module, "base_fabrication_time", 1.0))
-        base_time_s = int(blueprint_time * module_factor)
+        base_time_s = int(graph.fabrication_time_s(bp, fab_module))
 
         # If not station slot, use manager API to retrieve authoritative fabrication status for this slot
         if not station_slot_selected:
@@ -457,9 +459,10 @@ def fabrication_bpdetails_screen(main_player, player_fleet, selected_fabricator_
         screen.blit(rarity_surf, rarity_rect.topleft)
 
         # now place the blueprint name a bit lower, under the DETAILS row
-        title_font = pygame.font.Font(None, 26)
+        title_font = self.bp_title_font
 
         # title from blueprint (can be multi-line with '\n')
+        title_text = ""
         if bp is not None and getattr(bp, "title", None):
             title_text = str(bp.title)
         elif bp is not None and hasattr(bp, "name"):
@@ -479,7 +482,6 @@ def fabrication_bpdetails_screen(main_player, player_fleet, selected_fabricator_
             module_title_rect = pygame.Rect(details_x, details_y, 0, title_font.get_height())
 
         # description lines (from blueprint)
-        desc_font = pygame.font.Font(None, 20)
         desc_text = str(bp.description)
 
 
@@ -506,8 +508,8 @@ def fabrication_bpdetails_screen(main_player, player_fleet, selected_fabricator_
             dy += s.get_height() + 2
 
         # Module stats placed under description — render with connecting underline
-        stat_label_font = pygame.font.Font(None, 20)
-        stat_value_font = pygame.font.Font(None, 20)
+        stat_label_font = self.stat_label_font
+        stat_value_font = self.stat_value_font
         stat_x = details_x
         stat_y = dy + 12
 
@@ -611,7 +613,7 @@ def fabrication_bpdetails_screen(main_player, player_fleet, selected_fabricator_
         drawCornerFrame(screen, big_rect, corner_color, corner_len=big_corner_len, corner_thick=big_corner_thick, bottom_offset=bottom_offset)
 
         # --- preview in the center of the big rect ---
-        # Prefer the produced unit's preview image (from PREVIEW_IMAGE_MAP via preview_for_unit).
+        # Prefer the produced unit's preview image (from PREVIEW_IMAGE_NAMES via preview_for_unit).
         img = None
         try:
             unit_cls = getattr(bp, 'unit_class', None)
@@ -711,45 +713,8 @@ def fabrication_bpdetails_screen(main_player, player_fleet, selected_fabricator_
         # ---------- PRODUCTION DETAILS (RIGHT) ----------
         inv_mgr = getattr(main_player, 'inventory_manager', None)
 
-        # Build a list of (letter, amount, tier, available) tuples supporting
-        # either the legacy single-field blueprint attributes or the newer
-        # `required_resources` mapping.
-        resources = []
-        if hasattr(bp, 'required_resources') and isinstance(getattr(bp, 'required_resources'), dict):
-            for letter, amt in bp.required_resources.items():
-                letter = str(letter)
-                amt = int(amt)
-                # default to blueprint tier if no specific per-resource tier exists
-                # Raw ore 'M' should be tier 0 (unrefined), so handle specially
-                if letter == 'M':
-                    tier = int(getattr(bp, 'required_ore_tier', 0))
-                else:
-                    tier = int(getattr(bp, 'tier', getattr(bp, 'required_ore_tier', 1)))
-                # availability check: prefer refined key for A/B/C if present
-                available = 0
-                try:
-                    if inv_mgr is not None:
-                        if letter in ('A', 'B', 'C') and inv_mgr.get_amount('R' + letter) > 0:
-                            available = int(inv_mgr.get_amount('R' + letter))
-                        else:
-                            available = int(inv_mgr.get_amount(letter))
-                except Exception:
-                    available = 0
-                resources.append((letter, amt, tier, available))
-        else:
-            ore_letter = getattr(bp, 'required_ore_letter', None)
-            if ore_letter is not None:
-                ore_amount = int(getattr(bp, 'required_ore_amount', 0))
-                ore_tier = int(getattr(bp, 'required_ore_tier', getattr(bp, 'tier', 1)))
-                if ore_letter == 'M':
-                    ore_tier = int(getattr(bp, 'required_ore_tier', 0))
-                available = 0
-                try:
-                    if inv_mgr is not None:
-                        available = int(inv_mgr.get_amount(ore_letter))
-                except Exception:
-                    available = 0
-                resources.append((ore_letter, ore_amount, ore_tier, available))
+        # (letter, amount, tier, available) rows; only availability changes per frame
+        resources = [(req.letter, req.amount, req.tier, graph.available(req, inv_mgr)) for req in requirements]
 
         # header
         prod_surf = meta_font.render('PRODUCTION DETAILS', True, (160, 180, 210))
@@ -781,23 +746,10 @@ def fabrication_bpdetails_screen(main_player, player_fleet, selected_fabricator_
             for i, (letter, amt, tier, available) in enumerate(resources):
                 row_y = row_start_y + i * (ore_size + row_spacing)
 
-                # preview image for this resource
-                if letter == 'M':
-                    try:
-                        ore_surf = pygame.transform.smoothscale(ore_preview_img, (ore_size, ore_size))
-                    except Exception:
-                        ore_surf = pygame.Surface((ore_size, ore_size))
-                else:
-                    # try refined preview (respecting tier) then fall back to ore preview
-                    preview_filename = f"RUIngot{letter}T{tier}.png"
-                    try:
-                        loaded = pygame.image.load(PREVIEWS_DIR + '/' + preview_filename).convert_alpha()
-                        ore_surf = pygame.transform.smoothscale(loaded, (ore_size, ore_size))
-                    except Exception:
-                        try:
-                            ore_surf = pygame.transform.smoothscale(ore_preview_img, (ore_size, ore_size))
-                        except Exception:
-                            ore_surf = pygame.Surface((ore_size, ore_size))
+                # preview image for this resource, scaled once per row
+                if i >= len(requirement_surfs):
+                    requirement_surfs.append(_requirement_preview(requirements[i], ore_preview_img, ore_size))
+                ore_surf = requirement_surfs[i]
 
                 ore_rect = ore_surf.get_rect()
                 ore_rect.left = right_rect.left + 16
@@ -927,7 +879,7 @@ def fabrication_bpdetails_screen(main_player, player_fleet, selected_fabricator_
             minutes = remaining_s // 60
             seconds = remaining_s % 60
             time_str = f"{minutes:02d}:{seconds:02d}"
-            time_font = pygame.font.Font(None, 42)
+            time_font = self.time_font
             time_surf = time_font.render(time_str, True, UI_SECTION_TEXT_COLOR)
             time_rect = time_surf.get_rect()
             time_rect.topleft = (right_rect.left + 10, prod_rect.bottom + 6)
@@ -970,4 +922,6 @@ def fabrication_bpdetails_screen(main_player, player_fleet, selected_fabricator_
             cancel_rect = cancel_surf.get_rect(center=build_btn_rect.center)
             screen.blit(cancel_surf, cancel_rect)
 
-        pygame.display.flip()
\ No newline at end of file
+
+def fabrication_bpdetails_screen(main_player, player_fleet, selected_fabricator_index, bp, station_slot=False):
+    return run_screen("fabrication_bpdetails", main_player, player_fleet, selected_fabricator_index, bp, station_slot=station_slot)
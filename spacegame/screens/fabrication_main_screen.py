@@ -1,8 +1,5 @@
-import sys
 import pygame
 from spacegame.config import (
-    SCREEN_WIDTH, 
-    SCREEN_HEIGHT, 
     UI_BG_COLOR, 
     UI_TAB_HEIGHT, 
     UI_SECTION_TEXT_COLOR,
@@ -24,199 +21,186 @@ from spacegame.ui.fabrication_ui import (
 )
 from spacegame.ui.fabrication_ui import make_card_rect, compute_idx_rect_base
 from spacegame.ui.ui import draw_plus_circle, drawCornerFrame, UI_BG_IMG
+from spacegame.core.screen_manager import Screen, run_screen
+
+
+class FabricationMainScreen(Screen):
+    """FABRICATION tab: fabricator slots (01 / 02 / ... / SY) and the production slot."""
+
+    def setup(self):
+        width, height = self.width, self.height
+
+        # ---------- FONTS ----------
+        title_font = pygame.font.Font(None, 40)
+        self.tab_font = pygame.font.Font(None, 28)
+        self.section_font = pygame.font.Font(None, 28)
+        close_font = pygame.font.Font(None, 40)
+        self.module_title_font = pygame.font.Font(None, 36)
+        self.desc_font = pygame.font.Font(None, 20)
+        self.stat_label_font = pygame.font.Font(None, 20)
+        self.stat_value_font = pygame.font.Font(None, 20)
+
+        # ---------- TOP BAR ----------
+        TOP_BAR_HEIGHT = 96
+        # Title in the center of the top bar (moved slightly up to give more room to tabs)
+        title_text = "FABRICATION"
+        self.title_surf = title_font.render(title_text, True, UI_SECTION_TEXT_COLOR)
+        self.title_rect = self.title_surf.get_rect(center=(width // 2, TOP_BAR_HEIGHT // 2 - 22))
+
+        # Back arrow (left)
+        arrow_size = 32
+        self.back_arrow_rect = pygame.Rect(0, 0, arrow_size, arrow_size)
+        self.back_arrow_rect.center = (40, TOP_BAR_HEIGHT // 1.3)
+
+        # Close "X" (right)
+        self.close_surf = close_font.render("X", True, (255, 160, 40))
+        self.close_rect = self.close_surf.get_rect()
+        self.close_rect.center = (width - 40, TOP_BAR_HEIGHT // 1.25)
+        self.close_hit_rect = self.close_rect.inflate(16, 16)
+
+        # ---------- TABS ----------
+        tab_labels = ["STORAGE", "BRIDGE", "FABRICATION", "REFINING", "INTERNAL MODULES"]
+        icon_filenames = ["Nav_Icon_Inventory.png", "Nav_Icon_Bridge.png", "Nav_Icon_Fabricator.png", "Nav_Icon_Refinery.png", "Nav_Icon_InternalModules.png"]
+        self.tab_entries, self.tabs_y = create_tab_entries(tab_labels, self.tab_font, width, TOP_BAR_HEIGHT, UI_TAB_HEIGHT, icon_filenames)
+
+        # Geometry for the left card and index column (01 / 02 / ...)
+        nav_bottom_y = self.tabs_y + UI_TAB_HEIGHT + 6
+        content_top = nav_bottom_y + 24
+
+        LEFT_SHIFT = 20
+        self.card_rect = make_card_rect(width, height, content_top, left_shift=LEFT_SHIFT)
+
+        self.idx_size = 96
+        self.idx_rect_base = compute_idx_rect_base(self.card_rect, idx_size=self.idx_size)
+        self.IDX_V_SPACING = self.idx_size + 24
+
+        # ----- BIG CENTER RECT (AROUND THE PLUS-CIRCLE) -----
+        plus_radius = 120
+        preview_center = (width // 2, height // 2)
+        big_rect_pad = 100
+        self.big_rect = pygame.Rect(
+            preview_center[0] - plus_radius - big_rect_pad,
+            preview_center[1] - plus_radius - big_rect_pad,
+            (plus_radius + big_rect_pad) * 2,
+            (plus_radius + big_rect_pad) * 2
+        )
 
+    def enter(self, main_player, player_fleet):
+        self.main_player = main_player
+        self.player_fleet = player_fleet
+        self.selected_tab = 2  # FABRICATION selected
+        # ---------- FABRICATOR MODULE SLOTS (01 / 02 / ...) ----------
+        # `fabricator_modules` and `selected_fabricator_index` are recomputed
+        # in update() so the UI updates immediately when modules are
+        # installed/removed while this screen is open.
+        self.fab_manager = get_fabrication_manager(main_player)
+        # Selection state for the station-only SY slot
+        self.station_slot_selected = False
+        self.update(0.0)
+
+    def resume(self, result):
+        if isinstance(result, int):
+            # blueprint selection returns the fabricator slot it worked on
+            self.selected_fabricator_index = result
+            self.fab_manager.set_selected_index(result)
+            return
+        super().resume(result)
+        # return focus back to FABRICATION tab after closing another tab
+        self.selected_tab = 2
+
+    def update(self, dt):
+        main_player = self.main_player
+        manager = self.fab_manager
+        disabled_labels = set()
+        if not modules_manager.get_fabricators():
+            disabled_labels.add("FABRICATION")
+        if not modules_manager.get_refineries():
+            disabled_labels.add("REFINING")
+        self.disabled_labels = disabled_labels
 
-def fabrication_main_screen(main_player, player_fleet):
-    # Use the existing display surface if present; otherwise create one.
-    screen = pygame.display.get_surface()
-    if screen is None:
-        screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-
-    width, height = screen.get_size()
-
-    # ---------- FONTS ----------
-    title_font = pygame.font.Font(None, 40)
-    tab_font = pygame.font.Font(None, 28)
-    section_font = pygame.font.Font(None, 28)
-    close_font = pygame.font.Font(None, 40)
-
-    # ---------- TOP BAR ----------
-    TOP_BAR_HEIGHT = 96
-    # Title in the center of the top bar (moved slightly up to give more room to tabs)
-    title_text = "FABRICATION"
-    title_surf = title_font.render(title_text, True, UI_SECTION_TEXT_COLOR)
-    title_rect = title_surf.get_rect(center=(width // 2, TOP_BAR_HEIGHT // 2 - 22))
-
-    # Back arrow (left)
-    arrow_size = 32
-    back_arrow_rect = pygame.Rect(0, 0, arrow_size, arrow_size)
-    back_arrow_rect.center = (40, TOP_BAR_HEIGHT // 1.3)
-
-    # Close "X" (right)
-    close_surf = close_font.render("X", True, (255, 160, 40))
-    close_rect = close_surf.get_rect()
-    close_rect.center = (width - 40, TOP_BAR_HEIGHT // 1.25)
-    close_hit_rect = close_rect.inflate(16, 16)
-
-    # ---------- TABS ----------
-    tab_labels = ["STORAGE", "BRIDGE", "FABRICATION", "REFINING", "INTERNAL MODULES"]
-    icon_filenames = ["Nav_Icon_Inventory.png", "Nav_Icon_Bridge.png", "Nav_Icon_Fabricator.png", "Nav_Icon_Refinery.png", "Nav_Icon_InternalModules.png"]
-    selected_tab = 2  # FABRICATION selected
-
-    tab_entries, tabs_y = create_tab_entries(tab_labels, tab_font, width, TOP_BAR_HEIGHT, UI_TAB_HEIGHT, icon_filenames)
-    disabled_labels = set()
-    if not modules_manager.get_fabricators():
-        disabled_labels.add("FABRICATION")
-    if not modules_manager.get_refineries():
-        disabled_labels.add("REFINING")
-
-    # ---------- FABRICATOR MODULE SLOTS (01 / 02 / ...) ----------
-    manager = get_fabrication_manager(main_player)
-    # `fabricator_modules` and `selected_fabricator_index` are computed
-    # inside the main loop so the UI updates immediately when modules
-    # are installed/removed while this screen is open.
-
-    # Geometry for the left card and index column (01 / 02 / ...)
-    nav_top_y = tabs_y - 6
-    nav_bottom_y = tabs_y + UI_TAB_HEIGHT + 6
-    content_top = nav_bottom_y + 24
-
-    LEFT_SHIFT = 20
-    card_rect = make_card_rect(width, height, content_top, left_shift=LEFT_SHIFT)
-
-    idx_size = 96
-    idx_rect_base = compute_idx_rect_base(card_rect, idx_size=idx_size)
-    IDX_V_SPACING = idx_size + 24
-    # Initialize fabricator_modules to a safe default so earlier geometry
-    # calculations won't fail before the main loop recomputes them.
-    try:
-        fabricator_modules = manager.get_modules() or []
-    except Exception:
-        fabricator_modules = []
-
-    # one rect per equipped fabricator: 01 stays as-is, 02/03/... stacked below it
-    idx_rects_modules: list[pygame.Rect] = generate_slot_rects(idx_rect_base, len(fabricator_modules), IDX_V_SPACING)
-    # station-only SY slot rect (positioned below module slots)
-    sy_rect = pygame.Rect(idx_rect_base.left, idx_rect_base.top + IDX_V_SPACING * len(idx_rects_modules), idx_size, idx_size)
-
-    # ----- BIG CENTER RECT (AROUND THE PLUS-CIRCLE) -----
-    plus_radius = 120
-    preview_center = (width // 2, height // 2)
-    big_rect_pad = 100
-    big_rect = pygame.Rect(
-        preview_center[0] - plus_radius - big_rect_pad,
-        preview_center[1] - plus_radius - big_rect_pad,
-        (plus_radius + big_rect_pad) * 2,
-        (plus_radius + big_rect_pad) * 2
-    )
-
-    # Selection state for the station-only SY slot
-    station_slot_selected = False
-
-    running = True
-    while running:
         # Determine whether player is currently at a station (simple name heuristic).
         # This allows the UI to hide the SY slot when the player is not at a station.
         try:
             loc_area = getattr(main_player, 'location_area', '')
-            is_at_station = isinstance(loc_area, str) and ('station' in loc_area.lower())
+            self.is_at_station = isinstance(loc_area, str) and ('station' in loc_area.lower())
         except Exception:
-            is_at_station = False
+            self.is_at_station = False
 
         # Re-evaluate current fabricator modules and selection each frame so
         # that installations made from other screens (Internal/Module selection)
         # are immediately reflected without needing to re-open the screen.
         try:
-            fabricator_modules = manager.get_modules() or []
+            self.fabricator_modules = manager.get_modules() or []
         except Exception:
-            fabricator_modules = []
+            self.fabricator_modules = []
         try:
-            selected_fabricator_index = manager.get_selected_index()
+            self.selected_fabricator_index = manager.get_selected_index()
         except Exception:
-            selected_fabricator_index = 0
+            self.selected_fabricator_index = 0
 
         # one rect per equipped fabricator: 01 stays as-is, 02/03/... stacked below it
-        idx_rects_modules: list[pygame.Rect] = generate_slot_rects(idx_rect_base, len(fabricator_modules), IDX_V_SPACING)
+        self.idx_rects_modules: list[pygame.Rect] = generate_slot_rects(self.idx_rect_base, len(self.fabricator_modules), self.IDX_V_SPACING)
         # station-only SY slot rect (positioned below module slots)
-        sy_rect = pygame.Rect(idx_rect_base.left, idx_rect_base.top + IDX_V_SPACING * len(idx_rects_modules), idx_size, idx_size)
+        self.sy_rect = pygame.Rect(self.idx_rect_base.left, self.idx_rect_base.top + self.IDX_V_SPACING * len(self.idx_rects_modules), self.idx_size, self.idx_size)
 
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.manager.pop()
+            return
 
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            mx, my = event.pos
+
+            if self.back_arrow_rect.collidepoint(mx, my):
+                self.manager.pop()
                 return
 
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                mx, my = event.pos
-
-                if back_arrow_rect.collidepoint(mx, my):
-                    return
-
-                if close_hit_rect.collidepoint(mx, my):
-                    return "to_game"
-
-                # Tabs
-                for idx, entry in enumerate(tab_entries):
-                    if entry["rect"].collidepoint(mx, my):
-                        label = entry["label"]
-                        # ignore clicks on disabled tabs
-                        if label in disabled_labels:
-                            break
-                        # Open Storage (Inventory) when STORAGE tab clicked
-                        if label == "STORAGE":
-                            from spacegame.screens.inventory import inventory_screen
-
-                            res = inventory_screen(main_player, player_fleet)
-                            if res == "to_game":
-                                return "to_game"
-                            # return focus back to FABRICATION tab after closing inventory
-                            selected_tab = 2
-                        elif label == "INTERNAL MODULES":
-                            from spacegame.screens.internal_modules_screen import internal_modules_screen
-
-                            res = internal_modules_screen(main_player, player_fleet)
-                            if res == "to_game":
-                                return "to_game"
-                            if res == "to_internal":
-                                return "to_internal"
-                            # after closing, go back to FABRICATION tab highlight
-                            selected_tab = 2
-                        elif label == "REFINING":
-                            from spacegame.screens.refining_main_screen import refining_main_screen
-
-                            res = refining_main_screen(main_player, player_fleet)
-                            if res == "to_game":
-                                return "to_game"
-                            selected_tab = 3
-                        else:
-                            selected_tab = idx
-                        break
+            if self.close_hit_rect.collidepoint(mx, my):
+                self.manager.pop("to_game")
+                return
 
-                # Fabricator slot buttons (01 / 02 / ...)
-                for i, rect in enumerate(idx_rects_modules):
-                    if rect.collidepoint(mx, my):
-                        selected_fabricator_index = i
-                        station_slot_selected = False
-                        manager.set_selected_index(i)
+            # Tabs
+            for idx, entry in enumerate(self.tab_entries):
+                if entry["rect"].collidepoint(mx, my):
+                    label = entry["label"]
+                    # ignore clicks on disabled tabs
+                    if label in self.disabled_labels:
                         break
+                    if label != "FABRICATION" and self.open_tab(label, self.main_player, self.player_fleet):
+                        return
+                    self.selected_tab = idx
+                    break
+
+            # Fabricator slot buttons (01 / 02 / ...)
+            for i, rect in enumerate(self.idx_rects_modules):
+                if rect.collidepoint(mx, my):
+                    self.selected_fabricator_index = i
+                    self.station_slot_selected = False
+                    self.fab_manager.set_selected_index(i)
+                    break
+
+            # SY station-only slot: only selectable when player is at a station
+            if self.is_at_station and self.sy_rect.collidepoint(mx, my):
+                self.station_slot_selected = True
+                # keep manager selection unchanged; just update UI selection
+                return
 
-                # SY station-only slot: only selectable when player is at a station
-                if is_at_station and sy_rect.collidepoint(mx, my):
-                    station_slot_selected = True
-                    # keep manager selection unchanged; just update UI selection
-                    continue
-
-                # BIG CENTER RECT -> OPEN BLUEPRINT SELECT
-                if big_rect.collidepoint(mx, my):
-                    from spacegame.screens.fabrication_bpselect_screen import fabrication_bpselect_screen
-                    res = fabrication_bpselect_screen(main_player, player_fleet, selected_fabricator_index, station_slot=station_slot_selected)
-                    if res == "to_game":
-                        return "to_game"
-                    elif isinstance(res, int):
-                        selected_fabricator_index = res
-                        manager.set_selected_index(res)
+            # BIG CENTER RECT -> OPEN BLUEPRINT SELECT
+            if self.big_rect.collidepoint(mx, my):
+                self.manager.push(
+                    "fabrication_bpselect", self.main_player, self.player_fleet,
+                    self.selected_fabricator_index, station_slot=self.station_slot_selected,
+                )
+
+    def draw(self, screen):
+        width, height = self.width, self.height
+        tabs_y = self.tabs_y
+        manager = self.fab_manager
+        idx_rects_modules = self.idx_rects_modules
+        selected_fabricator_index = self.selected_fabricator_index
+        station_slot_selected = self.station_slot_selected
+        is_at_station = self.is_at_station
+        card_rect = self.card_rect
 
         # ---------- DRAW ----------
         try:
@@ -242,25 +226,23 @@ def fabrication_main_screen(main_player, player_fleet):
         )
 
         # Title (on top of nav background)
-        screen.blit(title_surf, title_rect)
+        screen.blit(self.title_surf, self.title_rect)
 
         # Back arrow (on top of nav background) - use image
         back_arrow_img = get_back_arrow_image()
         if back_arrow_img:
             arrow_size = 32
             arrow_scaled = pygame.transform.smoothscale(back_arrow_img, (arrow_size - 4, arrow_size - 4))
-            arrow_draw_rect = arrow_scaled.get_rect(center=back_arrow_rect.center)
+            arrow_draw_rect = arrow_scaled.get_rect(center=self.back_arrow_rect.center)
             screen.blit(arrow_scaled, arrow_draw_rect)
 
         # Close X (on top of nav background)
-        screen.blit(close_surf, close_rect)
+        screen.blit(self.close_surf, self.close_rect)
 
         # Tabs (draw using shared nav helper)
-        nav_top_y, nav_bottom_y = draw_tabs(screen, tab_entries, selected_tab, tabs_y, width, tab_font, disabled_labels=disabled_labels)
+        draw_tabs(screen, self.tab_entries, self.selected_tab, tabs_y, width, self.tab_font, disabled_labels=self.disabled_labels)
 
         # ---------- MAIN CONTENT (fabrication visual) ----------
-        content_top = nav_bottom_y + 24  # same as used when we built card_rect
-
         # Left detail: index squares (01, 02, ...) with corner-only decoration + progress bar,
         # and transparent details to the right (no border/background).
 
@@ -279,7 +261,7 @@ def fabrication_main_screen(main_player, player_fleet):
         if is_at_station:
             draw_index_square(
                 screen,
-                sy_rect,
+                self.sy_rect,
                 "SY",
                 station_slot_selected,
                 UI_TAB_UNDERLINE_COLOR,
@@ -287,7 +269,6 @@ def fabrication_main_screen(main_player, player_fleet):
             )
 
         # progress bar inside ALL slot squares (selected or not)
-        fabrication_progress = 0.0  # 0 = idle, >0 once fabrication has started
         pb_margin = 12
         PROGRESS_COLOR = (255, 160, 40)  # same orange as nav X
 
@@ -299,27 +280,23 @@ def fabrication_main_screen(main_player, player_fleet):
 
         # Draw a placeholder progress bar for SY when at a station so visuals match other slots
         if is_at_station:
-            draw_slot_progress(screen, sy_rect, 0.0, pb_margin=pb_margin, progress_color=PROGRESS_COLOR)
-
-
+            draw_slot_progress(screen, self.sy_rect, 0.0, pb_margin=pb_margin, progress_color=PROGRESS_COLOR)
 
         # Details to the right of the FIRST 01 square (fixed position)
         if idx_rects_modules:
             base_idx_rect = idx_rects_modules[0]
         else:
-            base_idx_rect = idx_rect_base
+            base_idx_rect = self.idx_rect_base
 
         details_x = base_idx_rect.right + 18
         details_y = base_idx_rect.top
 
-        title_font = pygame.font.Font(None, 36)
-        module_title = title_font.render("FABRICATOR", True, UI_SECTION_TEXT_COLOR)
+        module_title = self.module_title_font.render("FABRICATOR", True, UI_SECTION_TEXT_COLOR)
         module_title_rect = module_title.get_rect()
         module_title_rect.topleft = (details_x, details_y)
         screen.blit(module_title, module_title_rect)
 
         # description lines (to the right of the square)
-        desc_font = pygame.font.Font(None, 20)
         desc_lines = [
             "A standard fabricator module, used for",
             "on-ship fabrication for weapons and",
@@ -327,19 +304,19 @@ def fabrication_main_screen(main_player, player_fleet):
         ]
         dy = module_title_rect.bottom + 8
         for line in desc_lines:
-            s = desc_font.render(line, True, (180, 200, 220))
+            s = self.desc_font.render(line, True, (180, 200, 220))
             screen.blit(s, (details_x, dy))
             dy += s.get_height() + 2
 
         # Module stats placed under description — render with connecting underline
-        stat_label_font = pygame.font.Font(None, 20)
-        stat_value_font = pygame.font.Font(None, 20)
+        stat_label_font = self.stat_label_font
+        stat_value_font = self.stat_value_font
         stat_x = details_x
         stat_y = dy + 12
 
         # Statistics for the currently selected fabricator module (slot 01 / 02 / ...)
-        if 0 <= selected_fabricator_index < len(fabricator_modules):
-            fabricator_module = fabricator_modules[selected_fabricator_index] if selected_fabricator_index < len(fabricator_modules) else None
+        if 0 <= selected_fabricator_index < len(self.fabricator_modules):
+            fabricator_module = self.fabricator_modules[selected_fabricator_index]
         else:
             fabricator_module = FabricatorModule()
 
@@ -348,7 +325,6 @@ def fabrication_main_screen(main_player, player_fleet):
             ("Base Fabrication Time:", str(fabricator_module.base_fabrication_time)),
         ]
 
-
         for label_text, value_text in stat_rows:
             lbl = stat_label_font.render(label_text, True, UI_SECTION_TEXT_COLOR)
             val = stat_value_font.render(value_text, True, (200, 230, 200))
@@ -400,7 +376,7 @@ def fabrication_main_screen(main_player, player_fleet):
         big_corner_len = 28
         big_corner_thick = 4
         corner_color = UI_TAB_TEXT_SELECTED
-        drawCornerFrame(screen, big_rect, corner_color, corner_len=big_corner_len, corner_thick=big_corner_thick)
+        drawCornerFrame(screen, self.big_rect, corner_color, corner_len=big_corner_len, corner_thick=big_corner_thick)
 
         # Bottom green button (centered)
         btn_w = 380
@@ -410,8 +386,10 @@ def fabrication_main_screen(main_player, player_fleet):
         btn_rect = pygame.Rect(btn_x, btn_y, btn_w, btn_h)
         BTN_LIGHT_GREEN = (96, 255, 144)
         pygame.draw.rect(screen, BTN_LIGHT_GREEN, btn_rect, width=2, border_radius=0)
-        btn_label = section_font.render("ADD BLUEPRINT FOR PRODUCTION", True, BTN_LIGHT_GREEN)
+        btn_label = self.section_font.render("ADD BLUEPRINT FOR PRODUCTION", True, BTN_LIGHT_GREEN)
         btn_label_rect = btn_label.get_rect(center=btn_rect.center)
         screen.blit(btn_label, btn_label_rect)
 
-        pygame.display.flip()
\ No newline at end of file
+
+def fabrication_main_screen(main_player, player_fleet):
+    return run_screen("fabrication_main", main_player, player_fleet)
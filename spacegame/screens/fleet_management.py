@@ -5,7 +5,6 @@ state from `main_player.inventory_manager.hangar` and allows inspecting
 and assigning light-craft to slots.
 """
 
-import sys
 import pygame
 from spacegame.ui.fleet_management_ui import (
     draw_fleet_section_titles,
@@ -17,12 +16,12 @@ from spacegame.models.units.frigate import Frigate
 from spacegame.ui.ui import preview_for_unit, draw_hex, draw_triangle, draw_dalton, draw_diamond, UI_BG_IMG
 from spacegame.ui.nav_ui import get_back_arrow_image
 from spacegame.config import (
-    FPS,
     UI_BG_COLOR, 
     UI_NAV_LINE_COLOR, 
     UI_TITLE_COLOR,
     UI_TOP_BAR_HEIGHT
     )
+from spacegame.core.screen_manager import Screen, run_screen
 
 
 def _build_hangar_snapshot(main_player):
@@ -51,117 +50,137 @@ def _entry_name(entry) -> str:
     return name if name is not None else ""
 
 
-def fleet_management_screen(main_player: ExpeditionShip, player_fleet):
+# vertical offset (pixels) to lower preview shapes and preview images
+PREVIEW_OFFSET_Y = 60
+
+
+class FleetManagementScreen(Screen):
     """Main fleet management UI.
 
     Displays the mothership preview, squad slots and an escort preview. The
-    function renders a live view of the hangar (queried each frame) and
-    returns `"to_game"` if the user requests returning to gameplay; otherwise
-    it exits normally (None).
+    screen renders a live view of the hangar (queried each frame) and pops
+    `"to_game"` if the user requests returning to gameplay; otherwise None.
     """
-    screen = pygame.display.get_surface()
-    if screen is None:
-        return
-
-    clock = pygame.time.Clock()
-    width, height = screen.get_size()
-
-    # ---------- COLORS / CONSTANTS TO MATCH INTERNAL SCREEN ----------
-    # Fonts
-    title_font = pygame.font.Font(None, 40)
-    label_font = pygame.font.Font(None, 28)
-
-    # ----------------- TITLE + NAV LAYOUT -----------------
-    title_text = "FLEET CONFIGURATION"
-    title_surf = title_font.render(title_text, True, UI_TITLE_COLOR)
-    title_rect = title_surf.get_rect(center=(width // 2, UI_TOP_BAR_HEIGHT // 2 - 22))
-
-    # Back arrow and close "X" at same height as in internal screen
-    nav_center_y = UI_TOP_BAR_HEIGHT // 1.3
-
-    arrow_size = 32
-    back_arrow_rect = pygame.Rect(0, 0, arrow_size, arrow_size)
-    back_arrow_rect.center = (40, nav_center_y)
-    back_arrow_hit_rect = back_arrow_rect.inflate(20, 20)
-
-    close_font = pygame.font.Font(None, 40)
-    close_surf = close_font.render("X", True, (255, 160, 0))
-    close_rect = close_surf.get_rect()
-    close_rect.center = (width - 40, UI_TOP_BAR_HEIGHT // 1.25)
-    close_hit_rect = close_rect.inflate(20, 20)
-
-    
-    # ----------------- LAYOUT CONSTANTS (shared fleet preview geometry) -----------------
-    fleet_layout = compute_fleet_preview_layout(width, height)
-    left_center_x = fleet_layout["left_center_x"]
-    mid_center_x = fleet_layout["mid_center_x"]
-    ms_rect = fleet_layout["ms_rect"]
-    circle_rects = fleet_layout["circle_rects"]
-    fr_rect = fleet_layout["fr_rect"]
-    previews_top = fleet_layout["previews_top"]
-    circle_radius = fleet_layout.get("circle_radius", 30)
-    circle_col_x = mid_center_x
-
-    # vertical offset (pixels) to lower preview shapes and preview images
-    PREVIEW_OFFSET_Y = 60
-
-    # compute a reference Y for ship titles based on the first squad slot
-    # (we'll align expedition and frigate titles to this Y so heights match)
-    first_slot_name_height = label_font.size("M")[1]
-    if fleet_layout.get("circle_rects"):
-        ref_name_y = fleet_layout["circle_rects"][0].top - (first_slot_name_height + 6)
-    else:
-        ref_name_y = ms_rect.top - (first_slot_name_height + 6)
-
-    running = True
-    while running:
-        # ------------- EVENTS -------------
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                running = False
-
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                if back_arrow_hit_rect.collidepoint(event.pos):
-                    running = False
-                    continue
-                if close_hit_rect.collidepoint(event.pos):
-                    return "to_game"
-
-                for idx, c_rect in enumerate(circle_rects):
-                    # Create a hit rectangle that spans the title area above
-                    # the slot and the lowered preview area below. This allows
-                    # clicking anywhere in the visual squad card to open details.
-                    name_height = label_font.size("M")[1]
-                    # title is drawn at: title_y = c_rect.top - (name_height + 6)
-                    title_y = c_rect.top - (name_height + 6)
-                    preview_bottom = c_rect.bottom + PREVIEW_OFFSET_Y
-
-                    # pad a few pixels above the title and below the preview
-                    pad = 8
-                    card_top = title_y - pad
-                    card_bottom = preview_bottom + pad
-
-                    card_left = c_rect.left - 140
-                    card_right = c_rect.right + 140
-                    card_rect = pygame.Rect(card_left, card_top, card_right - card_left, card_bottom - card_top)
-
-                    if card_rect.collidepoint(event.pos):
-                        # Open detailed squad card for this hangar slot.
-                        from spacegame.screens.squad_detail import squad_detail_screen
-
-                        res = squad_detail_screen(main_player, player_fleet, idx)
-                        if res == "to_game":
-                            return "to_game"
-                        break
 
+    def setup(self):
+        width, height = self.width, self.height
+
+        # ---------- COLORS / CONSTANTS TO MATCH INTERNAL SCREEN ----------
+        # Fonts
+        title_font = pygame.font.Font(None, 40)
+        self.label_font = label_font = pygame.font.Font(None, 28)
+
+        # ----------------- TITLE + NAV LAYOUT -----------------
+        title_text = "FLEET CONFIGURATION"
+        self.title_surf = title_font.render(title_text, True, UI_TITLE_COLOR)
+        self.title_rect = self.title_surf.get_rect(center=(width // 2, UI_TOP_BAR_HEIGHT // 2 - 22))
+
+        # Back arrow and close "X" at same height as in internal screen
+        self.nav_center_y = UI_TOP_BAR_HEIGHT // 1.3
+
+        arrow_size = 32
+        self.back_arrow_rect = back_arrow_rect = pygame.Rect(0, 0, arrow_size, arrow_size)
+        back_arrow_rect.center = (40, self.nav_center_y)
+        self.back_arrow_hit_rect = back_arrow_rect.inflate(20, 20)
+
+        close_font = pygame.font.Font(None, 40)
+        self.close_surf = close_font.render("X", True, (255, 160, 0))
+        self.close_rect = self.close_surf.get_rect()
+        self.close_rect.center = (width - 40, UI_TOP_BAR_HEIGHT // 1.25)
+        self.close_hit_rect = self.close_rect.inflate(20, 20)
+
+        # ----------------- LAYOUT CONSTANTS (shared fleet preview geometry) -----------------
+        fleet_layout = compute_fleet_preview_layout(width, height)
+        self.left_center_x = fleet_layout["left_center_x"]
+        self.mid_center_x = mid_center_x = fleet_layout["mid_center_x"]
+        self.ms_rect = ms_rect = fleet_layout["ms_rect"]
+        self.circle_rects = circle_rects = fleet_layout["circle_rects"]
+        self.fr_rect = fleet_layout["fr_rect"]
+        self.previews_top = fleet_layout["previews_top"]
+        self.circle_radius = fleet_layout.get("circle_radius", 30)
+        self.circle_col_x = mid_center_x
+
+        # compute a reference Y for ship titles based on the first squad slot
+        # (we'll align expedition and frigate titles to this Y so heights match)
+        first_slot_name_height = label_font.size("M")[1]
+        if fleet_layout.get("circle_rects"):
+            self.ref_name_y = fleet_layout["circle_rects"][0].top - (first_slot_name_height + 6)
+        else:
+            self.ref_name_y = ms_rect.top - (first_slot_name_height + 6)
+
+        # squad card hit areas span the title above each slot and the
+        # lowered preview below it
+        self.card_rects = []
+        for c_rect in circle_rects:
+            # Create a hit rectangle that spans the title area above
+            # the slot and the lowered preview area below. This allows
+            # clicking anywhere in the visual squad card to open details.
+            name_height = label_font.size("M")[1]
+            # title is drawn at: title_y = c_rect.top - (name_height + 6)
+            title_y = c_rect.top - (name_height + 6)
+            preview_bottom = c_rect.bottom + PREVIEW_OFFSET_Y
+
+            # pad a few pixels above the title and below the preview
+            pad = 8
+            card_top = title_y - pad
+            card_bottom = preview_bottom + pad
+
+            card_left = c_rect.left - 140
+            card_right = c_rect.right + 140
+            card_rect = pygame.Rect(card_left, card_top, card_right - card_left, card_bottom - card_top)
+            self.card_rects.append(card_rect)
+
+        # preview images scaled to the size they are drawn at
+        self.scaled_previews = {}
+
+    def scaled_preview(self, unit_type, size):
+        key = (unit_type, size)
+        surf = self.scaled_previews.get(key)
+        if surf is None:
+            surf = pygame.transform.smoothscale(preview_for_unit(unit_type), size)
+            self.scaled_previews[key] = surf
+        return surf
+
+    def enter(self, main_player: ExpeditionShip, player_fleet):
+        self.main_player = main_player
+        self.player_fleet = player_fleet
+        self.update(0.0)
+
+    def update(self, dt):
         # Rebuild a fresh snapshot of hangar state each frame (authoritative)
-        assignments, ships, pool_by_id = _build_hangar_snapshot(main_player)
+        self.assignments, self.ships, self.pool_by_id = _build_hangar_snapshot(self.main_player)
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.manager.pop()
+            return
+
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            if self.back_arrow_hit_rect.collidepoint(event.pos):
+                self.manager.pop()
+                return
+            if self.close_hit_rect.collidepoint(event.pos):
+                self.manager.pop("to_game")
+                return
+
+            for idx, card_rect in enumerate(self.card_rects):
+                if card_rect.collidepoint(event.pos):
+                    # Open detailed squad card for this hangar slot.
+                    self.manager.push("squad_detail", self.main_player, self.player_fleet, idx)
+                    return
+
+    def draw(self, screen):
+        main_player, player_fleet = self.main_player, self.player_fleet
+        assignments, pool_by_id = self.assignments, self.pool_by_id
+        label_font = self.label_font
+        title_surf, title_rect = self.title_surf, self.title_rect
+        back_arrow_rect = self.back_arrow_rect
+        close_surf, close_rect = self.close_surf, self.close_rect
+        nav_center_y, ref_name_y = self.nav_center_y, self.ref_name_y
+        left_center_x, circle_col_x, previews_top = self.left_center_x, self.circle_col_x, self.previews_top
+        ms_rect, fr_rect = self.ms_rect, self.fr_rect
+        circle_rects, circle_radius = self.circle_rects, self.circle_radius
 
-        # ------------- DRAW -------------
         try:
             screen.blit(UI_BG_IMG, (0, 0))
         except Exception:
@@ -207,7 +226,7 @@ def fleet_management_screen(main_player: ExpeditionShip, player_fleet):
         # Draw geometric hex behind the expedition preview (lowered)
         ms_center = (ms_rect.centerx, ms_rect.centery - 125)
         draw_hex(screen, ms_center, ms_rect.width * 0.9, ms_rect.height * 0.5, (80, 255, 190), 3)
-        ms_surf = pygame.transform.smoothscale(preview_for_unit("expedition"), (ms_rect.width, ms_rect.height))
+        ms_surf = self.scaled_preview("expedition", (ms_rect.width, ms_rect.height))
         ms_img_rect = ms_surf.get_rect(center=ms_center)
         screen.blit(ms_surf, ms_img_rect.topleft)
         # Expedition ship name: left-align above the preview, vertically aligned
@@ -263,8 +282,7 @@ def fleet_management_screen(main_player: ExpeditionShip, player_fleet):
                 else:
                     draw_diamond(screen, slot_center, scaled * 1.2, scaled * 1.2, (80, 255, 190), 2)
 
-                preview_img = preview_for_unit(unit_type)
-                icpt_img = pygame.transform.smoothscale(preview_img, (scaled, scaled))
+                icpt_img = self.scaled_preview(unit_type, (scaled, scaled))
                 img_rect = icpt_img.get_rect(center=slot_center)
                 screen.blit(icpt_img, img_rect.topleft)
 
@@ -303,7 +321,7 @@ def fleet_management_screen(main_player: ExpeditionShip, player_fleet):
             draw_diamond(screen, fr_center, fr_rect.height * scale, fr_rect.width / 1.2 * scale, (80, 255, 190), 3)
             fr_w = int(fr_rect.width * scale)
             fr_h = int(fr_rect.height * scale)
-            fr_img = pygame.transform.smoothscale(preview_for_unit("frigate"), (fr_w, fr_h))
+            fr_img = self.scaled_preview("frigate", (fr_w, fr_h))
             # center the scaled preview on the lowered center so name/flag positions remain unchanged
             img_rect = fr_img.get_rect(center=fr_center)
             screen.blit(fr_img, img_rect.topleft)
@@ -329,5 +347,9 @@ def fleet_management_screen(main_player: ExpeditionShip, player_fleet):
         else:
             pygame.draw.rect(screen, (80, 80, 80), fr_rect, border_radius=10)
 
-        pygame.display.flip()
-        clock.tick(FPS)
\ No newline at end of file
+
+def fleet_management_screen(main_player: ExpeditionShip, player_fleet):
+    """Run the fleet management screen; returns "to_game" or None."""
+    if pygame.display.get_surface() is None:
+        return
+    return run_screen("fleet_management", main_player, player_fleet)
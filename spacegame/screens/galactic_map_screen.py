@@ -2,7 +2,18 @@ import pygame
 from pygame.math import Vector2
 from spacegame.ui.ui import Button, draw_hex
 from spacegame.screens.internal_screen import internal_screen
-from spacegame.config import PREVIEWS_DIR, SCREEN_WIDTH, SCREEN_HEIGHT, UI_ICON_BLUE
+from spacegame.core.spatial import SpatialGrid
+from spacegame.core.battle_sim import get_background_sim
+from spacegame.core.assets import load_image
+from spacegame.config import (
+    PREVIEWS_DIR,
+    SCREEN_WIDTH,
+    SCREEN_HEIGHT,
+    UI_ICON_BLUE,
+    GALAXY_MAP_GRID_CELL,
+    GALAXY_MAP_LABEL_ZOOM,
+    GALAXY_MAP_LABEL_MAX_VISIBLE,
+)
 
 
 # Global caches for fast screen transitions
@@ -14,16 +25,17 @@ _GALACTIC_MAP_CACHE = {
     'hud_separator': None,
     'tier_icons': {},
     'map_icons': {},
+    # (source key, size) -> pre-scaled surface, shared by every map area
+    'scaled_icons': {},
+    # area name -> (title surface, shadow surface)
+    'labels': {},
 }
 
 
 def _load_cached_image(filename: str, use_convert_alpha: bool = True) -> pygame.Surface:
-    """Load and cache an image."""
+    """Load and cache an image (usually already streamed in by the asset preloader)."""
     try:
-        img = pygame.image.load(filename)
-        if use_convert_alpha:
-            return img.convert_alpha()
-        return img.convert()
+        return load_image(filename, alpha=use_convert_alpha)
     except Exception:
         return None
 
@@ -80,30 +92,33 @@ def _init_galactic_map_cache():
         _GALACTIC_MAP_CACHE['fleet_icon'] = _load_cached_image(f"{PREVIEWS_DIR}/FleetIcon.png", use_convert_alpha=True)
 
 
-def preload_map_images():
-    """Preload galactic background and all Map_<Name>.png previews from PREVIEWS_DIR.
+def _get_scaled_icon(group: str, key: str, size: int):
+    """Return cached icon `key` from cache `group` scaled to `size` pixels square.
 
-    Stores results in _GALACTIC_MAP_CACHE['system_previews'] keyed by Titlecase name.
+    Map areas share a handful of icons, so scaling once per (icon, size) keeps
+    the per-frame cost independent of how many areas are drawn.
     """
-    _init_galactic_map_cache()
-    import os
-    previews = {}
-    try:
-        for fn in os.listdir(PREVIEWS_DIR):
-            if fn.startswith('Map_') and fn.lower().endswith(('.png', '.jpg', '.jpeg')):
-                name = fn[len('Map_'):]
-                name = os.path.splitext(name)[0]
-                try:
-                    img = _load_cached_image(f"{PREVIEWS_DIR}/{fn}", use_convert_alpha=True)
-                    if img is not None:
-                        previews[name.title()] = img
-                except Exception:
-                    pass
-    except Exception:
-        pass
+    cache_key = (group, key, size)
+    scaled_cache = _GALACTIC_MAP_CACHE['scaled_icons']
+    if cache_key not in scaled_cache:
+        src = _GALACTIC_MAP_CACHE.get(group) if group == 'fleet_icon' else _GALACTIC_MAP_CACHE[group].get(key)
+        scaled = None
+        if src is not None:
+            try:
+                scaled = pygame.transform.smoothscale(src, (size, size))
+            except Exception:
+                scaled = None
+        scaled_cache[cache_key] = scaled
+    return scaled_cache[cache_key]
 
-    _GALACTIC_MAP_CACHE['system_previews'] = previews
-    return previews
+
+def _get_area_label(name: str):
+    """Return cached (title, shadow) surfaces for an area name."""
+    labels = _GALACTIC_MAP_CACHE['labels']
+    if name not in labels:
+        font = _GALACTIC_MAP_CACHE['small_font']
+        labels[name] = (font.render(name, True, (220, 230, 255)), font.render(name, True, (0, 0, 0)))
+    return labels[name]
 
 
 def galactic_map_screen(main_player, player_fleet):
@@ -191,6 +206,15 @@ def galactic_map_screen(main_player, player_fleet):
         elif 'pos' not in a:
             a['pos'] = (map_center_x, map_center_y)
 
+    # Spatial index over area positions: drawing and hit-testing only visit
+    # the cells overlapping the viewport / cursor instead of every area.
+    area_grid = SpatialGrid(GALAXY_MAP_GRID_CELL)
+    area_grid.build(map_areas, key=lambda a: a['pos'])
+    areas_by_name = {}
+    for a in map_areas:
+        if a.get('name'):
+            areas_by_name.setdefault(str(a['name']).upper(), a)
+
     # If a fleet move has been requested (annotated on main_player), animate the fleet icon
     fleet_move = getattr(main_player, '_fleet_move', None)
     if fleet_move:
@@ -200,12 +224,7 @@ def galactic_map_screen(main_player, player_fleet):
             def find_area_by_name(n):
                 if n is None:
                     return None
-                for a in map_areas:
-                    if a.get('name') and a['name'].lower() == str(n).lower():
-                        return a
-                    if a.get('name') and a['name'].upper() == str(n).upper():
-                        return a
-                return None
+                return areas_by_name.get(str(n).upper())
 
             a_from = find_area_by_name(from_name)
             a_to = find_area_by_name(to_name)
@@ -220,7 +239,7 @@ def galactic_map_screen(main_player, player_fleet):
                 anim_dur = 1.2
                 clock_anim = pygame.time.Clock()
                 t = 0.0
-                fleet_icon = _GALACTIC_MAP_CACHE.get('fleet_icon')
+                fleet_icon = _get_scaled_icon('fleet_icon', 'fleet_icon', 40)
                 while t < anim_dur:
                     dt = clock_anim.tick(60) / 1000.0
                     t += dt
@@ -237,9 +256,7 @@ def galactic_map_screen(main_player, player_fleet):
                     # draw fleet icon
                     if fleet_icon:
                         try:
-                            icon = pygame.transform.smoothscale(fleet_icon, (40, 40))
-                            icon.set_alpha(255)
-                            screen.blit(icon, (int(ix - 20), int(iy - 20)))
+                            screen.blit(fleet_icon, (int(ix - 20), int(iy - 20)))
                         except Exception:
                             pass
                     # Draw cinematic bars overlay if requested
@@ -317,6 +334,9 @@ def galactic_map_screen(main_player, player_fleet):
 
     while True:
         dt = clock.tick(60) / 1000.0
+        # the battle keeps running behind the map
+        if get_background_sim().tick().mothership_lost:
+            return "back"
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 return "exit"
@@ -327,13 +347,19 @@ def galactic_map_screen(main_player, player_fleet):
                 # Check fleet button first
                 if fleet_btn.handle_event(event):
                     res = internal_screen(main_player, player_fleet)
+                    if res == "exit":
+                        return "exit"
                     if res == "to_game":
                         pass
                     continue
 
                 # Check for map area clicks
                 area_clicked = False
-                for area in map_areas:
+                # Only test areas in the cells around the cursor
+                hit_radius = 15 * 1.5 / zoom if zoom > 0 else 15
+                world_mx = (event.pos[0] - offset.x) / zoom if zoom > 0 else 0
+                world_my = (event.pos[1] - offset.y) / zoom if zoom > 0 else 0
+                for area in area_grid.query_radius(world_mx, world_my, hit_radius):
                     # Convert world coordinates to screen coordinates
                     area_screen_x = area['pos'][0] * zoom + offset.x
                     area_screen_y = area['pos'][1] * zoom + offset.y
@@ -469,84 +495,87 @@ def galactic_map_screen(main_player, player_fleet):
         if cached_bg_scaled:
             screen.blit(cached_bg_scaled, (int(offset.x), int(offset.y)))
 
-        # Draw map areas (selectable regions)
-        for area in map_areas:
+        # Draw map areas (selectable regions) - query only the cells overlapping
+        # the viewport (plus a margin for rings/labels) from the spatial grid.
+        margin = 50
+        view_left = (-margin - offset.x) / zoom
+        view_top = (-margin - offset.y) / zoom
+        view_right = (width + margin - offset.x) / zoom
+        view_bottom = (height + margin - offset.y) / zoom
+        visible_areas = area_grid.query_rect(view_left, view_top, view_right, view_bottom)
+        # Labels are the expensive part; suppress them when zoomed far out on a crowded map
+        draw_labels = zoom >= fit_zoom * GALAXY_MAP_LABEL_ZOOM or len(visible_areas) <= GALAXY_MAP_LABEL_MAX_VISIBLE
+        icon_size = 18
+        for area in visible_areas:
             # Convert world coordinates to screen coordinates
             area_screen_x = area['pos'][0] * zoom + offset.x
             area_screen_y = area['pos'][1] * zoom + offset.y
-            
-            # Only draw if on screen
-            if -50 < area_screen_x < width + 50 and -50 < area_screen_y < height + 50:
-                # Draw area circle with glow effect
-                is_selected = (selected_area == area)
-                color = (255, 200, 50) if is_selected else (120, 180, 255)
-                glow_color = (255, 220, 100) if is_selected else (150, 200, 255)
-                
-                # Glow ring
-                pygame.draw.circle(screen, glow_color, (int(area_screen_x), int(area_screen_y)), 20, 2)
-                # Main circle
-                pygame.draw.circle(screen, color, (int(area_screen_x), int(area_screen_y)), 12, 2)
-                # Center dot
-                pygame.draw.circle(screen, color, (int(area_screen_x), int(area_screen_y)), 4)
-                
-                # Draw small overlay at top-right of the map icon: title + tier icon + type icon
-                try:
-                    title_font = _GALACTIC_MAP_CACHE['small_font']
-                    title_surf = title_font.render(area['name'], True, (220, 230, 255))
-                    icon_size = 18
-                    padding = 6
-
-                    # Icons
-                    tier_key = f"tier{area.get('tier',0)}"
-                    tier_icon = _GALACTIC_MAP_CACHE['tier_icons'].get(tier_key)
-                    type_icon = _GALACTIC_MAP_CACHE['map_icons'].get(f"map_{area.get('type','Asteroirds')}")
-
-                    text_w = title_surf.get_width()
-                    icons_w = (icon_size + 4) * (1 if tier_icon else 0) + (icon_size + 4) * (1 if type_icon else 0)
-                    box_w = text_w + padding + icons_w + padding
-                    box_h = max(title_surf.get_height(), icon_size) + padding * 2
-
-                    box_x = int(area_screen_x + 14)
-                    box_y = int(area_screen_y - box_h - 8)
-
-                    # Transparent background and no border per request; draw title with shadow for readability
-                    text_x = box_x + padding
-                    text_y = box_y + padding + (box_h - padding*2 - title_surf.get_height())//2
-                    # shadow
-                    shadow = _GALACTIC_MAP_CACHE['small_font'].render(area['name'], True, (0, 0, 0))
-                    screen.blit(shadow, (text_x + 1, text_y + 1))
-                    screen.blit(title_surf, (text_x, text_y))
-
-                    # Blit icons to the right of the text
-                    icon_x = box_x + box_w - padding - icon_size
-                    icon_y = box_y + padding + (box_h - padding*2 - icon_size)//2
-                    if type_icon:
-                        t_scaled = pygame.transform.smoothscale(type_icon, (icon_size, icon_size))
-                        screen.blit(t_scaled, (icon_x, icon_y))
-                        icon_x -= (icon_size + 4)
-                    if tier_icon:
-                        r_scaled = pygame.transform.smoothscale(tier_icon, (icon_size, icon_size))
-                        screen.blit(r_scaled, (icon_x, icon_y))
-                except Exception:
-                    pass
+
+            # Draw area circle with glow effect
+            is_selected = (selected_area == area)
+            color = (255, 200, 50) if is_selected else (120, 180, 255)
+            glow_color = (255, 220, 100) if is_selected else (150, 200, 255)
+            center = (int(area_screen_x), int(area_screen_y))
+
+            if not draw_labels and not is_selected:
+                # Far zoom: a single dot per area keeps crowded maps cheap
+                pygame.draw.circle(screen, color, center, 3)
+                continue
+
+            # Glow ring
+            pygame.draw.circle(screen, glow_color, center, 20, 2)
+            # Main circle
+            pygame.draw.circle(screen, color, center, 12, 2)
+            # Center dot
+            pygame.draw.circle(screen, color, center, 4)
+
+            # Draw small overlay at top-right of the map icon: title + tier icon + type icon
+            try:
+                title_surf, shadow = _get_area_label(area['name'])
+                padding = 6
+
+                # Icons (pre-scaled and shared across areas)
+                tier_icon = _get_scaled_icon('tier_icons', f"tier{area.get('tier',0)}", icon_size)
+                type_icon = _get_scaled_icon('map_icons', f"map_{area.get('type','Asteroirds')}", icon_size)
+
+                text_w = title_surf.get_width()
+                icons_w = (icon_size + 4) * (1 if tier_icon else 0) + (icon_size + 4) * (1 if type_icon else 0)
+                box_w = text_w + padding + icons_w + padding
+                box_h = max(title_surf.get_height(), icon_size) + padding * 2
+
+                box_x = int(area_screen_x + 14)
+                box_y = int(area_screen_y - box_h - 8)
+
+                # Transparent background and no border per request; draw title with shadow for readability
+                text_x = box_x + padding
+                text_y = box_y + padding + (box_h - padding*2 - title_surf.get_height())//2
+                screen.blit(shadow, (text_x + 1, text_y + 1))
+                screen.blit(title_surf, (text_x, text_y))
+
+                # Blit icons to the right of the text
+                icon_x = box_x + box_w - padding - icon_size
+                icon_y = box_y + padding + (box_h - padding*2 - icon_size)//2
+                if type_icon:
+                    screen.blit(type_icon, (icon_x, icon_y))
+                    icon_x -= (icon_size + 4)
+                if tier_icon:
+                    screen.blit(tier_icon, (icon_x, icon_y))
+            except Exception:
+                pass
 
         # Draw fleet icon at current location
         try:
             current_location = getattr(main_player, 'location_system', None)
-            fleet_icon = _GALACTIC_MAP_CACHE.get('fleet_icon')
-            if current_location and fleet_icon:
-                # Find the area matching current location
-                for area in map_areas:
-                    if area['name'].upper() == str(current_location).upper():
-                        fleet_screen_x = area['pos'][0] * zoom + offset.x
-                        fleet_screen_y = area['pos'][1] * zoom + offset.y
-                        
-                        # Only draw if on screen
-                        if -50 < fleet_screen_x < width + 50 and -50 < fleet_screen_y < height + 50:
-                            fleet_icon_scaled = pygame.transform.smoothscale(fleet_icon, (40, 40))
-                            fleet_icon_rect = fleet_icon_scaled.get_rect(center=(int(fleet_screen_x), int(fleet_screen_y)))
-                            screen.blit(fleet_icon_scaled, fleet_icon_rect)
-                        break
+            fleet_icon_scaled = _get_scaled_icon('fleet_icon', 'fleet_icon', 40)
+            area = areas_by_name.get(str(current_location).upper()) if current_location else None
+            if area is not None and fleet_icon_scaled:
+                fleet_screen_x = area['pos'][0] * zoom + offset.x
+                fleet_screen_y = area['pos'][1] * zoom + offset.y
+
+                # Only draw if on screen
+                if -50 < fleet_screen_x < width + 50 and -50 < fleet_screen_y < height + 50:
+                    fleet_icon_rect = fleet_icon_scaled.get_rect(center=(int(fleet_screen_x), int(fleet_screen_y)))
+                    screen.blit(fleet_icon_scaled, fleet_icon_rect)
         except Exception:
             pass
         # Top-left: fleet button (hex style to match game_screen)
@@ -634,8 +663,8 @@ def galactic_map_screen(main_player, player_fleet):
             visit_s = num_font.render(str(visit_count), True, (180, 240, 180))
 
             icon_size = 18
-            type_icon = _GALACTIC_MAP_CACHE['map_icons'].get(f"map_{selected_area.get('type','Asteroirds')}")
-            tier_icon = _GALACTIC_MAP_CACHE['tier_icons'].get(f"tier{selected_area.get('tier',0)}")
+            type_icon = _get_scaled_icon('map_icons', f"map_{selected_area.get('type','Asteroirds')}", icon_size)
+            tier_icon = _get_scaled_icon('tier_icons', f"tier{selected_area.get('tier',0)}", icon_size)
 
             # Blit onto panel surface
             panel_surf.blit(name_s, (padding, padding))
@@ -661,14 +690,12 @@ def galactic_map_screen(main_player, player_fleet):
 
             # tier icon (left of visit count)
             if tier_icon:
-                t_scaled = pygame.transform.smoothscale(tier_icon, (icon_size, icon_size))
-                panel_surf.blit(t_scaled, (right_x - icon_size, top_y))
+                panel_surf.blit(tier_icon, (right_x - icon_size, top_y))
                 right_x -= (icon_size + 6)
 
             # type icon (left of tier)
             if type_icon:
-                m_scaled = pygame.transform.smoothscale(type_icon, (icon_size, icon_size))
-                panel_surf.blit(m_scaled, (right_x - icon_size, top_y))
+                panel_surf.blit(type_icon, (right_x - icon_size, top_y))
                 right_x -= (icon_size + 6)
 
             # VIEW Button
@@ -1,8 +1,6 @@
 import pygame
-import random
 import json
 from pygame.math import Vector2
-from spacegame.models.units.fleet_unit import SpaceUnit
 from spacegame.models.units.pirate_frigate import PirateFrigate
 from spacegame.models.units.expedition_ship import ExpeditionShip
 from spacegame.models.units.frigate import Frigate
@@ -10,79 +8,36 @@ from spacegame.models.units.interceptor import Interceptor
 from spacegame.models.units.resource_collector import ResourceCollector
 from spacegame.models.units.plasma_bomber import PlasmaBomber
 from spacegame.models.units.space_station import SpaceStation
-from spacegame.models.asteroids.asteroida import MineableAsteroidA
-from spacegame.models.asteroids.asteroidb import MineableAsteroidB
-from spacegame.models.asteroids.asteroidc import MineableAsteroidC
-from spacegame.models.asteroids.asteroidm import MineableAsteroidM
-from spacegame.core.mover import Mover
 from spacegame.core import effects
-from spacegame.core.utils import spawn_enemy_wave, handle_auto_fire, handle_projectile_collisions
+from spacegame.core.asteroid_field import get_asteroid_field
+from spacegame.core.assets import get_asset_preloader, load_image
+from spacegame.core.sprite_pack import baked_sources
+from spacegame.core.battle_snapshot import capture_battle, restore_battle
+from spacegame.core.battle_sim import Battle, get_background_sim
+from spacegame.core.navigation import get_navigator
+from spacegame.core.formation import plan_formation, next_formation
 from spacegame.core import events
+from spacegame.core.save_scheduler import record_change
 from spacegame.ui.hud_ui import HudUI
-from spacegame.ui.ui import Button, draw_triangle, draw_diamond, draw_dalton, draw_hex, OREM_PREVIEW_IMG
-from spacegame.core.fabrication import get_fabrication_manager
+from spacegame.ui.ui import Button, draw_triangle, draw_diamond, draw_dalton, draw_hex, ui_image
 from spacegame.core.sound_manager import get_sound_manager
 from spacegame.config import (
     SCREEN_WIDTH,
     SCREEN_HEIGHT,
     FPS,
     MAX_DT,
-    SEPARATION_ITER,
     IMAGES_DIR,
     PREVIEWS_DIR,
     ENEMY_SPAWN_INTERVAL,
-    ENEMY_SPAWN_COUNT,
     JUMP_CINEMATIC_BAR_FACTOR,
     JUMP_CINEMATIC_CLOSE_SPEED,
-    STATION_HEALING_RATE,
-    SELECTION_MIN_PIXELS
+    SELECTION_MIN_PIXELS,
+    ASTEROID_CHUNK_ORIGIN,
+    FORMATION_DEFAULT,
 )
-from spacegame.screens.internal_screen import internal_screen
-from spacegame.screens.galactic_map_screen import galactic_map_screen, _init_galactic_map_cache, preload_map_images
-from spacegame.screens.star_system_map import star_system_map
-import threading
-from spacegame.screens.loading_screen import loading_screen
-
-
-
-
-def handle_collisions(player_fleet, enemy_fleet, dt):
-    """Handle separation and collision damage between ships."""
-    # Separation: keep ships from overlapping too much
-    for _ in range(SEPARATION_ITER):
-        # Player-player separation
-        for i, a in enumerate(player_fleet):
-            for b in player_fleet[i + 1:]:
-                # Light crafts push each other
-                # but don't push larger ships
-                if isinstance(a, (Interceptor, ResourceCollector, PlasmaBomber)) and isinstance(b, (Interceptor, ResourceCollector, PlasmaBomber)):
-                    Mover.separate_rotated(a, b)
-                elif not isinstance(a, (Interceptor, ResourceCollector, PlasmaBomber)) and not isinstance(b, (Interceptor, ResourceCollector, PlasmaBomber)):
-                    Mover.separate_rotated(a, b)
-
-        # Enemy-enemy separation
-        for i, a in enumerate(enemy_fleet):
-            for b in enemy_fleet[i + 1:]:
-                Mover.separate_rotated(a, b)
-
-        # NEW: Player-enemy separation (so big ships push enemies instead of clipping)
-        for p in player_fleet:
-            for e in enemy_fleet:
-                Mover.separate_rotated(p, e)
-
-    # Player-enemy collision damage (unchanged)
-    for p in player_fleet:
-        for e in enemy_fleet:
-            if p.collides_with(e):
-                dmg = SpaceUnit.COLLISION_DPS * dt
-                if getattr(p, 'max_armor', 0) > 0 and getattr(p, 'armor', 0) > 0:
-                    p.take_armor_damage(dmg)
-                else:
-                    p.take_damage(dmg)
-                if getattr(e, 'max_armor', 0) > 0 and getattr(e, 'armor', 0) > 0:
-                    e.take_armor_damage(dmg)
-                else:
-                    e.take_damage(dmg)
+# Screens reached only through navigation (internal, galactic map, star
+# system map, loading) are imported where they are opened, keeping them
+# and their assets off the startup path.
 
 
 # Helper functions moved to `spacegame.core.utils` to reduce screen complexity
@@ -135,64 +90,6 @@ def get_location_data(main_player):
     return None
 
 
-def spawn_asteroids_for_location(location_data):
-    """Return a list of asteroids appropriate for the given location with random positions and counts."""
-    if location_data is None or location_data.get('type') != 'Asteroids':
-        return []
-
-    tier = location_data.get('tier', 0)
-    ore_type = location_data.get('ore', 'M')
-
-    asteroids = []
-
-    # Generate random spawn area (roughly in visible area with padding)
-    spawn_margin = 100
-    max_x = SCREEN_WIDTH - spawn_margin
-    max_y = SCREEN_HEIGHT - spawn_margin
-    min_x = spawn_margin
-    min_y = spawn_margin
-
-    # Determine spawn count independent of tier: all locations have at most 10 asteroids.
-    # Tier affects asteroid tier and ore tier only, not count.
-    if ore_type == 'M':
-        count = random.randint(4, 10)
-    else:
-        count = random.randint(5, 10)
-
-    # If the visitable's ore is M, spawn only M asteroids at high purity
-    if ore_type == 'M':
-        for _ in range(count):
-            pos = (random.randint(min_x, max_x), random.randint(min_y, max_y))
-            asteroids.append(MineableAsteroidM(pos, tier=tier, purity=0.5))
-        return asteroids
-
-    # For non-M visitables, spawn A/B/C asteroids. The designated ore_type gets high purity (0.5),
-    # others get low purity (0.13).
-    high_purity = 0.5
-    low_purity = 0.13
-    ore_purities = {
-        'A': high_purity if ore_type == 'A' else low_purity,
-        'B': high_purity if ore_type == 'B' else low_purity,
-        'C': high_purity if ore_type == 'C' else low_purity,
-    }
-
-    asteroid_map = {'A': MineableAsteroidA, 'B': MineableAsteroidB, 'C': MineableAsteroidC}
-
-    # Ensure at least one asteroid of each type A/B/C is present for non-M visitables.
-    ore_choices = ['A', 'B', 'C']
-    if count > 3:
-        ore_choices += [random.choice(['A', 'B', 'C']) for _ in range(count - 3)]
-    random.shuffle(ore_choices)
-
-    for ore_key in ore_choices:
-        pos = (random.randint(min_x, max_x), random.randint(min_y, max_y))
-        asteroid_class = asteroid_map[ore_key]
-        purity_val = ore_purities.get(ore_key, low_purity)
-        asteroids.append(asteroid_class(pos, tier=tier, purity=purity_val))
-
-    return asteroids
-
-
 def spawn_station_for_location(location_data):
     """Return a space station if the location is a station type, positioned at a fixed location."""
     if location_data is None or location_data.get('type') != 'Station':
@@ -231,6 +128,8 @@ def play_jump_cinematic(main_player, player_fleet, prev_system, new_system, prev
     try:
         sound_manager = get_sound_manager()
         sound_manager.on_hyperspace_launch()
+        # the cinematic runs its own loop; submit now rather than after it
+        sound_manager.flush()
     except Exception:
         pass
 
@@ -389,21 +288,29 @@ def run_game():
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
     pygame.display.set_caption("SpaceGame")
     
-    # Pre-initialize galactic map resources and system previews in background for instant transitions
-    _init_galactic_map_cache()
+    # Preload images in priority tiers on background threads. The loading
+    # screen waits for the gameplay sprites only; HUD icons and map / menu
+    # previews keep streaming in while the game runs.
+    from spacegame.screens.loading_screen import loading_screen
+    preloader = get_asset_preloader()
+    try:
+        # decode the gameplay sound groups in the background meanwhile, so the
+        # first death or collector chatter doesn't decode on the game thread
+        get_sound_manager().prewarm()
+    except Exception:
+        pass
     try:
-        # Start preloading on a background thread so the main loop isn't blocked.
-        t = threading.Thread(target=preload_map_images, daemon=True)
-        t.start()
-        # Show an animated loading screen while preload runs; if user quits, propagate exit
-        res = loading_screen(t)
+        # sprites baked into the sprite pack need no source decode
+        preloader.start(skip=baked_sources())
+        # if user quits during loading, propagate exit
+        res = loading_screen(preloader)
         if res == "exit":
             return "exit"
     except Exception:
         pass
 
     # --- Load skybox background ---
-    background_img = pygame.image.load(IMAGES_DIR + "/nebula_15.png").convert()
+    background_img = load_image(IMAGES_DIR + "/nebula_15.png", alpha=False)
     background_img = pygame.transform.smoothscale(background_img, (WIDTH, HEIGHT))
 
     clock = pygame.time.Clock()
@@ -419,12 +326,17 @@ def run_game():
     # --- Main player (ExpeditionShip with hangar) ---
     main_player = ExpeditionShip((400, 300))
     # Default starting location for the player's fleet (safe starter system)
+    resumed_location = bool(getattr(main_player, 'location_system', None))
     try:
         main_player.location_system = getattr(main_player, 'location_system', None) or 'Lazarus'
         main_player.location_area = getattr(main_player, 'location_area', None) or 'Lazarus Station'
     except Exception:
         main_player.location_system = 'Lazarus'
         main_player.location_area = 'Lazarus Station'
+    if not resumed_location:
+        # a new game's snapshot was taken before the location was set, and
+        # LocationChanged only fires on jumps: journal the starting location
+        record_change("loc", s=main_player.location_system, a=main_player.location_area)
 
     player_fleet = [
         main_player,
@@ -443,12 +355,11 @@ def run_game():
 
     # Load location data and spawn appropriate asteroids/enemies based on location type
     location_data = get_location_data(main_player)
-    asteroids = spawn_asteroids_for_location(location_data)
-    # asteroid sprite group
+    # asteroid sprite group, filled chunk by chunk by the location's asteroid field
     asteroid_group = pygame.sprite.Group()
-    for a in asteroids:
-        if isinstance(a, pygame.sprite.Sprite):
-            asteroid_group.add(a)
+    asteroid_field = get_asteroid_field(main_player.location_system, main_player.location_area, location_data, group=asteroid_group)
+    # The camera is fixed, so the field's view is the play area inside the HUD margins
+    asteroid_view_rect = pygame.Rect(ASTEROID_CHUNK_ORIGIN, (WIDTH - 2 * ASTEROID_CHUNK_ORIGIN[0], HEIGHT - 2 * ASTEROID_CHUNK_ORIGIN[1]))
 
     # Spawn station if at a station location
     station = spawn_station_for_location(location_data)
@@ -467,8 +378,14 @@ def run_game():
         if isinstance(e, pygame.sprite.Sprite):
             enemy_group.add(e)
 
-    # Spawn timer for enemy waves
-    spawn_timer = ENEMY_SPAWN_INTERVAL
+    # Everything the frame step simulates; menus keep stepping it in the background
+    battle = Battle(main_player, player_fleet, enemy_fleet, player_group, enemy_group, projectile_group,
+                    asteroid_field, location_data, spawn_timer=ENEMY_SPAWN_INTERVAL)
+    background_sim = get_background_sim()
+    # Quick-save battle snapshot (F5 saves, F9 restores)
+    quick_save = None
+    # Layout for group move orders (F cycles line / wedge / box / ring)
+    formation_kind = FORMATION_DEFAULT
     # Track current system name so we can detect inter-system jumps
     current_system_name = getattr(main_player, 'location_system', None)
 
@@ -489,7 +406,7 @@ def run_game():
         
         if cache_key not in hud_icon_cache:
             try:
-                icon = pygame.image.load(f"{PREVIEWS_DIR}/{filename}").convert_alpha()
+                icon = load_image(f"{PREVIEWS_DIR}/{filename}")
                 hud_icon_cache[cache_key] = icon
             except Exception:
                 hud_icon_cache[cache_key] = None
@@ -500,7 +417,7 @@ def run_game():
         """Load the HUD separator image."""
         if 'separator' not in hud_icon_cache:
             try:
-                sep = pygame.image.load(f"{PREVIEWS_DIR}/HudIcon_Separator.png").convert_alpha()
+                sep = load_image(f"{PREVIEWS_DIR}/HudIcon_Separator.png")
                 hud_icon_cache['separator'] = sep
             except Exception:
                 hud_icon_cache['separator'] = None
@@ -515,9 +432,11 @@ def run_game():
 
     while True:
         dt = clock.tick(FPS) / 1000.0
-        # Ignore huge dt spikes (e.g. when coming back from INTERNAL screen)
+        # Ignore huge dt spikes (e.g. after a blocking load or the jump cinematic)
         if dt > MAX_DT:      # threshold in seconds, tweak if you want
             dt = 0.0      # treat that frame as “paused"        
+        # Convert images the preloader has decoded since the last frame
+        preloader.pump()
         # Reload location data each frame to stay in sync with player's current location
         # This ensures asteroids/enemies spawn correctly when returning from star system map
         new_location_data = get_location_data(main_player)
@@ -619,12 +538,18 @@ def run_game():
 
             # Now update in-game location and respawn content for the new location
             location_data = new_location_data
-            # Clear old asteroids
+            # Clear old asteroids (the field keeps their mined-out deltas)
+            if asteroid_field is not None:
+                asteroid_field.close()
             asteroid_group.empty()
-            asteroids = spawn_asteroids_for_location(location_data)
-            for a in asteroids:
-                if isinstance(a, pygame.sprite.Sprite):
-                    asteroid_group.add(a)
+            asteroid_field = get_asteroid_field(
+                getattr(main_player, 'location_system', None),
+                getattr(main_player, 'location_area', None),
+                location_data,
+                group=asteroid_group,
+            )
+            battle.location_data = location_data
+            battle.asteroid_field = asteroid_field
 
             # Respawn station if at a station location
             station_group.empty()
@@ -632,39 +557,32 @@ def run_game():
             if station is not None and isinstance(station, pygame.sprite.Sprite):
                 station_group.add(station)
 
-            # Play hyperspace complete sound (asteroids/station now drawn)
-            try:
-                sound_manager = get_sound_manager()
-                sound_manager.on_hyperspace_complete()
-            except Exception:
-                pass
+            # Arrival (asteroids/station now drawn): sound and save subscribe
+            events.get_event_bus().publish(events.LocationChanged(
+                main_player, prev_system, prev_area,
+                current_system_name, getattr(main_player, 'location_area', None)))
 
             # Clear all enemies when location changes
-            enemy_fleet = []
+            enemy_fleet.clear()
             enemy_group.empty()
 
             # Restart enemy spawn timer when location changes
-            spawn_timer = ENEMY_SPAWN_INTERVAL
+            battle.spawn_timer = ENEMY_SPAWN_INTERVAL
         
-        # Heal player fleet if at a station
-        if location_data and location_data.get('type') == 'Station':
-            healing_rate = float(STATION_HEALING_RATE)  # HP per second
-            for ship in player_fleet:
-                if ship.health < ship.max_health:
-                    ship.heal(healing_rate * dt)
-                if ship.armor < ship.max_armor:
-                    ship.set_armor(ship.armor + healing_rate * dt)
-            
+        # Generate asteroid chunks around the view and evict far ones
+        if asteroid_field is not None:
+            asteroid_field.update(asteroid_view_rect)
+
         for event in pygame.event.get():
             # Handle custom save event posted by InventoryManager and other systems
             try:
                 if event.type == events.SAVE_GAME_EVENT:
                     try:
-                        from spacegame.core import save as _save
+                        from spacegame.core.save_scheduler import get_save_scheduler
                         owner = getattr(event, 'owner', None)
                         if owner is None:
                             owner = main_player
-                        _save.save_game(owner)
+                        get_save_scheduler().mark_dirty(owner)
                     except Exception:
                         pass
                     # do not process this event further
@@ -677,12 +595,29 @@ def run_game():
                 return "exit" # "exit"
             elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                 return "main_menu" # "main_menu"
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_f:
+                formation_kind = next_formation(formation_kind)
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F5:
+                quick_save = capture_battle(main_player, player_fleet, enemy_fleet, projectile_group,
+                                            asteroid_field, battle.spawn_timer)
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F9 and quick_save is not None:
+                restored = restore_battle(quick_save, main_player, player_group, enemy_group,
+                                          projectile_group, asteroid_field)
+                if restored is not None:
+                    # refill in place: the battle and open screens share these lists
+                    player_fleet[:], enemy_fleet[:], battle.spawn_timer = restored
             elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 clicked_ui = False  # Initialize click tracking
                 
                 # First: fleet management button
                 if fleet_btn.handle_event(event):
-                    res = internal_screen(main_player, player_fleet)
+                    from spacegame.screens.internal_screen import internal_screen
+                    with background_sim.running(battle):
+                        res = internal_screen(main_player, player_fleet)
+                    # the background simulation already covered the time away
+                    clock.tick()
+                    if res == "exit":
+                        return "exit"
                     if res == "to_game":
                         # Orange X from any internal screen chain: already back in game.
                         # Treat as a fresh slate; no extra action needed.
@@ -705,7 +640,10 @@ def run_game():
                         # Leftmost icon (i==0) opens the Galactic Map
                         if i == 0:
                             try:
-                                res = galactic_map_screen(main_player, player_fleet)
+                                from spacegame.screens.galactic_map_screen import galactic_map_screen
+                                with background_sim.running(battle):
+                                    res = galactic_map_screen(main_player, player_fleet)
+                                clock.tick()
                                 if res == "exit":
                                     return "exit"
                             except Exception:
@@ -716,7 +654,10 @@ def run_game():
                         if i == 1:
                             try:
                                 current_system = getattr(main_player, 'location_system', None) or 'Lazarus'
-                                res = star_system_map(main_player, player_fleet, system_name=current_system)
+                                from spacegame.screens.star_system_map import star_system_map
+                                with background_sim.running(battle):
+                                    res = star_system_map(main_player, player_fleet, system_name=current_system)
+                                clock.tick()
                                 if res == "exit":
                                     return "exit"
                             except Exception:
@@ -760,7 +701,7 @@ def run_game():
                     if selected_collectors:
                         # First: if clicking an asteroid, start mining
                         clicked_asteroid = None
-                        for a in asteroids:
+                        for a in asteroid_group:
                             if a.point_inside(event.pos):
                                 clicked_asteroid = a
                                 break
@@ -822,13 +763,20 @@ def run_game():
                             except Exception:
                                 pass
                     
-                    # Calculate the average position (center) of all selected shapes (formation center)
-                    center = sum((s.pos for s in selected_shapes), Vector2(0, 0)) / len(selected_shapes)
-                    for s in selected_shapes:
-                        s.mover.formation_offset = s.pos - center # Store each spaceship's offset from the formation center (to preserve relative positions)
                     center_target = Vector2(event.pos)  # Target point for the group movement is where the player right-clicked
+                    # Lay the selection out in the current formation, facing the move, with each
+                    # ship taking the slot that keeps total travel short and paths uncrossed
+                    offsets = plan_formation(selected_shapes, center_target, formation_kind)
+                    for s, offset in zip(selected_shapes, offsets):
+                        s.mover.formation_offset = offset
+                    # One flow field around asteroids / the station, shared by the whole group
+                    navigator = get_navigator()
+                    navigator.sync(asteroid_group, station_group)
+                    flow = navigator.field_to(center_target)
                     for s in selected_shapes:
-                        s.mover.set_target(center_target + s.mover.formation_offset) # Set individual targets so shapes move in formation relative to the clicked position
+                        s.mover.set_target(center_target + s.mover.formation_offset) # Each ship heads for its formation slot around the clicked position
+                        if flow is not None:
+                            s.mover.follow(flow, slack=s.mover.formation_offset.length())
                     
                     # Play move command sound
                     try:
@@ -837,181 +785,19 @@ def run_game():
                     except Exception:
                         pass
 
-        # --- Update cooldowns ---
-        for s in player_fleet + enemy_fleet:
-            s.update_cooldown(dt)
-        # Ensure fabrications are advanced/finalized even while in gameplay.
-        try:
-            fm = get_fabrication_manager(main_player)
-            if fm is not None:
-                fm.update()
-        except Exception:
-            pass
-        # Update expedition ship notifications (timers) via InventoryManager
-        try:
-            inv = getattr(main_player, 'inventory_manager', None)
-            if inv is not None:
-                inv.update(dt)
-        except Exception:
-            pass
-
-        # --- Update healing and mining for resource collectors ---
-        for collector in [s for s in player_fleet if isinstance(s, ResourceCollector)]:
-            collector.update_healing(dt)
-            collector.update_mining(dt)
-
-        # --- Update movement ---
-        for spaceship in player_fleet:
-            spaceship.mover.update(dt)
-        # --- Handle recalled fighters: fly back to main ship and re-dock ---
-        recalled_done = []
-        for spaceship in player_fleet:
-            if isinstance(spaceship, (Interceptor, ResourceCollector, PlasmaBomber)) and getattr(spaceship, "recalling", False):
-                # Always steer toward the main ship
-                spaceship.mover.set_target(main_player.pos)
-
-                # When close enough, mark for docking
-                if (spaceship.pos - main_player.pos).length() < 50:
-                    recalled_done.append(spaceship)
-
-        for craft in recalled_done:
-            # Remove from active ships; Hangar will take care of internal lists.
-            if craft in player_fleet:
-                player_fleet.remove(craft)
-
-            # Play ship docking sound
-            try:
-                sound_manager = get_sound_manager()
-                sound_manager.on_ship_docking()
-            except Exception:
-                pass
-
-            # Inform the Hangar (via InventoryManager) that this craft has successfully docked
-            # so the corresponding slot becomes ready again.
-            inv = getattr(main_player, 'inventory_manager', None)
-            if inv is None or getattr(inv, 'hangar', None) is None:
-                raise RuntimeError("Hangar/InventoryManager not available on main_player; migration required")
-            inv.hangar.on_recalled(craft)
-            try:
-                # ensure sprite is removed from any drawing groups
-                if isinstance(craft, pygame.sprite.Sprite):
-                    craft.kill()
-            except Exception:
-                pass
-        # Enemies: approach to within range, then hold
-        for e in enemy_fleet:
-            if player_fleet:
-                closest = min(player_fleet, key=lambda p: (p.pos - e.pos).length_squared())
-                dist = (closest.pos - e.pos).length()
-                if dist > e.fire_range * 0.95:
-                    e.mover.set_target(closest.pos)  # approach
-                else:
-                    e.mover.set_target(e.pos)  # hold & shoot
-            e.mover.update(dt)
-
-        # Sync sprite images/rects to mover state
-        try:
-            player_group.update(dt)
-        except Exception:
-            pass
-        try:
-            enemy_group.update(dt)
-        except Exception:
-            pass
-
-        # --- Enemy spawning (timed waves) ---
-        if ENEMY_SPAWN_INTERVAL > 0:
-            spawn_timer -= dt
-            if spawn_timer <= 0:
-                spawn_timer = ENEMY_SPAWN_INTERVAL
-                # Only spawn enemies if at an asteroid location
-                if location_data and location_data.get('type') == 'Asteroids':
-                    # spawn N pirates at random edge positions via helper
-                    spawn_enemy_wave(WIDTH, HEIGHT, location_data, enemy_group, enemy_fleet, count=ENEMY_SPAWN_COUNT)
-
-        # --- Auto-fire: both sides (delegated to helper) ---
-        handle_auto_fire(player_fleet, enemy_fleet, projectile_group, owner_is_enemy=False, color=(255,240,120), speed_factor=1.0)
-        handle_auto_fire(enemy_fleet, player_fleet, projectile_group, owner_is_enemy=True, color=(255,120,120), speed_factor=0.9)
-
-        # --- Update projectiles (group) & handle hits ---
-        projectile_group.update(dt)
-        # update effects (particles, explosions)
-        try:
-            effects.effects_group.update(dt)
-        except Exception:
-            pass
-
-        # --- Update projectiles (group) & handle hits ---
-        handle_projectile_collisions(projectile_group, player_fleet, enemy_fleet)
-
-
-
-        # Update hangar state for any light crafts that died this frame
-        dead_crafts = [
-            s for s in player_fleet
-            if isinstance(s, (Interceptor, ResourceCollector, PlasmaBomber)) and s.health <= 0.0
-        ]
-        for craft in dead_crafts:
-            # Play appropriate destruction sound
-            try:
-                sound_manager = get_sound_manager()
-                if isinstance(craft, ResourceCollector):
-                    sound_manager.on_unit_destroyed_collector()
-                elif isinstance(craft, (Interceptor, PlasmaBomber)):
-                    # Group interceptors and plasma bombers as strikegroup
-                    sound_manager.on_unit_destroyed_strikegroup()
-            except Exception:
-                pass
-            
-            inv = getattr(main_player, 'inventory_manager', None)
-            if inv is None or getattr(inv, 'hangar', None) is None:
-                raise RuntimeError("Hangar/InventoryManager not available on main_player; migration required")
-            inv.hangar.on_interceptor_dead(craft)
-            # handled above; asteroid drawing happens in the main draw section
-
-        prev_enemies = list(enemy_fleet)
-        prev_players = list(player_fleet)
-
-        enemy_fleet = [s for s in enemy_fleet if s.health > 0.0]
-        player_fleet = [s for s in player_fleet if s.health > 0.0]
-
-        # remove sprites for any ships that were filtered out
-        for e in prev_enemies:
-            if e not in enemy_fleet:
-                # Play destruction sound for enemy frigates
-                try:
-                    if isinstance(e, PirateFrigate):
-                        sound_manager = get_sound_manager()
-                        sound_manager.on_unit_destroyed_frigate()
-                except Exception:
-                    pass
-                try:
-                    e.kill()
-                except Exception:
-                    pass
-        for p in prev_players:
-            if p not in player_fleet:
-                try:
-                    p.kill()
-                except Exception:
-                    pass
+        battle.step(dt)
 
         # --- End game when ExpeditionShip dies ---
         if main_player.health <= 0:
             return "end"  # "end"
 
-
-        # --- Collisions (residual): small damage from touching using class-level DPS ---
-        handle_collisions(player_fleet, enemy_fleet, dt)
-
 # --- Draw ---
         screen.blit(background_img, (0, 0))
         # Draw asteroids under ships (prefer sprite group draw)
         try:
             asteroid_group.draw(screen)
         except Exception:
-            for a in asteroids:
-                a.draw(screen)
+            pass
 
         # Draw station if present
         try:
@@ -1159,19 +945,19 @@ def run_game():
                     preview_fn = n.get('preview')
                     if preview_fn:
                         try:
-                            icon = pygame.image.load(PREVIEWS_DIR + "/" + preview_fn).convert_alpha()
+                            icon = load_image(PREVIEWS_DIR + "/" + preview_fn)
                             icon_s = pygame.transform.smoothscale(icon, (icon_size, icon_size))
                             screen.blit(icon_s, (nx + padding, ny + (popup_h - icon_size) // 2))
                         except Exception:
                             try:
-                                icon = OREM_PREVIEW_IMG
+                                icon = ui_image("OREM_PREVIEW_IMG")
                                 icon_s = pygame.transform.smoothscale(icon, (icon_size, icon_size))
                                 screen.blit(icon_s, (nx + padding, ny + (popup_h - icon_size) // 2))
                             except Exception:
                                 pass
                     else:
                         try:
-                            icon = OREM_PREVIEW_IMG
+                            icon = ui_image("OREM_PREVIEW_IMG")
                             icon_s = pygame.transform.smoothscale(icon, (icon_size, icon_size))
                             screen.blit(icon_s, (nx + padding, ny + (popup_h - icon_size) // 2))
                         except Exception:
@@ -1186,6 +972,13 @@ def run_game():
                     # main text
                     text_surf = small_font.render(text, True, (108, 198, 219))
                     screen.blit(text_surf, (tx, ty))
+                elif notif_type == 'summary':
+                    # text-only summary (e.g. jobs settled while the game was closed)
+                    text = n.get('title', '')
+                    shadow_surf = small_font.render(text, True, (0, 0, 0))
+                    screen.blit(shadow_surf, (tx + 1, ty + 1))
+                    text_surf = small_font.render(text, True, (108, 198, 219))
+                    screen.blit(text_surf, (tx, ty))
                 else:
                     # default: ore delivery notification (existing behaviour)
                     try:
@@ -1193,11 +986,11 @@ def run_game():
                         preview_fn = n.get('preview')
                         if preview_fn:
                             try:
-                                icon = pygame.image.load(PREVIEWS_DIR + "/" + preview_fn).convert_alpha()
+                                icon = load_image(PREVIEWS_DIR + "/" + preview_fn)
                             except Exception:
-                                icon = OREM_PREVIEW_IMG
+                                icon = ui_image("OREM_PREVIEW_IMG")
                         else:
-                            icon = OREM_PREVIEW_IMG
+                            icon = ui_image("OREM_PREVIEW_IMG")
                         icon_s = pygame.transform.smoothscale(icon, (icon_size, icon_size))
                         screen.blit(icon_s, (nx + padding, ny + (popup_h - icon_size) // 2))
                     except Exception:
@@ -1216,4 +1009,12 @@ def run_game():
                     text_surf = small_font.render(text, True, (108, 198, 219))
                     screen.blit(text_surf, (tx, ty))
 
+        # Deliver this frame's deferred game events, then submit the sound
+        # requests they caused (merged, one pass over the voices)
+        events.get_event_bus().dispatch_pending()
+        try:
+            get_sound_manager().flush()
+        except Exception:
+            pass
+
         pygame.display.flip()
\ No newline at end of file
@@ -1,8 +1,5 @@
-import sys
 import pygame
 from spacegame.config import (
-    SCREEN_WIDTH,
-    SCREEN_HEIGHT,
     UI_BG_COLOR,
     UI_TAB_HEIGHT,
     UI_SECTION_TEXT_COLOR,
@@ -18,126 +15,60 @@ from spacegame.ui.fleet_management_ui import draw_tier_icon_image
 from spacegame.core.modules_manager import manager as modules_manager
 from spacegame.ui.nav_ui import create_tab_entries, draw_tabs, get_back_arrow_image
 from spacegame.ui.ui import UI_BG_IMG
+from spacegame.core.assets import load_image
+from spacegame.core.screen_manager import Screen, run_screen
 
 
-def internal_modules_screen(main_player, player_fleet):
+# Layout constants for module cards (inventory style); BOX_W scales with the window
+COLS = 2
+BOX_H = 110
+MARGIN_X = 22
+MARGIN_Y = 18
+
+
+class InternalModulesScreen(Screen):
     """Internal Modules management screen.
 
     Layout and navigation are intentionally very close to the Fabricator
     blueprint‑select screen so assets and behaviour stay consistent.
     """
-    screen = pygame.display.get_surface()
-    if screen is None:
-        screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-
-    width, height = screen.get_size()
-
-    # ---------- FONTS ----------
-    title_font = pygame.font.Font(None, 40)
-    tab_font = pygame.font.Font(None, 28)
-    close_font = pygame.font.Font(None, 40)
-    name_font = pygame.font.Font(None, 22)
-    small_font = pygame.font.Font(None, 20)
-
-    # ---------- TOP BAR ----------
-    TOP_BAR_HEIGHT = 96
-
-    # Title in the center of the top bar (moved slightly up to give more room to tabs)
-    title_text = "INTERNAL MODULES"
-    title_surf = title_font.render(title_text, True, UI_SECTION_TEXT_COLOR)
-    title_rect = title_surf.get_rect(center=(width // 2, TOP_BAR_HEIGHT // 2 - 22))
-
-    # Back arrow (left)
-    arrow_size = 32
-    back_arrow_rect = pygame.Rect(0, 0, arrow_size, arrow_size)
-    back_arrow_rect.center = (40, TOP_BAR_HEIGHT // 1.3)
-
-    # Close "X" (right)
-    close_surf = close_font.render("X", True, (255, 160, 40))
-    close_rect = close_surf.get_rect()
-    close_rect.center = (width - 40, TOP_BAR_HEIGHT // 1.25)
-    close_hit_rect = close_rect.inflate(16, 16)
-
-    # ---------- TABS ----------
-    tab_labels = ["STORAGE", "BRIDGE", "FABRICATION", "REFINING", "INTERNAL MODULES"]
-    icon_filenames = ["Nav_Icon_Inventory.png", "Nav_Icon_Bridge.png", "Nav_Icon_Fabricator.png", "Nav_Icon_Refinery.png", "Nav_Icon_InternalModules.png"]
-    selected_tab = 4  # INTERNAL MODULES selected
-
-    tab_entries, tabs_y = create_tab_entries(tab_labels, tab_font, width, TOP_BAR_HEIGHT, UI_TAB_HEIGHT, icon_filenames)
-    disabled_labels = set()
-    try:
-        
 
-        if not modules_manager.get_fabricators():
-            disabled_labels.add("FABRICATION")
-        if not modules_manager.get_refineries():
-            disabled_labels.add("REFINING")
-    except Exception:
-        pass
-
-    if 0 <= selected_tab < len(tab_entries) and tab_entries[selected_tab]["label"] in disabled_labels:
-        for i, e in enumerate(tab_entries):
-            if e["label"] not in disabled_labels:
-                selected_tab = i
-                break
-
-    # ---------- MODULE DATA ----------
-    # Use the centralised ModulesManager as the source of truth for equipped modules
-    SECTION_MODULES = modules_manager.get_internal_sections()
-
-    # Fabrication/Refining managers read from ModulesManager dynamically; no sync required
-
-    # Capacity limits are persisted on the player's ExpeditionShip so they
-    # survive navigation between screens. Fall back to sensible defaults
-    # if the attribute is missing on older ship objects.
-    SECTION_CAPACITY_LIMITS = getattr(main_player, 'internal_section_capacity_limits')
-    selected_section = 0  # 0 -> "01", 1 -> "02", 2 -> "03"
-
-    # Layout constants for module cards (inventory style)
-    COLS = 2
-    BOX_W = int(width * 0.22)
-    BOX_H = 110
-    MARGIN_X = 22
-    MARGIN_Y = 18
-
-    def layout_rects(num_items: int, top_y: int, left_start: int) -> list[pygame.Rect]:
-        rects: list[pygame.Rect] = []
-        for i in range(num_items):
-            row = i // COLS
-            col = i % COLS
-            x = left_start + col * (BOX_W + MARGIN_X)
-            y = top_y + row * (BOX_H + MARGIN_Y)
-            rects.append(pygame.Rect(x, y, BOX_W, BOX_H))
-        return rects
+    def setup(self):
+        width, height = self.width, self.height
 
-    # simple cache so we only load each preview image once
-    preview_cache: dict[str, pygame.Surface] = {}
+        # ---------- FONTS ----------
+        self.title_font = pygame.font.Font(None, 40)
+        self.tab_font = pygame.font.Font(None, 28)
+        close_font = pygame.font.Font(None, 40)
+        self.name_font = pygame.font.Font(None, 22)
+        self.small_font = pygame.font.Font(None, 20)
 
-    running = True
-    clock = pygame.time.Clock()
+        # ---------- TOP BAR ----------
+        TOP_BAR_HEIGHT = 96
 
-    while running:
-        clock.tick(60)
+        # Title in the center of the top bar (moved slightly up to give more room to tabs)
+        title_text = "INTERNAL MODULES"
+        self.title_surf = self.title_font.render(title_text, True, UI_SECTION_TEXT_COLOR)
+        self.title_rect = self.title_surf.get_rect(center=(width // 2, TOP_BAR_HEIGHT // 2 - 22))
 
-        # Recompute disabled tabs and sections each frame so UI stays in sync
-        disabled_labels = set()
-        if not modules_manager.get_fabricators():
-            disabled_labels.add("FABRICATION")
-        if not modules_manager.get_refineries():
-            disabled_labels.add("REFINING")
-        # ensure selected_tab isn't disabled
-        if 0 <= selected_tab < len(tab_entries) and tab_entries[selected_tab]["label"] in disabled_labels:
-            for i, e in enumerate(tab_entries):
-                if e["label"] not in disabled_labels:
-                    selected_tab = i
-                    break
+        # Back arrow (left)
+        arrow_size = 32
+        self.back_arrow_rect = pygame.Rect(0, 0, arrow_size, arrow_size)
+        self.back_arrow_rect.center = (40, TOP_BAR_HEIGHT // 1.3)
 
-        # Always read the authoritative sections from the central manager
-        SECTION_MODULES = modules_manager.get_internal_sections()
+        # Close "X" (right)
+        self.close_surf = close_font.render("X", True, (255, 160, 40))
+        self.close_rect = self.close_surf.get_rect()
+        self.close_rect.center = (width - 40, TOP_BAR_HEIGHT // 1.25)
+        self.close_hit_rect = self.close_rect.inflate(16, 16)
+
+        # ---------- TABS ----------
+        tab_labels = ["STORAGE", "BRIDGE", "FABRICATION", "REFINING", "INTERNAL MODULES"]
+        icon_filenames = ["Nav_Icon_Inventory.png", "Nav_Icon_Bridge.png", "Nav_Icon_Fabricator.png", "Nav_Icon_Refinery.png", "Nav_Icon_InternalModules.png"]
+        self.tab_entries, self.tabs_y = create_tab_entries(tab_labels, self.tab_font, width, TOP_BAR_HEIGHT, UI_TAB_HEIGHT, icon_filenames)
 
         # ---------- STATIC LAYOUT THAT DEPENDS ON NAV POSITION ----------
-        nav_top_y = tabs_y - 6
-        nav_bottom_y = tabs_y + UI_TAB_HEIGHT + 6
+        nav_bottom_y = self.tabs_y + UI_TAB_HEIGHT + 6
 
         # content area begins just under the nav strip, just like fabrication screen
         content_top = nav_bottom_y + 24
@@ -156,212 +87,253 @@ def internal_modules_screen(main_player, player_fleet):
 
         # Derived "02" and "03" rects stacked vertically under 01
         IDX_V_SPACING = idx_size + 24
-        idx_rects = [
+        self.idx_rects = [
             idx_rect_base,
             pygame.Rect(idx_rect_base.left, idx_rect_base.top + IDX_V_SPACING, idx_size, idx_size),
             pygame.Rect(idx_rect_base.left, idx_rect_base.top + 2 * IDX_V_SPACING, idx_size, idx_size),
         ]
 
         # Module cards appear to the right of the index column
-        cards_left_start = idx_rect_base.right + 80
-        cards_top_y = content_top
-        current_modules = SECTION_MODULES[selected_section]
-        card_rects = layout_rects(len(current_modules), cards_top_y, cards_left_start)
+        self.cards_left_start = idx_rect_base.right + 80
+        self.cards_top_y = content_top
+        self.box_w = int(width * 0.22)
 
         # Capacity panel on the far right
         capacity_panel_w = 260
-        capacity_panel_rect = pygame.Rect(width - capacity_panel_w - 40, content_top, capacity_panel_w, 140)
+        self.capacity_panel_rect = pygame.Rect(width - capacity_panel_w - 40, content_top, capacity_panel_w, 140)
 
         # Mount module button (bottom‑right)
         mount_btn_w = 240
         mount_btn_h = 64
-        mount_btn_rect = pygame.Rect(
+        self.mount_btn_rect = pygame.Rect(
             width - mount_btn_w - 40,
             height - mount_btn_h - 40,
             mount_btn_w,
             mount_btn_h,
         )
 
-        # ---------- EVENT HANDLING ----------
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                # If Fabrication/Refining are disabled, signal to skip
-                # back to the broader Internal screen instead of returning
-                # to a now-inaccessible main screen.
-                if "FABRICATION" in disabled_labels or "REFINING" in disabled_labels:
-                    return "to_internal"
-                return
+        # simple cache so we only load (and scale) each preview image once
+        self.preview_cache: dict[str, pygame.Surface] = {}
 
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                mx, my = event.pos
+    def layout_rects(self, num_items: int) -> list[pygame.Rect]:
+        rects: list[pygame.Rect] = []
+        for i in range(num_items):
+            row = i // COLS
+            col = i % COLS
+            x = self.cards_left_start + col * (self.box_w + MARGIN_X)
+            y = self.cards_top_y + row * (BOX_H + MARGIN_Y)
+            rects.append(pygame.Rect(x, y, self.box_w, BOX_H))
+        return rects
 
-                if back_arrow_rect.collidepoint(mx, my):
-                    if "FABRICATION" in disabled_labels or "REFINING" in disabled_labels:
-                        return "to_internal"
-                    return
+    def enter(self, main_player, player_fleet):
+        self.main_player = main_player
+        self.player_fleet = player_fleet
+        self.selected_tab = 4  # INTERNAL MODULES selected
+        self.selected_section = 0  # 0 -> "01", 1 -> "02", 2 -> "03"
+        # ModulesManager version / section the card layout was computed for
+        self.card_layout_key = None
+        self.update(0.0)
+
+    def resume(self, result):
+        if isinstance(result, int) and not isinstance(result, bool):
+            # module details: jump to the section the player picked there
+            self.selected_section = result
+        elif result is not None and result not in ("to_game", "to_internal"):
+            # module selection: (module, section_index) or a bare module
+            self.install_picked(result)
+        else:
+            super().resume(result)
+        self.selected_tab = 4
+
+    def install_picked(self, picked):
+        main_player = self.main_player
+        # `module_selection_screen` returns either a module or
+        # a (module, section_index) tuple. Support both forms
+        # for backwards-compatibility.
+        target_section = self.selected_section
+        picked_module = picked
+        try:
+            if isinstance(picked, tuple) and len(picked) >= 2:
+                picked_module, target_section = picked[0], int(picked[1])
+        except Exception:
+            picked_module = picked
 
-                if close_hit_rect.collidepoint(mx, my):
-                    return "to_game"
-
-                # Tabs
-                for idx, entry in enumerate(tab_entries):
-                    if entry["rect"].collidepoint(mx, my):
-                        label = entry["label"]
-                        # ignore clicks on disabled tabs
-                        if label in disabled_labels:
-                            break
-                        if label == "STORAGE":
-                            from spacegame.screens.inventory import inventory_screen
-
-                            res = inventory_screen(main_player, player_fleet)
-                            if res == "to_game":
-                                return "to_game"
-                            selected_tab = 0
-                        elif label == "FABRICATION":
-                            from spacegame.screens.fabrication_main_screen import fabrication_main_screen
-
-                            res = fabrication_main_screen(main_player, player_fleet)
-                            if res == "to_game":
-                                return "to_game"
-                            selected_tab = 2
-                        elif label == "REFINING":
-                            from spacegame.screens.refining_main_screen import refining_main_screen
-
-                            res = refining_main_screen(main_player, player_fleet)
-                            if res == "to_game":
-                                return "to_game"
-                            selected_tab = 3
-                        elif label == "INTERNAL MODULES":
-                            selected_tab = 4
-                        else:
-                            selected_tab = idx
-                        break
+        # If the module came from the player's inventory, try to remove
+        # it first from the unequipped modules list so it no longer
+        # appears there.
+        try:
+            inv_mgr = getattr(main_player, 'inventory_manager', None)
+            if inv_mgr is not None and hasattr(inv_mgr, 'remove_module'):
+                try:
+                    inv_mgr.remove_module(picked_module)
+                except Exception:
+                    pass
+        except Exception:
+            pass
 
-                # Section selector squares ("01", "02", "03")
-                for i, r in enumerate(idx_rects):
-                    if r.collidepoint(mx, my):
-                        selected_section = i
-                        break
+        # add the chosen module to the central modules manager
+        try:
+            modules_manager.install_module(target_section, picked_module)
+        except Exception:
+            pass
+        # Persist compatibility attribute on the player object
+        try:
+            setattr(main_player, 'installed_internal_modules', modules_manager.get_internal_sections())
+        except Exception:
+            pass
 
-                # Mount module button (no gameplay logic yet)
-                if mount_btn_rect.collidepoint(mx, my):
-                    # Open the module selection screen and allow the player to pick
-                    # a module for the currently selected section. If a module is
-                    # returned, append it to the SECTION_MODULES for that section.
-                    from spacegame.screens.module_selection_screen import module_selection_screen
-
-                    picked = module_selection_screen(main_player, player_fleet, selected_section, installed_sections=SECTION_MODULES)
-                    if picked is None:
-                        # user cancelled or closed the selection screen
-                        pass
-                    elif picked == "to_game":
-                        return "to_game"
-                    else:
-                        # `module_selection_screen` returns either a module or
-                        # a (module, section_index) tuple. Support both forms
-                        # for backwards-compatibility.
-                        target_section = selected_section
-                        picked_module = picked
-                        try:
-                            if isinstance(picked, tuple) and len(picked) >= 2:
-                                picked_module, target_section = picked[0], int(picked[1])
-                        except Exception:
-                            picked_module = picked
-
-                        # If the module came from the player's inventory, try to remove
-                        # it first from the unequipped modules list so it no longer
-                        # appears there.
-                        try:
-                            inv_mgr = getattr(main_player, 'inventory_manager', None)
-                            if inv_mgr is not None and hasattr(inv_mgr, 'remove_module'):
-                                try:
-                                    inv_mgr.remove_module(picked_module)
-                                except Exception:
-                                    pass
-                        except Exception:
-                            pass
-
-                        # add the chosen module to the central modules manager
-                        try:
-                            modules_manager.install_module(target_section, picked_module)
-                        except Exception:
-                            pass
-                        else:
-                            # update local view immediately so the UI reflects changes
-                            try:
-                                SECTION_MODULES = modules_manager.get_internal_sections()
-                                current_modules = SECTION_MODULES[selected_section]
-                                card_rects = layout_rects(len(current_modules), cards_top_y, cards_left_start)
-                            except Exception:
-                                pass
-                        # Persist compatibility attribute on the player object
-                        try:
-                            setattr(main_player, 'installed_internal_modules', modules_manager.get_internal_sections())
-                        except Exception:
-                            pass
-
-                        # Trigger autosave via InventoryManager if available
-                        try:
-                            inv_mgr = getattr(main_player, 'inventory_manager', None)
-                            if inv_mgr is not None and hasattr(inv_mgr, '_trigger_autosave'):
-                                try:
-                                    inv_mgr._trigger_autosave()
-                                except Exception:
-                                    pass
-                        except Exception:
-                            pass
-
-                        # No manager sync required; Fabrication/Refining managers
-                        # read from the central ModulesManager at runtime.
-
-                # Click on a module card should open the module details screen.
-                # The details screen will return a section index when the user
-                # clicks one of its section selector buttons; treat that as a
-                # navigation hint and set the selected_section accordingly.
-                for idx, r in enumerate(card_rects):
-                    if r.collidepoint(mx, my):
-                        from spacegame.screens.module_details_screen import module_details_screen
-
-                        # Pass the clicked module to the details screen so it can
-                        # present module-specific info. If `idx` is out-of-range
-                        # for `current_modules`, fall back to None.
-                        selected_mod = None
-                        try:
-                            selected_mod = current_modules[idx]
-                        except Exception:
-                            selected_mod = None
-
-                        res = module_details_screen(
-                            main_player,
-                            player_fleet,
-                            initial_section=selected_section,
-                            installed_sections=SECTION_MODULES,
-                            selected_module=selected_mod,
-                        )
-                        if res == "to_game":
-                            return "to_game"
-                        try:
-                            if isinstance(res, int):
-                                selected_section = res
-                        except Exception:
-                            pass
-                        break
+        # Trigger autosave via InventoryManager if available
+        try:
+            inv_mgr = getattr(main_player, 'inventory_manager', None)
+            if inv_mgr is not None and hasattr(inv_mgr, '_trigger_autosave'):
+                try:
+                    inv_mgr._trigger_autosave()
+                except Exception:
+                    pass
+        except Exception:
+            pass
+
+        # No manager sync required; Fabrication/Refining managers
+        # read from the central ModulesManager at runtime.
+        self.update(0.0)
+
+    def update(self, dt):
+        # Recompute disabled tabs and sections each frame so UI stays in sync
+        disabled_labels = set()
+        if not modules_manager.get_fabricators():
+            disabled_labels.add("FABRICATION")
+        if not modules_manager.get_refineries():
+            disabled_labels.add("REFINING")
+        self.disabled_labels = disabled_labels
+        # ensure selected_tab isn't disabled
+        tab_entries = self.tab_entries
+        if 0 <= self.selected_tab < len(tab_entries) and tab_entries[self.selected_tab]["label"] in disabled_labels:
+            for i, e in enumerate(tab_entries):
+                if e["label"] not in disabled_labels:
+                    self.selected_tab = i
+                    break
+
+        # Always read the authoritative sections from the central manager
+        self.SECTION_MODULES = modules_manager.get_internal_sections()
+        self.current_modules = self.SECTION_MODULES[self.selected_section]
+        # card layout only changes when the modules or the selected section do
+        layout_key = (modules_manager.version, self.selected_section)
+        if layout_key != self.card_layout_key:
+            self.card_rects = self.layout_rects(len(self.current_modules))
+            self.card_layout_key = layout_key
 
         # ---------- CAPACITY CALCULATION FOR CURRENT SECTION ----------
-        capacity_used = sum(m.capacity for m in current_modules)
-        # read per-section capacity from the ship (fallback to default list)
-        capacity_limits = getattr(main_player, 'internal_section_capacity_limits', SECTION_CAPACITY_LIMITS)
+        # Capacity limits are persisted on the player's ExpeditionShip so they
+        # survive navigation between screens.
+        capacity_used = modules_manager.section_capacity(self.selected_section)
+        capacity_limits = getattr(self.main_player, 'internal_section_capacity_limits', None) or []
         # clamp selected_section index
-        if selected_section < 0 or selected_section >= len(capacity_limits):
-            capacity_max = SECTION_CAPACITY_LIMITS[0] if capacity_limits else 0
+        if self.selected_section < 0 or self.selected_section >= len(capacity_limits):
+            capacity_max = capacity_limits[0] if capacity_limits else 0
+        else:
+            capacity_max = capacity_limits[self.selected_section]
+        self.clamped_used = min(capacity_used, capacity_max)
+        self.capacity_max = capacity_max
+        self.capacity_ratio = self.clamped_used / float(capacity_max) if capacity_max > 0 else 0.0
+
+    def leave(self):
+        # If Fabrication/Refining are disabled, signal to skip
+        # back to the broader Internal screen instead of returning
+        # to a now-inaccessible main screen.
+        if "FABRICATION" in self.disabled_labels or "REFINING" in self.disabled_labels:
+            self.manager.pop("to_internal")
         else:
-            capacity_max = capacity_limits[selected_section]
-        clamped_used = min(capacity_used, capacity_max)
-        capacity_ratio = clamped_used / float(capacity_max) if capacity_max > 0 else 0.0
+            self.manager.pop()
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.leave()
+            return
+
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            mx, my = event.pos
+
+            if self.back_arrow_rect.collidepoint(mx, my):
+                self.leave()
+                return
+
+            if self.close_hit_rect.collidepoint(mx, my):
+                self.manager.pop("to_game")
+                return
+
+            # Tabs
+            for idx, entry in enumerate(self.tab_entries):
+                if entry["rect"].collidepoint(mx, my):
+                    label = entry["label"]
+                    # ignore clicks on disabled tabs
+                    if label in self.disabled_labels:
+                        break
+                    if label != "INTERNAL MODULES" and self.open_tab(label, self.main_player, self.player_fleet):
+                        return
+                    self.selected_tab = idx
+                    break
+
+            # Section selector squares ("01", "02", "03")
+            for i, r in enumerate(self.idx_rects):
+                if r.collidepoint(mx, my):
+                    self.selected_section = i
+                    self.update(0.0)
+                    break
+
+            if self.mount_btn_rect.collidepoint(mx, my):
+                # Open the module selection screen and allow the player to pick
+                # a module for the currently selected section; the pick comes
+                # back through `resume`.
+                self.manager.push(
+                    "module_selection",
+                    self.main_player,
+                    self.player_fleet,
+                    self.selected_section,
+                    installed_sections=self.SECTION_MODULES,
+                )
+                return
+
+            # Click on a module card should open the module details screen.
+            # The details screen will return a section index when the user
+            # clicks one of its section selector buttons; `resume` treats that
+            # as a navigation hint and sets the selected_section accordingly.
+            for idx, r in enumerate(self.card_rects):
+                if r.collidepoint(mx, my):
+                    # Pass the clicked module to the details screen so it can
+                    # present module-specific info. If `idx` is out-of-range
+                    # for `current_modules`, fall back to None.
+                    try:
+                        selected_mod = self.current_modules[idx]
+                    except Exception:
+                        selected_mod = None
+                    self.manager.push(
+                        "module_details",
+                        self.main_player,
+                        self.player_fleet,
+                        initial_section=self.selected_section,
+                        installed_sections=self.SECTION_MODULES,
+                        selected_module=selected_mod,
+                    )
+                    return
+
+    def draw(self, screen):
+        width = self.width
+        tabs_y = self.tabs_y
+        title_font, tab_font = self.title_font, self.tab_font
+        name_font, small_font = self.name_font, self.small_font
+        title_surf, title_rect = self.title_surf, self.title_rect
+        back_arrow_rect = self.back_arrow_rect
+        close_surf, close_rect = self.close_surf, self.close_rect
+        tab_entries, selected_tab, disabled_labels = self.tab_entries, self.selected_tab, self.disabled_labels
+        idx_rects, selected_section = self.idx_rects, self.selected_section
+        current_modules, card_rects = self.current_modules, self.card_rects
+        preview_cache = self.preview_cache
+        capacity_panel_rect, mount_btn_rect = self.capacity_panel_rect, self.mount_btn_rect
+        clamped_used, capacity_max, capacity_ratio = self.clamped_used, self.capacity_max, self.capacity_ratio
+
+        # Nav band coordinates
+        nav_top_y = tabs_y - 6
+        nav_bottom_y = tabs_y + UI_TAB_HEIGHT + 6
 
         # ---------- DRAW ----------
         try:
@@ -399,7 +371,7 @@ def internal_modules_screen(main_player, player_fleet):
         screen.blit(close_surf, close_rect)
 
         # Tabs (draw using shared nav helper)
-        nav_top_y, nav_bottom_y = draw_tabs(screen, tab_entries, selected_tab, tabs_y, width, tab_font, disabled_labels=disabled_labels)
+        draw_tabs(screen, tab_entries, selected_tab, tabs_y, width, tab_font, disabled_labels=disabled_labels)
 
         # ---------- MAIN CONTENT ----------
 
@@ -489,21 +461,19 @@ def internal_modules_screen(main_player, player_fleet):
             thumb_y = rect.centery - thumb_h // 2
             thumb_rect = pygame.Rect(thumb_x, thumb_y, thumb_w, thumb_h)
 
-            preview_surf = None
+            # scaled thumbnails are kept between frames and visits
+            thumb_img = None
             filename = getattr(module, "preview_filename", None)
             if filename:
-                surf = preview_cache.get(filename)
-                if surf is None:
+                if filename not in preview_cache:
                     try:
-                        loaded = pygame.image.load(PREVIEWS_DIR + "/" + filename).convert_alpha()
-                        surf = loaded
+                        loaded = load_image(PREVIEWS_DIR + "/" + filename)
+                        preview_cache[filename] = pygame.transform.smoothscale(loaded, (thumb_w, thumb_h))
                     except Exception:
-                        surf = None
-                    preview_cache[filename] = surf
-                preview_surf = surf
+                        preview_cache[filename] = None
+                thumb_img = preview_cache[filename]
 
-            if preview_surf is not None:
-                thumb_img = pygame.transform.smoothscale(preview_surf, (thumb_w, thumb_h))
+            if thumb_img is not None:
                 screen.blit(thumb_img, thumb_rect)
             else:
                 pygame.draw.rect(screen, (40, 40, 60), thumb_rect)
@@ -624,4 +594,7 @@ def internal_modules_screen(main_player, player_fleet):
         screen.blit(line1_surf, line1_rect)
         screen.blit(line2_surf, line2_rect)
 
-        pygame.display.flip()
\ No newline at end of file
+
+def internal_modules_screen(main_player, player_fleet):
+    """Run the Internal Modules screen; returns "to_game", "to_internal" or None."""
+    return run_screen("internal_modules", main_player, player_fleet)
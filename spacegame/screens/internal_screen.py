@@ -1,9 +1,6 @@
-import sys
 import pygame
 from spacegame.ui.ui import Button, draw_health_bar, draw_armor_bar, UI_BG_IMG
 from spacegame.config import (
-    SCREEN_WIDTH, 
-    SCREEN_HEIGHT, 
     UI_BG_COLOR, 
     UI_TAB_HEIGHT, 
     UI_SECTION_BASE_COLOR, 
@@ -15,6 +12,7 @@ from spacegame.config import (
     )
 from spacegame.ui.nav_ui import create_tab_entries, draw_tabs, get_back_arrow_image
 from spacegame.core.modules_manager import manager as modules_manager
+from spacegame.core.screen_manager import Screen, run_screen
 
 
 def _load_icon(filename: str) -> pygame.Surface | None:
@@ -25,194 +23,195 @@ def _load_icon(filename: str) -> pygame.Surface | None:
         return None
 
 
-def internal_screen(main_player, player_fleet):
-    # Use the existing display surface if present; otherwise create one.
-    screen = pygame.display.get_surface()
-    if screen is None:
-        screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-
-    width, height = screen.get_size()
-
-    # ---------- FONTS ----------
-    title_font = pygame.font.Font(None, 40)
-    tab_font = pygame.font.Font(None, 28)
-    section_font = pygame.font.Font(None, 26)
-    close_font = pygame.font.Font(None, 40)
-
-    # ---------- TOP BAR ----------
-    TOP_BAR_HEIGHT = 96
-
-    # Title in the center of the top bar (moved slightly up to give more room to tabs)
-    title_text = "INTERNAL"
-    title_surf = title_font.render(title_text, True, UI_SECTION_TEXT_COLOR)
-    title_rect = title_surf.get_rect(center=(width // 2, TOP_BAR_HEIGHT // 2 - 22))
-
-    # Back arrow (left)
-    arrow_size = 32
-    back_arrow_rect = pygame.Rect(0, 0, arrow_size, arrow_size)
-    back_arrow_rect.center = (40, TOP_BAR_HEIGHT // 1.3)
-
-    # Close "X" (right)
-    close_surf = close_font.render("X", True, (255, 160, 40))
-    close_rect = close_surf.get_rect()
-    close_rect.center = (width - 40, TOP_BAR_HEIGHT // 1.25)
-    close_hit_rect = close_rect.inflate(16, 16)
-
-    # ---------- TABS ----------
-    tab_labels = ["EXTERNAL", "INTERNAL", "FLEET CONFIGURATION"]
-    icon_filenames = ["Nav_Icon_External.png", "Nav_Icon_Internal.png", "Nav_Icon_Loadout.png"]
-    selected_tab = 1  # INTERNAL initially selected
-
-    tab_entries, tabs_y = create_tab_entries(tab_labels, tab_font, width, TOP_BAR_HEIGHT, UI_TAB_HEIGHT, icon_filenames)
-    disabled_labels = set()
-    if not modules_manager.get_fabricators():
-        disabled_labels.add("FABRICATION")
-    if not modules_manager.get_refineries():
-        disabled_labels.add("REFINING")
-
-    # ---------- SECTION BUTTONS ----------
-    section_width = int(width * 0.32)
-    section_height = 56
-
-    def centered_rect(cx, cy):
-        return pygame.Rect(
-            cx - section_width // 2,
-            cy - section_height // 2,
-            section_width,
-            section_height,
-        )
+class InternalScreen(Screen):
+    """Ship interior hub: STORAGE / BRIDGE / FABRICATION / REFINING sections."""
+
+    def setup(self):
+        width, height = self.width, self.height
+
+        # ---------- FONTS ----------
+        title_font = pygame.font.Font(None, 40)
+        self.tab_font = pygame.font.Font(None, 28)
+        section_font = pygame.font.Font(None, 26)
+        close_font = pygame.font.Font(None, 40)
+
+        # ---------- TOP BAR ----------
+        TOP_BAR_HEIGHT = 96
+
+        # Title in the center of the top bar (moved slightly up to give more room to tabs)
+        title_text = "INTERNAL"
+        self.title_surf = title_font.render(title_text, True, UI_SECTION_TEXT_COLOR)
+        self.title_rect = self.title_surf.get_rect(center=(width // 2, TOP_BAR_HEIGHT // 2 - 22))
+
+        # Back arrow (left)
+        self.arrow_size = 32
+        self.back_arrow_rect = pygame.Rect(0, 0, self.arrow_size, self.arrow_size)
+        self.back_arrow_rect.center = (40, TOP_BAR_HEIGHT // 1.3)
+
+        # Close "X" (right)
+        self.close_surf = close_font.render("X", True, (255, 160, 40))
+        self.close_rect = self.close_surf.get_rect()
+        self.close_rect.center = (width - 40, TOP_BAR_HEIGHT // 1.25)
+        self.close_hit_rect = self.close_rect.inflate(16, 16)
+
+        # ---------- TABS ----------
+        tab_labels = ["EXTERNAL", "INTERNAL", "FLEET CONFIGURATION"]
+        icon_filenames = ["Nav_Icon_External.png", "Nav_Icon_Internal.png", "Nav_Icon_Loadout.png"]
+        self.tab_entries, self.tabs_y = create_tab_entries(tab_labels, self.tab_font, width, TOP_BAR_HEIGHT, UI_TAB_HEIGHT, icon_filenames)
+
+        # ---------- SECTION BUTTONS ----------
+        section_width = int(width * 0.32)
+        section_height = 56
+
+        def centered_rect(cx, cy):
+            return pygame.Rect(
+                cx - section_width // 2,
+                cy - section_height // 2,
+                section_width,
+                section_height,
+            )
 
-    # Positions adjusted
-    row1_y = int(height * 0.38)
-    row2_y = int(height * 0.66)
-    left_x = int(width * 0.26)
-    right_x = int(width * 0.70)
-
-    storage_center = (left_x, row1_y)
-    bridge_center = (right_x, row1_y)
-    fabrication_center = (left_x, row2_y)
-    refining_center = (right_x, row2_y)
-
-    storage_btn = Button(
-        centered_rect(*storage_center),
-        "STORAGE",
-        section_font,
-        base_color=UI_SECTION_BASE_COLOR,
-        hover_color=UI_SECTION_HOVER_COLOR,
-        text_color=UI_SECTION_TEXT_COLOR,
-    )
-    bridge_btn = Button(
-        centered_rect(*bridge_center),
-        "BRIDGE",
-        section_font,
-        base_color=UI_SECTION_BASE_COLOR,
-        hover_color=UI_SECTION_HOVER_COLOR,
-        text_color=UI_SECTION_TEXT_COLOR,
-    )
-    fabrication_btn = Button(
-        centered_rect(*fabrication_center),
-        "FABRICATION",
-        section_font,
-        base_color=UI_SECTION_BASE_COLOR,
-        hover_color=UI_SECTION_HOVER_COLOR,
-        text_color=UI_SECTION_TEXT_COLOR,
-    )
-    refining_btn = Button(
-        centered_rect(*refining_center),
-        "REFINING",
-        section_font,
-        base_color=UI_SECTION_BASE_COLOR,
-        hover_color=UI_SECTION_HOVER_COLOR,
-        text_color=UI_SECTION_TEXT_COLOR,
-    )
+        # Positions adjusted
+        row1_y = int(height * 0.38)
+        row2_y = int(height * 0.66)
+        left_x = int(width * 0.26)
+        right_x = int(width * 0.70)
+
+        storage_center = (left_x, row1_y)
+        bridge_center = (right_x, row1_y)
+        fabrication_center = (left_x, row2_y)
+        refining_center = (right_x, row2_y)
+
+        storage_btn = Button(
+            centered_rect(*storage_center),
+            "STORAGE",
+            section_font,
+            base_color=UI_SECTION_BASE_COLOR,
+            hover_color=UI_SECTION_HOVER_COLOR,
+            text_color=UI_SECTION_TEXT_COLOR,
+        )
+        bridge_btn = Button(
+            centered_rect(*bridge_center),
+            "BRIDGE",
+            section_font,
+            base_color=UI_SECTION_BASE_COLOR,
+            hover_color=UI_SECTION_HOVER_COLOR,
+            text_color=UI_SECTION_TEXT_COLOR,
+        )
+        fabrication_btn = Button(
+            centered_rect(*fabrication_center),
+            "FABRICATION",
+            section_font,
+            base_color=UI_SECTION_BASE_COLOR,
+            hover_color=UI_SECTION_HOVER_COLOR,
+            text_color=UI_SECTION_TEXT_COLOR,
+        )
+        refining_btn = Button(
+            centered_rect(*refining_center),
+            "REFINING",
+            section_font,
+            base_color=UI_SECTION_BASE_COLOR,
+            hover_color=UI_SECTION_HOVER_COLOR,
+            text_color=UI_SECTION_TEXT_COLOR,
+        )
 
-    section_buttons = [
-        ("STORAGE", storage_btn, "Nav_Icon_Inventory.png"),
-        ("BRIDGE", bridge_btn, "Nav_Icon_Bridge.png"),
-        ("FABRICATION", fabrication_btn, "Nav_Icon_Fabricator.png"),
-        ("REFINING", refining_btn, "Nav_Icon_Refinery.png"),
-    ]
-    
-    # Preload icons
-    icon_cache = {}
-    for name, btn, icon_file in section_buttons:
-        icon_cache[name] = _load_icon(icon_file)
-
-    # ---------- HEALTH BAR ----------
-    health_bar_width = int(width * 0.80)
-    health_bar_height = 14
-    health_bar_x = (width - health_bar_width) // 2
-    health_bar_y = height - 46
-
-    running = True
-    while running:
+        self.section_buttons = [
+            ("STORAGE", storage_btn, "Nav_Icon_Inventory.png"),
+            ("BRIDGE", bridge_btn, "Nav_Icon_Bridge.png"),
+            ("FABRICATION", fabrication_btn, "Nav_Icon_Fabricator.png"),
+            ("REFINING", refining_btn, "Nav_Icon_Refinery.png"),
+        ]
+
+        # Preload icons, scaled once to fit their icon boxes
+        self.ICON_BOX_SIZE = 34
+        self.icon_cache = {}
+        for name, btn, icon_file in self.section_buttons:
+            icon_surf = _load_icon(icon_file)
+            if icon_surf:
+                icon_surf = pygame.transform.smoothscale(icon_surf, (self.ICON_BOX_SIZE - 8, self.ICON_BOX_SIZE - 8))
+            self.icon_cache[name] = icon_surf
+
+        # ---------- HEALTH BAR ----------
+        self.health_bar_width = int(width * 0.80)
+        self.health_bar_height = 14
+        self.health_bar_x = (width - self.health_bar_width) // 2
+        self.health_bar_y = height - 46
+
+    def enter(self, main_player, player_fleet):
+        self.main_player = main_player
+        self.player_fleet = player_fleet
+        self.selected_tab = 1  # INTERNAL initially selected
+        self.update(0.0)
+
+    def resume(self, result):
+        # "to_internal" or None: stay in internal screen, don't return
+        super().resume(result)
+        # reset highlight back to INTERNAL after returning
+        self.selected_tab = 1
+
+    def update(self, dt):
         # Recompute disabled tabs each frame to stay in sync with ModulesManager
         disabled_labels = set()
         if not modules_manager.get_fabricators():
             disabled_labels.add("FABRICATION")
         if not modules_manager.get_refineries():
             disabled_labels.add("REFINING")
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
+        self.disabled_labels = disabled_labels
+
+    def handle_event(self, event):
+        main_player, player_fleet = self.main_player, self.player_fleet
+        disabled_labels = self.disabled_labels
+
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.manager.pop()
+            return
 
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            mx, my = event.pos
+
+            if self.back_arrow_rect.collidepoint(mx, my):
+                self.manager.pop()
                 return
 
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                mx, my = event.pos
-
-                if back_arrow_rect.collidepoint(mx, my):
-                    return
-
-                if close_hit_rect.collidepoint(mx, my):
-                    return "to_game"
-
-                # Tabs
-                for idx, entry in enumerate(tab_entries):
-                    if entry["rect"].collidepoint(mx, my):
-                        label = entry["label"]
-                        if label in disabled_labels:
-                            break
-                        if label == "FLEET CONFIGURATION":
-                            from spacegame.screens.fleet_management import (
-                                fleet_management_screen
-                            )
-
-                            res = fleet_management_screen(main_player, player_fleet)
-                            if res == "to_game":
-                                return "to_game"
-                            # reset highlight back to INTERNAL after returning
-                            selected_tab = 1
-                        else:
-                            selected_tab = idx
-                        break
+            if self.close_hit_rect.collidepoint(mx, my):
+                self.manager.pop("to_game")
+                return
 
-                for name, btn, icon_file in section_buttons:
-                    if btn.handle_event(event):
-                        if name == "STORAGE":
-                            from spacegame.screens.inventory import inventory_screen
-                            res = inventory_screen(main_player, player_fleet)
-                            if res == "to_game":
-                                return "to_game"
-                            # "to_internal" or None: stay in internal screen loop, don't return
-                        if name == "FABRICATION":
-                            # ignore if disabled
-                            if "FABRICATION" in disabled_labels:
-                                continue
-                            from spacegame.screens.fabrication_main_screen import fabrication_main_screen
-                            res = fabrication_main_screen(main_player, player_fleet)
-                            if res == "to_game":
-                                return "to_game"
-                        if name == "REFINING":
-                            # ignore if disabled
-                            if "REFINING" in disabled_labels:
-                                continue
-                            from spacegame.screens.refining_main_screen import refining_main_screen
-                            res = refining_main_screen(main_player, player_fleet)
-                            if res == "to_game":
-                                return "to_game"
+            # Tabs
+            for idx, entry in enumerate(self.tab_entries):
+                if entry["rect"].collidepoint(mx, my):
+                    label = entry["label"]
+                    if label in disabled_labels:
+                        break
+                    if label == "FLEET CONFIGURATION":
+                        self.manager.push("fleet_management", main_player, player_fleet)
+                        return
+                    else:
+                        self.selected_tab = idx
+                    break
+
+            for name, btn, icon_file in self.section_buttons:
+                if btn.handle_event(event):
+                    if name == "STORAGE":
+                        self.manager.push("inventory", main_player, player_fleet)
+                        return
+                    if name == "FABRICATION":
+                        # ignore if disabled
+                        if "FABRICATION" in disabled_labels:
+                            continue
+                        self.manager.push("fabrication_main", main_player, player_fleet)
+                        return
+                    if name == "REFINING":
+                        # ignore if disabled
+                        if "REFINING" in disabled_labels:
+                            continue
+                        self.manager.push("refining_main", main_player, player_fleet)
+                        return
+
+    def draw(self, screen):
+        width = self.width
+        main_player = self.main_player
+        disabled_labels = self.disabled_labels
 
         # ---------- DRAW ----------
         try:
@@ -221,8 +220,8 @@ def internal_screen(main_player, player_fleet):
             screen.fill(UI_BG_COLOR)
 
         # Nav band coordinates
-        nav_top_y = tabs_y - 6
-        nav_bottom_y = tabs_y + UI_TAB_HEIGHT + 6
+        nav_top_y = self.tabs_y - 6
+        nav_bottom_y = self.tabs_y + UI_TAB_HEIGHT + 6
 
         # Brighter strip behind all nav text/buttons
         pygame.draw.rect(
@@ -238,24 +237,25 @@ def internal_screen(main_player, player_fleet):
         )
 
         # Title (on top of nav background)
-        screen.blit(title_surf, title_rect)
+        screen.blit(self.title_surf, self.title_rect)
 
         # Back arrow (on top of nav background) - use image
         back_arrow_img = get_back_arrow_image()
         if back_arrow_img:
+            arrow_size = self.arrow_size
             arrow_scaled = pygame.transform.smoothscale(back_arrow_img, (arrow_size - 4, arrow_size - 4))
-            arrow_draw_rect = arrow_scaled.get_rect(center=back_arrow_rect.center)
+            arrow_draw_rect = arrow_scaled.get_rect(center=self.back_arrow_rect.center)
             screen.blit(arrow_scaled, arrow_draw_rect)
 
         # Close X (on top of nav background)
-        screen.blit(close_surf, close_rect)
+        screen.blit(self.close_surf, self.close_rect)
 
         # Tabs (draw using shared nav helper)
-        nav_top_y, nav_bottom_y = draw_tabs(screen, tab_entries, selected_tab, tabs_y, width, tab_font, disabled_labels=disabled_labels)
+        draw_tabs(screen, self.tab_entries, self.selected_tab, self.tabs_y, width, self.tab_font, disabled_labels=disabled_labels)
 
         # Section buttons + icon images
-        ICON_BOX_SIZE = 34
-        for name, btn, icon_file in section_buttons:
+        ICON_BOX_SIZE = self.ICON_BOX_SIZE
+        for name, btn, icon_file in self.section_buttons:
             # visually disable buttons when corresponding modules are not equipped
             if name == "FABRICATION" and "FABRICATION" in disabled_labels:
                 btn.text_color = (140, 140, 140)
@@ -280,13 +280,14 @@ def internal_screen(main_player, player_fleet):
             )
 
             # Draw icon image
-            icon_surf = icon_cache.get(name)
-            if icon_surf:
-                icon_scaled = pygame.transform.smoothscale(icon_surf, (ICON_BOX_SIZE - 8, ICON_BOX_SIZE - 8))
+            icon_scaled = self.icon_cache.get(name)
+            if icon_scaled:
                 icon_draw_rect = icon_scaled.get_rect(center=icon_box_rect.center)
                 screen.blit(icon_scaled, icon_draw_rect)
 
         # Health bar at the bottom
+        health_bar_x, health_bar_y = self.health_bar_x, self.health_bar_y
+        health_bar_width, health_bar_height = self.health_bar_width, self.health_bar_height
         if hasattr(main_player, "max_health") and main_player.max_health > 0:
             draw_health_bar(
                 screen,
@@ -323,4 +324,6 @@ def internal_screen(main_player, player_fleet):
                     1,
                 )
 
-        pygame.display.flip()
\ No newline at end of file
+
+def internal_screen(main_player, player_fleet):
+    return run_screen("internal", main_player, player_fleet)
@@ -31,13 +31,21 @@ class LoadingSprite(pygame.sprite.Sprite):
         self.rect = self.image.get_rect(center=self.rect.center)
 
 
-def loading_screen(preload_thread, message="Loading..."):
-    """Display an animated loading circle while `preload_thread` is alive.
+def loading_screen(task, message="Loading...", until_tier=None):
+    """Display an animated loading circle while `task` is loading.
 
-    This function takes over the main loop and returns when the thread finishes.
+    `task` is either a thread (the screen returns when it finishes) or an
+    `AssetPreloader`: the screen then pumps it every frame, shows a progress
+    bar, and returns once tier `until_tier` (default: the critical gameplay
+    tier) is loaded while later tiers keep streaming in.
     If the user closes the window it returns the string "exit".
     """
-    
+    from spacegame.core.assets import TIER_CRITICAL, TIER_NAMES
+
+    preloader = task if hasattr(task, "pump") else None
+    if until_tier is None:
+        until_tier = TIER_CRITICAL
+
     screen = pygame.display.get_surface()
     if screen is None:
         # fallback to standard size
@@ -53,6 +61,8 @@ def loading_screen(preload_thread, message="Loading..."):
     group = pygame.sprite.Group(sprite)
 
     font = pygame.font.Font(None, 28)
+    small_font = pygame.font.Font(None, 22)
+    bar_w, bar_h = 320, 8
 
     running = True
     while running:
@@ -64,6 +74,10 @@ def loading_screen(preload_thread, message="Loading..."):
                 # allow esc to cancel loading
                 return "exit"
 
+        if preloader is not None:
+            # convert decoded images while we wait; the frame has time to spare
+            preloader.pump(budget_ms=12.0)
+
         # update sprite
         group.update(dt)
 
@@ -75,10 +89,29 @@ def loading_screen(preload_thread, message="Loading..."):
         trect = text_s.get_rect(center=(width // 2, sprite.rect.bottom + 28))
         screen.blit(text_s, trect)
 
+        if preloader is not None:
+            frac = preloader.progress(until_tier)
+            bar = pygame.Rect(0, 0, bar_w, bar_h)
+            bar.center = (width // 2, trect.bottom + 22)
+            pygame.draw.rect(screen, (30, 45, 70), bar, border_radius=4)
+            fill = bar.copy()
+            fill.width = int(bar_w * frac)
+            if fill.width > 0:
+                pygame.draw.rect(screen, (108, 198, 219), fill, border_radius=4)
+            tier = min(preloader.loading_tier(), until_tier)
+            done = sum(preloader.done[:until_tier + 1])
+            total = sum(preloader.total[:until_tier + 1])
+            detail = f"{TIER_NAMES[tier]} {done}/{total}  {preloader.current}"
+            detail_s = small_font.render(detail, True, (130, 150, 175))
+            screen.blit(detail_s, detail_s.get_rect(center=(width // 2, bar.bottom + 18)))
+
         pygame.display.flip()
 
-        # stop when the preload thread finishes
-        if not preload_thread.is_alive():
+        # stop when the preload finishes (or the awaited tier is in)
+        if preloader is not None:
+            if preloader.tier_done(until_tier):
+                running = False
+        elif not task.is_alive():
             running = False
 
     return None
@@ -1,6 +1,7 @@
 import pygame
-from spacegame.ui.ui import Button, UI_BG_MAINMENU_IMG
+from spacegame.ui.ui import Button, ui_image
 from spacegame.config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
+from spacegame.core import startup
 
 def main():
     pygame.display.set_caption("SpaceGame - Main Menu")
@@ -36,7 +37,7 @@ def main():
 
         # Blit the main menu background image
         try:
-            screen.blit(UI_BG_MAINMENU_IMG, (0, 0))
+            screen.blit(ui_image("UI_BG_MAINMENU_IMG"), (0, 0))
         except Exception:
             # Fallback: fill with solid color if image is missing
             screen.fill((15, 15, 20))
@@ -51,4 +52,5 @@ def main():
         exit_button.draw(screen)
 
         pygame.display.flip()
+        startup.first_frame_shown()
         clock.tick(FPS)
\ No newline at end of file
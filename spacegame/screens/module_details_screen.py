@@ -1,8 +1,5 @@
-import sys
 import pygame
 from spacegame.config import (
-    SCREEN_WIDTH,
-    SCREEN_HEIGHT,
     UI_BG_COLOR,
     UI_TAB_HEIGHT,
     UI_SECTION_TEXT_COLOR,
@@ -20,90 +17,57 @@ from spacegame.core.modules_manager import manager as modules_manager
 from spacegame.ui.nav_ui import create_tab_entries, draw_tabs, get_back_arrow_image
 from spacegame.ui.ui import UI_BG_IMG
 from spacegame.ui.ui import draw_plus_circle, drawCornerFrame
+from spacegame.core.assets import load_image
+from spacegame.core.screen_manager import Screen, run_screen
 
 
-def module_details_screen(main_player, player_fleet, initial_section=1, installed_sections=None, selected_module=None, selected_module_index=0):
-    """Internal Modules management screen.
+class ModuleDetailsScreen(Screen):
+    """Details of one installed module, with a DISMOUNT button.
 
     Layout and navigation are intentionally very close to the Fabricator
     blueprint‑select screen so assets and behaviour stay consistent.
+    Pops the section index to show when a section square is clicked or the
+    module is dismounted.
     """
-    screen = pygame.display.get_surface()
-    if screen is None:
-        screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-
-    width, height = screen.get_size()
-
-    # ---------- FONTS ----------
-    title_font = pygame.font.Font(None, 40)
-    tab_font = pygame.font.Font(None, 28)
-    close_font = pygame.font.Font(None, 40)
-    name_font = pygame.font.Font(None, 22)
-    small_font = pygame.font.Font(None, 20)
-
-    # ---------- TOP BAR ----------
-    TOP_BAR_HEIGHT = 96
-
-    # Title in the center of the top bar (moved slightly up to give more room to tabs)
-    title_text = "INTERNAL MODULES"
-    title_surf = title_font.render(title_text, True, UI_SECTION_TEXT_COLOR)
-    title_rect = title_surf.get_rect(center=(width // 2, TOP_BAR_HEIGHT // 2 - 22))
-
-    # Back arrow (left)
-    arrow_size = 32
-    back_arrow_rect = pygame.Rect(0, 0, arrow_size, arrow_size)
-    back_arrow_rect.center = (40, TOP_BAR_HEIGHT // 1.3)
-
-    # Close "X" (right)
-    close_surf = close_font.render("X", True, (255, 160, 40))
-    close_rect = close_surf.get_rect()
-    close_rect.center = (width - 40, TOP_BAR_HEIGHT // 1.25)
-    close_hit_rect = close_rect.inflate(16, 16)
-
-    # ---------- TABS ----------
-    tab_labels = ["STORAGE", "BRIDGE", "FABRICATION", "REFINING", "INTERNAL MODULES"]
-    icon_filenames = ["Nav_Icon_Inventory.png", "Nav_Icon_Bridge.png", "Nav_Icon_Fabricator.png", "Nav_Icon_Refinery.png", "Nav_Icon_InternalModules.png"]
-    selected_tab = 4  # INTERNAL MODULES selected
-
-    tab_entries, tabs_y = create_tab_entries(tab_labels, tab_font, width, TOP_BAR_HEIGHT, UI_TAB_HEIGHT, icon_filenames)
-    # Grey-out/selectability: disable FABRICATION/REFINING when none equipped
-    disabled_labels = set()
-    if not modules_manager.get_fabricators():
-        disabled_labels.add("FABRICATION")
-    if not modules_manager.get_refineries():
-        disabled_labels.add("REFINING")
-
-    # clamp selected_tab to a non-disabled tab if necessary
-    if 0 <= selected_tab < len(tab_entries) and tab_entries[selected_tab]["label"] in disabled_labels:
-        for i, e in enumerate(tab_entries):
-            if e["label"] not in disabled_labels:
-                selected_tab = i
-                break
-
-    # ---------- MODULE DATA ----------
-    # Use the centralised ModulesManager as the source of truth for equipped modules.
-    SECTION_MODULES = modules_manager.get_internal_sections()
-    # allow caller to override the visible installed sections (caller may pass
-    # the live SECTION_MODULES from another screen so navigation persists)
-    if installed_sections is not None:
-        SECTION_MODULES = installed_sections
-
-    # Fabrication/Refining managers read from ModulesManager dynamically, no sync needed
-
-    selected_section = initial_section  # 0 -> "front", 1 -> "middle", 2 -> "back"
-
-    # simple cache so we only load each preview image once
-    preview_cache: dict[str, pygame.Surface] = {}
-
-    running = True
-    clock = pygame.time.Clock()
-
-    while running:
-        clock.tick(60)
+
+    def setup(self):
+        width, height = self.width, self.height
+
+        # ---------- FONTS ----------
+        title_font = pygame.font.Font(None, 40)
+        self.tab_font = pygame.font.Font(None, 28)
+        close_font = pygame.font.Font(None, 40)
+        self.module_title_font = pygame.font.Font(None, 36)
+        self.desc_font = pygame.font.Font(None, 20)
+        self.stat_label_font = pygame.font.Font(None, 20)
+        self.stat_value_font = pygame.font.Font(None, 20)
+
+        # ---------- TOP BAR ----------
+        TOP_BAR_HEIGHT = 96
+
+        # Title in the center of the top bar (moved slightly up to give more room to tabs)
+        title_text = "INTERNAL MODULES"
+        self.title_surf = title_font.render(title_text, True, UI_SECTION_TEXT_COLOR)
+        self.title_rect = self.title_surf.get_rect(center=(width // 2, TOP_BAR_HEIGHT // 2 - 22))
+
+        # Back arrow (left)
+        self.arrow_size = 32
+        self.back_arrow_rect = pygame.Rect(0, 0, self.arrow_size, self.arrow_size)
+        self.back_arrow_rect.center = (40, TOP_BAR_HEIGHT // 1.3)
+
+        # Close "X" (right)
+        self.close_surf = close_font.render("X", True, (255, 160, 40))
+        self.close_rect = self.close_surf.get_rect()
+        self.close_rect.center = (width - 40, TOP_BAR_HEIGHT // 1.25)
+        self.close_hit_rect = self.close_rect.inflate(16, 16)
+
+        # ---------- TABS ----------
+        tab_labels = ["STORAGE", "BRIDGE", "FABRICATION", "REFINING", "INTERNAL MODULES"]
+        icon_filenames = ["Nav_Icon_Inventory.png", "Nav_Icon_Bridge.png", "Nav_Icon_Fabricator.png", "Nav_Icon_Refinery.png", "Nav_Icon_InternalModules.png"]
+        self.tab_entries, self.tabs_y = create_tab_entries(tab_labels, self.tab_font, width, TOP_BAR_HEIGHT, UI_TAB_HEIGHT, icon_filenames)
 
         # ---------- STATIC LAYOUT THAT DEPENDS ON NAV POSITION ----------
-        nav_top_y = tabs_y - 6
-        nav_bottom_y = tabs_y + UI_TAB_HEIGHT + 6
+        nav_bottom_y = self.tabs_y + UI_TAB_HEIGHT + 6
 
         # content area begins just under the nav strip, just like fabrication screen
         content_top = nav_bottom_y + 24
@@ -114,36 +78,27 @@ def module_details_screen(main_player, player_fleet, initial_section=1, installe
         card_y = content_top
         card_w = int(width * 0.38)
         card_h = int(height * 0.64)
-        card_rect = pygame.Rect(card_x, card_y, card_w, card_h)
+        self.card_rect = card_rect = pygame.Rect(card_x, card_y, card_w, card_h)
 
         # Base section rect — positions and size identical to fabrication screen
         idx_size = 96
-        idx_rect_base = pygame.Rect(card_rect.left + 16, card_rect.top + 16, idx_size, idx_size)
+        self.idx_rect_base = idx_rect_base = pygame.Rect(card_rect.left + 16, card_rect.top + 16, idx_size, idx_size)
 
         # Derived section rects stacked vertically
         IDX_V_SPACING = idx_size + 24
-        idx_rects = [
+        self.idx_rects = [
             idx_rect_base,
             pygame.Rect(idx_rect_base.left, idx_rect_base.top + IDX_V_SPACING, idx_size, idx_size),
             pygame.Rect(idx_rect_base.left, idx_rect_base.top + 2 * IDX_V_SPACING, idx_size, idx_size),
         ]
 
-        # determine which module instance to display for the screen
-        if selected_module is not None:
-            module_instance = selected_module
-        else:
-                try:
-                    module_instance = SECTION_MODULES[selected_section][0]
-                except Exception:
-                    module_instance = None
-
         # center big rect (used for plus-circle UI and click actions)
         plus_radius = 120
-        preview_center = (width // 2, height // 2)
+        self.preview_center = (width // 2, height // 2)
         big_rect_pad = 100
-        big_rect = pygame.Rect(
-            preview_center[0] - plus_radius - big_rect_pad,
-            preview_center[1] - plus_radius - big_rect_pad,
+        self.big_rect = pygame.Rect(
+            self.preview_center[0] - plus_radius - big_rect_pad,
+            self.preview_center[1] - plus_radius - big_rect_pad,
             (plus_radius + big_rect_pad) * 2,
             (plus_radius + big_rect_pad) * 2,
         )
@@ -151,124 +106,166 @@ def module_details_screen(main_player, player_fleet, initial_section=1, installe
         # RIGHT PANEL + DISMOUNT BUTTON (copy size/positioning used in
         # fabrication_bpdetails_screen for the build button)
         right_panel_w = 340
-        right_rect = pygame.Rect(
+        self.right_rect = pygame.Rect(
             width - right_panel_w - 40,
             card_rect.top,
             right_panel_w,
             140,
         )
-        
+
         dismount_btn_h = 64
-        dismount_btn_rect = pygame.Rect(
-            right_rect.left,
+        self.dismount_btn_rect = pygame.Rect(
+            self.right_rect.left,
             height - dismount_btn_h - 40,
             right_panel_w,
             dismount_btn_h,
         )
 
-        # no bottom button in the details screen
+        # simple cache so we only load (and scale) each preview image once
+        self.preview_cache: dict[str, pygame.Surface] = {}
+
+    def enter(self, main_player, player_fleet, initial_section=1, installed_sections=None, selected_module=None, selected_module_index=0):
+        self.main_player = main_player
+        self.player_fleet = player_fleet
+        self.selected_tab = 4  # INTERNAL MODULES selected
+        self.selected_section = initial_section  # 0 -> "front", 1 -> "middle", 2 -> "back"
+        # allow caller to override the visible installed sections (caller may pass
+        # the live SECTION_MODULES from another screen so navigation persists)
+        self.installed_sections = installed_sections
+        self.selected_module = selected_module
+        self.update(0.0)
+
+    def resume(self, result):
+        super().resume(result)
+        self.selected_tab = 4
+
+    def update(self, dt):
+        # Grey-out/selectability: disable FABRICATION/REFINING when none equipped
+        disabled_labels = set()
+        if not modules_manager.get_fabricators():
+            disabled_labels.add("FABRICATION")
+        if not modules_manager.get_refineries():
+            disabled_labels.add("REFINING")
+        self.disabled_labels = disabled_labels
+
+        # clamp selected_tab to a non-disabled tab if necessary
+        tab_entries = self.tab_entries
+        if 0 <= self.selected_tab < len(tab_entries) and tab_entries[self.selected_tab]["label"] in disabled_labels:
+            for i, e in enumerate(tab_entries):
+                if e["label"] not in disabled_labels:
+                    self.selected_tab = i
+                    break
 
-        # ---------- EVENT HANDLING ----------
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
+        # determine which module instance to display for the screen
+        if self.selected_module is not None:
+            self.module_instance = self.selected_module
+        else:
+            # Use the centralised ModulesManager as the source of truth for equipped modules.
+            SECTION_MODULES = self.installed_sections
+            if SECTION_MODULES is None:
+                SECTION_MODULES = modules_manager.get_internal_sections()
+            try:
+                self.module_instance = SECTION_MODULES[self.selected_section][0]
+            except Exception:
+                self.module_instance = None
+
+    def leave(self):
+        if "FABRICATION" in self.disabled_labels or "REFINING" in self.disabled_labels:
+            self.manager.pop("to_internal")
+        else:
+            self.manager.pop()
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.leave()
+            return
+
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            mx, my = event.pos
 
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                if "FABRICATION" in disabled_labels or "REFINING" in disabled_labels:
-                    return "to_internal"
+            if self.back_arrow_rect.collidepoint(mx, my):
+                self.leave()
                 return
 
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                mx, my = event.pos
+            if self.close_hit_rect.collidepoint(mx, my):
+                self.manager.pop("to_game")
+                return
 
-                if back_arrow_rect.collidepoint(mx, my):
-                    if "FABRICATION" in disabled_labels or "REFINING" in disabled_labels:
-                        return "to_internal"
+            # Tabs
+            for idx, entry in enumerate(self.tab_entries):
+                if entry["rect"].collidepoint(mx, my):
+                    label = entry["label"]
+                    # ignore clicks on disabled tabs
+                    if label in self.disabled_labels:
+                        break
+                    if label != "INTERNAL MODULES" and self.open_tab(label, self.main_player, self.player_fleet):
+                        return
+                    self.selected_tab = idx
+                    break
+
+            # Section selector squares ("01", "02", "03") — clicking
+            # any of these should return control to the calling screen with
+            # the chosen section so the caller can show that section.
+            for i, r in enumerate(self.idx_rects):
+                if r.collidepoint(mx, my):
+                    self.manager.pop(i)
                     return
 
-                if close_hit_rect.collidepoint(mx, my):
-                    return "to_game"
-
-                # Tabs
-                for idx, entry in enumerate(tab_entries):
-                    if entry["rect"].collidepoint(mx, my):
-                        label = entry["label"]
-                        # ignore clicks on disabled tabs
-                        if label in disabled_labels:
-                            break
-                        if label == "STORAGE":
-                            from spacegame.screens.inventory import inventory_screen
-
-                            res = inventory_screen(main_player, player_fleet)
-                            if res == "to_game":
-                                return "to_game"
-                            selected_tab = 0
-                        elif label == "FABRICATION":
-                            from spacegame.screens.fabrication_main_screen import fabrication_main_screen
-
-                            res = fabrication_main_screen(main_player, player_fleet)
-                            if res == "to_game":
-                                return "to_game"
-                            selected_tab = 2
-                        elif label == "REFINING":
-                            from spacegame.screens.refining_main_screen import refining_main_screen
-
-                            res = refining_main_screen(main_player, player_fleet)
-                            if res == "to_game":
-                                return "to_game"
-                            selected_tab = 3
-                        elif label == "INTERNAL MODULES":
-                            selected_tab = 4
-                        else:
-                            selected_tab = idx
-                        break
+            # central big rect is non-interactive; handle DISMOUNT button
+            if self.dismount_btn_rect.collidepoint(mx, my):
+                self.dismount()
+                return
+
+    def dismount(self):
+        # Only dismount if we have a valid module_instance and it
+        # is currently installed in the selected section.
+        main_player = self.main_player
+        module_instance = self.module_instance
+        selected_section = self.selected_section
+        if module_instance is None:
+            return
+
+        # remove from central manager
+        try:
+            modules_manager.remove_module(selected_section, module_instance)
+        except Exception:
+            pass
 
-                # Section selector squares ("01", "02", "03") — clicking
-                # any of these should return control to the calling screen with
-                # the chosen section so the caller can show that section.
-                for i, r in enumerate(idx_rects):
-                    if r.collidepoint(mx, my):
-                        return i
-
-                # central big rect is non-interactive; handle DISMOUNT button
-                if dismount_btn_rect.collidepoint(mx, my):
-                    # Only dismount if we have a valid module_instance and it
-                    # is currently installed in the selected section.
-                        try:
-                            if module_instance is None:
-                                continue
-                        except Exception:
-                            continue
-
-                        # remove from central manager
-                        try:
-                            modules_manager.remove_module(selected_section, module_instance)
-                        except Exception:
-                            pass
-
-                        # persist compatibility attribute on player
-                        try:
-                            setattr(main_player, 'installed_internal_modules', modules_manager.get_internal_sections())
-                        except Exception:
-                            pass
-
-                        # add the module to the unequipped inventory
-                        try:
-                            inv_mgr = getattr(main_player, 'inventory_manager', None)
-                            if inv_mgr is not None and hasattr(inv_mgr, 'add_module'):
-                                inv_mgr.add_module(module_instance)
-                        except Exception:
-                            pass
-
-                        # Return to caller, signalling the selected section so
-                        # the caller returns with that section open
-                        return selected_section
-
-                # Left-derivered module area: we don't currently display module
-                # cards in this details screen, but it is useful if a caller
-                # passed a specific `selected_module` and wants to interact
-                # with the material. No per-card clicks are handled here.
+        # persist compatibility attribute on player
+        try:
+            setattr(main_player, 'installed_internal_modules', modules_manager.get_internal_sections())
+        except Exception:
+            pass
+
+        # add the module to the unequipped inventory
+        try:
+            inv_mgr = getattr(main_player, 'inventory_manager', None)
+            if inv_mgr is not None and hasattr(inv_mgr, 'add_module'):
+                inv_mgr.add_module(module_instance)
+        except Exception:
+            pass
+
+        # Return to caller, signalling the selected section so
+        # the caller returns with that section open
+        self.manager.pop(selected_section)
+
+    def draw(self, screen):
+        width = self.width
+        tabs_y = self.tabs_y
+        tab_font = self.tab_font
+        title_surf, title_rect = self.title_surf, self.title_rect
+        back_arrow_rect, arrow_size = self.back_arrow_rect, self.arrow_size
+        close_surf, close_rect = self.close_surf, self.close_rect
+        tab_entries, selected_tab, disabled_labels = self.tab_entries, self.selected_tab, self.disabled_labels
+        card_rect, idx_rect_base, idx_rects = self.card_rect, self.idx_rect_base, self.idx_rects
+        selected_section, module_instance = self.selected_section, self.module_instance
+        big_rect, preview_center = self.big_rect, self.preview_center
+        right_rect, dismount_btn_rect = self.right_rect, self.dismount_btn_rect
+        preview_cache = self.preview_cache
+
+        # Nav band coordinates
+        nav_top_y = tabs_y - 6
+        nav_bottom_y = tabs_y + UI_TAB_HEIGHT + 6
 
         # ---------- DRAW ----------
         try:
@@ -314,7 +311,7 @@ def module_details_screen(main_player, player_fleet, initial_section=1, installe
         screen.blit(close_surf, close_rect)
 
         # Tabs (draw using shared nav helper)
-        nav_top_y, nav_bottom_y = draw_tabs(screen, tab_entries, selected_tab, tabs_y, width, tab_font, disabled_labels=disabled_labels)
+        draw_tabs(screen, tab_entries, selected_tab, tabs_y, width, tab_font, disabled_labels=disabled_labels)
 
         # ---------- MAIN CONTENT ----------
         def draw_index_square(rect: pygame.Rect, label: str, selected: bool):
@@ -400,7 +397,7 @@ def module_details_screen(main_player, player_fleet, initial_section=1, installe
 
         # module_instance determined earlier (before event handling)
 
-        title_font = pygame.font.Font(None, 36)
+        title_font = self.module_title_font
         module_title_text = (module_instance.name.upper() if module_instance else "EMPTY")
         module_title = title_font.render(module_title_text, True, UI_SECTION_TEXT_COLOR)
         module_title_rect = module_title.get_rect()
@@ -408,7 +405,7 @@ def module_details_screen(main_player, player_fleet, initial_section=1, installe
         screen.blit(module_title, module_title_rect)
 
         # description lines depend on which module type we're showing
-        desc_font = pygame.font.Font(None, 20)
+        desc_font = self.desc_font
         if isinstance(module_instance, RefineryModule):
             desc_lines = [
                 "A standard refinery module, used for",
@@ -430,8 +427,8 @@ def module_details_screen(main_player, player_fleet, initial_section=1, installe
             dy += s.get_height() + 2
 
         # Module stats placed under description — render with connecting underline
-        stat_label_font = pygame.font.Font(None, 20)
-        stat_value_font = pygame.font.Font(None, 20)
+        stat_label_font = self.stat_label_font
+        stat_value_font = self.stat_value_font
         stat_x = details_x
         stat_y = dy + 12
 
@@ -496,38 +493,26 @@ def module_details_screen(main_player, player_fleet, initial_section=1, installe
         screen.blit(line2, (text_x, start_y + line1.get_height() + 4))
 
         # ----- Center big plus-circle (refinery production) -----
-        plus_radius = 120
-        preview_center = (width // 2, height // 2)
-        big_rect_pad = 100
-        big_rect = pygame.Rect(
-            preview_center[0] - plus_radius - big_rect_pad,
-            preview_center[1] - plus_radius - big_rect_pad,
-            (plus_radius + big_rect_pad) * 2,
-            (plus_radius + big_rect_pad) * 2,
-        )
-
         # Draw the module preview image centered inside the big rect instead
         filename = getattr(module_instance, 'preview_filename', None)
-        preview_surf = None
+        img = None
         if filename:
-            preview_surf = preview_cache.get(filename)
-            if preview_surf is None:
+            if filename not in preview_cache:
+                # scaled once to fit comfortably inside the big rect, then reused
                 try:
-                    loaded = pygame.image.load(PREVIEWS_DIR + "/" + filename).convert_alpha()
-                    preview_surf = loaded
+                    loaded = load_image(PREVIEWS_DIR + "/" + filename)
+                    max_w = int(big_rect.width * 0.82)
+                    max_h = int(big_rect.height * 0.82)
+                    surf_w, surf_h = loaded.get_size()
+                    scale = min(max_w / surf_w, max_h / surf_h, 1.0)
+                    target_w = int(surf_w * scale)
+                    target_h = int(surf_h * scale)
+                    preview_cache[filename] = pygame.transform.smoothscale(loaded, (target_w, target_h))
                 except Exception:
-                    preview_surf = None
-                preview_cache[filename] = preview_surf
-
-        if preview_surf is not None:
-            # scale to fit comfortably inside the big rect
-            max_w = int(big_rect.width * 0.82)
-            max_h = int(big_rect.height * 0.82)
-            surf_w, surf_h = preview_surf.get_size()
-            scale = min(max_w / surf_w, max_h / surf_h, 1.0)
-            target_w = int(surf_w * scale)
-            target_h = int(surf_h * scale)
-            img = pygame.transform.smoothscale(preview_surf, (target_w, target_h))
+                    preview_cache[filename] = None
+            img = preview_cache[filename]
+
+        if img is not None:
             img_rect = img.get_rect(center=preview_center)
             screen.blit(img, img_rect)
         
@@ -549,4 +534,16 @@ def module_details_screen(main_player, player_fleet, initial_section=1, installe
             screen.blit(btn_label, btn_label_rect)
         except Exception:
             pass
-        pygame.display.flip()
\ No newline at end of file
+
+
+def module_details_screen(main_player, player_fleet, initial_section=1, installed_sections=None, selected_module=None, selected_module_index=0):
+    """Run the module details screen; returns a section index, None, "to_internal" or "to_game"."""
+    return run_screen(
+        "module_details",
+        main_player,
+        player_fleet,
+        initial_section=initial_section,
+        installed_sections=installed_sections,
+        selected_module=selected_module,
+        selected_module_index=selected_module_index,
+    )
@@ -1,8 +1,6 @@
-import sys
 import math
 import pygame
 from spacegame.config import (
-    SCREEN_WIDTH,
     SCREEN_HEIGHT,
     UI_BG_COLOR,
     UI_TAB_HEIGHT,
@@ -28,220 +26,281 @@ from spacegame.ui.fabrication_ui import (
     draw_slot_progress,
 )
 from spacegame.ui.ui import drawCornerFrame, draw_plus_circle
+from spacegame.ui.grid_ui import SmoothScroll
+from spacegame.models.resources.refineda import RURefinedA
+from spacegame.models.resources.refinedb import RURefinedB
+from spacegame.models.resources.refinedc import RURefinedC
+from spacegame.core.assets import load_image
+from spacegame.core.screen_manager import Screen, run_screen
+
+
+# Layout / card constants reused from inventory screen style
+BOX_W = 360
+BOX_H = 80
+COLS = 2
+MARGIN_X = 18
+MARGIN_Y = 18
+HEADER_SPACING = 18
+
+# (refined class, raw ore class, ore letter, refined key)
+REFINED_MAP = [
+    (RURefinedA, RUOreA, 'A', 'RA'),
+    (RURefinedB, RUOreB, 'B', 'RB'),
+    (RURefinedC, RUOreC, 'C', 'RC'),
+]
+
+
+def layout_rects(num_items, top_y, left_start):
+    rects = []
+    for i in range(num_items):
+        row = i // COLS
+        col = i % COLS
+        x = left_start + col * (BOX_W + MARGIN_X)
+        y = top_y + row * (BOX_H + MARGIN_Y)
+        rects.append(pygame.Rect(x, y, BOX_W, BOX_H))
+    return rects
+
+
+class RefiningMainScreen(Screen):
+    """REFINING tab: refinery slots and the refinable ores held in storage."""
+
+    def setup(self):
+        width, height = self.width, self.height
+
+        # ---------- FONTS ----------
+        title_font = pygame.font.Font(None, 40)
+        self.tab_font = pygame.font.Font(None, 28)
+        close_font = pygame.font.Font(None, 40)
+        self.name_font = pygame.font.Font(None, 22)
+        self.dmg_font = pygame.font.Font(None, 22)
+        self.cat_title_font = pygame.font.Font(None, 32)
+        self.index_font = pygame.font.Font(None, 36)
+        self.small_font = pygame.font.Font(None, 18)
+        self.status_font = pygame.font.Font(None, 22)
+
+        # ---------- TOP BAR ----------
+        TOP_BAR_HEIGHT = 96
+
+        # Title in the center of the top bar
+        title_text = "REFINING"
+        self.title_surf = title_font.render(title_text, True, UI_SECTION_TEXT_COLOR)
+        self.title_rect = self.title_surf.get_rect(center=(width // 2, TOP_BAR_HEIGHT // 2 - 22))
+
+        # Back arrow (left)
+        arrow_size = 32
+        self.back_arrow_rect = pygame.Rect(0, 0, arrow_size, arrow_size)
+        self.back_arrow_rect.center = (40, TOP_BAR_HEIGHT // 1.3)
+
+        # Close "X" (right)
+        self.close_surf = close_font.render("X", True, (255, 160, 40))
+        self.close_rect = self.close_surf.get_rect()
+        self.close_rect.center = (width - 40, TOP_BAR_HEIGHT // 1.25)
+        self.close_hit_rect = self.close_rect.inflate(16, 16)
+
+        # ---------- TABS ----------
+        tab_labels = ["STORAGE", "BRIDGE", "FABRICATION", "REFINING", "INTERNAL MODULES"]
+        icon_filenames = ["Nav_Icon_Inventory.png", "Nav_Icon_Bridge.png", "Nav_Icon_Fabricator.png", "Nav_Icon_Refinery.png", "Nav_Icon_InternalModules.png"]
+
+        # Use central nav helper to compute tab entries and layout
+        self.tab_entries, self.tabs_y = create_tab_entries(tab_labels, self.tab_font, width, TOP_BAR_HEIGHT, UI_TAB_HEIGHT, icon_filenames)
+
+        # Geometry for the left card and index column (01 / 02 / ...)
+        nav_bottom_y = self.tabs_y + UI_TAB_HEIGHT + 6
+        content_top = nav_bottom_y + 24
+        self.scroll_area_top = nav_bottom_y + 4
+
+        LEFT_SHIFT = 20
+        card_x = 40 - LEFT_SHIFT
+        card_y = content_top
+        card_w = int(width * 0.38)
+        card_h = int(height * 0.64)
+        card_rect = pygame.Rect(card_x, card_y, card_w, card_h)
+
+        # make slot rectangles wider and taller to add officer card below.
+        # Keep `old_idx_h` as the original visual height so existing
+        # elements (top line, label, icon) remain at the same coordinates.
+        idx_w = 240
+        self.old_idx_h = 160  # baseline used for existing element positions
+        self.officer_box_h = 70
+        # new height extends below by the officer card + some padding
+        idx_h = self.old_idx_h + self.officer_box_h + 24
+        self.idx_rect_base = pygame.Rect(card_rect.left + 16, card_rect.top + 16, idx_w, idx_h)
+        self.IDX_V_SPACING = idx_h + 32
+
+        # refined item instances used for preview/name (quantity shown separately)
+        self.refined_items = [r_cls(quantity=0) for r_cls, _, _, _ in REFINED_MAP]
+        # tier comes from the raw ore class
+        self.ore_tiers = []
+        for _, ore_cls, _, _ in REFINED_MAP:
+            try:
+                self.ore_tiers.append(getattr(ore_cls(quantity=0), 'tier', 1))
+            except Exception:
+                self.ore_tiers.append(1)
+
+    def enter(self, main_player, player_fleet):
+        self.main_player = main_player
+        self.player_fleet = player_fleet
+        self.selected_tab = 3  # REFINING selected
+        self.update_disabled()
+        # ensure selected_tab isn't disabled
+        tab_entries = self.tab_entries
+        if 0 <= self.selected_tab < len(tab_entries) and tab_entries[self.selected_tab]["label"] in self.disabled_labels:
+            for i, e in enumerate(tab_entries):
+                if e["label"] not in self.disabled_labels:
+                    self.selected_tab = i
+                    break
+
+        # ---------- REFINERY MODULE SLOTS (01 / 02 / ...) ----------
+        manager = self.ref_manager = get_refinery_manager(main_player)
+        self.refinery_modules = manager.get_modules() or []
+        slot_count = max(1, len(self.refinery_modules))
+
+        # use manager's persisted selected index and clamp to valid range
+        self.selected_refinery_index = manager.get_selected_index()
+        self.idx_rects = generate_slot_rects(self.idx_rect_base, slot_count, self.IDX_V_SPACING)
+
+        # Scroll state (smooth)
+        self.scroll = SmoothScroll()
+        self.offset_y = 0
+        self.update(0.0)
+
+    def resume(self, result):
+        super().resume(result)
+        # return focus back to REFINING tab
+        self.selected_tab = 3
+
+    def update_disabled(self):
+        disabled_labels = set()
+        if not modules_manager.get_fabricators():
+            disabled_labels.add("FABRICATION")
+        if not modules_manager.get_refineries():
+            disabled_labels.add("REFINING")
+        self.disabled_labels = disabled_labels
+
+    def update(self, dt):
+        self.update_disabled()
+
+        # ---------- Right-hand area layout: ores + cards (inventory style)
+        base_idx_rect = self.idx_rects[0] if self.idx_rects else self.idx_rect_base
+        self.details_x = base_idx_rect.right + 18
+        details_y = base_idx_rect.top
+
+        # Layout for cards: start near details_y (we intentionally omit a
+        # top-level "ORES" title per design; block headers will show tiers)
+        cards_top_y = details_y + 8
 
+        # Build refined-materials list for display from player's inventory and
+        # group by availability (available >0) and insufficient (==0).
+        inv_mgr = getattr(self.main_player, 'inventory_manager', None)
 
-def refining_main_screen(main_player, player_fleet):
-    # Use the existing display surface if present; otherwise create one.
-    screen = pygame.display.get_surface()
-    if screen is None:
-        screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-
-    width, height = screen.get_size()
-
-    # ---------- FONTS ----------
-    title_font = pygame.font.Font(None, 40)
-    tab_font = pygame.font.Font(None, 28)
-    close_font = pygame.font.Font(None, 40)
-    name_font = pygame.font.Font(None, 22)
-    dmg_font = pygame.font.Font(None, 22)
-
-    # ---------- TOP BAR ----------
-    TOP_BAR_HEIGHT = 96
-
-    # Title in the center of the top bar
-    title_text = "REFINING"
-    title_surf = title_font.render(title_text, True, UI_SECTION_TEXT_COLOR)
-    title_rect = title_surf.get_rect(center=(width // 2, TOP_BAR_HEIGHT // 2 - 22))
-
-    # Back arrow (left)
-    arrow_size = 32
-    back_arrow_rect = pygame.Rect(0, 0, arrow_size, arrow_size)
-    back_arrow_rect.center = (40, TOP_BAR_HEIGHT // 1.3)
-
-    # Close "X" (right)
-    close_surf = close_font.render("X", True, (255, 160, 40))
-    close_rect = close_surf.get_rect()
-    close_rect.center = (width - 40, TOP_BAR_HEIGHT // 1.25)
-    close_hit_rect = close_rect.inflate(16, 16)
-
-    # ---------- TABS ----------
-    tab_labels = ["STORAGE", "BRIDGE", "FABRICATION", "REFINING", "INTERNAL MODULES"]
-    icon_filenames = ["Nav_Icon_Inventory.png", "Nav_Icon_Bridge.png", "Nav_Icon_Fabricator.png", "Nav_Icon_Refinery.png", "Nav_Icon_InternalModules.png"]
-    selected_tab = 3  # REFINING selected
-
-    # Use central nav helper to compute tab entries and layout
-    tab_entries, tabs_y = create_tab_entries(tab_labels, tab_font, width, TOP_BAR_HEIGHT, UI_TAB_HEIGHT, icon_filenames)
-    disabled_labels = set()
-    if not modules_manager.get_fabricators():
-        disabled_labels.add("FABRICATION")
-    if not modules_manager.get_refineries():
-        disabled_labels.add("REFINING")
-    # ensure selected_tab isn't disabled
-    if 0 <= selected_tab < len(tab_entries) and tab_entries[selected_tab]["label"] in disabled_labels:
-        for i, e in enumerate(tab_entries):
-            if e["label"] not in disabled_labels:
-                selected_tab = i
-                break
-
-    # ---------- REFINERY MODULE SLOTS (01 / 02 / ...) ----------
-    manager = get_refinery_manager(main_player)
-    refinery_modules = manager.get_modules() or []
-    slot_count = max(1, len(refinery_modules))
-
-    # use manager's persisted selected index and clamp to valid range
-    selected_refinery_index = manager.get_selected_index()
-
-    # Geometry for the left card and index column (01 / 02 / ...)
-    nav_top_y = tabs_y - 6
-    nav_bottom_y = tabs_y + UI_TAB_HEIGHT + 6
-    content_top = nav_bottom_y + 24
-
-    LEFT_SHIFT = 20
-    card_x = 40 - LEFT_SHIFT
-    card_y = content_top
-    card_w = int(width * 0.38)
-    card_h = int(height * 0.64)
-    card_rect = pygame.Rect(card_x, card_y, card_w, card_h)
-
-    # make slot rectangles wider and taller to add officer card below.
-    # Keep `old_idx_h` as the original visual height so existing
-    # elements (top line, label, icon) remain at the same coordinates.
-    idx_w = 240
-    old_idx_h = 160  # baseline used for existing element positions
-    officer_box_h = 70
-    # new height extends below by the officer card + some padding
-    idx_h = old_idx_h + officer_box_h + 24
-    idx_rect_base = pygame.Rect(card_rect.left + 16, card_rect.top + 16, idx_w, idx_h)
-    IDX_V_SPACING = idx_h + 32
-    idx_rects = generate_slot_rects(idx_rect_base, slot_count, IDX_V_SPACING)
-
-    # Layout / card constants reused from inventory screen style
-    BOX_W = 360
-    BOX_H = 80
-    COLS = 2
-    MARGIN_X = 18
-    MARGIN_Y = 18
-
-    # Scroll state (smooth)
-    offset_y = 0.0
-    offset_y_raw = 0.0
-    SCROLL_STEP = 40
-    SCROLL_SMOOTH = 0.25
-
-    # Build ores category from player's inventory
-    running = True
-    while running:
-        # Precompute the right-hand card layout and mapping so event handling
-        # (mouse clicks) can reference `card_rects` and `display_items`.
-        if idx_rects:
-            base_idx_rect = idx_rects[0]
+        available_groups = {}  # tier -> [ (refined_item_obj, ore_letter, ore_qty) ]
+        insufficient_items = []  # list of (refined_item_obj, ore_letter, 0)
+
+        for (_, _, ore_letter, _), refined_item, tier in zip(REFINED_MAP, self.refined_items, self.ore_tiers):
+            ore_qty = int(inv_mgr.get_amount(ore_letter)) if inv_mgr is not None else 0
+            if ore_qty > 0:
+                available_groups.setdefault(tier, []).append((refined_item, ore_letter, ore_qty))
+            else:
+                insufficient_items.append((refined_item, ore_letter, 0))
+
+        # Build ordered blocks: tiers (ascending) then insufficient block
+        blocks = []
+        for tier in sorted(available_groups.keys()):
+            blocks.append((f"TIER {tier}", available_groups[tier]))
+
+        # Insufficient block always after available blocks if any, or alone
+        if insufficient_items:
+            blocks.append(("INSUFFICIENT RESOURCES", insufficient_items))
+
+        # Lay out each block: (header, header y, items, card rects); the
+        # flattened `display_items` / `card_rects` are used for hit-testing.
+        self.blocks = []
+        self.display_items = []  # list of tuples (refined_item, ore_letter, ore_qty)
+        self.card_rects = []
+        top_y = cards_top_y
+        hdr_h = self.cat_title_font.get_height() + 8
+        for header, items in blocks:
+            block_rects = layout_rects(len(items), top_y + hdr_h, self.details_x)
+            self.blocks.append((header, top_y, items, block_rects))
+            self.card_rects.extend(block_rects)
+            self.display_items.extend(items)
+            # advance top_y past this block
+            top_y = block_rects[-1].bottom + HEADER_SPACING
+
+        # Scroll bounds (same logic as inventory)
+        content_top_unscrolled = cards_top_y
+        if self.card_rects:
+            content_bottom = self.card_rects[-1].bottom + 40
         else:
-            base_idx_rect = idx_rect_base
+            content_bottom = content_top_unscrolled
 
-        details_x = base_idx_rect.right + 18
-        details_y = base_idx_rect.top
+        visible_height = SCREEN_HEIGHT - self.scroll_area_top
+        bottom_limit = SmoothScroll.bottom_limit(content_bottom - content_top_unscrolled, self.scroll_area_top, visible_height)
+        self.offset_y = self.scroll.update(bottom_limit)
 
-        # Title area height approximation
-        cat_title_font = pygame.font.Font(None, 32)
-        cards_top_y = details_y + 32 + 18
-
-        def layout_rects(num_items, top_y, left_start):
-            rects = []
-            for i in range(num_items):
-                row = i // COLS
-                col = i % COLS
-                x = left_start + col * (BOX_W + MARGIN_X)
-                y = top_y + row * (BOX_H + MARGIN_Y)
-                rects.append(pygame.Rect(x, y, BOX_W, BOX_H))
-            return rects
-
-        # (Grouping and layout for display_items/card_rects handled below)
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                return manager.get_selected_index()
-
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                mx, my = event.pos
-
-                if back_arrow_rect.collidepoint(mx, my):
-                    return manager.get_selected_index()
-
-                if close_hit_rect.collidepoint(mx, my):
-                    return "to_game"
-
-                # Tabs
-                for idx, entry in enumerate(tab_entries):
-                    if entry["rect"].collidepoint(mx, my):
-                        label = entry["label"]
-                        # ignore clicks on disabled tabs
-                        if label in disabled_labels:
-                            break
-                        # Open Storage (Inventory) when STORAGE tab clicked
-                        if label == "STORAGE":
-                            from spacegame.screens.inventory import inventory_screen
-
-                            res = inventory_screen(main_player, player_fleet)
-                            if res == "to_game":
-                                return "to_game"
-                            # return focus back to REFINING tab after closing inventory
-                            selected_tab = 3
-                        elif label == "FABRICATION":
-                            from spacegame.screens.fabrication_main_screen import fabrication_main_screen
-
-                            res = fabrication_main_screen(main_player, player_fleet)
-                            if res == "to_game":
-                                return "to_game"
-                            # return focus back to REFINING tab after closing fabrication
-                            selected_tab = 3
-                        elif label == "INTERNAL MODULES":
-                            from spacegame.screens.internal_modules_screen import internal_modules_screen
-
-                            res = internal_modules_screen(main_player, player_fleet)
-                            if res == "to_game":
-                                return "to_game"
-                            if res == "to_internal":
-                                return "to_internal"
-                            # after closing, go back to REFINING tab highlight
-                            selected_tab = 3
-                        else:
-                            selected_tab = idx
-                        break
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.manager.pop()
+            return
 
-                # Refinery slot buttons (01 / 02 / ...)
-                for i, rect in enumerate(idx_rects):
-                    if rect.collidepoint(mx, my):
-                        selected_refinery_index = i
-                        manager.set_selected_index(i)
-                        break
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            mx, my = event.pos
 
-                # Ore/refined card clicks → open DETAILS screen for the
-                # corresponding ore letter. We map display_items (item, ore_letter)
-                # to the card_rects computed earlier.
-                for i, rect in enumerate(card_rects):
-                    draw_rect = rect.move(0, offset_y)  # apply scroll offset
-                    if draw_rect.collidepoint(mx, my):
-                        if i < len(display_items):
-                            ore_letter = display_items[i][1]
-                            from spacegame.screens.refining_oredetails_screen import refining_oredetails_screen
-
-                            res = refining_oredetails_screen(
-                                main_player,
-                                player_fleet,
-                                manager.get_selected_index(),
-                                ore_letter,
-                            )
-                            if res == "to_game":
-                                return "to_game"
-                        break
+            if self.back_arrow_rect.collidepoint(mx, my):
+                self.manager.pop()
+                return
 
+            if self.close_hit_rect.collidepoint(mx, my):
+                self.manager.pop("to_game")
+                return
 
-            # Mouse wheel support (pygame 2)
-            if event.type == pygame.MOUSEWHEEL:
-                offset_y_raw += event.y * SCROLL_STEP
+            # Tabs
+            for idx, entry in enumerate(self.tab_entries):
+                if entry["rect"].collidepoint(mx, my):
+                    label = entry["label"]
+                    # ignore clicks on disabled tabs
+                    if label in self.disabled_labels:
+                        break
+                    if label != "REFINING" and self.open_tab(label, self.main_player, self.player_fleet):
+                        return
+                    self.selected_tab = idx
+                    break
+
+            # Refinery slot buttons (01 / 02 / ...)
+            for i, rect in enumerate(self.idx_rects):
+                if rect.collidepoint(mx, my):
+                    self.selected_refinery_index = i
+                    self.ref_manager.set_selected_index(i)
+                    break
+
+            # Ore/refined card clicks → open DETAILS screen for the
+            # corresponding ore letter.
+            for i, rect in enumerate(self.card_rects):
+                draw_rect = rect.move(0, self.offset_y)  # apply scroll offset
+                if draw_rect.collidepoint(mx, my):
+                    ore_letter = self.display_items[i][1]
+                    self.manager.push(
+                        "refining_oredetails",
+                        self.main_player,
+                        self.player_fleet,
+                        self.ref_manager.get_selected_index(),
+                        ore_letter,
+                    )
+                    return
+
+        # Mouse wheel support (pygame 2)
+        if event.type == pygame.MOUSEWHEEL:
+            self.scroll.wheel(event.y)
+
+    def draw(self, screen):
+        width, height = self.width, self.height
+        tabs_y = self.tabs_y
+        manager = self.ref_manager
+        idx_rects = self.idx_rects
+        refinery_modules = self.refinery_modules
+        selected_refinery_index = self.selected_refinery_index
+        old_idx_h, officer_box_h = self.old_idx_h, self.officer_box_h
+        offset_y = self.offset_y
 
         # ---------- DRAW ----------
         try:
@@ -267,34 +326,30 @@ def refining_main_screen(main_player, player_fleet):
         )
 
         # Title (on top of nav background)
-        screen.blit(title_surf, title_rect)
+        screen.blit(self.title_surf, self.title_rect)
 
         # Back arrow (on top of nav background) - use image
         back_arrow_img = get_back_arrow_image()
         if back_arrow_img:
             arrow_size = 32
             arrow_scaled = pygame.transform.smoothscale(back_arrow_img, (arrow_size - 4, arrow_size - 4))
-            arrow_draw_rect = arrow_scaled.get_rect(center=back_arrow_rect.center)
+            arrow_draw_rect = arrow_scaled.get_rect(center=self.back_arrow_rect.center)
             screen.blit(arrow_scaled, arrow_draw_rect)
 
         # Close X (on top of nav background)
-        screen.blit(close_surf, close_rect)
+        screen.blit(self.close_surf, self.close_rect)
 
         # Tabs (draw using shared nav helper)
-        nav_top_y, nav_bottom_y = draw_tabs(screen, tab_entries, selected_tab, tabs_y, width, tab_font, disabled_labels=disabled_labels)
+        draw_tabs(screen, self.tab_entries, self.selected_tab, tabs_y, width, self.tab_font, disabled_labels=self.disabled_labels)
 
         # ---------- MAIN CONTENT (refining visual) ----------
-        content_top = nav_bottom_y + 24
-
         # Left detail: index squares (01, 02, ...) with corner-only decoration + progress bar.
 
         # Draw all slot squares (01 / 02 / ...) in the custom refinery style.
         pb_margin = 12
         PROGRESS_COLOR = (255, 160, 40)  # same orange as nav X
         roman_map = {1: "I", 2: "II", 3: "III", 4: "IV", 5: "V"}
-        index_font = pygame.font.Font(None, 36)
-        small_font = pygame.font.Font(None, 18)
-        status_font = pygame.font.Font(None, 22)
+        index_font, small_font, status_font = self.index_font, self.small_font, self.status_font
 
         for idx, rect in enumerate(idx_rects):
             # slot visual state
@@ -348,7 +403,7 @@ def refining_main_screen(main_player, player_fleet):
                 if recipe is not None:
                     preview_name = getattr(recipe, 'preview_filename', None)
                     if preview_name:
-                        img = pygame.image.load(PREVIEWS_DIR + "/" + preview_name).convert_alpha()
+                        img = load_image(PREVIEWS_DIR + "/" + preview_name)
                         # scale to fit icon rect with small padding
                         pad = 6
                         max_w = max(4, icon_rect.width - pad * 2)
@@ -412,153 +467,16 @@ def refining_main_screen(main_player, player_fleet):
             except Exception:
                 pass
 
-
-        # ---------- Right-hand area: ores + cards (inventory style)
-        if idx_rects:
-            base_idx_rect = idx_rects[0]
-        else:
-            base_idx_rect = idx_rect_base
-
-        details_x = base_idx_rect.right + 18
-        details_y = base_idx_rect.top
-
-        # Layout for cards: start near details_y (we intentionally omit a
-        # top-level "ORES" title per design; block headers will show tiers)
-        cat_title_font = pygame.font.Font(None, 32)
-        cards_top_y = details_y + 8
-
-        def layout_rects(num_items, top_y, left_start):
-            rects = []
-            for i in range(num_items):
-                row = i // COLS
-                col = i % COLS
-                x = left_start + col * (BOX_W + MARGIN_X)
-                y = top_y + row * (BOX_H + MARGIN_Y)
-                rects.append(pygame.Rect(x, y, BOX_W, BOX_H))
-            return rects
-
-
-        # Build refined-materials list for display from player's inventory and
-        # group by availability (available >0) and insufficient (==0).
-        inv_mgr = getattr(main_player, 'inventory_manager', None)
-        from spacegame.models.resources.refineda import RURefinedA
-        from spacegame.models.resources.refinedb import RURefinedB
-        from spacegame.models.resources.refinedc import RURefinedC
-
-        refined_map = [
-            (RURefinedA, RUOreA, 'A', 'RA'),
-            (RURefinedB, RUOreB, 'B', 'RB'),
-            (RURefinedC, RUOreC, 'C', 'RC'),
-        ]
-
-        available_groups = {}  # tier -> [ (refined_item_obj, ore_letter, ore_qty) ]
-        insufficient_items = []  # list of (refined_item_obj, ore_letter, 0)
-
-        for r_cls, ore_cls, ore_letter, refined_key in refined_map:
-            ore_qty = int(inv_mgr.get_amount(ore_letter)) if inv_mgr is not None else 0
-            # refined item instance used for preview/name (quantity shown separately)
-            refined_item = r_cls(quantity=0)
-            # get tier from the raw ore class
-            try:
-                ore_obj = ore_cls(quantity=ore_qty)
-                tier = getattr(ore_obj, 'tier', 1)
-            except Exception:
-                tier = 1
-
-            if ore_qty > 0:
-                available_groups.setdefault(tier, []).append((refined_item, ore_letter, ore_qty))
-            else:
-                insufficient_items.append((refined_item, ore_letter, 0))
-
-        # Build ordered blocks: tiers (ascending) then insufficient block
-        blocks = []
-        if available_groups:
-            for tier in sorted(available_groups.keys()):
-                blocks.append({
-                    'header': f"TIER {tier}",
-                    'items': available_groups.get(tier, []),
-                })
-
-        # Insufficient block always after available blocks if any, or alone
-        if insufficient_items:
-            blocks.append({
-                'header': "INSUFFICIENT RESOURCES",
-                'items': insufficient_items,
-            })
-
-        # Flatten blocks into master lists and compute rects per block
-        display_items = []  # list of tuples (refined_item, ore_letter, ore_qty)
-        card_rects = []
-        left_start = details_x
-        top_y = cards_top_y
-        HEADER_SPACING = 18
-        for b in blocks:
-            items = b['items']
-            if not items:
-                continue
-            # header height
-            hdr_h = cat_title_font.get_height() + 8
-            # compute rects for this block
-            block_rects = layout_rects(len(items), top_y + hdr_h, left_start)
-            # append
-            for rr in block_rects:
-                card_rects.append(rr)
-            for it in items:
-                display_items.append(it)
-            # advance top_y past this block
-            if block_rects:
-                top_y = block_rects[-1].bottom + HEADER_SPACING
-            else:
-                top_y = top_y + hdr_h + HEADER_SPACING
-
-        # displays the cards (precomputed into `card_rects` and `display_items` above)
-
-        # Scroll bounds (same logic as inventory)
-        scroll_area_top = nav_bottom_y + 4
-        content_top_unscrolled = cards_top_y
-        if card_rects:
-            content_bottom = card_rects[-1].bottom + 40
-        else:
-            content_bottom = content_top_unscrolled
-
-        visible_height = SCREEN_HEIGHT - scroll_area_top
-        total_content_height = content_bottom - content_top_unscrolled
-        if total_content_height <= visible_height:
-            bottom_limit = 0.0
-        else:
-            bottom_limit = scroll_area_top - total_content_height
-
-        # Clamp & smooth scroll
-        target = max(min(offset_y_raw, 0.0), bottom_limit)
-        offset_y += (target - offset_y) * SCROLL_SMOOTH
-        if abs(target - offset_y) < 0.5:
-            offset_y = target
-        offset_y_raw = target
-
         # Clip to scroll area
-        scroll_clip_rect = pygame.Rect(0, scroll_area_top, width, height - scroll_area_top)
+        scroll_clip_rect = pygame.Rect(0, self.scroll_area_top, width, height - self.scroll_area_top)
         screen.set_clip(scroll_clip_rect)
 
         # Draw grouped blocks: tier headers and their cards, then an
         # "INSUFFICIENT RESOURCES" block if present
-        top_y = cards_top_y
-        left_start = details_x
-        HEADER_SPACING = 18
-        for b in blocks:
-            items = b['items']
-            if not items:
-                continue
-
+        for hdr, hdr_y, items, block_rects in self.blocks:
             # draw header
-            hdr = b['header']
-            hdr_surf = cat_title_font.render(hdr, True, UI_SECTION_TEXT_COLOR)
-            hdr_rect = hdr_surf.get_rect()
-            hdr_rect.topleft = (details_x, top_y)
-            screen.blit(hdr_surf, hdr_rect.topleft)
-
-            hdr_h = hdr_rect.height + 8
-            # compute rects for this block
-            block_rects = layout_rects(len(items), top_y + hdr_h, left_start)
+            hdr_surf = self.cat_title_font.render(hdr, True, UI_SECTION_TEXT_COLOR)
+            screen.blit(hdr_surf, (self.details_x, hdr_y))
 
             for j, rr in enumerate(block_rects):
                 draw_rect = rr.move(0, offset_y)
@@ -573,7 +491,7 @@ def refining_main_screen(main_player, player_fleet):
                 draw_tier_icon_image(screen, draw_rect, tier_value)
 
                 try:
-                    img = pygame.image.load(PREVIEWS_DIR + "/" + refined_item.preview_filename)
+                    img = load_image(PREVIEWS_DIR + "/" + refined_item.preview_filename)
                     img = pygame.transform.smoothscale(img, (48, 48))
                     img_rect = img.get_rect(center=(draw_rect.x + 40, draw_rect.y + draw_rect.height // 2))
                     screen.blit(img, img_rect.topleft)
@@ -590,7 +508,7 @@ def refining_main_screen(main_player, player_fleet):
                 y_offs = 20
                 for k, ln in enumerate(lines[:2]):
                     try:
-                        line_surf = name_font.render(ln, True, (230, 230, 255))
+                        line_surf = self.name_font.render(ln, True, (230, 230, 255))
                         screen.blit(line_surf, (draw_rect.x + 110, draw_rect.y + y_offs + k * 20))
                     except Exception:
                         pass
@@ -601,16 +519,12 @@ def refining_main_screen(main_player, player_fleet):
                     qty_text = "INF"
                 else:
                     qty_text = f"{int(qty):,}"
-                qty_surf = dmg_font.render(qty_text, True, (108, 198, 219))
+                qty_surf = self.dmg_font.render(qty_text, True, (108, 198, 219))
                 screen.blit(qty_surf, (draw_rect.x + 60, draw_rect.y + 50))
 
-            # advance past this block
-            if block_rects:
-                top_y = block_rects[-1].bottom + HEADER_SPACING
-            else:
-                top_y = top_y + hdr_h + HEADER_SPACING
-
         # reset clip
         screen.set_clip(None)
 
-        pygame.display.flip()
+
+def refining_main_screen(main_player, player_fleet):
+    return run_screen("refining_main", main_player, player_fleet)
@@ -1,8 +1,5 @@
-import sys
 import pygame
 from spacegame.config import (
-    SCREEN_WIDTH,
-    SCREEN_HEIGHT,
     UI_BG_COLOR,
     UI_TAB_HEIGHT,
     UI_SECTION_TEXT_COLOR,
@@ -16,7 +13,7 @@ from spacegame.config import (
 )
 from spacegame.core.refining import get_refinery_manager
 from spacegame.ui.nav_ui import create_tab_entries, draw_tabs, get_back_arrow_image
-from spacegame.ui.ui import UI_BG_IMG
+from spacegame.ui.ui import UI_BG_IMG, OREM_PREVIEW_IMG
 from spacegame.core.modules_manager import manager as modules_manager
 from spacegame.ui.fabrication_ui import (
     generate_slot_rects,
@@ -27,243 +24,231 @@ from spacegame.ui.fabrication_ui import (
 )
 from spacegame.ui.ui import draw_plus_circle, drawCornerFrame
 from spacegame.ui.fleet_management_ui import draw_tier_icon_image
-from spacegame.models.ores.orem import RUOreM
-from spacegame.models.ores.orea import RUOreA
-from spacegame.models.ores.oreb import RUOreB
-from spacegame.models.ores.orec import RUOreC
+from spacegame.core.production import get_production_graph
+from spacegame.core.assets import load_image
+from spacegame.core.screen_manager import Screen, run_screen
+
+
+class RefiningOreDetailsScreen(Screen):
+    """Refinement details and REFINE / SPEED UP / CANCEL for one ore on one refinery slot."""
+
+    def setup(self):
+        width, height = self.width, self.height
+
+        # ---------- FONTS ----------
+        title_font = pygame.font.Font(None, 40)
+        self.tab_font = pygame.font.Font(None, 28)
+        close_font = pygame.font.Font(None, 40)
+        self.name_font = pygame.font.Font(None, 26)   # ore & REQUIREMENTS
+        self.desc_font = pygame.font.Font(None, 20)   # data
+        self.stat_font = pygame.font.Font(None, 20)   # ore
+        self.btn_font = pygame.font.Font(None, 28)    # REFINE
+        self.meta_font = pygame.font.Font(None, 20)   # DETAILS / REFINEMENT DETAILS
+        self.ore_title_font = pygame.font.Font(None, 26)
+        self.stat_label_font = pygame.font.Font(None, 20)
+        self.stat_value_font = pygame.font.Font(None, 20)
+        self.time_font = pygame.font.Font(None, 42)
+
+        # ---------- TOP BAR ----------
+        TOP_BAR_HEIGHT = 96
+
+        # Title in the center of the top bar
+        title_text = "REFINING"
+        self.title_surf = title_font.render(title_text, True, UI_SECTION_TEXT_COLOR)
+        self.title_rect = self.title_surf.get_rect(center=(width // 2, TOP_BAR_HEIGHT // 2 - 22))
+
+        # Back arrow (left)
+        arrow_size = 32
+        self.back_arrow_rect = pygame.Rect(0, 0, arrow_size, arrow_size)
+        self.back_arrow_rect.center = (40, TOP_BAR_HEIGHT // 1.3)
+
+        # Close "X" (right)
+        self.close_surf = close_font.render("X", True, (255, 160, 40))
+        self.close_rect = self.close_surf.get_rect()
+        self.close_rect.center = (width - 40, TOP_BAR_HEIGHT // 1.25)
+        self.close_hit_rect = self.close_rect.inflate(16, 16)
+
+        # ---------- TABS ----------
+        tab_labels = ["STORAGE", "BRIDGE", "FABRICATION", "REFINING", "INTERNAL MODULES"]
+        icon_filenames = ["Nav_Icon_Inventory.png", "Nav_Icon_Bridge.png", "Nav_Icon_Fabricator.png", "Nav_Icon_Refinery.png", "Nav_Icon_InternalModules.png"]
+        self.tab_entries, self.tabs_y = create_tab_entries(tab_labels, self.tab_font, width, TOP_BAR_HEIGHT, UI_TAB_HEIGHT, icon_filenames)
+
+        # Geometry for the left card and index column (01 / 02 / ...)
+        nav_bottom_y = self.tabs_y + UI_TAB_HEIGHT + 6
+        content_top = nav_bottom_y + 24
 
+        LEFT_SHIFT = 20
+        self.card_rect = make_card_rect(width, height, content_top, left_shift=LEFT_SHIFT)
+
+        self.idx_size = 96
+        self.idx_rect_base = compute_idx_rect_base(self.card_rect, idx_size=self.idx_size)
+        self.IDX_V_SPACING = self.idx_size + 24
+
+        # ----- BIG CENTER RECT -----
+        plus_radius = 120
+        preview_center = (width // 2, height // 2)
+        big_rect_pad = 100
+        self.big_rect = pygame.Rect(
+            preview_center[0] - plus_radius - big_rect_pad,
+            preview_center[1] - plus_radius - big_rect_pad,
+            (plus_radius + big_rect_pad) * 2,
+            (plus_radius + big_rect_pad) * 2
+        )
 
-def refining_oredetails_screen(main_player, player_fleet, selected_refinery_index, ore_letter):
-    # Use the existing display surface if present; otherwise create one.
-    screen = pygame.display.get_surface()
-    if screen is None:
-        screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-
-    width, height = screen.get_size()
-
-    # ---------- FONTS ----------
-    title_font = pygame.font.Font(None, 40)
-    tab_font = pygame.font.Font(None, 28)
-    close_font = pygame.font.Font(None, 40)
-    name_font = pygame.font.Font(None, 26)   # ore & REQUIREMENTS
-    desc_font = pygame.font.Font(None, 20)   # data
-    stat_font = pygame.font.Font(None, 20)   # ore
-    btn_font = pygame.font.Font(None, 28)    # REFINE
-    meta_font = pygame.font.Font(None, 20)   # DETAILS / REFINEMENT DETAILS
-
-    # ---------- TOP BAR ----------
-    TOP_BAR_HEIGHT = 96
-
-    # Title in the center of the top bar
-    title_text = "REFINING"
-    title_surf = title_font.render(title_text, True, UI_SECTION_TEXT_COLOR)
-    title_rect = title_surf.get_rect(center=(width // 2, TOP_BAR_HEIGHT // 2 - 22))
-
-    # Back arrow (left)
-    arrow_size = 32
-    back_arrow_rect = pygame.Rect(0, 0, arrow_size, arrow_size)
-    back_arrow_rect.center = (40, TOP_BAR_HEIGHT // 1.3)
-
-    # Close "X" (right)
-    close_surf = close_font.render("X", True, (255, 160, 40))
-    close_rect = close_surf.get_rect()
-    close_rect.center = (width - 40, TOP_BAR_HEIGHT // 1.25)
-    close_hit_rect = close_rect.inflate(16, 16)
-
-    # ---------- TABS ----------
-    tab_labels = ["STORAGE", "BRIDGE", "FABRICATION", "REFINING", "INTERNAL MODULES"]
-    icon_filenames = ["Nav_Icon_Inventory.png", "Nav_Icon_Bridge.png", "Nav_Icon_Fabricator.png", "Nav_Icon_Refinery.png", "Nav_Icon_InternalModules.png"]
-    selected_tab = 3  # REFINING selected
-
-    tab_entries, tabs_y = create_tab_entries(tab_labels, tab_font, width, TOP_BAR_HEIGHT, UI_TAB_HEIGHT, icon_filenames)
-    disabled_labels = set()
-    if not modules_manager.get_fabricators():
-        disabled_labels.add("FABRICATION")
-    if not modules_manager.get_refineries():
-        disabled_labels.add("REFINING")
-
-    # ---------- REFINERY MODULE SLOTS (01 / 02 / ...) ----------
-    manager = get_refinery_manager(main_player)
-    refinery_modules = manager.get_modules() or []
-    selected_refinery_index = manager.get_selected_index()  # which refinery slot is currently selected
-
-    # Geometry for the left card and index column (01 / 02 / ...)
-    nav_top_y = tabs_y - 6
-    nav_bottom_y = tabs_y + UI_TAB_HEIGHT + 6
-    content_top = nav_bottom_y + 24
-
-    LEFT_SHIFT = 20
-    card_rect = make_card_rect(width, height, content_top, left_shift=LEFT_SHIFT)
-
-    idx_size = 96
-    idx_rect_base = compute_idx_rect_base(card_rect, idx_size=idx_size)
-    IDX_V_SPACING = idx_size + 24
-    # one rect per equipped refinery: 01 stays as-is, 02/03/... stacked below it
-    slot_count = max(1, len(refinery_modules))
-    idx_rects: list[pygame.Rect] = generate_slot_rects(idx_rect_base, slot_count, IDX_V_SPACING)
-
-    # ----- BIG CENTER RECT -----
-    plus_radius = 120
-    preview_center = (width // 2, height // 2)
-    big_rect_pad = 100
-    big_rect = pygame.Rect(
-        preview_center[0] - plus_radius - big_rect_pad,
-        preview_center[1] - plus_radius - big_rect_pad,
-        (plus_radius + big_rect_pad) * 2,
-        (plus_radius + big_rect_pad) * 2
-    )
-
-    # ---------- REQUIREMENTS PANEL (RIGHT) ----------
-    right_panel_w = 340
-    right_rect = pygame.Rect(
-        width - right_panel_w - 40,
-        card_rect.top,
-        right_panel_w,
-        140,
-    )
-
-    # ---------- REFINE BUTTON (BIG GREEN) ----------
-    refine_btn_h = 64
-    refine_btn_rect = pygame.Rect(
-        right_rect.left,
-        height - refine_btn_h - 40,
-        right_panel_w,
-        refine_btn_h,
-    )
-
-    # "SPEED UP" button (used only while refining)
-    speed_btn_h = 64
-    speed_btn_rect = pygame.Rect(
-        right_rect.left,
-        right_rect.bottom + 40,
-        right_panel_w,
-        speed_btn_h,
-    )
-
-    # Map ore letter to ore class and get ore object
-    ore_classes = {
-        'M': RUOreM,
-        'A': RUOreA,
-        'B': RUOreB,
-        'C': RUOreC,
-    }
-
-    ore_class = ore_classes.get(ore_letter, RUOreM)
-    inv_mgr = getattr(main_player, 'inventory_manager', None)
-    # initial amount (will be refreshed each frame)
-    available_ore = int(inv_mgr.get_amount(ore_letter)) if inv_mgr is not None else 0
-    ore = ore_class(quantity=available_ore)
-
-    ore_preview_img = None
-    try:
-        from spacegame.ui.ui import OREM_PREVIEW_IMG
-        ore_preview_img = OREM_PREVIEW_IMG
-    except Exception:
-        pass
-
-    # mapping from ore letter to refined preview (show refined ingot in center)
-    refined_preview_map = {
-        'A': 'RUIngotAT1.png',
-        'B': 'RUIngotBT1.png',
-        'C': 'RUIngotCT1.png',
-        'M': 'RUIngotAT1.png',
-    }
-
-    running = True
-    while running:
+        # ---------- REQUIREMENTS PANEL (RIGHT) ----------
+        self.right_panel_w = 340
+        self.right_rect = pygame.Rect(
+            width - self.right_panel_w - 40,
+            self.card_rect.top,
+            self.right_panel_w,
+            140,
+        )
+
+        # ---------- REFINE BUTTON (BIG GREEN) ----------
+        refine_btn_h = 64
+        self.refine_btn_rect = pygame.Rect(
+            self.right_rect.left,
+            height - refine_btn_h - 40,
+            self.right_panel_w,
+            refine_btn_h,
+        )
+
+        # "SPEED UP" button (used only while refining)
+        speed_btn_h = 64
+        self.speed_btn_rect = pygame.Rect(
+            self.right_rect.left,
+            self.right_rect.bottom + 40,
+            self.right_panel_w,
+            speed_btn_h,
+        )
+
+        self.ore_preview_img = OREM_PREVIEW_IMG
+
+        # scaled preview surfaces, built on first draw and kept between visits
+        self.refined_previews = {}  # ore letter -> big refined preview
+        self.ore_row_surf = None
+
+        self.graph = get_production_graph()
+
+    def enter(self, main_player, player_fleet, selected_refinery_index, ore_letter):
+        self.main_player = main_player
+        self.player_fleet = player_fleet
+        self.ore_letter = ore_letter
+        self.selected_tab = 3  # REFINING selected
+
+        # ---------- REFINERY MODULE SLOTS (01 / 02 / ...) ----------
+        manager = self.ref_manager = get_refinery_manager(main_player)
+        self.refinery_modules = manager.get_modules() or []
+        self.selected_refinery_index = manager.get_selected_index()  # which refinery slot is currently selected
+
+        # one rect per equipped refinery: 01 stays as-is, 02/03/... stacked below it
+        slot_count = max(1, len(self.refinery_modules))
+        self.idx_rects: list[pygame.Rect] = generate_slot_rects(self.idx_rect_base, slot_count, self.IDX_V_SPACING)
+
+        # Ore facts and the refining recipe come from the production graph (memoized)
+        graph = self.graph
+        self.ore = graph.item(ore_letter) or graph.item('M')
+        self.recipe = graph.refining_recipe(ore_letter)
+        self.required_input = self.recipe.required_ore_amount
+        self.refined_output = self.recipe.output_ore_amount
+        self.conv_vals = f"{self.required_input}/{self.refined_output}"
+        self.update(0.0)
+
+    def resume(self, result):
+        super().resume(result)
+        # back to REFINING tab highlight
+        self.selected_tab = 3
+
+    def update(self, dt):
         # Recompute disabled tabs each frame to stay in sync with ModulesManager
         disabled_labels = set()
         if not modules_manager.get_fabricators():
             disabled_labels.add("FABRICATION")
         if not modules_manager.get_refineries():
             disabled_labels.add("REFINING")
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
+        self.disabled_labels = disabled_labels
+
+    def handle_event(self, event):
+        manager = self.ref_manager
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.manager.pop()
+            return
+
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            mx, my = event.pos
 
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            if self.back_arrow_rect.collidepoint(mx, my):
+                self.manager.pop()
                 return
 
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                mx, my = event.pos
-
-                if back_arrow_rect.collidepoint(mx, my):
-                    return
-
-                if close_hit_rect.collidepoint(mx, my):
-                    return "to_game"
-
-                # Tabs
-                for idx, entry in enumerate(tab_entries):
-                    if entry["rect"].collidepoint(mx, my):
-                        label = entry["label"]
-                        # ignore clicks on disabled tabs
-                        if label in disabled_labels:
-                            break
-                        # Open Storage (Inventory) when STORAGE tab clicked
-                        if label == "STORAGE":
-                            from spacegame.screens.inventory import inventory_screen
-                            res = inventory_screen(main_player, player_fleet)
-                            if res == "to_game":
-                                return "to_game"
-                            # return focus back to REFINING tab after closing inventory
-                            selected_tab = 3
-                        elif label == "FABRICATION":
-                            from spacegame.screens.fabrication_main_screen import fabrication_main_screen
-                            res = fabrication_main_screen(main_player, player_fleet)
-                            if res == "to_game":
-                                return "to_game"
-                            # return focus back to REFINING tab after closing fabrication
-                            selected_tab = 3
-                        elif label == "INTERNAL MODULES":
-                            from spacegame.screens.internal_modules_screen import internal_modules_screen
-                            res = internal_modules_screen(main_player, player_fleet)
-                            if res == "to_game":
-                                return "to_game"
-                            if res == "to_internal":
-                                return "to_internal"
-                            # after closing, go back to REFINING tab highlight
-                            selected_tab = 3
-                        else:
-                            selected_tab = idx
-                        break
-                
-                # Refinery slot buttons (01 / 02 / ...)
-                for i, rect in enumerate(idx_rects):
-                    if rect.collidepoint(mx, my):
-                        selected_refinery_index = i
-                        manager.set_selected_index(i)
+            if self.close_hit_rect.collidepoint(mx, my):
+                self.manager.pop("to_game")
+                return
+
+            # Tabs
+            for idx, entry in enumerate(self.tab_entries):
+                if entry["rect"].collidepoint(mx, my):
+                    label = entry["label"]
+                    # ignore clicks on disabled tabs
+                    if label in self.disabled_labels:
                         break
+                    if label != "REFINING" and self.open_tab(label, self.main_player, self.player_fleet):
+                        return
+                    self.selected_tab = idx
+                    break
+
+            # Refinery slot buttons (01 / 02 / ...)
+            for i, rect in enumerate(self.idx_rects):
+                if rect.collidepoint(mx, my):
+                    self.selected_refinery_index = i
+                    manager.set_selected_index(i)
+                    break
+
+            # ----- REFINE / SPEED UP / CANCEL -----
+            refinery_module = manager.get_module(self.selected_refinery_index)
+            status = manager.get_status(self.selected_refinery_index)
+            is_refining = bool(status.get("is_refining", False))
+
+            # CANCEL (bottom red button while refining)
+            if is_refining and self.refine_btn_rect.collidepoint(mx, my):
+                manager.cancel_refinement(self.selected_refinery_index)
+                return
 
-                # ----- REFINE / SPEED UP / CANCEL -----
-                refinery_module = manager.get_module(selected_refinery_index)
-                status = manager.get_status(selected_refinery_index)
-                total_ms = int(status.get("total_ms", 0))
-                start_ticks = int(status.get("start_ticks", 0))
-                is_refining = bool(status.get("is_refining", False))
-
-                # CANCEL (bottom red button while refining)
-                if is_refining and refine_btn_rect.collidepoint(mx, my):
-                    manager.cancel_refinement(selected_refinery_index)
-                    continue
-
-                # SPEED UP (grey button)
-                if is_refining and speed_btn_rect.collidepoint(mx, my):
-                    manager.speed_up(selected_refinery_index)
-                    continue
-
-                # REFINE (start refinement)
-                # recompute availability to avoid stale values during rapid clicks
-                available_ore = int(inv_mgr.get_amount(ore_letter)) if inv_mgr is not None else 0
-                required_input = 200
-                insufficient_resources = available_ore < required_input
-                if (not is_refining) and refinery_module is not None and refine_btn_rect.collidepoint(mx, my):
-                    if not insufficient_resources:
-                        manager.start_refinement(selected_refinery_index, ore_letter, 100, main_player)
-                    # if insufficient, clicking does nothing (visual banner is shown below)
-                    continue
+            # SPEED UP (grey button)
+            if is_refining and self.speed_btn_rect.collidepoint(mx, my):
+                manager.speed_up(self.selected_refinery_index)
+                return
 
+            # REFINE (start refinement)
+            # recompute availability to avoid stale values during rapid clicks
+            inv_mgr = getattr(self.main_player, 'inventory_manager', None)
+            available_ore = int(inv_mgr.get_amount(self.ore_letter)) if inv_mgr is not None else 0
+            insufficient_resources = available_ore < self.required_input
+            if (not is_refining) and refinery_module is not None and self.refine_btn_rect.collidepoint(mx, my):
+                if not insufficient_resources:
+                    manager.start_refinement(self.selected_refinery_index, self.ore_letter, self.refined_output, self.main_player)
+                # if insufficient, clicking does nothing (visual banner is shown below)
+                return
+
+    def draw(self, screen):
+        width = self.width
+        tabs_y = self.tabs_y
+        manager = self.ref_manager
+        graph = self.graph
+        ore_letter, ore, recipe = self.ore_letter, self.ore, self.recipe
+        required_input, conv_vals = self.required_input, self.conv_vals
+        refinery_modules = self.refinery_modules
+        selected_refinery_index = self.selected_refinery_index
+        idx_rects, idx_rect_base = self.idx_rects, self.idx_rect_base
+        card_rect, big_rect, right_rect = self.card_rect, self.big_rect, self.right_rect
+        right_panel_w = self.right_panel_w
+        refine_btn_rect, speed_btn_rect = self.refine_btn_rect, self.speed_btn_rect
+        ore_preview_img = self.ore_preview_img
+        refined_preview_surf = self.refined_previews.get(ore_letter)
+        ore_row_surf = self.ore_row_surf
+        desc_font, stat_font = self.desc_font, self.stat_font
+        btn_font, meta_font = self.btn_font, self.meta_font
+        inv_mgr = getattr(self.main_player, 'inventory_manager', None)
 
         # ---------- DRAW ----------
         try:
@@ -289,25 +274,23 @@ def refining_oredetails_screen(main_player, player_fleet, selected_refinery_inde
         )
 
         # Title (on top of nav background)
-        screen.blit(title_surf, title_rect)
+        screen.blit(self.title_surf, self.title_rect)
 
         # Back arrow (on top of nav background) - use image
         back_arrow_img = get_back_arrow_image()
         if back_arrow_img:
             arrow_size = 32
             arrow_scaled = pygame.transform.smoothscale(back_arrow_img, (arrow_size - 4, arrow_size - 4))
-            arrow_draw_rect = arrow_scaled.get_rect(center=back_arrow_rect.center)
+            arrow_draw_rect = arrow_scaled.get_rect(center=self.back_arrow_rect.center)
             screen.blit(arrow_scaled, arrow_draw_rect)
 
         # Close X (on top of nav background)
-        screen.blit(close_surf, close_rect)
+        screen.blit(self.close_surf, self.close_rect)
 
         # Tabs (draw using shared nav helper)
-        nav_top_y, nav_bottom_y = draw_tabs(screen, tab_entries, selected_tab, tabs_y, width, tab_font, disabled_labels=disabled_labels)
+        draw_tabs(screen, self.tab_entries, self.selected_tab, tabs_y, width, self.tab_font, disabled_labels=self.disabled_labels)
 
         # ---------- MAIN CONTENT (refining visual) ----------
-        content_top = nav_bottom_y + 24
-
         # draw all refinery slots (01 / 02 / ...)
         # use the horizontal-line style for refinery indexes (top+bottom lines)
         for i, rect in enumerate(idx_rects, start=1):
@@ -335,13 +318,9 @@ def refining_oredetails_screen(main_player, player_fleet, selected_refinery_inde
 
         # ----- shared refinement timer/progress (per refinery module) -----
         refinery_module = refinery_modules[selected_refinery_index]
-        # Compute true refinement time in seconds using the module's
-        # `standard_refinement_time_s` (seconds for one conversion of 200->100)
-        # multiplied by any module factor and scaled by ore tier.
-        module_standard_s = float(getattr(refinery_module, 'standard_refinement_time_s', 75.0))
-        module_factor = float(getattr(refinery_module, "base_refinement_time", 1.0))
-        ore_tier = int(getattr(ore, 'tier', 1) or 1)
-        base_time_s = int(module_standard_s * module_factor * ore_tier)
+        # True refinement time: the module's `standard_refinement_time_s` (one
+        # 200->100 conversion) times its factor, scaled by ore tier.
+        base_time_s = graph.refining_time_s(ore_letter, refinery_module)
 
         # Use manager API to retrieve authoritative refinement status for this slot
         status = manager.get_status(selected_refinery_index)
@@ -395,7 +374,7 @@ def refining_oredetails_screen(main_player, player_fleet, selected_refinery_inde
         screen.blit(tier_surf, tier_rect.topleft)
 
         # now place the ore name a bit lower, under the DETAILS row
-        title_font = pygame.font.Font(None, 26)
+        title_font = self.ore_title_font
 
         # title from ore
         title_text = getattr(ore, "name", "ORE")
@@ -414,7 +393,6 @@ def refining_oredetails_screen(main_player, player_fleet, selected_refinery_inde
             module_title_rect = pygame.Rect(details_x, details_y, 0, title_font.get_height())
 
         # description lines
-        desc_font = pygame.font.Font(None, 20)
         desc_text = f"Refining {ore.name} into refined materials."
 
         desc_lines = []
@@ -438,8 +416,8 @@ def refining_oredetails_screen(main_player, player_fleet, selected_refinery_inde
             dy += s.get_height() + 2
 
         # (Simplified) we do not show Ore Tier / Ore Quantity here per design
-        stat_label_font = pygame.font.Font(None, 20)
-        stat_value_font = pygame.font.Font(None, 20)
+        stat_label_font = self.stat_label_font
+        stat_value_font = self.stat_value_font
         stat_x = details_x
         stat_y = dy + 12
 
@@ -474,29 +452,31 @@ def refining_oredetails_screen(main_player, player_fleet, selected_refinery_inde
         drawCornerFrame(screen, big_rect, corner_color, corner_len=big_corner_len, corner_thick=big_corner_thick, bottom_offset=bottom_offset)
 
         # --- preview in the center of the big rect ---
-        img = None
         try:
-            # show the REFINED preview in the big rect (ingot), not the raw ore preview
-            refined_name = refined_preview_map.get(ore_letter, getattr(ore, 'preview_filename', None))
-            if refined_name:
-                img = pygame.image.load(PREVIEWS_DIR + "/" + refined_name).convert_alpha()
-
-            if img is not None:
-                # reduce inner margin so the preview appears larger in the big rect
-                inner_margin = 20
-                adjusted_bottom = big_rect.bottom - bottom_offset
-                avail_height = adjusted_bottom - big_rect.top
-                max_w = big_rect.width - inner_margin * 2
-                max_h = avail_height - inner_margin * 2
-
-                if max_w > 0 and max_h > 0:
+            # reduce inner margin so the preview appears larger in the big rect
+            inner_margin = 20
+            adjusted_bottom = big_rect.bottom - bottom_offset
+            avail_height = adjusted_bottom - big_rect.top
+            max_w = big_rect.width - inner_margin * 2
+            max_h = avail_height - inner_margin * 2
+
+            # show the REFINED preview in the big rect (ingot), not the raw ore
+            # preview; loaded and scaled once since the layout is fixed
+            if refined_preview_surf is None and max_w > 0 and max_h > 0:
+                refined_name = recipe.preview_filename or ore.preview_filename
+                if refined_name:
+                    img = load_image(PREVIEWS_DIR + "/" + refined_name)
                     try:
                         scale = min(max_w / img.get_width(), max_h / img.get_height(), 1.0)
                         new_size = (int(img.get_width() * scale), int(img.get_height() * scale))
                         img = pygame.transform.smoothscale(img, new_size)
                     except Exception:
                         pass
+                    refined_preview_surf = self.refined_previews[ore_letter] = img
 
+            img = refined_preview_surf
+            if img is not None:
+                if max_w > 0 and max_h > 0:
                     center_x = big_rect.centerx
                     center_y = (big_rect.top + adjusted_bottom) // 2
                     img_rect = img.get_rect(center=(center_x, center_y))
@@ -516,20 +496,19 @@ def refining_oredetails_screen(main_player, player_fleet, selected_refinery_inde
         # idle vs refining UI
         # refresh available_ore each frame so UI reflects inventory changes immediately
         available_ore = int(inv_mgr.get_amount(ore_letter)) if inv_mgr is not None else 0
-        insufficient_resources = available_ore < 200
+        insufficient_resources = available_ore < required_input
 
         # ----- IDLE: REQUIREMENTS + TIME + REFINE / INSUFFICIENT -----
         if not is_refining:
             # ore preview image
             row_y = ref_rect.bottom + 22
             ore_size = 40
-            if ore_preview_img is not None:
+            if ore_row_surf is None and ore_preview_img is not None:
                 try:
-                    ore_surf = pygame.transform.smoothscale(ore_preview_img, (ore_size, ore_size))
+                    ore_row_surf = self.ore_row_surf = pygame.transform.smoothscale(ore_preview_img, (ore_size, ore_size))
                 except Exception:
-                    ore_surf = None
-            else:
-                ore_surf = None
+                    ore_row_surf = None
+            ore_surf = ore_row_surf
 
             if ore_surf is not None:
                 ore_rect = ore_surf.get_rect()
@@ -555,8 +534,6 @@ def refining_oredetails_screen(main_player, player_fleet, selected_refinery_inde
             screen.blit(flag_surf, flag_text_rect)
 
             # AVAILABLE / REQUIRED (live)
-            required_input = 200
-            refined_output = 100
             avail_text = f"{available_ore} / {required_input}"
             avail_color = UI_SECTION_TEXT_COLOR if available_ore >= required_input else (220, 60, 60)
             avail_surf = stat_font.render(avail_text, True, avail_color)
@@ -658,7 +635,6 @@ def refining_oredetails_screen(main_player, player_fleet, selected_refinery_inde
             screen.blit(conv_label, conv_label_rect)
 
             # conversion values (available/produced)
-            conv_vals = f"{required_input}/{refined_output}"
             conv_val_surf = stat_font.render(conv_vals, True, UI_SECTION_TEXT_COLOR)
             conv_val_rect = conv_val_surf.get_rect()
             conv_val_rect.right = right_rect.right - 20
@@ -705,7 +681,7 @@ def refining_oredetails_screen(main_player, player_fleet, selected_refinery_inde
             minutes = remaining_s // 60
             seconds = remaining_s % 60
             time_str = f"{minutes:02d}:{seconds:02d}"
-            time_font = pygame.font.Font(None, 42)
+            time_font = self.time_font
             time_surf = time_font.render(time_str, True, UI_SECTION_TEXT_COLOR)
             time_rect = time_surf.get_rect()
             time_rect.topleft = (right_rect.left + 10, ref_rect.bottom + 6)
@@ -748,4 +724,6 @@ def refining_oredetails_screen(main_player, player_fleet, selected_refinery_inde
             cancel_rect = cancel_surf.get_rect(center=refine_btn_rect.center)
             screen.blit(cancel_surf, cancel_rect)
 
-        pygame.display.flip()
+
+def refining_oredetails_screen(main_player, player_fleet, selected_refinery_index, ore_letter):
+    return run_screen("refining_oredetails", main_player, player_fleet, selected_refinery_index, ore_letter)
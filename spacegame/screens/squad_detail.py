@@ -1,4 +1,3 @@
-import sys
 import pygame
 from spacegame.ui.fleet_management_ui import (
     draw_tier_icon_image,
@@ -15,8 +14,6 @@ from spacegame.models.units.interceptor import Interceptor
 from spacegame.models.units.plasma_bomber import PlasmaBomber
 from spacegame.models.units.resource_collector import ResourceCollector
 from spacegame.config import (
-    SCREEN_WIDTH, 
-    SCREEN_HEIGHT, 
     UI_BG_COLOR, 
     UI_NAV_LINE_COLOR, 
     UI_TITLE_COLOR, 
@@ -25,6 +22,7 @@ from spacegame.config import (
     UI_TAB_HEIGHT,
     UI_TAB_TEXT_SELECTED
     )
+from spacegame.core.screen_manager import Screen, run_screen
 
 
 def _compute_squad_stats(is_equipped: bool, hangar=None, slot_index: int = None, entry=None):
@@ -106,10 +104,9 @@ def _gather_slot_info(main_player, player_fleet, slot_index: int):
 
     entry = None
     if is_equipped:
-        for e in hangar.pool:
-            if e.id == assigned_id and e.alive:
-                entry = e
-                break
+        entry = hangar.get_entry_by_id(assigned_id)
+        if entry is not None and not entry.alive:
+            entry = None
         if entry is None:
             is_equipped = False
 
@@ -150,193 +147,207 @@ def _gather_slot_info(main_player, player_fleet, slot_index: int):
     }
 
 
-def squad_detail_screen(main_player, player_fleet, slot_index: int):
+# ---------- COLORS ----------
+CARD_BG = (12, 26, 50)
+STAT_LABEL = (160, 185, 210)
+
+BUTTON_BASE = (28, 80, 135)
+BUTTON_HOVER = (40, 110, 185)
+BUTTON_TEXT = UI_TITLE_COLOR
+BUTTON_DISABLED_BG = (40, 50, 70)
+BUTTON_DISABLED_TEXT = (110, 120, 140)
+
+PLUS_CIRCLE = (80, 160, 230)
+READY_FILLED = (120, 220, 255)
+READY_EMPTY = (60, 90, 130)
+
+REMOVE_X_COLOR = UI_TITLE_COLOR
+REMOVE_X_DISABLED = (90, 110, 140)
+
+# Officer square, ship preview, empty-slot plus-circle and remove-button sizes
+OFFICER_BOX_SIZE = 70
+PREVIEW_SIZE = 220
+PLUS_RADIUS = 80
+REMOVE_RADIUS = 20
+
+
+class SquadDetailScreen(Screen):
     """Show detailed info for a hangar slot's squad and allow changes.
 
     - `main_player` must expose `inventory_manager.hangar`.
     - `player_fleet` is used to show deployed ship status and previews.
     - `slot_index` selects which hangar slot to inspect/modify.
 
-    Returns `None` normally, or `"to_game"` when the UI requests returning
+    Pops `None` normally, or `"to_game"` when the UI requests returning
     to the gameplay screen.
     """
-    screen = pygame.display.get_surface()
-    if screen is None:
-        screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-
-    width, height = screen.get_size()
-
-    # ---------- COLORS ----------
-    CARD_BG = (12, 26, 50)
-    STAT_LABEL = (160, 185, 210)
-
-    BUTTON_BASE = (28, 80, 135)
-    BUTTON_HOVER = (40, 110, 185)
-    BUTTON_TEXT = UI_TITLE_COLOR
-    BUTTON_DISABLED_BG = (40, 50, 70)
-    BUTTON_DISABLED_TEXT = (110, 120, 140)
-
-    PLUS_CIRCLE = (80, 160, 230)
-    READY_FILLED = (120, 220, 255)
-    READY_EMPTY = (60, 90, 130)
-
-    REMOVE_X_COLOR = UI_TITLE_COLOR
-    REMOVE_X_DISABLED = (90, 110, 140)
-
-    # ---------- FONTS ----------
-    title_font = pygame.font.Font(None, 40)
-    label_font = pygame.font.Font(None, 28)
-    name_font = pygame.font.Font(None, 32)
-    small_header_font = pygame.font.Font(None, 22)  # "DETAILS" + rarity
-    stat_font = pygame.font.Font(None, 24)
-    officer_font = pygame.font.Font(None, 24)
-    button_font = pygame.font.Font(None, 28)
-
-    title_text = "FLEET CONFIGURATION"
-    title_surf = title_font.render(title_text, True, UI_TITLE_COLOR)
-    title_rect = title_surf.get_rect(center=(width // 2, UI_TOP_BAR_HEIGHT // 2 - 22))
-
-    tabs_y = UI_TOP_BAR_HEIGHT - UI_TAB_HEIGHT - 4
-    nav_bottom_y = tabs_y + UI_TAB_HEIGHT + 6
-
-    nav_center_y = UI_TOP_BAR_HEIGHT // 1.3
-
-    arrow_size = 32
-    back_arrow_rect = pygame.Rect(0, 0, arrow_size, arrow_size)
-    back_arrow_rect.center = (40, nav_center_y)
-    back_arrow_hit_rect = back_arrow_rect.inflate(20, 20)
-
-    close_font = pygame.font.Font(None, 40)
-    close_surf = close_font.render("X", True, (255, 160, 0))
-    close_rect = close_surf.get_rect()
-    close_rect.center = (width - 40, UI_TOP_BAR_HEIGHT // 1.25)
-    close_hit_rect = close_rect.inflate(20, 20)
-    
-    # ---------- LAYOUT CONSTANTS (from fleet_management, shared) ----------
-    fleet_layout = compute_fleet_preview_layout(width, height)
-    left_center_x = fleet_layout["left_center_x"]
-    mid_center_x = fleet_layout["mid_center_x"]
-    fr_rect = fleet_layout["fr_rect"]
-    previews_top = fleet_layout["previews_top"]
-    # ---------- LEFT CARD LAYOUT ----------
-    card_margin_x = 40
-    card_top = nav_bottom_y + 24
-    card_width = int(width * 0.42)
-    card_height = int(height * 0.64)
-    card_rect = pygame.Rect(card_margin_x, card_top, card_width, card_height)
-
-    # Officer square size (rect itself will be placed in draw section)
-    officer_box_size = 70
-
-    # CHANGE button under card (manual rect for sharp edges)
-    change_btn_w = 220
-    change_btn_h = 54
-    change_btn_x = card_rect.left
-    change_btn_y = card_rect.bottom + 26
-    change_rect = pygame.Rect(change_btn_x, change_btn_y, change_btn_w, change_btn_h)
-
-    # ---------- RIGHT PREVIEW LAYOUT ----------
-    preview_center = Vector2(int(width * 0.69), int(height * 0.50))
-    preview_size = 220
-
-    plus_radius = 80
-    plus_rect = pygame.Rect(0, 0, plus_radius * 2, plus_radius * 2)
-    plus_rect.center = (int(preview_center.x), int(preview_center.y))
-
-    running = True
-    while running:
-        slot_info = _gather_slot_info(main_player, player_fleet, slot_index)
-        is_equipped = slot_info["is_equipped"]
-        stats = slot_info["stats"]
+
+    def setup(self):
+        width, height = self.width, self.height
+
+        # ---------- FONTS ----------
+        title_font = pygame.font.Font(None, 40)
+        self.label_font = pygame.font.Font(None, 28)
+        self.name_font = name_font = pygame.font.Font(None, 32)
+        self.small_header_font = pygame.font.Font(None, 22)  # "DETAILS" + rarity
+        self.stat_font = pygame.font.Font(None, 24)
+        self.officer_font = pygame.font.Font(None, 24)
+        self.button_font = pygame.font.Font(None, 28)
+
+        title_text = "FLEET CONFIGURATION"
+        self.title_surf = title_font.render(title_text, True, UI_TITLE_COLOR)
+        self.title_rect = self.title_surf.get_rect(center=(width // 2, UI_TOP_BAR_HEIGHT // 2 - 22))
+
+        tabs_y = UI_TOP_BAR_HEIGHT - UI_TAB_HEIGHT - 4
+        nav_bottom_y = tabs_y + UI_TAB_HEIGHT + 6
+
+        self.nav_center_y = nav_center_y = UI_TOP_BAR_HEIGHT // 1.3
+
+        self.arrow_size = arrow_size = 32
+        self.back_arrow_rect = back_arrow_rect = pygame.Rect(0, 0, arrow_size, arrow_size)
+        back_arrow_rect.center = (40, nav_center_y)
+        self.back_arrow_hit_rect = back_arrow_rect.inflate(20, 20)
+
+        close_font = pygame.font.Font(None, 40)
+        self.close_surf = close_font.render("X", True, (255, 160, 0))
+        self.close_rect = close_rect = self.close_surf.get_rect()
+        close_rect.center = (width - 40, UI_TOP_BAR_HEIGHT // 1.25)
+        self.close_hit_rect = close_rect.inflate(20, 20)
+
+        # ---------- LAYOUT CONSTANTS (from fleet_management, shared) ----------
+        fleet_layout = compute_fleet_preview_layout(width, height)
+        self.left_center_x = fleet_layout["left_center_x"]
+        self.mid_center_x = fleet_layout["mid_center_x"]
+        self.fr_rect = fleet_layout["fr_rect"]
+        self.previews_top = fleet_layout["previews_top"]
+        # ---------- LEFT CARD LAYOUT ----------
+        card_margin_x = 40
+        card_top = nav_bottom_y + 24
+        card_width = int(width * 0.42)
+        card_height = int(height * 0.64)
+        self.card_rect = card_rect = pygame.Rect(card_margin_x, card_top, card_width, card_height)
+
+        # CHANGE button under card (manual rect for sharp edges)
+        change_btn_w = 220
+        change_btn_h = 54
+        change_btn_x = card_rect.left
+        change_btn_y = card_rect.bottom + 26
+        self.change_rect = pygame.Rect(change_btn_x, change_btn_y, change_btn_w, change_btn_h)
+
+        # ---------- RIGHT PREVIEW LAYOUT ----------
+        self.preview_center = preview_center = Vector2(int(width * 0.69), int(height * 0.50))
+
+        self.plus_rect = plus_rect = pygame.Rect(0, 0, PLUS_RADIUS * 2, PLUS_RADIUS * 2)
+        plus_rect.center = (int(preview_center.x), int(preview_center.y))
+
+        # remove button layout (aligned with squad name height, directly under orange X)
+        self.remove_center = remove_center = (close_rect.centerx, card_rect.top + 42 + name_font.get_height() // 2)
+        self.remove_hit_rect = pygame.Rect(0, 0, REMOVE_RADIUS * 2 + 10, REMOVE_RADIUS * 2 + 10)
+        self.remove_hit_rect.center = remove_center
+
+        # "REMOVE" / "SQUAD" label to the left of the remove button
+        remove_color = (110, 135, 155)
+        remove_font = pygame.font.Font(None, 24)
+        self.text_remove = remove_font.render("REMOVE", True, remove_color)
+        self.text_squad = remove_font.render("SQUAD", True, remove_color)
+
+        # scaled ship previews by unit type
+        self.ship_previews = {}
+
+    def enter(self, main_player, player_fleet, slot_index: int):
+        self.main_player = main_player
+        self.player_fleet = player_fleet
+        self.slot_index = slot_index
+        self.update(0.0)
+
+    def update(self, dt):
+        slot_index = self.slot_index
+        self.slot_info = _gather_slot_info(self.main_player, self.player_fleet, slot_index)
+        self.is_equipped = self.slot_info["is_equipped"]
 
         # ---- detect if this squad is currently deployed (alive ship in this slot) ----
-        inv = getattr(main_player, 'inventory_manager', None)
+        inv = getattr(self.main_player, 'inventory_manager', None)
         if inv is None or getattr(inv, 'hangar', None) is None:
             raise RuntimeError("Hangar/InventoryManager not available on main_player; migration required")
-        hangar = inv.hangar
-        is_deployed = False
+        self.hangar = hangar = inv.hangar
+        self.is_deployed = False
         if 0 <= slot_index < hangar.num_slots:
             ship = hangar.ships[slot_index]
             if ship is not None and getattr(ship, "health", 0.0) > 0.0:
-                is_deployed = True
+                self.is_deployed = True
 
-        # remove button layout (aligned with squad name height, directly under orange X)
-        remove_radius = 20
-        remove_center_x = close_rect.centerx
-        remove_center_y = card_rect.top + 42 + name_font.get_height() // 2
-        remove_center = (remove_center_x, remove_center_y)
-        remove_hit_rect = pygame.Rect(0, 0, remove_radius * 2 + 10, remove_radius * 2 + 10)
-        remove_hit_rect.center = remove_center
-
-        # --- prepare hangar / assignments / dot positions for clicks + drawing ---
-        num_slots = hangar.num_slots
-        assignments = hangar.assignments
-
-        slot_dot_positions = []
-        if num_slots > 0:
+        # --- slot dot positions for clicks + drawing ---
+        self.slot_dot_positions = []
+        if hangar.num_slots > 0:
             dot_spacing = 22
-            dot_x = remove_center[0]
-            start_y = remove_center[1] + remove_radius + 26
-            for i in range(num_slots):
+            dot_x = self.remove_center[0]
+            start_y = self.remove_center[1] + REMOVE_RADIUS + 26
+            for i in range(hangar.num_slots):
                 y = start_y + i * dot_spacing
-                slot_dot_positions.append((i, dot_x, y))
-
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                self.slot_dot_positions.append((i, dot_x, y))
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.manager.pop()
+            return
+
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            mx, my = event.pos
+            slot_index = self.slot_index
+            hangar = self.hangar
+            is_equipped, is_deployed = self.is_equipped, self.is_deployed
+            remove_hit_rect, plus_rect, change_rect = self.remove_hit_rect, self.plus_rect, self.change_rect
+            slot_dot_positions = self.slot_dot_positions
+
+            if self.back_arrow_hit_rect.collidepoint(mx, my):
+                self.manager.pop()
                 return
 
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                mx, my = event.pos
-
-                if back_arrow_hit_rect.collidepoint(mx, my):
-                    return
-
-                if close_hit_rect.collidepoint(mx, my):
-                    return "to_game"
-
-                # only allow remove if equipped and not currently deployed
-                if is_equipped and (not is_deployed) and remove_hit_rect.collidepoint(mx, my):
-                    hangar.clear_slot(slot_index)
-                    return
-
-                # plus: only when nothing is equipped
-                if (not is_equipped) and plus_rect.collidepoint(mx, my):
-                    from spacegame.screens.light_craft_selection import (
-                        light_craft_selection_screen,
-                    )
-
-                    res = light_craft_selection_screen(main_player, player_fleet, slot_index)
-                    if res == "to_game":
-                        return "to_game"
-                    continue
-
+            if self.close_hit_rect.collidepoint(mx, my):
+                self.manager.pop("to_game")
+                return
 
-                # CHANGE: only when equipped and not deployed
-                if (not is_deployed) and change_rect.collidepoint(mx, my):
-                    from spacegame.screens.light_craft_selection import (
-                        light_craft_selection_screen,
-                    )
+            # only allow remove if equipped and not currently deployed
+            if is_equipped and (not is_deployed) and remove_hit_rect.collidepoint(mx, my):
+                hangar.clear_slot(slot_index)
+                self.manager.pop()
+                return
 
-                    res = light_craft_selection_screen(main_player, player_fleet, slot_index)
-                    if res == "to_game":
-                        return "to_game"
-                    continue
+            # plus: only when nothing is equipped
+            if (not is_equipped) and plus_rect.collidepoint(mx, my):
+                self.manager.push("light_craft_selection", self.main_player, self.player_fleet, slot_index)
+                return
 
+            # CHANGE: only when equipped and not deployed
+            if (not is_deployed) and change_rect.collidepoint(mx, my):
+                self.manager.push("light_craft_selection", self.main_player, self.player_fleet, slot_index)
+                return
 
-                # --- slot-circle click handling: change viewed slot ---
-                slot_clicked = False
-                hit_radius_sq = 10 * 10
-                for idx, dx, dy in slot_dot_positions:
-                    if (mx - dx) * (mx - dx) + (my - dy) * (my - dy) <= hit_radius_sq:
-                        slot_index = idx  # switch view to this slot
-                        slot_clicked = True
-                        break
-                if slot_clicked:
-                    continue  # re-enter loop with new slot_index
+            # --- slot-circle click handling: change viewed slot ---
+            hit_radius_sq = 10 * 10
+            for idx, dx, dy in slot_dot_positions:
+                if (mx - dx) * (mx - dx) + (my - dy) * (my - dy) <= hit_radius_sq:
+                    self.slot_index = idx  # switch view to this slot
+                    self.update(0.0)
+                    break
+
+    def draw(self, screen):
+        player_fleet = self.player_fleet
+        slot_index, slot_info, hangar = self.slot_index, self.slot_info, self.hangar
+        is_equipped, is_deployed = self.is_equipped, self.is_deployed
+        stats = slot_info["stats"]
+        num_slots, assignments = hangar.num_slots, hangar.assignments
+        label_font, name_font, small_header_font = self.label_font, self.name_font, self.small_header_font
+        stat_font, officer_font, button_font = self.stat_font, self.officer_font, self.button_font
+        title_surf, title_rect, nav_center_y = self.title_surf, self.title_rect, self.nav_center_y
+        back_arrow_rect, arrow_size = self.back_arrow_rect, self.arrow_size
+        close_surf, close_rect = self.close_surf, self.close_rect
+        left_center_x, mid_center_x = self.left_center_x, self.mid_center_x
+        fr_rect, previews_top = self.fr_rect, self.previews_top
+        card_rect, change_rect = self.card_rect, self.change_rect
+        preview_center, plus_rect = self.preview_center, self.plus_rect
+        remove_center, remove_radius = self.remove_center, REMOVE_RADIUS
+        officer_box_size = OFFICER_BOX_SIZE
 
         # ---------- DRAW ----------
         try:
@@ -479,10 +490,6 @@ def squad_detail_screen(main_player, player_fleet, slot_index: int):
         if is_equipped:
             # Determine the equipped entry and pick the preview via helper
             entry = None
-            inv = getattr(main_player, 'inventory_manager', None)
-            if inv is None or getattr(inv, 'hangar', None) is None:
-                raise RuntimeError("Hangar/InventoryManager not available on main_player; migration required")
-            hangar = inv.hangar
             assigned_id = hangar.assignments[slot_index] if 0 <= slot_index < len(hangar.assignments) else None
             entry = hangar.get_entry_by_id(assigned_id) if assigned_id is not None else None
 
@@ -496,8 +503,8 @@ def squad_detail_screen(main_player, player_fleet, slot_index: int):
                 draw_dalton(
                     screen,
                     (preview_center.x, preview_center.y),
-                    preview_size * 0.9,
-                    preview_size * 1.1,
+                    PREVIEW_SIZE * 0.9,
+                    PREVIEW_SIZE * 1.1,
                     (80, 200, 255),
                     2,
                 )
@@ -505,18 +512,20 @@ def squad_detail_screen(main_player, player_fleet, slot_index: int):
                 draw_triangle(
                     screen,
                     (preview_center.x, preview_center.y),
-                    preview_size * 1.1,
+                    PREVIEW_SIZE * 1.1,
                     (80, 200, 255),
                     2,
                 )
 
             # ship preview: scale to a fixed width but preserve the preview's
             # aspect ratio so resource collector images are not vertically squished.
-            base_preview = ship_preview
-            base_w, base_h = base_preview.get_size()
-            ship_w = 160
-            ship_h = int(base_h * (ship_w / base_w)) if base_w > 0 else 100
-            ship_img = pygame.transform.smoothscale(base_preview, (ship_w, ship_h))
+            ship_img = self.ship_previews.get(unit_type)
+            if ship_img is None:
+                base_preview = ship_preview
+                base_w, base_h = base_preview.get_size()
+                ship_w = 160
+                ship_h = int(base_h * (ship_w / base_w)) if base_w > 0 else 100
+                ship_img = self.ship_previews[unit_type] = pygame.transform.smoothscale(base_preview, (ship_w, ship_h))
             ship_rect = ship_img.get_rect()
             ship_rect.center = (int(preview_center.x), int(preview_center.y))
             screen.blit(ship_img, ship_rect.topleft)
@@ -529,7 +538,7 @@ def squad_detail_screen(main_player, player_fleet, slot_index: int):
             draw_tier_icon_image(screen, tier_host_rect, slot_info["tier"])
         else:
             # empty slot: big plus-circle
-            pygame.draw.circle(screen, PLUS_CIRCLE, plus_rect.center, plus_radius, 3)
+            pygame.draw.circle(screen, PLUS_CIRCLE, plus_rect.center, PLUS_RADIUS, 3)
             plus_size_big = 26
             cx, cy = plus_rect.center
             pygame.draw.line(screen, PLUS_CIRCLE, (cx - plus_size_big, cy), (cx + plus_size_big, cy), 3)
@@ -560,10 +569,7 @@ def squad_detail_screen(main_player, player_fleet, slot_index: int):
         )
 
         # "REMOVE" / "SQUAD" to the LEFT of button, 2 lines
-        remove_color = (110, 135, 155)
-        remove_font = pygame.font.Font(None, 24)
-        text_remove = remove_font.render("REMOVE", True, remove_color)
-        text_squad = remove_font.render("SQUAD", True, remove_color)
+        text_remove, text_squad = self.text_remove, self.text_squad
 
         text_right = remove_center[0] - remove_radius - 14
         text_remove_rect = text_remove.get_rect()
@@ -611,4 +617,7 @@ def squad_detail_screen(main_player, player_fleet, slot_index: int):
 
                 pygame.draw.circle(screen, color, (dot_x, y), radius, width)
 
-        pygame.display.flip()
\ No newline at end of file
+
+def squad_detail_screen(main_player, player_fleet, slot_index: int):
+    """Run the squad detail screen for hangar slot `slot_index`; returns "to_game" or None."""
+    return run_screen("squad_detail", main_player, player_fleet, slot_index)
@@ -3,13 +3,14 @@ import json
 import os
 from spacegame.config import PREVIEWS_DIR, SCREEN_WIDTH, SCREEN_HEIGHT, UI_SECTION_TEXT_COLOR, UI_TOP_BAR_HEIGHT, UI_NAV_LINE_COLOR, UI_ICON_BLUE
 from spacegame.ui.ui import Button, draw_hex
+from spacegame.core.assets import load_image
+from spacegame.core.battle_sim import get_background_sim
 from spacegame.screens.internal_screen import internal_screen
 
 
 def _load_image(filename: str):
     try:
-        img = pygame.image.load(filename)
-        return img.convert_alpha() if hasattr(img, 'convert_alpha') else img.convert()
+        return load_image(filename)
     except Exception:
         return None
 
@@ -22,7 +23,6 @@ def star_system_map(main_player, player_fleet, system_name: str | None = None):
     Controls:
     - ESC: go back
     """
-    pygame.init()
     screen = pygame.display.get_surface()
     if screen is None:
         screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
@@ -36,19 +36,9 @@ def star_system_map(main_player, player_fleet, system_name: str | None = None):
     if not name:
         name = 'None'
 
-    # Try to use preloaded system preview if available (cached by galactic_map_screen.preload_map_images)
-    bg_img = None
-    try:
-        from spacegame.screens.galactic_map_screen import _GALACTIC_MAP_CACHE as _GMC
-        sys_previews = _GMC.get('system_previews', {})
-        bg_img = sys_previews.get(str(name).title()) if sys_previews else None
-    except Exception:
-        bg_img = None
-
-    # fallback to loading file directly
-    if bg_img is None:
-        preview_fn = f"{PREVIEWS_DIR}/Map_{str(name).title()}.png"
-        bg_img = _load_image(preview_fn)
+    # System preview (usually already streamed in by the asset preloader)
+    preview_fn = f"{PREVIEWS_DIR}/Map_{str(name).title()}.png"
+    bg_img = _load_image(preview_fn)
     if bg_img is None:
         bg_img = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
         bg_img.fill((6, 10, 20))
@@ -337,6 +327,9 @@ def star_system_map(main_player, player_fleet, system_name: str | None = None):
 
     while True:
         clock.tick(60)
+        # the battle keeps running behind the map
+        if get_background_sim().tick().mothership_lost:
+            return "back"
         for ev in pygame.event.get():
             if ev.type == pygame.QUIT:
                 return "exit"
@@ -347,10 +340,10 @@ def star_system_map(main_player, player_fleet, system_name: str | None = None):
                 if fleet_btn.handle_event(ev):
                     try:
                         res = internal_screen(main_player, player_fleet)
-                        if res == 'to_game':
-                            pass
                     except Exception:
-                        pass
+                        res = None
+                    if res == 'exit':
+                        return 'exit'
                     continue
 
                 # HUD icon clicks (top-right)
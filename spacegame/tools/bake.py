@@ -0,0 +1,157 @@
+"""Bake unit sprites into a memory-mappable sprite pack.
+
+Usage (from the project root):
+
+    python -m spacegame.tools.bake [--force] [--out DIR]
+
+Collects every `SpriteSpec` declared by the unit and asteroid classes,
+orients and scales the source art, renders all rotation frames and writes
+them as raw pixels (`PACK_PIXEL_FORMAT`) into ``<SPRITE_CACHE_DIR>/
+sprites-v<PACK_VERSION>/``:
+
+- ``sprites.pack``: pixel data, one region per base image / frame.
+- ``index.json``: per sprite the region table, a content hash of the
+  source file + spec, and the source file's size / mtime.
+
+Sprites whose content hash is unchanged are copied from the previous pack
+instead of being re-rendered; `--force` re-renders everything. The game
+checks the recorded size / mtime at load time and ignores entries whose
+source art changed since the last bake.
+"""
+import argparse
+import hashlib
+import importlib
+import json
+import os
+import pkgutil
+import sys
+import time
+from typing import Dict, List
+
+import pygame
+
+from spacegame.core.sprite_pack import (
+    PACK_VERSION,
+    PACK_PIXEL_FORMAT,
+    PACK_INDEX_NAME,
+    PACK_DATA_NAME,
+    SpriteSpec,
+    build_base,
+    build_frame,
+    pack_dir,
+)
+
+# Packages whose classes declare sprites (as SpriteSpec class attributes)
+_SPRITE_PACKAGES = (
+    "spacegame.models.units",
+    "spacegame.models.asteroids",
+)
+
+
+def collect_specs() -> List[SpriteSpec]:
+    """Return every distinct SpriteSpec declared by a model class."""
+    specs: Dict[str, SpriteSpec] = {}
+    for pkg_name in _SPRITE_PACKAGES:
+        pkg = importlib.import_module(pkg_name)
+        for info in pkgutil.iter_modules(pkg.__path__):
+            module = importlib.import_module(f"{pkg_name}.{info.name}")
+            for obj in vars(module).values():
+                if isinstance(obj, type):
+                    for value in vars(obj).values():
+                        if isinstance(value, SpriteSpec):
+                            specs.setdefault(value.key, value)
+    return sorted(specs.values(), key=lambda s: s.key)
+
+
+def content_hash(spec: SpriteSpec) -> str:
+    h = hashlib.sha1()
+    h.update(repr((PACK_VERSION, tuple(spec), pygame.version.ver)).encode("utf-8"))
+    with open(spec.path, "rb") as fh:
+        h.update(fh.read())
+    return h.hexdigest()
+
+
+def _read_previous(directory: str):
+    try:
+        with open(os.path.join(directory, PACK_INDEX_NAME), "r", encoding="utf-8") as fh:
+            index = json.load(fh)
+        if index.get("version") != PACK_VERSION or index.get("format") != PACK_PIXEL_FORMAT:
+            return {}, b""
+        with open(os.path.join(directory, PACK_DATA_NAME), "rb") as fh:
+            return dict(index.get("sprites") or {}), fh.read()
+    except (OSError, ValueError):
+        return {}, b""
+
+
+def bake(directory: str, force: bool = False) -> dict:
+    """Bake all sprites into `directory`; return a summary dict."""
+    os.makedirs(directory, exist_ok=True)
+    previous, previous_data = ({}, b"") if force else _read_previous(directory)
+
+    chunks: List[bytes] = []
+    offset = 0
+    sprites = {}
+    baked = reused = 0
+
+    def add(data: bytes) -> int:
+        nonlocal offset
+        start = offset
+        chunks.append(data)
+        offset += len(data)
+        return start
+
+    for spec in collect_specs():
+        digest = content_hash(spec)
+        st = os.stat(spec.path)
+        old = previous.get(spec.key)
+        if old is not None and old.get("hash") == digest:
+            # unchanged: copy regions from the previous pack
+            def copy_region(region):
+                o, w, h = region
+                return [add(previous_data[o:o + w * h * 4]), w, h]
+            entry = {
+                "base": copy_region(old["base"]),
+                "frames": [copy_region(r) for r in old.get("frames", [])],
+            }
+            reused += 1
+        else:
+            base = build_base(spec, pygame.image.load(spec.path))
+            frames = [build_frame(spec, base, i) for i in range(max(1, spec.frames))]
+            entry = {
+                "base": [add(pygame.image.tobytes(base, PACK_PIXEL_FORMAT)), *base.get_size()],
+                "frames": [[add(pygame.image.tobytes(f, PACK_PIXEL_FORMAT)), *f.get_size()] for f in frames],
+            }
+            baked += 1
+        entry["source"] = spec.source
+        entry["hash"] = digest
+        entry["stat"] = [st.st_size, st.st_mtime_ns]
+        sprites[spec.key] = entry
+
+    # write data first, then the index that points into it
+    data_path = os.path.join(directory, PACK_DATA_NAME)
+    with open(data_path + ".tmp", "wb") as fh:
+        for chunk in chunks:
+            fh.write(chunk)
+    os.replace(data_path + ".tmp", data_path)
+    index_path = os.path.join(directory, PACK_INDEX_NAME)
+    with open(index_path + ".tmp", "w", encoding="utf-8") as fh:
+        json.dump({"version": PACK_VERSION, "format": PACK_PIXEL_FORMAT, "sprites": sprites}, fh, separators=(",", ":"))
+    os.replace(index_path + ".tmp", index_path)
+    return {"sprites": len(sprites), "baked": baked, "reused": reused, "bytes": offset}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m spacegame.tools.bake", description="Bake unit sprites into a sprite pack.")
+    parser.add_argument("--force", action="store_true", help="re-render every sprite even if its source is unchanged")
+    parser.add_argument("--out", default=None, help=f"output directory (default: {pack_dir()})")
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    summary = bake(args.out or pack_dir(), force=args.force)
+    print(f"Baked {summary['sprites']} sprites ({summary['baked']} rendered, {summary['reused']} reused), "
+          f"{summary['bytes'] / (1024 * 1024):.1f} MiB in {time.perf_counter() - t0:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
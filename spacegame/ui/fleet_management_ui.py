@@ -6,6 +6,7 @@ visuals (tier icons, section headers and preview layout geometry).
 
 import pygame
 from spacegame.config import PREVIEWS_DIR
+from spacegame.core.assets import load_image
 
 
 _tier_icon_cache = {}
@@ -28,7 +29,7 @@ def get_tier_icon_image(tier_value: int) -> pygame.Surface:
         
         path = f"{PREVIEWS_DIR}/{img_name}"
         try:
-            img = pygame.image.load(path).convert_alpha()
+            img = load_image(path)
             _tier_icon_cache[tier_value] = img
         except Exception as e:
             raise RuntimeError(f"Failed to load tier icon {path}: {e}")
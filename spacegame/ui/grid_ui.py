@@ -0,0 +1,181 @@
+"""Virtualized card grid and smooth scrolling for list screens.
+
+The storage, light-craft, module and blueprint screens show items as
+fixed-size cards in a centered grid. `VirtualGrid` answers every layout
+question arithmetically (rect of item i, item under the mouse, content
+height), so nothing is built per item; `visible()` yields only the cards
+that intersect the clip area for the current scroll offset.
+
+Card contents are rendered once into a cell surface keyed by what they
+show and reused while the key is unchanged. Old cells are recycled
+(least recently used first) instead of allocating new surfaces, so the
+per-frame cost depends on the window size, not on the item count.
+"""
+from collections import OrderedDict
+from typing import Callable, Hashable, Iterator, Optional, Tuple
+
+import pygame
+
+from spacegame.config import UI_GRID_SCROLL_STEP, UI_GRID_SCROLL_SMOOTH, UI_GRID_CELL_CACHE
+
+
+# Empty-slot card colors shared by every grid screen
+PLACEHOLDER_FILL = (20, 35, 60)
+PLACEHOLDER_BORDER = (60, 100, 150)
+
+
+def draw_placeholder(surface: pygame.Surface, rect: pygame.Rect) -> None:
+    pygame.draw.rect(surface, PLACEHOLDER_FILL, rect, border_radius=0)
+    pygame.draw.rect(surface, PLACEHOLDER_BORDER, rect, 1, border_radius=0)
+
+
+class SmoothScroll:
+    """Mouse-wheel scroll offset that eases toward its clamped target."""
+
+    def __init__(self, step: int = UI_GRID_SCROLL_STEP, smooth: float = UI_GRID_SCROLL_SMOOTH):
+        self.step = step
+        self.smooth = smooth
+        self.offset = 0.0  # what we render with
+        self.raw = 0.0     # direct input accumulator
+
+    def wheel(self, dy: int) -> None:
+        # dy: 1 for wheel up, -1 for wheel down
+        self.raw += dy * self.step
+
+    @staticmethod
+    def bottom_limit(content_height: float, scroll_area_top: int, visible_height: int) -> float:
+        """Lowest offset for `content_height` of content (0 when it all fits)."""
+        if content_height <= visible_height:
+            return 0.0
+        return float(scroll_area_top - content_height)
+
+    def update(self, bottom_limit: float, top_limit: float = 0.0) -> int:
+        """Clamp the target, ease toward it and return the integer draw offset."""
+        target = max(min(self.raw, top_limit), bottom_limit)
+        self.offset += (target - self.offset) * self.smooth
+        # snap when very close, to avoid tiny float drift
+        if abs(target - self.offset) < 0.5:
+            self.offset = target
+        # stop the raw value from drifting beyond the limits
+        self.raw = target
+        return int(self.offset)
+
+
+class VirtualGrid:
+    """Fixed-size cards laid out `cols` wide from (`left`, `top`)."""
+
+    def __init__(self, cols: int, cell_w: int, cell_h: int, margin_x: int = 18, margin_y: int = 18,
+                 left: int = 0, top: int = 0, cache_size: int = UI_GRID_CELL_CACHE):
+        self.cols = max(1, int(cols))
+        self.cell_w = int(cell_w)
+        self.cell_h = int(cell_h)
+        self.margin_x = int(margin_x)
+        self.margin_y = int(margin_y)
+        self.left = int(left)
+        self.top = int(top)
+        self.cache_size = max(1, int(cache_size))
+        self._cells: "OrderedDict[Hashable, pygame.Surface]" = OrderedDict()
+        self.rendered = 0  # cells drawn since creation (cache misses)
+
+    @classmethod
+    def centered(cls, width: int, cols: int, cell_w: int, cell_h: int, margin_x: int = 18,
+                 margin_y: int = 18, top: int = 0, **kw) -> "VirtualGrid":
+        """Grid horizontally centered in a surface `width` pixels wide."""
+        total_w = cols * cell_w + (cols - 1) * margin_x
+        return cls(cols, cell_w, cell_h, margin_x, margin_y, left=width // 2 - total_w // 2, top=top, **kw)
+
+    # ---- Layout ----
+    def rows(self, count: int) -> int:
+        return (max(0, count) + self.cols - 1) // self.cols
+
+    def padded(self, count: int, min_count: int = 0) -> int:
+        """`count` rounded up to whole rows (at least `min_count`), for placeholder cards."""
+        count = max(count, min_count)
+        return self.rows(count) * self.cols
+
+    def rect(self, index: int, offset_y: int = 0) -> pygame.Rect:
+        row, col = divmod(index, self.cols)
+        x = self.left + col * (self.cell_w + self.margin_x)
+        y = self.top + row * (self.cell_h + self.margin_y) + int(offset_y)
+        return pygame.Rect(x, y, self.cell_w, self.cell_h)
+
+    def bottom(self, count: int) -> int:
+        """Bottom edge of the last card for `count` cards (`top` when empty)."""
+        rows = self.rows(count)
+        if rows == 0:
+            return self.top
+        return self.top + rows * (self.cell_h + self.margin_y) - self.margin_y
+
+    def visible_range(self, count: int, offset_y: int, clip_top: int, clip_bottom: int) -> range:
+        """Indices below `count` whose row overlaps [clip_top, clip_bottom)."""
+        if count <= 0:
+            return range(0)
+        pitch = self.cell_h + self.margin_y
+        origin = self.top + int(offset_y)
+        first_row = max(0, (clip_top - origin) // pitch)
+        last_row = min(self.rows(count) - 1, (clip_bottom - 1 - origin) // pitch)
+        if last_row < first_row:
+            return range(0)
+        return range(first_row * self.cols, min(count, (last_row + 1) * self.cols))
+
+    def visible(self, count: int, offset_y: int, clip: pygame.Rect) -> Iterator[Tuple[int, pygame.Rect]]:
+        """Yield (index, draw rect) for the cards inside `clip`."""
+        for i in self.visible_range(count, offset_y, clip.top, clip.bottom):
+            yield i, self.rect(i, offset_y)
+
+    def index_at(self, pos, count: int, offset_y: int = 0) -> Optional[int]:
+        """Index of the card under `pos` (None for gaps and empty slots)."""
+        x = pos[0] - self.left
+        y = pos[1] - self.top - int(offset_y)
+        if x < 0 or y < 0:
+            return None
+        col, cx = divmod(x, self.cell_w + self.margin_x)
+        row, cy = divmod(y, self.cell_h + self.margin_y)
+        if col >= self.cols or cx >= self.cell_w or cy >= self.cell_h:
+            return None
+        index = row * self.cols + col
+        return index if index < count else None
+
+    # ---- Cell surfaces ----
+    def cell(self, key: Hashable, render: Callable[[pygame.Surface, pygame.Rect], None]) -> pygame.Surface:
+        """Cached card surface for `key`; `render(surface, rect)` draws it on a miss.
+
+        `key` must cover everything the card shows (name, tier, quantity...).
+        """
+        cells = self._cells
+        surf = cells.get(key)
+        if surf is not None:
+            cells.move_to_end(key)
+            return surf
+        if len(cells) >= self.cache_size:
+            # recycle the least recently used cell
+            _, surf = cells.popitem(last=False)
+        else:
+            surf = pygame.Surface((self.cell_w, self.cell_h))
+            if pygame.display.get_surface() is not None:
+                surf = surf.convert()
+        render(surf, surf.get_rect())
+        cells[key] = surf
+        self.rendered += 1
+        return surf
+
+    def draw(self, surface: pygame.Surface, count: int, offset_y: int, key_for: Callable[[int], Hashable],
+             render: Callable[[pygame.Surface, pygame.Rect, int], None], clip: Optional[pygame.Rect] = None,
+             min_count: int = 0) -> None:
+        """Blit the visible cards out of `count`, then placeholders filling the last row.
+
+        `key_for(index)` is only called for visible cards; `render(surface,
+        rect, index)` draws card `index` on a cache miss.
+        """
+        if clip is None:
+            clip = surface.get_clip()
+        for i, rect in self.visible(self.padded(count, min_count), offset_y, clip):
+            if i < count:
+                surf = self.cell(key_for(i), lambda s, r, i=i: render(s, r, i))
+                surface.blit(surf, rect)
+            else:
+                draw_placeholder(surface, rect)
+
+    def invalidate(self) -> None:
+        """Drop every cached cell (e.g. after a font or theme change)."""
+        self._cells.clear()
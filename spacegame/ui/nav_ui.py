@@ -14,6 +14,7 @@ from spacegame.config import (
     UI_TAB_UNDERLINE_COLOR,
     PREVIEWS_DIR,
 )
+from spacegame.core.assets import load_image
 
 _icon_cache: Dict[str, pygame.Surface] = {}
 _back_arrow_img: Optional[pygame.Surface] = None
@@ -24,7 +25,7 @@ def _load_icon(icon_filename: str) -> Optional[pygame.Surface]:
     if icon_filename not in _icon_cache:
         try:
             path = f"{PREVIEWS_DIR}/{icon_filename}"
-            img = pygame.image.load(path).convert_alpha()
+            img = load_image(path)
             _icon_cache[icon_filename] = img
         except Exception:
             return None
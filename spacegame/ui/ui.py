@@ -11,6 +11,7 @@ to be safe for import from any UI module.
 
 import pygame
 from spacegame.config import PREVIEWS_DIR
+from spacegame.core.assets import load_image
 
 
 class Button:
@@ -45,27 +46,43 @@ class Button:
 
 # ---------- Shared preview images ----------
 # Centralized here so multiple screens can reuse the same loaded surfaces.
-EXPEDITION_PREVIEW_IMG = pygame.image.load(PREVIEWS_DIR + "/Carrier_T1_Preview.png")
-FRIGATE_PREVIEW_IMG    = pygame.image.load(PREVIEWS_DIR + "/Frigate_Preview.png")
-INTERCEPTOR_PREVIEW_IMG = pygame.image.load(PREVIEWS_DIR + "/Interceptor_Preview.png")
-RESOURCE_COLLECTOR_PREVIEW_IMG = pygame.image.load(PREVIEWS_DIR + "/Resource_Collector_Preview.png")
-OREM_PREVIEW_IMG = pygame.image.load(PREVIEWS_DIR + "/RUOreM.png")
-BOMBER_PREVIEW_IMG = pygame.image.load(PREVIEWS_DIR + "/Bomber_Preview.png")
-
-# Small UI icons
-UI_ICON_GEARSCORE_IMG = pygame.image.load(PREVIEWS_DIR + "/UI_icon_gearScore.png")
-
-# Background images
-UI_BG_IMG = pygame.image.load(PREVIEWS_DIR + "/ui_background.png")
-UI_BG_MAINMENU_IMG = pygame.image.load(PREVIEWS_DIR + "/ui_background_mainmenu.png")
-
-# Map unit type keys to preview surfaces for easy lookup by UI code.
-PREVIEW_IMAGE_MAP = {
-    "expedition": EXPEDITION_PREVIEW_IMG,
-    "frigate": FRIGATE_PREVIEW_IMG,
-    "interceptor": INTERCEPTOR_PREVIEW_IMG,
-    "resource_collector": RESOURCE_COLLECTOR_PREVIEW_IMG
-    ,"plasma_bomber": BOMBER_PREVIEW_IMG
+# Images are loaded on first use rather than at import time, and converted to
+# the display's pixel format so blits from them need no per-blit conversion.
+_UI_IMAGE_FILES = {
+    "EXPEDITION_PREVIEW_IMG": "Carrier_T1_Preview.png",
+    "FRIGATE_PREVIEW_IMG": "Frigate_Preview.png",
+    "INTERCEPTOR_PREVIEW_IMG": "Interceptor_Preview.png",
+    "RESOURCE_COLLECTOR_PREVIEW_IMG": "Resource_Collector_Preview.png",
+    "OREM_PREVIEW_IMG": "RUOreM.png",
+    "BOMBER_PREVIEW_IMG": "Bomber_Preview.png",
+    # Small UI icons
+    "UI_ICON_GEARSCORE_IMG": "UI_icon_gearScore.png",
+    # Background images
+    "UI_BG_IMG": "ui_background.png",
+    "UI_BG_MAINMENU_IMG": "ui_background_mainmenu.png",
+}
+
+
+def ui_image(name: str):
+    """Return the shared UI surface `name` (e.g. "UI_BG_IMG"), loading it on first use."""
+    return load_image(PREVIEWS_DIR + "/" + _UI_IMAGE_FILES[name])
+
+
+def __getattr__(name):
+    # Keeps `from spacegame.ui.ui import UI_BG_IMG` working; the image is
+    # loaded when the importing screen module is first imported.
+    if name in _UI_IMAGE_FILES:
+        return ui_image(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Map unit type keys to preview images for easy lookup by UI code.
+PREVIEW_IMAGE_NAMES = {
+    "expedition": "EXPEDITION_PREVIEW_IMG",
+    "frigate": "FRIGATE_PREVIEW_IMG",
+    "interceptor": "INTERCEPTOR_PREVIEW_IMG",
+    "resource_collector": "RESOURCE_COLLECTOR_PREVIEW_IMG",
+    "plasma_bomber": "BOMBER_PREVIEW_IMG",
 }
 
 
@@ -79,7 +96,7 @@ def preview_for_unit(unit_type: str, default: str = "interceptor"):
     """
     if unit_type is None:
         unit_type = default
-    return PREVIEW_IMAGE_MAP.get(unit_type, PREVIEW_IMAGE_MAP.get(default))
+    return ui_image(PREVIEW_IMAGE_NAMES.get(unit_type, PREVIEW_IMAGE_NAMES.get(default)))
 
 
 # Cache for scaled preview surfaces to avoid repeated smoothscale() calls.
@@ -290,7 +307,7 @@ def draw_power_icon(surface, topleft: tuple, size: int = 20, color=(200, 200, 22
     key = (w, h)
     surf = _SCALED_POWER_ICON_CACHE.get(key)
     if surf is None:
-        surf = pygame.transform.smoothscale(UI_ICON_GEARSCORE_IMG, (w, h))
+        surf = pygame.transform.smoothscale(ui_image("UI_ICON_GEARSCORE_IMG"), (w, h))
         _SCALED_POWER_ICON_CACHE[key] = surf
 
     # blit so the new icon's center aligns with the legacy center (numbers use that)